@@ -0,0 +1 @@
+"""Benchmarks of Mirascope's own (framework) overhead."""
@@ -0,0 +1,56 @@
+"""Zero-latency fake provider clients that return canned responses.
+
+There is one module per provider, named after it, so that benchmarking a provider only
+imports its own SDK. Each fake mirrors the subset of its SDK client that Mirascope
+calls and returns real SDK response objects (or payload dicts for Bedrock), so the
+full response and chunk handling paths run. When the request includes tools, the fake
+answers with a call to the first tool using `BOOK_ARGS`, which works for both
+`format_book` and `Book`. Responses are built once per (kind, chunks) and reused, so
+the fakes themselves add next to no time to the measurements.
+
+LiteLLM has no fake: it takes no client and calls `litellm.completion` directly, and
+Mirascope handles its requests and responses with the OpenAI code paths, which the
+OpenAI fake already covers.
+"""
+
+from collections.abc import Callable, Iterator
+from typing import Any, TypeVar
+
+TEXT = (
+    "I recommend The Name of the Wind by Patrick Rothfuss, the first book in the "
+    "Kingkiller Chronicle, which follows the life of Kvothe, a gifted young man who "
+    "grows up to become a legendary wizard."
+)
+BOOK_ARGS = {"title": "The Name of the Wind", "author": "Patrick Rothfuss"}
+MODEL = "fake-model"
+
+_ChunkT = TypeVar("_ChunkT")
+
+
+def split(text: str, chunks: int) -> list[str]:
+    """Splits `text` into `chunks` roughly equal, non-empty pieces."""
+    size = max(1, -(-len(text) // chunks))
+    return [text[i : i + size] for i in range(0, len(text), size)]
+
+
+_streamed_chunks = 0
+
+
+def stream(chunks: list[_ChunkT]) -> Iterator[_ChunkT]:
+    """Returns an iterator over `chunks` and counts them as streamed."""
+    global _streamed_chunks
+    _streamed_chunks += len(chunks)
+    return iter(chunks)
+
+
+def streamed_chunks() -> int:
+    """Returns the total number of chunks streamed by all fakes so far."""
+    return _streamed_chunks
+
+
+def requested_tool(
+    kwargs: dict[str, Any], get_name: Callable[[Any], str]
+) -> str | None:
+    """Returns the name of the first tool in the request, if any."""
+    tools = kwargs.get("tools")
+    return get_name(tools[0]) if tools else None
@@ -0,0 +1,91 @@
+"""A fake `Anthropic` client."""
+
+import json
+from collections.abc import Iterator
+from functools import cache
+from typing import Any
+
+from anthropic import Anthropic
+from anthropic.types import Message, RawMessageStreamEvent
+from pydantic import TypeAdapter
+
+from . import BOOK_ARGS, MODEL, TEXT, requested_tool, split, stream
+
+
+@cache
+def _anthropic_message(tool_name: str | None) -> Message:
+    content: dict[str, Any] = {"type": "text", "text": TEXT}
+    if tool_name:
+        content = {
+            "type": "tool_use",
+            "id": "toolu_0",
+            "name": tool_name,
+            "input": BOOK_ARGS,
+        }
+    return Message.model_validate(
+        {
+            "id": "id",
+            "type": "message",
+            "role": "assistant",
+            "model": MODEL,
+            "content": [content],
+            "stop_reason": "end_turn",
+            "usage": {"input_tokens": 10, "output_tokens": 50},
+        }
+    )
+
+
+@cache
+def _anthropic_events(
+    tool_name: str | None, chunks: int
+) -> list[RawMessageStreamEvent]:
+    message = _anthropic_message(None).model_dump() | {
+        "content": [],
+        "stop_reason": None,
+    }
+    if tool_name:
+        block = {"type": "tool_use", "id": "toolu_0", "name": tool_name, "input": {}}
+        deltas = [
+            {"type": "input_json_delta", "partial_json": piece}
+            for piece in split(json.dumps(BOOK_ARGS), chunks)
+        ]
+    else:
+        block = {"type": "text", "text": ""}
+        deltas = [
+            {"type": "text_delta", "text": piece} for piece in split(TEXT, chunks)
+        ]
+    payloads = [
+        {"type": "message_start", "message": message},
+        {"type": "content_block_start", "index": 0, "content_block": block},
+        *(
+            {"type": "content_block_delta", "index": 0, "delta": delta}
+            for delta in deltas
+        ),
+        {"type": "content_block_stop", "index": 0},
+        {
+            "type": "message_delta",
+            "delta": {"stop_reason": "end_turn", "stop_sequence": None},
+            "usage": {"output_tokens": 50},
+        },
+        {"type": "message_stop"},
+    ]
+    adapter = TypeAdapter(RawMessageStreamEvent)
+    return [adapter.validate_python(payload) for payload in payloads]
+
+
+class _FakeAnthropicMessages:
+    def __init__(self, chunks: int) -> None:
+        self.chunks = chunks
+
+    def create(self, **kwargs: Any) -> Message | Iterator[RawMessageStreamEvent]:  # noqa: ANN401
+        name = requested_tool(kwargs, lambda tool: tool["name"])
+        if kwargs.get("stream"):
+            return stream(_anthropic_events(name, self.chunks))
+        return _anthropic_message(name)
+
+
+class FakeAnthropic(Anthropic):
+    """An `Anthropic` client returning canned messages."""
+
+    def __init__(self, chunks: int = 50) -> None:
+        self.messages = _FakeAnthropicMessages(chunks)  # pyright: ignore [reportAttributeAccessIssue]
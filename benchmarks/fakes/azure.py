@@ -0,0 +1,45 @@
+"""A fake Azure AI Inference `ChatCompletionsClient`."""
+
+from collections.abc import Iterator
+from functools import cache
+from typing import Any
+
+from azure.ai.inference import ChatCompletionsClient
+from azure.ai.inference.models import ChatCompletions, StreamingChatCompletionsUpdate
+
+from . import requested_tool, stream
+from .openai import chunk_payloads, completion_payload
+
+_NO_USAGE = {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0}
+
+
+@cache
+def _completion(tool_name: str | None) -> ChatCompletions:
+    return ChatCompletions(completion_payload(tool_name))
+
+
+@cache
+def _updates(
+    tool_name: str | None, chunks: int
+) -> list[StreamingChatCompletionsUpdate]:
+    # Azure reports the usage of every update, which Mirascope reads unconditionally
+    return [
+        StreamingChatCompletionsUpdate({"usage": _NO_USAGE} | payload)
+        for payload in chunk_payloads(tool_name, chunks)
+    ]
+
+
+class FakeChatCompletionsClient(ChatCompletionsClient):
+    """A `ChatCompletionsClient` returning canned chat completions."""
+
+    def __init__(self, chunks: int = 50) -> None:
+        self.chunks = chunks
+
+    def complete(  # pyright: ignore [reportIncompatibleMethodOverride]
+        self,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> ChatCompletions | Iterator[StreamingChatCompletionsUpdate]:
+        name = requested_tool(kwargs, lambda tool: tool.function.name)
+        if kwargs.get("stream"):
+            return stream(_updates(name, self.chunks))
+        return _completion(name)
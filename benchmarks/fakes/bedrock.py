@@ -0,0 +1,73 @@
+"""A fake Bedrock runtime client."""
+
+import json
+from functools import cache
+from typing import Any
+
+from . import BOOK_ARGS, TEXT, split, stream
+
+
+@cache
+def _bedrock_response(tool_name: str | None) -> dict[str, Any]:
+    content: dict[str, Any] = {"text": TEXT}
+    if tool_name:
+        content = {
+            "toolUse": {"toolUseId": "tooluse_0", "name": tool_name, "input": BOOK_ARGS}
+        }
+    return {
+        "ResponseMetadata": {"RequestId": "id", "HTTPStatusCode": 200},
+        "output": {"message": {"role": "assistant", "content": [content]}},
+        "stopReason": "tool_use" if tool_name else "end_turn",
+        "usage": {"inputTokens": 10, "outputTokens": 50, "totalTokens": 60},
+        "metrics": {"latencyMs": 0},
+    }
+
+
+@cache
+def _bedrock_events(tool_name: str | None, chunks: int) -> list[dict[str, Any]]:
+    if tool_name:
+        start = {"start": {"toolUse": {"toolUseId": "tooluse_0", "name": tool_name}}}
+        deltas = [
+            {"toolUse": {"input": piece}}
+            for piece in split(json.dumps(BOOK_ARGS), chunks)
+        ]
+    else:
+        start = None
+        deltas = [{"text": piece} for piece in split(TEXT, chunks)]
+    return [
+        {"messageStart": {"role": "assistant"}},
+        *([{"contentBlockStart": start | {"contentBlockIndex": 0}}] if start else []),
+        *(
+            {"contentBlockDelta": {"delta": delta, "contentBlockIndex": 0}}
+            for delta in deltas
+        ),
+        {"contentBlockStop": {"contentBlockIndex": 0}},
+        {"messageStop": {"stopReason": "tool_use" if tool_name else "end_turn"}},
+        {
+            "metadata": {
+                "usage": {"inputTokens": 10, "outputTokens": 50, "totalTokens": 60},
+                "metrics": {"latencyMs": 0},
+            }
+        },
+    ]
+
+
+class FakeBedrockRuntimeClient:
+    """A Bedrock runtime client returning canned Converse responses."""
+
+    def __init__(self, chunks: int = 50) -> None:
+        self.chunks = chunks
+
+    @staticmethod
+    def _tool_name(kwargs: dict[str, Any]) -> str | None:
+        tools = kwargs.get("toolConfig", {}).get("tools")
+        return tools[0]["toolSpec"]["name"] if tools else None
+
+    def converse(self, **kwargs: Any) -> dict[str, Any]:  # noqa: ANN401
+        return _bedrock_response(self._tool_name(kwargs))
+
+    def converse_stream(self, **kwargs: Any) -> dict[str, Any]:  # noqa: ANN401
+        return {
+            "ResponseMetadata": {"RequestId": "id", "HTTPStatusCode": 200},
+            "stream": stream(_bedrock_events(self._tool_name(kwargs), self.chunks)),
+        }
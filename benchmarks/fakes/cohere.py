@@ -0,0 +1,73 @@
+"""A fake Cohere `Client`."""
+
+from collections.abc import Iterator
+from functools import cache
+from typing import Any
+
+from cohere import Client
+from cohere.types import (
+    ApiMeta,
+    ApiMetaBilledUnits,
+    NonStreamedChatResponse,
+    StreamedChatResponse,
+    StreamEndStreamedChatResponse,
+    StreamStartStreamedChatResponse,
+    TextGenerationStreamedChatResponse,
+    ToolCall,
+    ToolCallsGenerationStreamedChatResponse,
+)
+
+from . import BOOK_ARGS, TEXT, requested_tool, split, stream
+
+
+@cache
+def _response(tool_name: str | None) -> NonStreamedChatResponse:
+    tool_calls = [ToolCall(name=tool_name, parameters=BOOK_ARGS)] if tool_name else None
+    return NonStreamedChatResponse(
+        generation_id="id",
+        text="" if tool_name else TEXT,
+        tool_calls=tool_calls,
+        finish_reason="COMPLETE",
+        meta=ApiMeta(
+            billed_units=ApiMetaBilledUnits(input_tokens=10, output_tokens=50)
+        ),
+    )
+
+
+@cache
+def _events(tool_name: str | None, chunks: int) -> list[StreamedChatResponse]:
+    # Cohere streams the text and sends the tool calls whole once they are generated
+    response = _response(tool_name)
+    return [
+        StreamStartStreamedChatResponse(generation_id="id"),
+        *(
+            TextGenerationStreamedChatResponse(text=piece)
+            for piece in split(response.text, chunks)
+        ),
+        *(
+            [ToolCallsGenerationStreamedChatResponse(tool_calls=response.tool_calls)]
+            if response.tool_calls
+            else []
+        ),
+        StreamEndStreamedChatResponse(finish_reason="COMPLETE", response=response),
+    ]
+
+
+class FakeCohere(Client):
+    """A Cohere `Client` returning canned chat responses."""
+
+    def __init__(self, chunks: int = 50) -> None:
+        self.chunks = chunks
+
+    def chat(  # pyright: ignore [reportIncompatibleMethodOverride]
+        self,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> NonStreamedChatResponse:
+        return _response(requested_tool(kwargs, lambda tool: tool.name))
+
+    def chat_stream(  # pyright: ignore [reportIncompatibleMethodOverride]
+        self,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> Iterator[StreamedChatResponse]:
+        name = requested_tool(kwargs, lambda tool: tool.name)
+        return stream(_events(name, self.chunks))
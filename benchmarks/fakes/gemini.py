@@ -0,0 +1,78 @@
+"""A fake Gemini `GenerativeModel`."""
+
+import json
+from collections.abc import Iterator
+from functools import cache
+from typing import Any
+
+from google.ai.generativelanguage import (
+    Candidate,
+    Content,
+    FunctionCall,
+    GenerateContentResponse,
+    Part,
+)
+from google.generativeai import GenerativeModel
+from google.generativeai.types import (
+    GenerateContentResponse as GenerateContentResponseType,
+)
+
+from . import BOOK_ARGS, TEXT, requested_tool, split, stream
+
+_USAGE = {
+    "prompt_token_count": 10,
+    "candidates_token_count": 50,
+    "total_token_count": 60,
+}
+
+
+def _generate_content_response(
+    part: Part, usage: dict[str, int] | None = None
+) -> GenerateContentResponseType:
+    return GenerateContentResponseType.from_response(
+        GenerateContentResponse(
+            candidates=[
+                Candidate(finish_reason=1, content=Content(parts=[part], role="model"))
+            ],
+            usage_metadata=usage,
+        )
+    )
+
+
+@cache
+def _response(tool_name: str | None, json_mode: bool) -> GenerateContentResponseType:
+    if tool_name:
+        part = Part(function_call=FunctionCall(name=tool_name, args=BOOK_ARGS))
+    else:
+        part = Part(text=json.dumps(BOOK_ARGS) if json_mode else TEXT)
+    return _generate_content_response(part, _USAGE)
+
+
+@cache
+def _chunks(json_mode: bool, chunks: int) -> list[GenerateContentResponseType]:
+    # Mirascope doesn't stream Gemini tools, so streams always answer with text
+    pieces = split(json.dumps(BOOK_ARGS) if json_mode else TEXT, chunks)
+    return [
+        _generate_content_response(
+            Part(text=piece), _USAGE if index == len(pieces) - 1 else None
+        )
+        for index, piece in enumerate(pieces)
+    ]
+
+
+class FakeGenerativeModel(GenerativeModel):
+    """A `GenerativeModel` returning canned content."""
+
+    def __init__(self, chunks: int = 50) -> None:
+        self.chunks = chunks
+
+    def generate_content(  # pyright: ignore [reportIncompatibleMethodOverride]
+        self,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> GenerateContentResponseType | Iterator[GenerateContentResponseType]:
+        generation_config = kwargs.get("generation_config") or {}
+        json_mode = generation_config.get("response_mime_type") == "application/json"
+        if kwargs.get("stream"):
+            return stream(_chunks(json_mode, self.chunks))
+        name = requested_tool(kwargs, lambda tool: tool.function_declarations[0].name)
+        return _response(name, json_mode)
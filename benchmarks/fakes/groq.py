@@ -0,0 +1,50 @@
+"""A fake `Groq` client."""
+
+from collections.abc import Iterator
+from functools import cache
+from typing import Any
+
+from groq import Groq
+from groq.types.chat import ChatCompletion, ChatCompletionChunk
+
+from . import requested_tool, stream
+from .openai import chunk_payloads, completion_payload
+
+
+@cache
+def _completion(tool_name: str | None) -> ChatCompletion:
+    return ChatCompletion.model_validate(completion_payload(tool_name))
+
+
+@cache
+def _chunks(tool_name: str | None, chunks: int) -> list[ChatCompletionChunk]:
+    return [
+        ChatCompletionChunk.model_validate(payload)
+        for payload in chunk_payloads(tool_name, chunks)
+    ]
+
+
+class _FakeCompletions:
+    def __init__(self, chunks: int) -> None:
+        self.chunks = chunks
+
+    def create(
+        self,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> ChatCompletion | Iterator[ChatCompletionChunk]:
+        name = requested_tool(kwargs, lambda tool: tool["function"]["name"])
+        if kwargs.get("stream"):
+            return stream(_chunks(name, self.chunks))
+        return _completion(name)
+
+
+class _FakeChat:
+    def __init__(self, chunks: int) -> None:
+        self.completions = _FakeCompletions(chunks)
+
+
+class FakeGroq(Groq):
+    """A `Groq` client returning canned chat completions."""
+
+    def __init__(self, chunks: int = 50) -> None:
+        self.chat = _FakeChat(chunks)  # pyright: ignore [reportAttributeAccessIssue]
@@ -0,0 +1,100 @@
+"""A fake `MistralClient`."""
+
+import json
+from collections.abc import Iterator
+from functools import cache
+from typing import Any
+
+from mistralai.client import MistralClient
+from mistralai.models.chat_completion import (
+    ChatCompletionResponse,
+    ChatCompletionStreamResponse,
+)
+
+from . import BOOK_ARGS, MODEL, TEXT, requested_tool, split, stream
+from .openai import USAGE
+
+
+@cache
+def _response(tool_name: str | None) -> ChatCompletionResponse:
+    message: dict[str, Any] = {"role": "assistant", "content": TEXT}
+    if tool_name:
+        message = {
+            "role": "assistant",
+            "content": "",
+            "tool_calls": [
+                {
+                    "id": "call_0",
+                    "type": "function",
+                    "function": {"name": tool_name, "arguments": json.dumps(BOOK_ARGS)},
+                }
+            ],
+        }
+    return ChatCompletionResponse.model_validate(
+        {
+            "id": "id",
+            "object": "chat.completion",
+            "created": 0,
+            "model": MODEL,
+            "choices": [{"index": 0, "message": message, "finish_reason": "stop"}],
+            "usage": USAGE,
+        }
+    )
+
+
+@cache
+def _chunks(tool_name: str | None, chunks: int) -> list[ChatCompletionStreamResponse]:
+    def chunk(delta: dict[str, Any], finish_reason: str | None = None) -> dict:
+        return {
+            "id": "id",
+            "object": "chat.completion.chunk",
+            "created": 0,
+            "model": MODEL,
+            "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}],
+        }
+
+    if tool_name:
+        # Mistral starts a new tool call on every id other than its `"null"` default
+        deltas = [
+            {
+                "tool_calls": [
+                    {
+                        "id": "call_0" if index == 0 else "null",
+                        "function": {"name": tool_name, "arguments": piece},
+                    }
+                ]
+            }
+            for index, piece in enumerate(
+                ["", *split(json.dumps(BOOK_ARGS), chunks - 1)]
+            )
+        ]
+    else:
+        deltas = [
+            {"role": "assistant", "content": piece} for piece in split(TEXT, chunks)
+        ]
+    payloads = [chunk(delta) for delta in deltas]
+    payloads.append(chunk({"content": ""}, "stop"))
+    payloads[-1]["usage"] = USAGE
+    return [
+        ChatCompletionStreamResponse.model_validate(payload) for payload in payloads
+    ]
+
+
+class FakeMistralClient(MistralClient):
+    """A `MistralClient` returning canned chat completions."""
+
+    def __init__(self, chunks: int = 50) -> None:
+        self.chunks = chunks
+
+    def chat(  # pyright: ignore [reportIncompatibleMethodOverride]
+        self,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> ChatCompletionResponse:
+        return _response(requested_tool(kwargs, lambda tool: tool["function"]["name"]))
+
+    def chat_stream(  # pyright: ignore [reportIncompatibleMethodOverride]
+        self,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> Iterator[ChatCompletionStreamResponse]:
+        name = requested_tool(kwargs, lambda tool: tool["function"]["name"])
+        return stream(_chunks(name, self.chunks))
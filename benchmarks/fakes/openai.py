@@ -0,0 +1,122 @@
+"""A fake `OpenAI` client.
+
+The payload builders are shared with the providers whose APIs follow OpenAI's chat
+completions format (Azure and Groq).
+"""
+
+import json
+from collections.abc import Iterator
+from functools import cache
+from typing import Any
+
+from openai import OpenAI
+from openai.types.chat import ChatCompletion, ChatCompletionChunk
+
+from . import BOOK_ARGS, MODEL, TEXT, requested_tool, split, stream
+
+USAGE = {"prompt_tokens": 10, "completion_tokens": 50, "total_tokens": 60}
+
+
+def completion_payload(tool_name: str | None) -> dict[str, Any]:
+    """Returns a chat completion payload answering with `TEXT` or a tool call."""
+    message: dict[str, Any] = {"role": "assistant", "content": TEXT}
+    if tool_name:
+        message = {
+            "role": "assistant",
+            "content": None,
+            "tool_calls": [
+                {
+                    "id": "call_0",
+                    "type": "function",
+                    "function": {"name": tool_name, "arguments": json.dumps(BOOK_ARGS)},
+                }
+            ],
+        }
+    return {
+        "id": "id",
+        "created": 0,
+        "model": MODEL,
+        "object": "chat.completion",
+        "choices": [{"index": 0, "finish_reason": "stop", "message": message}],
+        "usage": USAGE,
+    }
+
+
+def chunk_payloads(tool_name: str | None, chunks: int) -> list[dict[str, Any]]:
+    """Returns the chat completion chunk payloads streaming `completion_payload`.
+
+    Only the last chunk, which holds no delta, includes the usage.
+    """
+
+    def chunk(delta: dict[str, Any], finish_reason: str | None = None) -> dict:
+        return {
+            "id": "id",
+            "created": 0,
+            "model": MODEL,
+            "object": "chat.completion.chunk",
+            "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}],
+        }
+
+    if tool_name:
+        deltas = [
+            {
+                "tool_calls": [
+                    {
+                        "index": 0,
+                        "id": "call_0",
+                        "type": "function",
+                        "function": {"name": tool_name, "arguments": ""},
+                    }
+                ]
+            }
+        ] + [
+            {"tool_calls": [{"index": 0, "function": {"arguments": piece}}]}
+            for piece in split(json.dumps(BOOK_ARGS), chunks - 1)
+        ]
+    else:
+        deltas = [
+            {"role": "assistant", "content": piece} for piece in split(TEXT, chunks)
+        ]
+    payloads = [chunk(delta) for delta in deltas]
+    payloads.append(chunk({}, "stop"))
+    payloads[-1]["usage"] = USAGE
+    return payloads
+
+
+@cache
+def _completion(tool_name: str | None) -> ChatCompletion:
+    return ChatCompletion.model_validate(completion_payload(tool_name))
+
+
+@cache
+def _chunks(tool_name: str | None, chunks: int) -> list[ChatCompletionChunk]:
+    return [
+        ChatCompletionChunk.model_validate(payload)
+        for payload in chunk_payloads(tool_name, chunks)
+    ]
+
+
+class _FakeCompletions:
+    def __init__(self, chunks: int) -> None:
+        self.chunks = chunks
+
+    def create(
+        self,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> ChatCompletion | Iterator[ChatCompletionChunk]:
+        name = requested_tool(kwargs, lambda tool: tool["function"]["name"])
+        if kwargs.get("stream"):
+            return stream(_chunks(name, self.chunks))
+        return _completion(name)
+
+
+class _FakeChat:
+    def __init__(self, chunks: int) -> None:
+        self.completions = _FakeCompletions(chunks)
+
+
+class FakeOpenAI(OpenAI):
+    """An `OpenAI` client returning canned chat completions."""
+
+    def __init__(self, chunks: int = 50) -> None:
+        self.chat = _FakeChat(chunks)  # pyright: ignore [reportAttributeAccessIssue]
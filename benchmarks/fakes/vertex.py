@@ -0,0 +1,74 @@
+"""A fake Vertex AI `GenerativeModel`."""
+
+import json
+from collections.abc import Iterator
+from functools import cache
+from typing import Any
+
+from vertexai.generative_models import GenerationResponse, GenerativeModel
+
+from . import BOOK_ARGS, TEXT, requested_tool, split, stream
+
+_USAGE = {
+    "prompt_token_count": 10,
+    "candidates_token_count": 50,
+    "total_token_count": 60,
+}
+
+
+def _generation_response(
+    part: dict[str, Any], usage: dict[str, int] | None = None
+) -> GenerationResponse:
+    response: dict[str, Any] = {
+        "candidates": [
+            {"finish_reason": 1, "content": {"role": "model", "parts": [part]}}
+        ]
+    }
+    if usage:
+        response["usage_metadata"] = usage
+    return GenerationResponse.from_dict(response)
+
+
+@cache
+def _response(tool_name: str | None, json_mode: bool) -> GenerationResponse:
+    if tool_name:
+        part = {"function_call": {"name": tool_name, "args": BOOK_ARGS}}
+    else:
+        part = {"text": json.dumps(BOOK_ARGS) if json_mode else TEXT}
+    return _generation_response(part, _USAGE)
+
+
+@cache
+def _chunks(json_mode: bool, chunks: int) -> list[GenerationResponse]:
+    # Mirascope doesn't stream Vertex tools, so streams always answer with text
+    pieces = split(json.dumps(BOOK_ARGS) if json_mode else TEXT, chunks)
+    return [
+        _generation_response(
+            {"text": piece}, _USAGE if index == len(pieces) - 1 else None
+        )
+        for index, piece in enumerate(pieces)
+    ]
+
+
+class FakeGenerativeModel(GenerativeModel):
+    """A `GenerativeModel` returning canned content."""
+
+    def __init__(self, chunks: int = 50) -> None:
+        self.chunks = chunks
+
+    def generate_content(  # pyright: ignore [reportIncompatibleMethodOverride]
+        self,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> GenerationResponse | Iterator[GenerationResponse]:
+        generation_config = kwargs.get("generation_config")
+        json_mode = (
+            generation_config is not None
+            and generation_config.to_dict().get("response_mime_type")
+            == "application/json"
+        )
+        if kwargs.get("stream"):
+            return stream(_chunks(json_mode, self.chunks))
+        name = requested_tool(
+            kwargs, lambda tool: tool.to_dict()["function_declarations"][0]["name"]
+        )
+        return _response(name, json_mode)
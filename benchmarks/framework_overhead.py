@@ -0,0 +1,205 @@
+"""Benchmarks Mirascope's own overhead for each provider and call type.
+
+Every provider runs against a zero-latency fake client from `benchmarks.fakes`, so
+the measurements only cover Mirascope's work: `_setup_call`, `convert_message_params`,
+`handle_stream`, response construction, tool and response model parsing, etc. Only the
+SDKs of the selected providers are imported. LiteLLM is not benchmarked separately as
+it runs through the OpenAI code paths.
+
+Cohere, Gemini, and Vertex don't stream tools, so their `stream_tools` scenario streams
+text and Gemini and Vertex stream structured outputs in JSON mode.
+
+For each provider and scenario this reports:
+- `us/op`: the best mean time per operation across the repeats.
+- `peak KiB/op`: the peak traced memory allocated during a single operation.
+- `chunks/s`: the number of provider chunks processed per second on one core for
+  streaming scenarios.
+
+Usage:
+    python -m benchmarks.framework_overhead [--providers openai anthropic]
+        [--scenarios call stream] [--number 1000] [--repeat 5] [--chunks 50]
+        [--validate-responses] [--json results.json]
+
+Pass `--validate-responses` to validate every call response like before the trusted
+construction path (`MIRASCOPE_VALIDATE_CALL_RESPONSES=ENABLED`) and compare the two
+runs to measure what skipping the validation saves.
+"""
+
+import argparse
+import json
+import os
+import timeit
+import tracemalloc
+from collections.abc import Callable
+from importlib import import_module
+from typing import Any, NamedTuple
+
+from pydantic import BaseModel
+
+from .fakes import streamed_chunks
+
+
+class Book(BaseModel):
+    """A book."""
+
+    title: str
+    author: str
+
+
+def format_book(title: str, author: str) -> str:
+    """Returns the formatted book.
+
+    Args:
+        title: The title of the book.
+        author: The author of the book.
+    """
+    return f"{title} by {author}"
+
+
+class Provider(NamedTuple):
+    model: str
+    fake_client: str
+    json_mode_stream: bool = False
+
+
+# Each provider's call decorator is `mirascope.core.<name>.call` and its fake client is
+# `benchmarks.fakes.<name>.<fake_client>`, both imported only once the provider runs.
+PROVIDERS = {
+    "openai": Provider("gpt-4o-mini", "FakeOpenAI"),
+    "anthropic": Provider("claude-3-5-sonnet-latest", "FakeAnthropic"),
+    "azure": Provider("gpt-4o-mini", "FakeChatCompletionsClient"),
+    "bedrock": Provider(
+        "anthropic.claude-3-haiku-20240307-v1:0", "FakeBedrockRuntimeClient"
+    ),
+    "cohere": Provider("command-r-plus", "FakeCohere"),
+    "gemini": Provider("gemini-1.5-flash", "FakeGenerativeModel", True),
+    "groq": Provider("llama-3.1-8b-instant", "FakeGroq"),
+    "mistral": Provider("mistral-large-latest", "FakeMistralClient"),
+    "vertex": Provider("gemini-1.5-flash", "FakeGenerativeModel", True),
+}
+
+
+def _scenarios(name: str, chunks: int) -> dict[str, Callable[[], object]]:
+    provider = PROVIDERS[name]
+    call = import_module(f"mirascope.core.{name}").call
+    fakes = import_module(f".fakes.{name}", __package__)
+    model, client = provider.model, getattr(fakes, provider.fake_client)(chunks)
+
+    def prompt(genre: str) -> str:
+        return f"Recommend a {genre} book."
+
+    text_call = call(model, client=client)(prompt)
+    stream_call = call(model, client=client, stream=True)(prompt)
+    tool_call = call(model, client=client, tools=[format_book])(prompt)
+    tool_stream_call = call(model, client=client, tools=[format_book], stream=True)(
+        prompt
+    )
+    extract_call = call(model, client=client, response_model=Book)(prompt)
+    structured_stream_call = call(
+        model,
+        client=client,
+        response_model=Book,
+        stream=True,
+        json_mode=provider.json_mode_stream,
+    )(prompt)
+
+    def consume_stream() -> None:
+        for _ in stream_call("fantasy"):
+            pass
+
+    def call_tool() -> None:
+        tool_call("fantasy").tool.call()
+
+    def consume_tool_stream() -> None:
+        for _, tool in tool_stream_call("fantasy"):
+            if tool:
+                tool.call()
+
+    def consume_structured_stream() -> None:
+        for _ in structured_stream_call("fantasy"):
+            pass
+
+    return {
+        "call": lambda: text_call("fantasy"),
+        "stream": consume_stream,
+        "tools": call_tool,
+        "stream_tools": consume_tool_stream,
+        "extract": lambda: extract_call("fantasy"),
+        "structured_stream": consume_structured_stream,
+    }
+
+
+def _peak_kib(op: Callable[[], object]) -> float:
+    tracemalloc.start()
+    try:
+        op()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak / 1024
+
+
+def run(
+    providers: list[str],
+    scenarios: list[str] | None,
+    number: int,
+    repeat: int,
+    chunks: int,
+) -> list[dict[str, Any]]:
+    """Runs the benchmarks and returns one result row per provider and scenario."""
+    results = []
+    for provider_name in providers:
+        for scenario_name, op in _scenarios(provider_name, chunks).items():
+            if scenarios and scenario_name not in scenarios:
+                continue
+            # Warm up the template, tool, and model caches
+            start_chunks = streamed_chunks()
+            op()
+            op_chunks = streamed_chunks() - start_chunks
+            seconds = min(timeit.repeat(op, number=number, repeat=repeat)) / number
+            results.append(
+                {
+                    "provider": provider_name,
+                    "scenario": scenario_name,
+                    "us_per_op": seconds * 1e6,
+                    "peak_kib_per_op": _peak_kib(op),
+                    "chunks_per_s": op_chunks / seconds if op_chunks else None,
+                }
+            )
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Benchmarks Mirascope's own overhead for each provider."
+    )
+    parser.add_argument("--providers", nargs="+", default=list(PROVIDERS))
+    parser.add_argument("--scenarios", nargs="+", default=None)
+    parser.add_argument("--number", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--chunks", type=int, default=50)
+    parser.add_argument("--validate-responses", action="store_true")
+    parser.add_argument("--json", help="Also write the results to this JSON file.")
+    args = parser.parse_args()
+    if args.validate_responses:
+        os.environ["MIRASCOPE_VALIDATE_CALL_RESPONSES"] = "ENABLED"
+
+    results = run(args.providers, args.scenarios, args.number, args.repeat, args.chunks)
+    print(
+        f"{'provider':<10} {'scenario':<18} {'us/op':>10} {'peak KiB/op':>12} "
+        f"{'chunks/s':>12}"
+    )
+    for result in results:
+        chunks_per_s = result["chunks_per_s"]
+        print(
+            f"{result['provider']:<10} {result['scenario']:<18} "
+            f"{result['us_per_op']:>10.1f} {result['peak_kib_per_op']:>12.1f} "
+            f"{f'{chunks_per_s:,.0f}' if chunks_per_s else '-':>12}"
+        )
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
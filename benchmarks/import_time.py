@@ -0,0 +1,112 @@
+"""Benchmarks the time it takes to import Mirascope modules.
+
+Each import runs in a fresh interpreter with `python -X importtime`, so nothing is
+already cached in `sys.modules`. This reports, for each module:
+- `ms`: the best cumulative import time across the repeats.
+- `modules`: the number of modules the import loaded.
+- the slowest top-level packages it pulled in, by cumulative time.
+
+Usage:
+    python -m benchmarks.import_time [--modules mirascope.core] [--repeat 5]
+        [--top 5] [--json results.json]
+"""
+
+import argparse
+import json
+import re
+import subprocess
+import sys
+from typing import Any, NamedTuple
+
+DEFAULT_MODULES = [
+    "mirascope",
+    "mirascope.core",
+    "mirascope.core.openai",
+    "mirascope.core.anthropic",
+]
+
+_IMPORT_TIME_LINE = re.compile(r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|( *)(\S+)")
+
+
+class ImportTime(NamedTuple):
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def measure(module: str) -> list[ImportTime]:
+    """Imports `module` in a new interpreter and returns the timing of every import."""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return [
+        ImportTime(
+            module=match[4],
+            self_us=int(match[1]),
+            cumulative_us=int(match[2]),
+            depth=len(match[3]) // 2,
+        )
+        for line in completed.stderr.splitlines()
+        if (match := _IMPORT_TIME_LINE.match(line))
+    ]
+
+
+def run(modules: list[str], repeat: int, top: int) -> list[dict[str, Any]]:
+    """Runs the benchmarks and returns one result row per module."""
+    results = []
+    for module in modules:
+        best: list[ImportTime] | None = None
+        for _ in range(repeat):
+            import_times = measure(module)
+            if best is None or import_times[-1].cumulative_us < best[-1].cumulative_us:
+                best = import_times
+        assert best
+        packages: dict[str, int] = {}
+        for import_time in best:
+            package = import_time.module.split(".")[0]
+            if package != module.split(".")[0] and import_time.depth:
+                packages[package] = max(
+                    packages.get(package, 0), import_time.cumulative_us
+                )
+        results.append(
+            {
+                "module": module,
+                "ms": best[-1].cumulative_us / 1000,
+                "modules": len(best),
+                "slowest": sorted(packages.items(), key=lambda item: -item[1])[:top],
+            }
+        )
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Benchmarks the time it takes to import Mirascope modules."
+    )
+    parser.add_argument("--modules", nargs="+", default=DEFAULT_MODULES)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--top", type=int, default=5)
+    parser.add_argument("--json", help="Also write the results to this JSON file.")
+    args = parser.parse_args()
+
+    results = run(args.modules, args.repeat, args.top)
+    print(f"{'module':<28} {'ms':>9} {'modules':>8}  slowest packages")
+    for result in results:
+        slowest = ", ".join(
+            f"{package} ({us / 1000:.0f} ms)" for package, us in result["slowest"]
+        )
+        print(
+            f"{result['module']:<28} {result['ms']:>9.1f} {result['modules']:>8}  "
+            f"{slowest}"
+        )
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -5,6 +5,7 @@ import base64
 import inspect
 import json
 import os
+from collections import defaultdict
 from collections.abc import Callable
 from functools import lru_cache
 from io import BytesIO
@@ -17,7 +18,6 @@ from typing import (
 )
 
 import websockets
-from black.trans import defaultdict
 from pydantic import BaseModel
 from pydub import AudioSegment
 from typing_extensions import NotRequired, overload
@@ -3,22 +3,33 @@
 from .base import (
     BaseChunker,
     BaseEmbedder,
+    BaseEmbeddingCache,
     BaseEmbeddingParams,
     BaseEmbeddingResponse,
     BaseQueryResults,
     BaseVectorStore,
     BaseVectorStoreParams,
     Document,
+    EmbeddingCacheStats,
+    InMemoryEmbeddingCache,
+    SQLiteEmbeddingCache,
+    SyncResult,
+    TextChunker,
 )
 
 __all__ = [
     "BaseChunker",
     "TextChunker",
     "BaseEmbedder",
+    "BaseEmbeddingCache",
     "BaseEmbeddingParams",
     "BaseEmbeddingResponse",
     "BaseQueryResults",
     "BaseVectorStoreParams",
     "BaseVectorStore",
     "Document",
+    "EmbeddingCacheStats",
+    "InMemoryEmbeddingCache",
+    "SQLiteEmbeddingCache",
+    "SyncResult",
 ]
@@ -3,20 +3,31 @@
 from .chunkers import BaseChunker, TextChunker
 from .document import Document
 from .embedders import BaseEmbedder
+from .embedding_cache import (
+    BaseEmbeddingCache,
+    EmbeddingCacheStats,
+    InMemoryEmbeddingCache,
+    SQLiteEmbeddingCache,
+)
 from .embedding_params import BaseEmbeddingParams
 from .embedding_response import BaseEmbeddingResponse
 from .query_results import BaseQueryResults
 from .vectorstore_params import BaseVectorStoreParams
-from .vectorstores import BaseVectorStore
+from .vectorstores import BaseVectorStore, SyncResult
 
 __all__ = [
     "BaseChunker",
     "TextChunker",
     "BaseEmbedder",
+    "BaseEmbeddingCache",
     "BaseEmbeddingParams",
     "BaseEmbeddingResponse",
     "BaseQueryResults",
     "BaseVectorStoreParams",
     "BaseVectorStore",
     "Document",
+    "EmbeddingCacheStats",
+    "InMemoryEmbeddingCache",
+    "SQLiteEmbeddingCache",
+    "SyncResult",
 ]
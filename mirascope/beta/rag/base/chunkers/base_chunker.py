@@ -1,11 +1,15 @@
 """Chunkers for the RAG module."""
 
+import uuid
 from abc import ABC, abstractmethod
 
 from pydantic import BaseModel
 
 from ..document import Document
 
+CHUNK_ID_NAMESPACE = uuid.UUID("6f1c1f0e-4c3a-5b8e-9a57-2d7f5c1e0b3d")
+"""The namespace of the UUIDv5 chunk ids generated by `BaseChunker.chunk_id`."""
+
 
 class BaseChunker(BaseModel, ABC):
     """Base class for chunkers.
@@ -13,6 +17,8 @@ class BaseChunker(BaseModel, ABC):
     Example:
 
     ```python
+    import uuid
+
     from mirascope.rag import BaseChunker, Document
 
 
@@ -33,5 +39,38 @@ class BaseChunker(BaseModel, ABC):
 
     @abstractmethod
     def chunk(self, text: str) -> list[Document]:
-        """Returns a Document that contains an id, text, and optionally metadata."""
+        """Returns a Document that contains an id, text, and optionally metadata.
+
+        The ids must be unique across calls, e.g. `uuid4`s, so that the chunks of
+        different texts added to the same vectorstore never overwrite each other. Use
+        `chunk_source` for ids that are stable across re-chunking.
+        """
         ...
+
+    def chunk_source(self, source_id: str, text: str) -> list[Document]:
+        """Chunks the `text` of the source `source_id` into documents with stable ids.
+
+        Each document's id is derived from the source, the chunk's position, and its
+        text, so re-chunking an unchanged text yields the same ids and vectorstores can
+        tell which chunks they already store. The `source_id` is added to the metadata.
+        """
+        return [
+            document.model_copy(
+                update={
+                    "id": self.chunk_id(document.text, position, source_id),
+                    "metadata": (document.metadata or {}) | {"source_id": source_id},
+                }
+            )
+            for position, document in enumerate(self.chunk(text))
+        ]
+
+    @staticmethod
+    def chunk_id(text: str, position: int, source_id: str) -> str:
+        """Returns the deterministic id of a chunk as a UUID string.
+
+        Args:
+            text: The text of the chunk.
+            position: The index of the chunk among the chunks of its source.
+            source_id: The id of the source the chunk was split from.
+        """
+        return str(uuid.uuid5(CHUNK_ID_NAMESPACE, f"{source_id}\0{position}\0{text}"))
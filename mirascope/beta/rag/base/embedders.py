@@ -1,19 +1,45 @@
 """Embedders for the RAG module."""
 
-from abc import ABC, abstractmethod
+import asyncio
+import time
+from abc import ABC
 from typing import ClassVar, Generic, TypeVar
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
+
+from mirascope.core.base import BatchResult, abatch, batch
 
 from .config import BaseConfig
+from .embedding_cache import BaseEmbeddingCache
 from .embedding_params import BaseEmbeddingParams
 from .embedding_response import BaseEmbeddingResponse
 
 BaseEmbeddingT = TypeVar("BaseEmbeddingT", bound=BaseEmbeddingResponse)
 
+_RETRYABLE_STATUS_CODES = frozenset({408, 409, 429})
+
 
 class BaseEmbedder(BaseModel, Generic[BaseEmbeddingT], ABC):
-    """The base class abstract interface for interacting with LLM embeddings."""
+    """The base class abstract interface for interacting with LLM embeddings.
+
+    `embed` and `embed_async` split the inputs into batches that fit a single request,
+    send at most `max_workers` batches at once on a client shared across calls, and
+    retry only the batches that failed with a transient error (see `_is_retryable`)
+    before merging the responses in input order. Subclasses implement `_embed` and
+    `_merge_batch_embeddings` to use this pipeline, or override `embed` and
+    `embed_async` directly.
+
+    With a `cache`, only the inputs whose embeddings are not cached yet (for the same
+    provider, model, and dimensions) are sent to the provider.
+
+    Attributes:
+        embed_batch_size: The maximum number of inputs per request, if any.
+        max_batch_tokens: The maximum estimated number of tokens per request, if any.
+        max_workers: The maximum number of requests in flight at once.
+        max_retries: The number of times a failed batch is retried.
+        retry_backoff: The seconds to wait before the first retry, doubling after each.
+        cache: The cache of previously computed embeddings, if any.
+    """
 
     api_key: ClassVar[str | None] = None
     base_url: ClassVar[str | None] = None
@@ -21,15 +47,249 @@ class BaseEmbedder(BaseModel, Generic[BaseEmbeddingT], ABC):
         model="text-embedding-ada-002"
     )
     dimensions: int | None = None
+    embed_batch_size: int | None = None
+    max_batch_tokens: int | None = None
+    max_workers: int = 8
+    max_retries: int = 2
+    retry_backoff: float = 1.0
+    cache: BaseEmbeddingCache | None = None
     configuration: ClassVar[BaseConfig] = BaseConfig(llm_ops=[], client_wrappers=[])
     _provider: ClassVar[str] = "base"
 
-    @abstractmethod
-    def embed(self, input: list[str]) -> BaseEmbeddingT:
-        """A call to the embedder with a single input"""
-        ...
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    def embed(self, inputs: list[str]) -> BaseEmbeddingT:
+        """Call the embedder with multiple inputs"""
+        if (cache := self._active_cache()) is None:
+            return self._embed_batches(inputs)
+        keys, cached, misses = self._lookup_cache(cache, inputs)
+        response = self._embed_batches(list(misses.values())) if misses else None
+        return self._cached_response(cache, inputs, keys, cached, misses, response)
+
+    async def embed_async(self, inputs: list[str]) -> BaseEmbeddingT:
+        """Asynchronously call the embedder with multiple inputs"""
+        if (cache := self._active_cache()) is None:
+            return await self._embed_batches_async(inputs)
+        keys, cached, misses = self._lookup_cache(cache, inputs)
+        response = (
+            await self._embed_batches_async(list(misses.values())) if misses else None
+        )
+        return self._cached_response(cache, inputs, keys, cached, misses, response)
+
+    ############################## PRIVATE METHODS ###################################
+
+    def _embed_batches(self, inputs: list[str]) -> BaseEmbeddingT:
+        """Embeds `inputs` in batches, retrying the failed ones."""
+        if not inputs:
+            return self._response_from_embeddings([], [], None)
+        batches = self._batch_inputs(inputs)
+        responses: dict[int, BaseEmbeddingT] = {}
+        pending = list(range(len(batches)))
+        for attempt in range(self.max_retries + 1):
+            if attempt:
+                time.sleep(self.retry_backoff * 2 ** (attempt - 1))
+            results = batch(
+                self._embed,
+                [{"inputs": batches[index]} for index in pending],
+                max_concurrency=self.max_workers,
+            )
+            failures = self._collect_batch_results(pending, results, responses)
+            if not failures:
+                break
+            self._raise_unless_retryable(failures, attempt)
+            pending = list(failures)
+        return self._merge_batch_embeddings(
+            [responses[index] for index in range(len(batches))]
+        )
+
+    async def _embed_batches_async(self, inputs: list[str]) -> BaseEmbeddingT:
+        """Asynchronously embeds `inputs` in batches, retrying the failed ones."""
+        if not inputs:
+            return self._response_from_embeddings([], [], None)
+        batches = self._batch_inputs(inputs)
+        responses: dict[int, BaseEmbeddingT] = {}
+        pending = list(range(len(batches)))
+        for attempt in range(self.max_retries + 1):
+            if attempt:
+                await asyncio.sleep(self.retry_backoff * 2 ** (attempt - 1))
+            results = await abatch(
+                self._embed_async,
+                [{"inputs": batches[index]} for index in pending],
+                max_concurrency=self.max_workers,
+            )
+            failures = self._collect_batch_results(pending, results, responses)
+            if not failures:
+                break
+            self._raise_unless_retryable(failures, attempt)
+            pending = list(failures)
+        return self._merge_batch_embeddings(
+            [responses[index] for index in range(len(batches))]
+        )
+
+    def _embed(self, inputs: list[str]) -> BaseEmbeddingT:
+        """Should call the embedder with a single batch of inputs."""
+        raise NotImplementedError(
+            f"{type(self).__name__} must implement `_embed` or override `embed`."
+        )
+
+    async def _embed_async(self, inputs: list[str]) -> BaseEmbeddingT:
+        """Should asynchronously call the embedder with a single batch of inputs.
+
+        Defaults to running `_embed` in a thread.
+        """
+        return await asyncio.to_thread(self._embed, inputs)
+
+    def _merge_batch_embeddings(
+        self, embedding_responses: list[BaseEmbeddingT]
+    ) -> BaseEmbeddingT:
+        """Should merge the responses of the batches, in order, into a single one."""
+        if len(embedding_responses) == 1:
+            return embedding_responses[0]
+        raise NotImplementedError(
+            f"{type(self).__name__} must implement `_merge_batch_embeddings` to embed "
+            "more than one batch."
+        )
+
+    def _response_from_embeddings(
+        self,
+        inputs: list[str],
+        embeddings: list[list[float]],
+        response: BaseEmbeddingT | None,
+    ) -> BaseEmbeddingT:
+        """Should build the response for `inputs` from their (partly cached) embeddings.
+
+        `response` is the response for the inputs that missed the cache, if any, from
+        which e.g. the usage should be carried over. This is also used to build the
+        response for empty inputs without calling the provider.
+        """
+        raise NotImplementedError(
+            f"{type(self).__name__} must implement `_response_from_embeddings` to use "
+            "a cache or embed empty inputs."
+        )
+
+    def _is_retryable(self, error: Exception) -> bool:
+        """Returns whether a batch that failed with `error` should be retried.
+
+        Timeouts, connection errors, rate limits, and server errors are transient, while
+        e.g. authentication errors and invalid inputs are raised right away. Providers
+        override this to recognize their SDK's connection errors.
+        """
+        if isinstance(error, TimeoutError | ConnectionError):
+            return True
+        status_code = getattr(error, "status_code", None)
+        return isinstance(status_code, int) and (
+            status_code in _RETRYABLE_STATUS_CODES or status_code >= 500
+        )
+
+    def _raise_unless_retryable(
+        self, failures: dict[int, Exception], attempt: int
+    ) -> None:
+        """Raises the first error that is not retryable or once retries run out."""
+        for error in failures.values():
+            if not self._is_retryable(error):
+                raise error
+        if attempt == self.max_retries:
+            raise next(iter(failures.values()))
+
+    def _active_cache(self) -> BaseEmbeddingCache | None:
+        """Returns the cache to use, or `None` if the embeddings can't be cached.
+
+        Providers return `None` for parameters under which the responses don't hold
+        float vectors (e.g. base64-encoded embeddings).
+        """
+        return self.cache
+
+    def _cache_namespace(self) -> str:
+        """Returns what, besides the text, determines an embedding of this embedder."""
+        return f"{self._provider}:{self.embedding_params.model}:{self.dimensions}"
+
+    def _lookup_cache(
+        self, cache: BaseEmbeddingCache, inputs: list[str]
+    ) -> tuple[list[str], dict[str, list[float]], dict[str, str]]:
+        """Returns the cache keys, the cached embeddings, and the unique cache misses.
+
+        The misses map each missing cache key to its input text.
+        """
+        namespace = self._cache_namespace()
+        keys = [cache.key(namespace, input) for input in inputs]
+        cached = cache.get_many(keys)
+        misses = {
+            key: input
+            for key, input in zip(keys, inputs, strict=True)
+            if key not in cached
+        }
+        return keys, cached, misses
+
+    def _cached_response(
+        self,
+        cache: BaseEmbeddingCache,
+        inputs: list[str],
+        keys: list[str],
+        cached: dict[str, list[float]],
+        misses: dict[str, str],
+        response: BaseEmbeddingT | None,
+    ) -> BaseEmbeddingT:
+        """Caches the embeddings of the misses and returns the response for `inputs`."""
+        if response is not None:
+            if (embeddings := response.embeddings) is None:
+                return response
+            computed = dict(zip(misses, embeddings, strict=True))
+            cache.set_many(computed)
+            if len(misses) == len(inputs):
+                return response
+            cached |= computed
+        return self._response_from_embeddings(
+            inputs, [cached[key] for key in keys], response
+        )
+
+    def _estimate_tokens(self, input: str) -> int:
+        """Returns a conservative estimate of the number of tokens in `input`.
+
+        Tokenizers rarely produce fewer than one token per three bytes of UTF-8, so this
+        overestimates English text while staying safe for other scripts.
+        """
+        return len(input.encode("utf-8")) // 3 + 1
+
+    def _batch_inputs(self, inputs: list[str]) -> list[list[str]]:
+        """Splits `inputs` into the batches to send, preserving their order.
+
+        A batch is closed once it holds `embed_batch_size` inputs or the next input
+        would push its estimated tokens past `max_batch_tokens`. An input that exceeds
+        `max_batch_tokens` on its own is sent alone for the provider to truncate.
+        """
+        batches: list[list[str]] = []
+        tokens = 0
+        for input in inputs:
+            input_tokens = self._estimate_tokens(input) if self.max_batch_tokens else 0
+            current = batches[-1] if batches else []
+            if not batches or (
+                (self.embed_batch_size and len(current) >= self.embed_batch_size)
+                or (
+                    self.max_batch_tokens
+                    and tokens + input_tokens > self.max_batch_tokens
+                )
+            ):
+                batches.append(current := [])
+                tokens = 0
+            current.append(input)
+            tokens += input_tokens
+        return batches
+
+    def _collect_batch_results(
+        self,
+        indices: list[int],
+        results: list[BatchResult[BaseEmbeddingT]],
+        responses: dict[int, BaseEmbeddingT],
+    ) -> dict[int, Exception]:
+        """Stores the responses of the succeeded batches and returns the failed ones.
 
-    @abstractmethod
-    async def embed_async(self, input: list[str]) -> BaseEmbeddingT:
-        """Asynchronously call the embedder with a single input"""
-        ...
+        Returns:
+            The errors of the failed batches keyed on the index of the batch.
+        """
+        failures: dict[int, Exception] = {}
+        for index, result in zip(indices, results, strict=True):
+            if (error := result["error"]) is not None:
+                failures[index] = error
+            else:
+                responses[index] = result["output"]  # pyright: ignore [reportArgumentType]
+        return failures
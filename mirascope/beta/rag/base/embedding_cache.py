@@ -0,0 +1,228 @@
+"""Content-addressed caches for the embeddings of an embedder."""
+
+import hashlib
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from array import array
+from collections import OrderedDict
+from pathlib import Path
+
+
+class EmbeddingCacheStats:
+    """The number of cache hits and misses of an embedding cache.
+
+    Attributes:
+        hits: The number of inputs whose embedding was found in the cache.
+        misses: The number of inputs whose embedding had to be requested.
+    """
+
+    hits: int
+    misses: int
+
+    def __init__(self) -> None:
+        """Initializes an instance of `EmbeddingCacheStats`."""
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Returns the fraction of lookups that were hits, or 0 without lookups."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def reset(self) -> None:
+        """Resets the counts to zero."""
+        self.hits = 0
+        self.misses = 0
+
+    def __repr__(self) -> str:
+        return (
+            f"EmbeddingCacheStats(hits={self.hits}, misses={self.misses}, "
+            f"hit_rate={self.hit_rate:.2%})"
+        )
+
+
+class BaseEmbeddingCache(ABC):
+    """The base class abstract interface for caching embeddings by content.
+
+    Embeddings are keyed on a hash of the text and the embedder's namespace (its
+    provider, model, dimensions, and any parameter changing the embedding), so an
+    unchanged text is never embedded twice by the same model.
+
+    Attributes:
+        stats: The hit and miss counts of the lookups made through `get_many`.
+    """
+
+    stats: EmbeddingCacheStats
+
+    def __init__(self) -> None:
+        """Initializes an instance of `BaseEmbeddingCache`."""
+        self.stats = EmbeddingCacheStats()
+        self._stats_lock = threading.Lock()
+
+    @staticmethod
+    def key(namespace: str, text: str) -> str:
+        """Returns the cache key of the embedding of `text` within `namespace`."""
+        digest = hashlib.sha256(namespace.encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(text.encode("utf-8"))
+        return digest.hexdigest()
+
+    def get_many(self, keys: list[str]) -> dict[str, list[float]]:
+        """Returns the cached embeddings of `keys`, recording the hits and misses."""
+        found = self._get_many(list(dict.fromkeys(keys)))
+        hits = sum(key in found for key in keys)
+        with self._stats_lock:
+            self.stats.hits += hits
+            self.stats.misses += len(keys) - hits
+        return found
+
+    @abstractmethod
+    def _get_many(self, keys: list[str]) -> dict[str, list[float]]:
+        """Should return the embeddings of the (unique) `keys` found in the cache."""
+        ...
+
+    @abstractmethod
+    def set_many(self, embeddings: dict[str, list[float]]) -> None:
+        """Should store the `embeddings` keyed on their cache keys."""
+        ...
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Should remove every cached embedding."""
+        ...
+
+
+class InMemoryEmbeddingCache(BaseEmbeddingCache):
+    """Caches embeddings in memory, evicting the least recently used ones.
+
+    Like `SQLiteEmbeddingCache`, vectors are stored as packed float32 arrays, which
+    take 4 bytes per dimension instead of the 32 of a list of Python floats (about 6
+    KB instead of 50 KB per 1536-dimensional embedding).
+
+    Example:
+
+    ```python
+    from mirascope.beta.rag.base import InMemoryEmbeddingCache
+    from mirascope.beta.rag.openai import OpenAIEmbedder
+
+    embedder = OpenAIEmbedder(cache=InMemoryEmbeddingCache(max_size=100_000))
+    embedder.embed(["your text to embed"])
+    embedder.embed(["your text to embed"])  # served from the cache
+    print(embedder.cache.stats)
+    ```
+    """
+
+    max_size: int | None
+
+    def __init__(self, max_size: int | None = 10_000) -> None:
+        """Initializes an instance of `InMemoryEmbeddingCache`.
+
+        Args:
+            max_size: The maximum number of embeddings to keep, or `None` for no limit.
+        """
+        super().__init__()
+        self.max_size = max_size
+        self._embeddings: OrderedDict[str, array[float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _get_many(self, keys: list[str]) -> dict[str, list[float]]:
+        found: dict[str, list[float]] = {}
+        with self._lock:
+            for key in keys:
+                if (embedding := self._embeddings.get(key)) is not None:
+                    self._embeddings.move_to_end(key)
+                    found[key] = embedding.tolist()
+        return found
+
+    def set_many(self, embeddings: dict[str, list[float]]) -> None:
+        packed = {key: array("f", embedding) for key, embedding in embeddings.items()}
+        with self._lock:
+            self._embeddings.update(packed)
+            for key in packed:
+                self._embeddings.move_to_end(key)
+            if self.max_size is not None:
+                while len(self._embeddings) > self.max_size:
+                    self._embeddings.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._embeddings.clear()
+
+    def __len__(self) -> int:
+        return len(self._embeddings)
+
+
+class SQLiteEmbeddingCache(BaseEmbeddingCache):
+    """Persists embeddings to a SQLite database as packed float32 vectors.
+
+    The cache survives restarts, so re-ingesting a corpus only embeds the chunks whose
+    text changed. Vectors are stored with float32 precision, which is what vector
+    stores index anyway, at a quarter of the size of their JSON representation.
+
+    Example:
+
+    ```python
+    from mirascope.beta.rag.base import SQLiteEmbeddingCache
+    from mirascope.beta.rag.openai import OpenAIEmbedder
+
+    embedder = OpenAIEmbedder(cache=SQLiteEmbeddingCache(".cache/embeddings.db"))
+    ```
+    """
+
+    path: Path
+
+    # SQLite limits the number of host parameters of a single statement.
+    _MAX_VARIABLES: int = 900
+
+    def __init__(self, path: str | Path) -> None:
+        """Initializes an instance of `SQLiteEmbeddingCache`.
+
+        Args:
+            path: The path of the database file, which is created if it doesn't exist.
+        """
+        super().__init__()
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings "
+                "(key TEXT PRIMARY KEY, embedding BLOB NOT NULL)"
+            )
+
+    def _get_many(self, keys: list[str]) -> dict[str, list[float]]:
+        found: dict[str, list[float]] = {}
+        with self._lock:
+            for i in range(0, len(keys), self._MAX_VARIABLES):
+                chunk = keys[i : i + self._MAX_VARIABLES]
+                rows = self._connection.execute(
+                    "SELECT key, embedding FROM embeddings "
+                    f"WHERE key IN ({', '.join('?' * len(chunk))})",
+                    chunk,
+                )
+                for key, blob in rows:
+                    found[key] = array("f", blob).tolist()
+        return found
+
+    def set_many(self, embeddings: dict[str, list[float]]) -> None:
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO embeddings (key, embedding) VALUES (?, ?)",
+                [
+                    (key, array("f", embedding).tobytes())
+                    for key, embedding in embeddings.items()
+                ],
+            )
+
+    def clear(self) -> None:
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM embeddings")
+
+    def close(self) -> None:
+        """Closes the connection to the database."""
+        with self._lock:
+            self._connection.close()
@@ -15,6 +15,20 @@ from .vectorstore_params import BaseVectorStoreParams
 BaseQueryResultsT = TypeVar("BaseQueryResultsT", bound=BaseQueryResults)
 
 
+class SyncResult(BaseModel):
+    """The changes made to a vectorstore by `BaseVectorStore.sync`.
+
+    Attributes:
+        added_ids: The ids of the new or changed chunks that were embedded and added.
+        deleted_ids: The ids of the stale chunks that were deleted.
+        unchanged: The number of chunks that were already stored.
+    """
+
+    added_ids: list[str]
+    deleted_ids: list[str]
+    unchanged: int
+
+
 class BaseVectorStore(BaseModel, Generic[BaseQueryResultsT], ABC):
     """The base class abstract interface for interacting with vectorstores."""
 
@@ -35,3 +49,56 @@ class BaseVectorStore(BaseModel, Generic[BaseQueryResultsT], ABC):
     def add(self, text: str | list[Document], **kwargs: Any) -> None:  # noqa: ANN401
         """Takes unstructured data and upserts into vectorstore"""
         ...
+
+    def sync(self, source_id: str, text: str, **kwargs: Any) -> SyncResult:  # noqa: ANN401
+        """Incrementally re-indexes the `text` of the source `source_id`.
+
+        The text is chunked with deterministic ids (see `BaseChunker.chunk_source`) and
+        diffed against the chunks stored for the source, so only new or changed chunks
+        are embedded and added and the stale ones are deleted.
+
+        Example:
+
+        ```python
+        my_store = MyStore()
+        with open("notes.md") as file:
+            result = my_store.sync("notes.md", file.read())
+        print(result.added_ids, result.deleted_ids)
+        ```
+
+        Args:
+            source_id: The id of the source (e.g. its path or URL).
+            text: The current text of the source.
+            **kwargs: The keyword arguments passed to `add`.
+        """
+        documents = self._chunk_source(source_id, text)
+        stored_ids = set(self._get_source_ids(source_id))
+        new_documents = [
+            document for document in documents if document.id not in stored_ids
+        ]
+        stale_ids = sorted(stored_ids - {document.id for document in documents})
+        if new_documents:
+            self.add(new_documents, **kwargs)
+        if stale_ids:
+            self._delete(stale_ids)
+        return SyncResult(
+            added_ids=[document.id for document in new_documents],
+            deleted_ids=stale_ids,
+            unchanged=len(documents) - len(new_documents),
+        )
+
+    ############################## PRIVATE METHODS ###################################
+
+    def _chunk_source(self, source_id: str, text: str) -> list[Document]:
+        """Returns the documents to store for the `text` of the source `source_id`."""
+        return self.chunker.chunk_source(source_id, text)
+
+    @abstractmethod
+    def _get_source_ids(self, source_id: str) -> list[str]:
+        """Returns the ids of the stored documents of the source `source_id`."""
+        ...
+
+    @abstractmethod
+    def _delete(self, ids: list[str]) -> None:
+        """Deletes the documents with the given `ids`."""
+        ...
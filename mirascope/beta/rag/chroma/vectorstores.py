@@ -72,6 +72,14 @@ class ChromaVectorStore(BaseVectorStore):
             **kwargs,
         )
 
+    ############################## PRIVATE METHODS ###################################
+
+    def _get_source_ids(self, source_id: str) -> list[str]:
+        return self._index.get(where={"source_id": source_id}, include=[])["ids"]
+
+    def _delete(self, ids: list[str]) -> None:
+        self._index.delete(ids=ids)
+
     ############################# PRIVATE PROPERTIES #################################
 
     @cached_property
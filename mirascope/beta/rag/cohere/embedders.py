@@ -1,14 +1,25 @@
-"""A module for calling OpenAI's Embeddings models."""
+"""A module for calling Cohere's Embeddings models."""
 
 import datetime
-from typing import ClassVar
+from typing import ClassVar, Literal
 
+import httpx
 from cohere import AsyncClient, Client
+from cohere.types import (
+    EmbedByTypeResponseEmbeddings,
+    EmbeddingsByTypeEmbedResponse,
+    EmbeddingsFloatsEmbedResponse,
+)
+
+from mirascope.core.base import client_pool
 
 from ..base.embedders import BaseEmbedder
 from .embedding_params import CohereEmbeddingParams
 from .embedding_response import CohereEmbeddingResponse
 
+# The environment variable that the clients read their default API key from
+_CLIENT_ENV = ("CO_API_KEY",)
+
 
 class CohereEmbedder(BaseEmbedder[CohereEmbeddingResponse]):
     """Cohere Embedder
@@ -37,36 +48,62 @@ class CohereEmbedder(BaseEmbedder[CohereEmbeddingResponse]):
     """
 
     dimensions: int | None = 1024
+    embed_batch_size: int | None = 96
     embedding_params: ClassVar[CohereEmbeddingParams] = CohereEmbeddingParams(
         model="embed-english-v3.0"
     )
     _provider: ClassVar[str] = "cohere"
 
-    def embed(self, inputs: list[str]) -> CohereEmbeddingResponse:
-        """Call the embedder with multiple inputs"""
+    def __call__(self, input: list[str]) -> list[list[float]] | list[list[int]] | None:
+        """Call the embedder with a input
+
+        Chroma expects parameter to be `input`.
+        """
+        response = self.embed(input)
+        embeddings = response.embeddings
+        return embeddings
+
+    ############################## PRIVATE METHODS ###################################
 
-        co = Client(api_key=self.api_key, base_url=self.base_url)
-        embedding_type = (
+    def _embedding_type(
+        self,
+    ) -> Literal["float", "int8", "uint8", "binary", "ubinary"] | None:
+        """Returns the embedding type read from the responses."""
+        return (
             self.embedding_params.embedding_types[0]
             if self.embedding_params.embedding_types
             else None
         )
+
+    def _cache_namespace(self) -> str:
+        """Returns what, besides the text, determines an embedding of this embedder"""
+        return ":".join(
+            [
+                super()._cache_namespace(),
+                self.embedding_params.input_type,
+                str(self._embedding_type()),
+                str(self.embedding_params.truncate),
+            ]
+        )
+
+    def _embed(self, inputs: list[str]) -> CohereEmbeddingResponse:
+        """Call the embedder with a single batch of inputs"""
+        co = client_pool.get_client(
+            Client, env=_CLIENT_ENV, api_key=self.api_key, base_url=self.base_url
+        )
         start_time = datetime.datetime.now().timestamp() * 1000
         response = co.embed(texts=inputs, **self.embedding_params.kwargs())
         return CohereEmbeddingResponse(
             response=response,
             start_time=start_time,
             end_time=datetime.datetime.now().timestamp() * 1000,
-            embedding_type=embedding_type,
+            embedding_type=self._embedding_type(),
         )
 
-    async def embed_async(self, inputs: list[str]) -> CohereEmbeddingResponse:
-        """Asynchronously call the embedder with multiple inputs"""
-        co = AsyncClient(api_key=self.api_key, base_url=self.base_url)
-        embedding_type = (
-            self.embedding_params.embedding_types[0]
-            if self.embedding_params.embedding_types
-            else None
+    async def _embed_async(self, inputs: list[str]) -> CohereEmbeddingResponse:
+        """Asynchronously call the embedder with a single batch of inputs"""
+        co = client_pool.get_async_client(
+            AsyncClient, env=_CLIENT_ENV, api_key=self.api_key, base_url=self.base_url
         )
         start_time = datetime.datetime.now().timestamp() * 1000
         response = await co.embed(texts=inputs, **self.embedding_params.kwargs())
@@ -74,14 +111,89 @@ class CohereEmbedder(BaseEmbedder[CohereEmbeddingResponse]):
             response=response,
             start_time=start_time,
             end_time=datetime.datetime.now().timestamp() * 1000,
-            embedding_type=embedding_type,
+            embedding_type=self._embedding_type(),
         )
 
-    def __call__(self, input: list[str]) -> list[list[float]] | list[list[int]] | None:
-        """Call the embedder with a input
+    def _is_retryable(self, error: Exception) -> bool:
+        """Also retries connection errors and timeouts of the Cohere client"""
+        return isinstance(error, httpx.TransportError) or super()._is_retryable(error)
+
+    def _response_from_embeddings(
+        self,
+        inputs: list[str],
+        embeddings: list[list[float]],
+        response: CohereEmbeddingResponse | None,
+    ) -> CohereEmbeddingResponse:
+        """Build the response for `inputs` from their (partly cached) embeddings"""
+        now = datetime.datetime.now().timestamp() * 1000
+        embedding_type = self._embedding_type()
+        response_id = response.response.id if response else ""
+        meta = response.response.meta if response else None
+        if embedding_type is None:
+            embed_response = EmbeddingsFloatsEmbedResponse(
+                id=response_id, embeddings=embeddings, texts=inputs, meta=meta
+            )
+        elif embedding_type == "float":
+            embed_response = EmbeddingsByTypeEmbedResponse(
+                id=response_id,
+                embeddings=EmbedByTypeResponseEmbeddings(float_=embeddings),
+                texts=inputs,
+                meta=meta,
+            )
+        else:
+            # Integer embeddings are cached as floats, which represent them exactly
+            embed_response = EmbeddingsByTypeEmbedResponse(
+                id=response_id,
+                embeddings=EmbedByTypeResponseEmbeddings(
+                    **{
+                        embedding_type: [
+                            [int(value) for value in embedding]
+                            for embedding in embeddings
+                        ]
+                    }
+                ),
+                texts=inputs,
+                meta=meta,
+            )
+        return CohereEmbeddingResponse(
+            response=embed_response,
+            start_time=response.start_time if response else now,
+            end_time=response.end_time if response else now,
+            embedding_type=embedding_type,
+        )
 
-        Chroma expects parameter to be `input`.
-        """
-        response = self.embed(input)
-        embeddings = response.embeddings
-        return embeddings
+    def _merge_batch_embeddings(
+        self, cohere_embeddings: list[CohereEmbeddingResponse]
+    ) -> CohereEmbeddingResponse:
+        """Merge a batch of embeddings into a single embedding"""
+        if len(cohere_embeddings) == 1:
+            return cohere_embeddings[0]
+        responses = [embedding.response for embedding in cohere_embeddings]
+        texts = [text for response in responses for text in response.texts or []]
+        first = responses[0]
+        if isinstance(first, EmbeddingsFloatsEmbedResponse):
+            embeddings = [
+                embedding
+                for response in responses
+                for embedding in response.embeddings  # pyright: ignore [reportAttributeAccessIssue]
+            ]
+        else:
+            embeddings = first.embeddings.model_copy(
+                update={
+                    embedding_type: [
+                        embedding
+                        for response in responses
+                        for embedding in getattr(response.embeddings, embedding_type)
+                    ]
+                    for embedding_type in first.embeddings.model_fields
+                    if getattr(first.embeddings, embedding_type) is not None
+                }
+            )
+        return CohereEmbeddingResponse(
+            response=first.model_copy(
+                update={"embeddings": embeddings, "texts": texts}
+            ),
+            start_time=min(embedding.start_time for embedding in cohere_embeddings),
+            end_time=max(embedding.end_time for embedding in cohere_embeddings),
+            embedding_type=cohere_embeddings[0].embedding_type,
+        )
@@ -0,0 +1,10 @@
+"""A module for interacting with local NumPy vectorstores."""
+
+from .types import NumpyQueryResult, NumpySettings
+from .vectorstores import NumpyVectorStore
+
+__all__ = [
+    "NumpyQueryResult",
+    "NumpySettings",
+    "NumpyVectorStore",
+]
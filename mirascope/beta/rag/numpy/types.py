@@ -0,0 +1,37 @@
+"""Types for interacting with the local NumPy vectorstore using Mirascope."""
+
+from typing import Any
+
+from pydantic import BaseModel
+
+from ..base.query_results import BaseQueryResults
+
+
+class NumpySettings(BaseModel):
+    """Settings for a NumPy vectorstore.
+
+    Attributes:
+        path: The directory in which each index is persisted in a subdirectory named
+            after it, or `None` to keep the index in memory only.
+        search_chunk_size: The number of stored vectors scored at once, which bounds
+            the memory used by a search over a memory-mapped index.
+    """
+
+    path: str | None = "./numpy_vectorstore"
+    search_chunk_size: int = 262_144
+
+
+class NumpyQueryResult(BaseQueryResults):
+    """The result of a NumPy vectorstore query, with one list per query text.
+
+    Attributes:
+        ids: The ids of the closest documents, best match first.
+        documents: The texts of the closest documents.
+        metadatas: The metadata of the closest documents.
+        scores: The cosine similarities of the closest documents to the query.
+    """
+
+    ids: list[list[str]]
+    documents: list[list[str]]
+    metadatas: list[list[dict[str, Any] | None]]
+    scores: list[list[float]]
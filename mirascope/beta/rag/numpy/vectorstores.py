@@ -0,0 +1,409 @@
+"""A module for a local, in-process vectorstore backed by NumPy."""
+
+import json
+import os
+import threading
+from collections.abc import Hashable, Iterator
+from functools import cached_property
+from pathlib import Path
+from typing import Any, ClassVar
+
+import numpy as np
+import numpy.typing as npt
+
+from ..base.document import Document
+from ..base.vectorstores import BaseVectorStore
+from .types import NumpyQueryResult, NumpySettings
+
+_FloatArray = npt.NDArray[np.float32]
+_IntArray = npt.NDArray[np.intp]
+
+
+def _normalize(vectors: _FloatArray) -> _FloatArray:
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1
+    return vectors / norms
+
+
+class _NumpyIndex:
+    """The vectors, documents, and metadata column indexes of a `NumpyVectorStore`.
+
+    Vectors are normalized to unit length and stored as rows of one contiguous float32
+    array, so a search is a single matrix product. Persisted indexes append the vectors
+    to a raw float32 file that is memory-mapped for search, and the documents (and
+    deletions) to a JSON lines file that is replayed on load. Replaced or deleted rows
+    stay in the files, masked as dead, until `compact` rewrites them.
+
+    The vectors of an add are written before its documents, so the documents file is
+    the source of truth: vector rows past its documents (from an add that failed or
+    crashed in between) are overwritten by the next add and truncated on load.
+    """
+
+    def __init__(self, directory: Path | None, search_chunk_size: int) -> None:
+        self.directory = directory
+        self.search_chunk_size = search_chunk_size
+        self.dimensions: int | None = None
+        self.ids: list[str] = []
+        self.texts: list[str] = []
+        self.metadatas: list[dict[str, Any] | None] = []
+        self.rows: dict[str, int] = {}
+        self.alive = np.zeros(0, dtype=bool)
+        # The rows of each hashable value of each metadata key, for filtering.
+        self.columns: dict[str, dict[Hashable, list[int]]] = {}
+        self._vectors: _FloatArray = np.zeros((0, 0), dtype=np.float32)
+        self._lock = threading.Lock()
+        if directory is not None:
+            directory.mkdir(parents=True, exist_ok=True)
+            self._load()
+
+    @property
+    def vectors(self) -> _FloatArray:
+        return self._vectors[: len(self.ids)]
+
+    def add(self, documents: list[Document], embeddings: list[list[float]]) -> None:
+        vectors = _normalize(np.asarray(embeddings, dtype=np.float32))
+        if vectors.ndim != 2 or len(vectors) != len(documents):
+            raise ValueError("Expected one embedding per document.")
+        with self._lock:
+            if self.dimensions is None:
+                self._set_dimensions(vectors.shape[1])
+            elif vectors.shape[1] != self.dimensions:
+                raise ValueError(
+                    f"Expected embeddings of {self.dimensions} dimensions, got "
+                    f"{vectors.shape[1]}."
+                )
+            if self.directory is not None:
+                records = self._dump_records(
+                    {
+                        "id": document.id,
+                        "text": document.text,
+                        "metadata": document.metadata,
+                    }
+                    for document in documents
+                )
+                self._write_vectors(vectors)
+                self._append_records(records)
+            self.alive = np.concatenate([self.alive, np.ones(len(documents), bool)])
+            for document in documents:
+                self._append_document(document.id, document.text, document.metadata)
+            if self.directory is not None:
+                self._map_vectors()
+            else:
+                self._append_vectors(vectors)
+
+    def delete(self, ids: list[str]) -> None:
+        with self._lock:
+            deleted = [id for id in ids if self._remove(id)]
+            if self.directory is not None and deleted:
+                self._append_records(
+                    self._dump_records({"delete": id} for id in deleted)
+                )
+
+    def find_ids(self, where: dict[str, Any]) -> list[str]:
+        return [self.ids[row] for row in self._candidates(where)]
+
+    def search(
+        self, queries: _FloatArray, top_k: int, where: dict[str, Any] | None
+    ) -> list[tuple[_IntArray, _FloatArray]]:
+        """Returns the rows and scores of the `top_k` closest vectors to each query."""
+        queries = _normalize(queries)
+        with self._lock:
+            vectors = self.vectors
+            candidates = (
+                self._candidates(where) if where or not self.alive.all() else None
+            )
+        total = len(vectors) if candidates is None else len(candidates)
+        top_k = min(top_k, total)
+        best_rows = np.zeros((len(queries), 0), dtype=np.intp)
+        best_scores = np.zeros((len(queries), 0), dtype=np.float32)
+        if top_k == 0:
+            return [(best_rows[i], best_scores[i]) for i in range(len(queries))]
+        for start in range(0, total, self.search_chunk_size):
+            end = min(start + self.search_chunk_size, total)
+            if candidates is None:
+                rows = np.arange(start, end)
+                chunk = vectors[start:end]
+            else:
+                rows = candidates[start:end]
+                chunk = vectors[rows]
+            scores = queries @ chunk.T
+            best_rows = np.concatenate(
+                [best_rows, np.broadcast_to(rows, scores.shape)], axis=1
+            )
+            best_scores = np.concatenate([best_scores, scores], axis=1)
+            if best_scores.shape[1] > top_k:
+                top = np.argpartition(-best_scores, top_k - 1, axis=1)[:, :top_k]
+                best_rows = np.take_along_axis(best_rows, top, axis=1)
+                best_scores = np.take_along_axis(best_scores, top, axis=1)
+        order = np.argsort(-best_scores, axis=1)
+        best_rows = np.take_along_axis(best_rows, order, axis=1)
+        best_scores = np.take_along_axis(best_scores, order, axis=1)
+        return [(best_rows[i], best_scores[i]) for i in range(len(queries))]
+
+    def compact(self) -> None:
+        """Drops the dead rows, rewriting the persisted files."""
+        with self._lock:
+            live = np.flatnonzero(self.alive)
+            vectors = np.ascontiguousarray(self.vectors[live])
+            documents = [
+                (self.ids[row], self.texts[row], self.metadatas[row]) for row in live
+            ]
+            if self.directory is not None:
+                self._replace_file("vectors.f32", vectors.tobytes())
+                self._replace_file(
+                    "documents.jsonl",
+                    "".join(
+                        json.dumps({"id": id, "text": text, "metadata": metadata})
+                        + "\n"
+                        for id, text, metadata in documents
+                    ).encode("utf-8"),
+                )
+            self.ids, self.texts, self.metadatas = [], [], []
+            self.rows, self.columns = {}, {}
+            self.alive = np.ones(len(documents), dtype=bool)
+            for document in documents:
+                self._append_document(*document)
+            if self.directory is not None:
+                self._map_vectors()
+            else:
+                self._vectors = vectors
+
+    ############################## PRIVATE METHODS ###################################
+
+    def _candidates(self, where: dict[str, Any] | None) -> _IntArray:
+        """Returns the live rows whose metadata matches all of `where`.
+
+        Each value of `where` is either the value to match or a list of values of which
+        any must match.
+        """
+        mask = self.alive.copy()
+        for key, value in (where or {}).items():
+            values = value if isinstance(value, list | tuple | set) else [value]
+            column = self.columns.get(key, {})
+            matches = np.zeros(len(self.ids), dtype=bool)
+            for value in values:
+                if isinstance(value, Hashable) and (rows := column.get(value)):
+                    matches[rows] = True
+            mask &= matches
+        return np.flatnonzero(mask)
+
+    def _append_document(
+        self, id: str, text: str, metadata: dict[str, Any] | None
+    ) -> None:
+        """Appends the document's row, replacing any live row with the same id."""
+        self._remove(id)
+        row = len(self.ids)
+        self.ids.append(id)
+        self.texts.append(text)
+        self.metadatas.append(metadata)
+        self.rows[id] = row
+        for key, value in (metadata or {}).items():
+            if isinstance(value, Hashable):
+                self.columns.setdefault(key, {}).setdefault(value, []).append(row)
+
+    def _remove(self, id: str) -> bool:
+        if (row := self.rows.pop(id, None)) is None:
+            return False
+        self.alive[row] = False
+        return True
+
+    def _append_vectors(self, vectors: _FloatArray) -> None:
+        """Copies `vectors` into the in-memory array, doubling its capacity as needed."""
+        size = len(self.ids) - len(vectors)
+        if len(self.ids) > len(self._vectors):
+            capacity = max(len(self.ids), 2 * len(self._vectors))
+            grown = np.empty((capacity, vectors.shape[1]), dtype=np.float32)
+            if size:
+                grown[:size] = self._vectors[:size]
+            self._vectors = grown
+        self._vectors[size : len(self.ids)] = vectors
+
+    def _set_dimensions(self, dimensions: int) -> None:
+        self.dimensions = dimensions
+        if self.directory is not None:
+            self._replace_file(
+                "index.json", json.dumps({"dimensions": dimensions}).encode("utf-8")
+            )
+
+    def _map_vectors(self) -> None:
+        if not self.ids or self.dimensions is None:
+            self._vectors = np.zeros((0, self.dimensions or 0), dtype=np.float32)
+            return
+        self._vectors = np.memmap(
+            self.directory / "vectors.f32",
+            dtype=np.float32,
+            mode="r",
+            shape=(len(self.ids), self.dimensions),
+        )
+
+    def _write_vectors(self, vectors: _FloatArray) -> None:
+        """Writes `vectors` after the rows of the recorded documents."""
+        path = self.directory / "vectors.f32"
+        with open(path, "r+b" if path.exists() else "wb") as file:
+            file.seek(len(self.ids) * vectors.shape[1] * vectors.itemsize)
+            file.truncate()
+            file.write(vectors.tobytes())
+
+    @staticmethod
+    def _dump_records(records: Iterator[dict[str, Any]]) -> str:
+        """Serializes all `records` up front, so a failure writes none of them."""
+        return "".join(json.dumps(record) + "\n" for record in records)
+
+    def _append_records(self, records: str) -> None:
+        with open(self.directory / "documents.jsonl", "a", encoding="utf-8") as file:
+            file.write(records)
+
+    def _replace_file(self, name: str, content: bytes) -> None:
+        path = self.directory / name
+        temporary_path = path.with_suffix(f"{path.suffix}.tmp")
+        temporary_path.write_bytes(content)
+        os.replace(temporary_path, path)
+
+    def _load(self) -> None:
+        """Replays the persisted documents and memory-maps their vectors."""
+        index_path = self.directory / "index.json"
+        documents_path = self.directory / "documents.jsonl"
+        if not index_path.exists() or not documents_path.exists():
+            return
+        self.dimensions = json.loads(index_path.read_text())["dimensions"]
+        content = documents_path.read_bytes()
+        if content and not content.endswith(b"\n"):
+            # Drop the torn last line of a write that crashed midway
+            content = content[: content.rfind(b"\n") + 1]
+            self._replace_file("documents.jsonl", content)
+        records = [
+            json.loads(line) for line in content.decode("utf-8").splitlines() if line
+        ]
+        self.alive = np.ones(sum("id" in record for record in records), dtype=bool)
+        for record in records:
+            if "delete" in record:
+                self._remove(record["delete"])
+            else:
+                self._append_document(record["id"], record["text"], record["metadata"])
+        vectors_path = self.directory / "vectors.f32"
+        row_size = self.dimensions * np.dtype(np.float32).itemsize
+        size = len(self.ids) * row_size
+        actual_size = vectors_path.stat().st_size if vectors_path.exists() else 0
+        if actual_size < size:
+            raise ValueError(
+                f"The index at {self.directory} is missing vectors of its documents "
+                f"(expected {size} bytes, found {actual_size})."
+            )
+        if actual_size > size:
+            # Drop the vectors of an add that failed before recording its documents
+            with open(vectors_path, "r+b") as file:
+                file.truncate(size)
+        self._map_vectors()
+
+
+class NumpyVectorStore(BaseVectorStore):
+    """A local, in-process vectorstore backed by NumPy.
+
+    Embeddings are kept in one contiguous, optionally memory-mapped, float32 array and
+    searched by cosine similarity with a vectorized matrix product, which is fast for
+    up to a few million vectors without running a database. Metadata values are indexed
+    on add so `where` filters select their rows before any vector is scored.
+
+    Example:
+
+    ```python
+    from mirascope.beta.rag import TextChunker
+    from mirascope.beta.rag.numpy import NumpySettings, NumpyVectorStore
+    from mirascope.beta.rag.openai import OpenAIEmbedder
+
+
+    class MyStore(NumpyVectorStore):
+        embedder = OpenAIEmbedder()
+        chunker = TextChunker(chunk_size=1000, chunk_overlap=200)
+        index_name = "my-store-0001"
+        client_settings = NumpySettings(path="./numpy_vectorstore")
+
+    my_store = MyStore()
+    with open(f"{PATH_TO_FILE}") as file:
+        data = file.read()
+        my_store.sync(PATH_TO_FILE, data)
+    documents = my_store.retrieve("my question", where={"source_id": PATH_TO_FILE})
+    print(documents.documents[0])
+    ```
+
+    Only one store instance should write to a persisted index at a time.
+    """
+
+    client_settings: ClassVar[NumpySettings] = NumpySettings()
+    _provider: ClassVar[str] = "numpy"
+
+    def retrieve(
+        self,
+        text: str | list[str],
+        top_k: int = 8,
+        where: dict[str, Any] | None = None,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> NumpyQueryResult:
+        """Queries the vectorstore for the closest matches of each text
+
+        Args:
+            text: The query text, or a list of texts searched in one batch.
+            top_k: The number of matches to return per query, at least 1.
+            where: The metadata values the matches must have, where a list value
+                matches any of its values.
+            **kwargs: Unused, accepted for compatibility with `BaseVectorStore`.
+
+        Raises:
+            ValueError: If `top_k` is less than 1.
+        """
+        if top_k < 1:
+            raise ValueError(f"`top_k` must be at least 1, got {top_k}.")
+        texts = [text] if isinstance(text, str) else text
+        embeddings = self.embedder.embed(texts).embeddings
+        if embeddings is None:
+            raise ValueError("Embedding is None")
+        matches = self._index.search(
+            np.asarray(embeddings, dtype=np.float32), top_k, where
+        )
+        return NumpyQueryResult(
+            ids=[[self._index.ids[row] for row in rows] for rows, _ in matches],
+            documents=[[self._index.texts[row] for row in rows] for rows, _ in matches],
+            metadatas=[
+                [self._index.metadatas[row] for row in rows] for rows, _ in matches
+            ],
+            scores=[scores.tolist() for _, scores in matches],
+        )
+
+    def add(self, text: str | list[Document], **kwargs: Any) -> None:  # noqa: ANN401
+        """Takes unstructured data and upserts into vectorstore"""
+        documents: list[Document]
+        if isinstance(text, str):
+            chunk = self.chunker.chunk
+            documents = chunk(text)
+        else:
+            documents = text
+        if not documents:
+            return
+        embedding_response = self.embedder.embed(
+            [document.text for document in documents]
+        )
+        if embedding_response.embeddings is None:
+            raise ValueError("Embedding is None")
+        self._index.add(documents, embedding_response.embeddings)
+
+    def compact(self) -> None:
+        """Reclaims the space of replaced and deleted documents"""
+        self._index.compact()
+
+    ############################## PRIVATE METHODS ###################################
+
+    def _get_source_ids(self, source_id: str) -> list[str]:
+        return self._index.find_ids({"source_id": source_id})
+
+    def _delete(self, ids: list[str]) -> None:
+        self._index.delete(ids)
+
+    ############################# PRIVATE PROPERTIES #################################
+
+    @cached_property
+    def _index(self) -> _NumpyIndex:
+        path = self.client_settings.path
+        return _NumpyIndex(
+            Path(path) / (self.index_name or "default") if path else None,
+            self.client_settings.search_chunk_size,
+        )
@@ -1,15 +1,17 @@
 """A module for calling OpenAI's Embeddings models."""
 
-import asyncio
 import datetime
-from concurrent.futures import ThreadPoolExecutor
-from typing import ClassVar
+from typing import Any, ClassVar
 
-from openai import AsyncOpenAI, OpenAI
+from openai import APIConnectionError, AsyncOpenAI, OpenAI
 from openai.types import Embedding
 from openai.types.create_embedding_response import CreateEmbeddingResponse, Usage
 
+from mirascope.core.base import client_pool
+from mirascope.core.openai._utils._setup_call import CLIENT_ENV
+
 from ..base.embedders import BaseEmbedder
+from ..base.embedding_cache import BaseEmbeddingCache
 from .embedding_params import OpenAIEmbeddingParams
 from .embedding_response import OpenAIEmbeddingResponse
 
@@ -29,48 +31,20 @@ class OpenAIEmbedder(BaseEmbedder[OpenAIEmbeddingResponse]):
     response = openai_embedder.embed(["your text to embed"])
     print(response)
     ```
+
+    Inputs are sent in batches of at most `embed_batch_size` inputs and an estimated
+    `max_batch_tokens` tokens (the API's per-request limit) on a pooled client.
     """
 
     dimensions: int | None = 1536
     embed_batch_size: int | None = 20
-    max_workers: int | None = 64
+    max_batch_tokens: int | None = 300_000
+    max_workers: int = 64
     embedding_params: ClassVar[OpenAIEmbeddingParams] = OpenAIEmbeddingParams(
         model="text-embedding-3-small"
     )
     _provider: ClassVar[str] = "openai"
 
-    def embed(self, inputs: list[str]) -> OpenAIEmbeddingResponse:
-        """Call the embedder with multiple inputs"""
-        if self.embed_batch_size is None:
-            return self._embed(inputs)
-
-        input_batches = [
-            inputs[i : i + self.embed_batch_size]
-            for i in range(0, len(inputs), self.embed_batch_size)
-        ]
-
-        embedding_responses: list[OpenAIEmbeddingResponse] = list(
-            ThreadPoolExecutor(self.max_workers).map(
-                lambda inputs: self._embed(inputs),
-                input_batches,
-            )
-        )
-        return self._merge_batch_embeddings(embedding_responses)
-
-    async def embed_async(self, inputs: list[str]) -> OpenAIEmbeddingResponse:
-        """Asynchronously call the embedder with multiple inputs"""
-        if self.embed_batch_size is None:
-            return await self._embed_async(inputs)
-
-        input_batches = [
-            inputs[i : i + self.embed_batch_size]
-            for i in range(0, len(inputs), self.embed_batch_size)
-        ]
-        embedding_responses: list[OpenAIEmbeddingResponse] = await asyncio.gather(
-            *[self._embed_async(inputs) for inputs in input_batches]
-        )
-        return self._merge_batch_embeddings(embedding_responses)
-
     def __call__(self, input: list[str]) -> list[list[float]]:
         """Call the embedder with a input
 
@@ -82,14 +56,26 @@ class OpenAIEmbedder(BaseEmbedder[OpenAIEmbeddingResponse]):
 
     ############################## PRIVATE METHODS ###################################
 
-    def _embed(self, inputs: list[str]) -> OpenAIEmbeddingResponse:
-        """Call the embedder with a single input"""
-        client = OpenAI(api_key=self.api_key, base_url=self.base_url)
+    def _active_cache(self) -> BaseEmbeddingCache | None:
+        """Skips the cache for base64 embeddings, which are not float vectors"""
+        if self.embedding_params.encoding_format == "base64":
+            return None
+        return super()._active_cache()
+
+    def _embed_kwargs(self) -> dict[str, Any]:
+        """Returns the keyword arguments for `embeddings.create`."""
         kwargs = self.embedding_params.kwargs()
         if self.embedding_params.model != "text-embedding-ada-002":
             kwargs["dimensions"] = self.dimensions
+        return kwargs
+
+    def _embed(self, inputs: list[str]) -> OpenAIEmbeddingResponse:
+        """Call the embedder with a single input"""
+        client = client_pool.get_client(
+            OpenAI, env=CLIENT_ENV, api_key=self.api_key, base_url=self.base_url
+        )
         start_time = datetime.datetime.now().timestamp() * 1000
-        embeddings = client.embeddings.create(input=inputs, **kwargs)
+        embeddings = client.embeddings.create(input=inputs, **self._embed_kwargs())
         return OpenAIEmbeddingResponse(
             response=embeddings,
             start_time=start_time,
@@ -98,22 +84,54 @@ class OpenAIEmbedder(BaseEmbedder[OpenAIEmbeddingResponse]):
 
     async def _embed_async(self, inputs: list[str]) -> OpenAIEmbeddingResponse:
         """Asynchronously call the embedder with a single input"""
-        client = AsyncOpenAI(api_key=self.api_key, base_url=self.base_url)
-        kwargs = self.embedding_params.kwargs()
-        if self.embedding_params.model != "text-embedding-ada-002":
-            kwargs["dimensions"] = self.dimensions
+        client = client_pool.get_async_client(
+            AsyncOpenAI, env=CLIENT_ENV, api_key=self.api_key, base_url=self.base_url
+        )
         start_time = datetime.datetime.now().timestamp() * 1000
-        embeddings = await client.embeddings.create(input=inputs, **kwargs)
+        embeddings = await client.embeddings.create(
+            input=inputs, **self._embed_kwargs()
+        )
         return OpenAIEmbeddingResponse(
             response=embeddings,
             start_time=start_time,
             end_time=datetime.datetime.now().timestamp() * 1000,
         )
 
+    def _is_retryable(self, error: Exception) -> bool:
+        """Also retries connection errors and timeouts of the OpenAI client"""
+        return isinstance(error, APIConnectionError) or super()._is_retryable(error)
+
+    def _response_from_embeddings(
+        self,
+        inputs: list[str],
+        embeddings: list[list[float]],
+        response: OpenAIEmbeddingResponse | None,
+    ) -> OpenAIEmbeddingResponse:
+        """Build the response for `inputs` from their (partly cached) embeddings"""
+        now = datetime.datetime.now().timestamp() * 1000
+        create_embedding_response = CreateEmbeddingResponse(
+            data=[
+                Embedding(embedding=embedding, index=i, object="embedding")
+                for i, embedding in enumerate(embeddings)
+            ],
+            model=response.response.model if response else self.embedding_params.model,
+            object="list",
+            usage=response.response.usage
+            if response
+            else Usage(prompt_tokens=0, total_tokens=0),
+        )
+        return OpenAIEmbeddingResponse(
+            response=create_embedding_response,
+            start_time=response.start_time if response else now,
+            end_time=response.end_time if response else now,
+        )
+
     def _merge_batch_embeddings(
         self, openai_embeddings: list[OpenAIEmbeddingResponse]
     ) -> OpenAIEmbeddingResponse:
         """Merge a batch of embeddings into a single embedding"""
+        if len(openai_embeddings) == 1:
+            return openai_embeddings[0]
         embeddings: list[Embedding] = []
         usage = Usage(
             prompt_tokens=0,
@@ -3,10 +3,10 @@
 from typing import Any, Literal
 
 from pinecone.config import Config
-from pinecone.core.client.api.manage_indexes_api import ManageIndexesApi
+from pinecone.core.openapi.control.api.manage_indexes_api import ManageIndexesApi
 from pydantic import BaseModel, ConfigDict
 
-from ..vectorstore_params import BaseVectorStoreParams
+from ..base.vectorstore_params import BaseVectorStoreParams
 
 
 class ServerlessSpec(BaseModel):
@@ -3,6 +3,7 @@
 from collections.abc import Callable
 from functools import cached_property
 from typing import Any, ClassVar
+from urllib.parse import quote
 
 from pinecone import Index, Pinecone, QueryResponse
 
@@ -131,6 +132,34 @@ class PineconeVectorStore(BaseVectorStore):
                 )
         return self._index.upsert(vectors, **kwargs)
 
+    ############################## PRIVATE METHODS ###################################
+
+    def _chunk_source(self, source_id: str, text: str) -> list[Document]:
+        """Prefixes the chunk ids with the source so they can be listed by prefix."""
+        prefix = self._source_prefix(source_id)
+        return [
+            document.model_copy(update={"id": f"{prefix}{document.id}"})
+            for document in super()._chunk_source(source_id, text)
+        ]
+
+    def _get_source_ids(self, source_id: str) -> list[str]:
+        """Lists the ids of the source by prefix, which requires a serverless index."""
+        prefix = self._source_prefix(source_id)
+        return [id for ids in self._index.list(prefix=prefix) for id in ids]
+
+    @staticmethod
+    def _source_prefix(source_id: str) -> str:
+        """Returns the id prefix of the source's chunks.
+
+        The source id is percent-encoded so it never contains the `#` separator, so
+        the prefix of e.g. `"notes"` does not also match the chunks of `"notes#x"`.
+        """
+        return f"{quote(source_id, safe='')}#"
+
+    def _delete(self, ids: list[str]) -> None:
+        for i in range(0, len(ids), 1000):
+            self._index.delete(ids=ids[i : i + 1000])
+
     ############################# PRIVATE PROPERTIES #################################
 
     @cached_property
@@ -42,6 +42,7 @@ class WeaviateVectorStore(BaseVectorStore):
     _provider: ClassVar[str] = "weaviate"
     vectorstore_params = WeaviateParams()
     client_settings: ClassVar[WeaviateSettings] = WeaviateSettings()
+    source_page_size: ClassVar[int] = 1_000
 
     def add(self, text: str | list[Document], **kwargs: Any) -> None:  # noqa: ANN401
         """Takes unstructured data and inserts into vectorstore"""
@@ -54,13 +55,15 @@ class WeaviateVectorStore(BaseVectorStore):
 
         if len(documents) < 2:
             return self._index.data.insert(
-                properties={"text": documents[0].text}, uuid=documents[0].id, **kwargs
+                properties=self._properties(documents[0]),
+                uuid=documents[0].id,
+                **kwargs,
             )
 
         data_objects = []
         for document in documents:
             data_object = wvc.data.DataObject(
-                properties={"text": document.text}, uuid=document.id
+                properties=self._properties(document), uuid=document.id
             )
             data_objects.append(data_object)
 
@@ -76,6 +79,31 @@ class WeaviateVectorStore(BaseVectorStore):
     def close_connection(self) -> None:
         self._client.close()
 
+    ############################## PRIVATE METHODS ###################################
+
+    def _properties(self, document: Document) -> dict[str, Any]:
+        properties: dict[str, Any] = {"text": document.text}
+        if document.metadata and "source_id" in document.metadata:
+            properties["source_id"] = document.metadata["source_id"]
+        return properties
+
+    def _get_source_ids(self, source_id: str) -> list[str]:
+        """Pages through the objects of the source until they run out."""
+        ids: list[str] = []
+        while True:
+            response = self._index.query.fetch_objects(
+                filters=wvc.query.Filter.by_property("source_id").equal(source_id),
+                limit=self.source_page_size,
+                offset=len(ids),
+                return_properties=[],
+            )
+            ids.extend(str(data_object.uuid) for data_object in response.objects)
+            if len(response.objects) < self.source_page_size:
+                return ids
+
+    def _delete(self, ids: list[str]) -> None:
+        self._index.data.delete_many(where=wvc.query.Filter.by_id().contains_any(ids))
+
     ############################# PRIVATE PROPERTIES #################################
 
     @cached_property
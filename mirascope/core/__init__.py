@@ -1,6 +1,12 @@
-"""The Mirascope Core Functionality."""
+"""The Mirascope Core Functionality.
 
-from contextlib import suppress
+Provider subpackages are imported lazily on first access so that importing
+`mirascope.core` does not pay for the SDKs of providers that are never used.
+"""
+
+import importlib
+from types import ModuleType
+from typing import TYPE_CHECKING
 
 from . import base
 from .base import (
@@ -18,32 +24,48 @@ from .base import (
     toolkit_tool,
 )
 
-with suppress(ImportError):
+if TYPE_CHECKING:
     from . import anthropic as anthropic
-
-with suppress(ImportError):
+    from . import azure as azure
     from . import cohere as cohere
-
-with suppress(ImportError):
     from . import gemini as gemini
-
-with suppress(ImportError):
     from . import groq as groq
-
-with suppress(ImportError):
     from . import litellm as litellm
-
-with suppress(ImportError):
     from . import mistral as mistral
-
-with suppress(ImportError):
     from . import openai as openai
-
-with suppress(ImportError):
     from . import vertex as vertex
 
-with suppress(ImportError):
-    from . import azure as azure
+_PROVIDERS = frozenset(
+    {
+        "anthropic",
+        "azure",
+        "cohere",
+        "gemini",
+        "groq",
+        "litellm",
+        "mistral",
+        "openai",
+        "vertex",
+    }
+)
+
+
+def __getattr__(name: str) -> ModuleType:
+    if name not in _PROVIDERS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    try:
+        module = importlib.import_module(f".{name}", __name__)
+    except ImportError as e:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r} ({e})"
+        ) from e
+    globals()[name] = module
+    return module
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | _PROVIDERS)
+
 
 __all__ = [
     "anthropic",
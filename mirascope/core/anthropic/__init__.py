@@ -7,6 +7,7 @@ from anthropic.types import MessageParam
 from ..base import BaseMessageParam
 from ._call import anthropic_call
 from ._call import anthropic_call as call
+from .batch_job import AnthropicBatchJob
 from .call_params import AnthropicCallParams
 from .call_response import AnthropicCallResponse
 from .call_response_chunk import AnthropicCallResponseChunk
@@ -17,6 +18,7 @@ from .tool import AnthropicTool, AnthropicToolConfig
 AnthropicMessageParam: TypeAlias = MessageParam | BaseMessageParam
 
 __all__ = [
+    "AnthropicBatchJob",
     "call",
     "AsyncAnthropicDynamicConfig",
     "AnthropicDynamicConfig",
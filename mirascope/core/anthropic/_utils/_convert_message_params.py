@@ -1,10 +1,9 @@
 """Utility for converting `BaseMessageParam` to `MessageParam`"""
 
-import base64
-
 from anthropic.types import MessageParam
 
 from ...base import BaseMessageParam
+from ...base._utils import encode_media
 
 
 def convert_message_params(
@@ -39,7 +38,7 @@ def convert_message_params(
                         {
                             "type": "image",
                             "source": {
-                                "data": base64.b64encode(part.image).decode("utf-8"),
+                                "data": encode_media(part.image, part.media_type),
                                 "media_type": part.media_type,
                                 "type": "base64",
                             },
@@ -55,7 +54,7 @@ def convert_message_params(
                         {
                             "type": "document",
                             "source": {
-                                "data": base64.b64encode(part.document).decode("utf-8"),
+                                "data": encode_media(part.document, part.media_type),
                                 "media_type": part.media_type,
                                 "type": "base64",
                             },
@@ -10,13 +10,13 @@ from ..tool import AnthropicTool
 
 
 def _handle_chunk(
-    buffer: str,
+    buffer: list[str],
     chunk: MessageStreamEvent,
     current_tool_call: ToolUseBlock,
     current_tool_type: type[AnthropicTool] | None,
     tool_types: list[type[AnthropicTool]] | None,
 ) -> tuple[
-    str,
+    list[str],
     AnthropicTool | None,
     ToolUseBlock,
     type[AnthropicTool] | None,
@@ -26,9 +26,9 @@ def _handle_chunk(
         return buffer, None, current_tool_call, current_tool_type
 
     if chunk.type == "content_block_stop" and current_tool_type and buffer:
-        current_tool_call.input = jiter.from_json(buffer.encode())
+        current_tool_call.input = jiter.from_json("".join(buffer).encode())
         return (
-            "",
+            [],
             current_tool_type.from_tool_call(current_tool_call),
             ToolUseBlock(id="", input={}, name="", type="tool_use"),
             None,
@@ -48,7 +48,7 @@ def _handle_chunk(
                 f"Unknown tool type in stream: {content_block.name}."
             )  # pragma: no cover
         return (
-            "",
+            [],
             None,
             ToolUseBlock(
                 id=content_block.id, input={}, name=content_block.name, type="tool_use"
@@ -57,7 +57,7 @@ def _handle_chunk(
         )
 
     if chunk.type == "content_block_delta" and chunk.delta.type == "input_json_delta":
-        buffer += chunk.delta.partial_json
+        buffer.append(chunk.delta.partial_json)
 
     return buffer, None, current_tool_call, current_tool_type
 
@@ -68,7 +68,8 @@ def handle_stream(
 ) -> Generator[tuple[AnthropicCallResponseChunk, AnthropicTool | None], None, None]:
     """Iterator over the stream and constructs tools as they are streamed."""
     current_tool_call = ToolUseBlock(id="", input={}, name="", type="tool_use")
-    current_tool_type, buffer = None, ""
+    current_tool_type = None
+    buffer: list[str] = []
     for chunk in stream:
         buffer, tool, current_tool_call, current_tool_type = _handle_chunk(
             buffer, chunk, current_tool_call, current_tool_type, tool_types
@@ -81,7 +82,8 @@ async def handle_stream_async(
     tool_types: list[type[AnthropicTool]] | None,
 ) -> AsyncGenerator[tuple[AnthropicCallResponseChunk, AnthropicTool | None], None]:
     current_tool_call = ToolUseBlock(id="", input={}, name="", type="tool_use")
-    current_tool_type, buffer = None, ""
+    current_tool_type = None
+    buffer: list[str] = []
     async for chunk in stream:
         buffer, tool, current_tool_call, current_tool_type = _handle_chunk(
             buffer, chunk, current_tool_call, current_tool_type, tool_types
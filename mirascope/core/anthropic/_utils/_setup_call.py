@@ -14,7 +14,7 @@ from anthropic import (
 )
 from anthropic.types import Message, MessageParam, MessageStreamEvent
 
-from ...base import BaseMessageParam, BaseTool, _utils
+from ...base import BaseMessageParam, BaseTool, _utils, client_pool
 from ...base._utils import AsyncCreateFn, CreateFn
 from .._call_kwargs import AnthropicCallKwargs
 from ..call_params import AnthropicCallParams
@@ -23,6 +23,9 @@ from ..tool import AnthropicTool
 from ._convert_common_call_params import convert_common_call_params
 from ._convert_message_params import convert_message_params
 
+# The environment variables that the default Anthropic clients read their settings from
+CLIENT_ENV = ("ANTHROPIC_API_KEY", "ANTHROPIC_AUTH_TOKEN", "ANTHROPIC_BASE_URL")
+
 
 @overload
 def setup_call(
@@ -130,6 +133,10 @@ def setup_call(
     }
 
     if client is None:
-        client = AsyncAnthropic() if inspect.iscoroutinefunction(fn) else Anthropic()
+        client = (
+            client_pool.get_async_client(AsyncAnthropic, env=CLIENT_ENV)
+            if inspect.iscoroutinefunction(fn)
+            else client_pool.get_client(Anthropic, env=CLIENT_ENV)
+        )
     create = client.messages.create
     return create, prompt_template, messages, tool_types, call_kwargs
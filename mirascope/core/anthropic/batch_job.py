@@ -0,0 +1,69 @@
+"""The `AnthropicBatchJob` class for running calls through the Message Batches API.
+
+usage docs: learn/calls.md
+"""
+
+from typing import Any, ClassVar
+
+from anthropic import Anthropic
+from anthropic.types import Message
+
+from ..base import client_pool
+from ..base.batch_job import BaseBatchJob
+from ._utils._setup_call import CLIENT_ENV
+
+
+class AnthropicBatchJob(BaseBatchJob[Anthropic, Message]):
+    """A job running an `anthropic.call` over many inputs through Message Batches.
+
+    Example:
+
+    ```python
+    from mirascope.core import anthropic
+
+
+    @anthropic.call("claude-3-5-sonnet-20240620")
+    def recommend_book(genre: str) -> str:
+        return f"Recommend a {genre} book"
+
+
+    job = anthropic.AnthropicBatchJob.submit(
+        recommend_book, [{"genre": "fantasy"}, {"genre": "horror"}]
+    )
+    for result in job.wait(poll_interval=60).results():
+        print(result["output"] or result["error"])
+    ```
+    """
+
+    terminal_statuses: ClassVar[frozenset[str]] = frozenset({"ended"})
+
+    @classmethod
+    def _default_client(cls) -> Anthropic:
+        return client_pool.get_client(Anthropic, env=CLIENT_ENV)
+
+    @classmethod
+    def _create_batch(cls, client: Anthropic, requests: list[dict[str, Any]]) -> str:
+        return client.beta.messages.batches.create(
+            requests=[
+                {"custom_id": request["custom_id"], "params": request["body"]}
+                for request in requests
+            ]
+        ).id
+
+    def _retrieve_status(self) -> str:
+        return self.client.beta.messages.batches.retrieve(self.id).processing_status
+
+    def _fetch_responses(self) -> dict[str, Message | Exception]:
+        responses: dict[str, Message | Exception] = {}
+        for response in self.client.beta.messages.batches.results(self.id):
+            result = response.result
+            if result.type == "succeeded":
+                responses[response.custom_id] = Message.model_validate(
+                    result.message.model_dump()
+                )
+            else:
+                error = result.error if result.type == "errored" else result.type
+                responses[response.custom_id] = RuntimeError(
+                    f"Batch request {response.custom_id} failed: {error}"
+                )
+        return responses
@@ -13,6 +13,7 @@ from anthropic.types import (
 from pydantic import SerializeAsAny, computed_field
 
 from ..base import BaseCallResponse
+from ..base._utils import cached_getter
 from ._utils import calculate_cost
 from .call_params import AnthropicCallParams
 from .dynamic_config import AnthropicDynamicConfig, AsyncAnthropicDynamicConfig
@@ -92,18 +93,21 @@ class AnthropicCallResponse(
         return self.usage.output_tokens
 
     @property
+    @cached_getter
     def cost(self) -> float | None:
         """Returns the cost of the call."""
         return calculate_cost(self.input_tokens, self.output_tokens, self.model)
 
     @computed_field
     @property
+    @cached_getter
     def message_param(self) -> SerializeAsAny[MessageParam]:
         """Returns the assistants's response as a message parameter."""
         return MessageParam(**self.response.model_dump(include={"content", "role"}))
 
     @computed_field
     @property
+    @cached_getter
     def tools(self) -> list[AnthropicTool] | None:
         """Returns any available tool calls as their `AnthropicTool` definition.
 
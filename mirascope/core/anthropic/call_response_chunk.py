@@ -12,6 +12,7 @@ from anthropic.types import (
     RawMessageStartEvent,
     Usage,
 )
+from pydantic import SkipValidation
 
 from ..base import BaseCallResponseChunk
 
@@ -45,6 +46,8 @@ class AnthropicCallResponseChunk(
     ```
     """
 
+    chunk: SkipValidation[MessageStreamEvent]
+
     @property
     def content(self) -> str:
         """Returns the string content of the 0th message."""
@@ -98,6 +101,6 @@ class AnthropicCallResponseChunk(
     @property
     def output_tokens(self) -> int | None:
         """Returns the number of output tokens."""
-        if self.usage:
-            return self.usage.output_tokens
+        if usage := self.usage:
+            return usage.output_tokens
         return None
@@ -131,7 +131,7 @@ class AnthropicStream(
             type="message",
             usage=usage,
         )
-        return AnthropicCallResponse(
+        return AnthropicCallResponse._construct_trusted(
             metadata=self.metadata,
             response=completion,
             tool_types=self.tool_types,
@@ -1,10 +1,9 @@
 """Utility for converting `BaseMessageParam` to `ChatRequestMessage`."""
 
-import base64
-
 from azure.ai.inference.models import ChatRequestMessage, UserMessage
 
 from ...base import BaseMessageParam
+from ...base._utils import encode_media_data_url
 
 
 def convert_message_params(
@@ -32,12 +31,13 @@ def convert_message_params(
                             f"Unsupported image media type: {part.media_type}. Azure"
                             " currently only supports JPEG, PNG, GIF, and WebP images."
                         )
-                    data = base64.b64encode(part.image).decode("utf-8")
                     converted_content.append(
                         {
                             "type": "image_url",
                             "image_url": {
-                                "url": f"data:{part.media_type};base64,{data}",
+                                "url": encode_media_data_url(
+                                    part.image, part.media_type
+                                ),
                                 "detail": part.detail if part.detail else "auto",
                             },
                         }
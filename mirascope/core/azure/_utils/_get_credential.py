@@ -1,9 +1,15 @@
+"""This module contains the cached credentials used for Azure AI Inference calls."""
+
 from __future__ import annotations
 
+import asyncio
 import os
-from typing import TYPE_CHECKING
+import threading
+import time
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
 
-from azure.core.credentials import AzureKeyCredential
+from azure.core.credentials import AccessToken, AzureKeyCredential, TokenCredential
 
 if TYPE_CHECKING:
     from azure.identity import (  # pyright: ignore [reportMissingImports]
@@ -12,6 +18,90 @@ if TYPE_CHECKING:
 else:
     AzureDefaultCredential = None
 
+TOKEN_REFRESH_MARGIN = 300
+"""The seconds before its expiry at which a cached token is refreshed."""
+
+
+class CachedTokenCredential:
+    """Caches the tokens of a credential per scope until shortly before they expire.
+
+    Fetching a token from an identity provider is a network round trip, so the token is
+    shared by every client using the credential and only refreshed once fewer than
+    `TOKEN_REFRESH_MARGIN` seconds remain. Token requests with `claims` or a `tenant_id`
+    (e.g. for CAE challenges) always go to the wrapped credential.
+    """
+
+    def __init__(self, credential: TokenCredential) -> None:
+        self._credential = credential
+        self._tokens: dict[tuple[str, ...], AccessToken] = {}
+        self._lock = threading.Lock()
+
+    def get_cached_token(self, *scopes: str) -> AccessToken | None:
+        """Returns the cached token for `scopes` if it is not about to expire."""
+        token = self._tokens.get(scopes)
+        if token is None or token.expires_on - time.time() <= TOKEN_REFRESH_MARGIN:
+            return None
+        return token
+
+    def get_token(
+        self,
+        *scopes: str,
+        claims: str | None = None,
+        tenant_id: str | None = None,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> AccessToken:
+        if claims or tenant_id:
+            return self._credential.get_token(
+                *scopes, claims=claims, tenant_id=tenant_id, **kwargs
+            )
+        if (token := self.get_cached_token(*scopes)) is not None:
+            return token
+        with self._lock:
+            if (token := self.get_cached_token(*scopes)) is None:
+                token = self._tokens[scopes] = self._credential.get_token(
+                    *scopes, **kwargs
+                )
+        return token
+
+
+class AsyncCachedTokenCredential:
+    """Serves the tokens of a `CachedTokenCredential` to async clients.
+
+    Sync and async clients share the same token cache. Refreshing a token runs the
+    sync credential in a worker thread so it does not block the event loop.
+    """
+
+    def __init__(self, credential: CachedTokenCredential) -> None:
+        self._credential = credential
+
+    async def get_token(
+        self,
+        *scopes: str,
+        claims: str | None = None,
+        tenant_id: str | None = None,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> AccessToken:
+        if not (claims or tenant_id) and (
+            token := self._credential.get_cached_token(*scopes)
+        ):
+            return token
+        return await asyncio.to_thread(
+            self._credential.get_token,
+            *scopes,
+            claims=claims,
+            tenant_id=tenant_id,
+            **kwargs,
+        )
+
+    async def close(self) -> None:
+        """Does nothing since the shared credential outlives any one client."""
+
+    async def __aenter__(self) -> AsyncCachedTokenCredential:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.close()
+
 
 def _get_key_from_env() -> str | None:
     return os.environ.get("AZURE_INFERENCE_CREDENTIAL")
@@ -27,7 +117,41 @@ def _get_azure_default_credential() -> DefaultAzureCredential:
     return DefaultAzureCredential()
 
 
-def get_credential() -> DefaultAzureCredential | AzureKeyCredential:
+@lru_cache(maxsize=8)
+def _get_key_credential(key: str) -> AzureKeyCredential:
+    return AzureKeyCredential(key)
+
+
+@lru_cache(maxsize=1)
+def _get_cached_default_credential() -> CachedTokenCredential:
+    return CachedTokenCredential(_get_azure_default_credential())
+
+
+@lru_cache(maxsize=1)
+def _get_async_cached_default_credential() -> AsyncCachedTokenCredential:
+    return AsyncCachedTokenCredential(_get_cached_default_credential())
+
+
+def get_credential() -> CachedTokenCredential | AzureKeyCredential:
+    """Returns the shared credential for sync clients.
+
+    The same credential object is returned for the same key (or for the default Azure
+    credential) so that pooled clients are reused across calls.
+    """
     if (credential := _get_key_from_env()) is None:
-        return _get_azure_default_credential()
-    return AzureKeyCredential(credential)
+        return _get_cached_default_credential()
+    return _get_key_credential(credential)
+
+
+def get_async_credential() -> AsyncCachedTokenCredential | AzureKeyCredential:
+    """Returns the shared credential for async clients, sharing tokens with sync ones."""
+    if (credential := _get_key_from_env()) is None:
+        return _get_async_cached_default_credential()
+    return _get_key_credential(credential)
+
+
+def clear_credential_cache() -> None:
+    """Drops the cached credentials and their tokens."""
+    _get_key_credential.cache_clear()
+    _get_cached_default_credential.cache_clear()
+    _get_async_cached_default_credential.cache_clear()
@@ -1,6 +1,5 @@
 """Handles the stream of completion chunks."""
 
-import copy
 from collections.abc import AsyncGenerator, Generator
 
 from azure.ai.inference.models import (
@@ -13,10 +12,22 @@ from ..call_response_chunk import AzureCallResponseChunk
 from ..tool import AzureTool
 
 
+def _complete_tool_call(
+    tool_type: type[AzureTool],
+    tool_call: ChatCompletionsToolCall,
+    arguments: list[str],
+) -> AzureTool:
+    """Returns the tool for `tool_call` with its buffered streamed `arguments`."""
+    tool_call.function.arguments = "".join(arguments)
+    arguments.clear()
+    return tool_type.from_tool_call(tool_call)
+
+
 def _handle_chunk(
     chunk: StreamingChatCompletionsUpdate,
     current_tool_call: ChatCompletionsToolCall,
     current_tool_type: type[AzureTool] | None,
+    current_tool_arguments: list[str],
     tool_types: list[type[AzureTool]] | None,
 ) -> tuple[
     AzureTool | None,
@@ -34,8 +45,16 @@ def _handle_chunk(
     tool_call = tool_calls[0]
     # Reset on new tool
     if tool_call.id and tool_call.function is not None:
-        previous_tool_call = copy.deepcopy(current_tool_call)
-        previous_tool_type = current_tool_type
+        previous_tool = None
+        if (
+            current_tool_call.id
+            and current_tool_arguments
+            and current_tool_type is not None
+        ):
+            previous_tool = _complete_tool_call(
+                current_tool_type, current_tool_call, current_tool_arguments
+            )
+        current_tool_arguments.clear()
         current_tool_call = ChatCompletionsToolCall(
             id=tool_call.id,
             function=FunctionCall(
@@ -52,20 +71,16 @@ def _handle_chunk(
             raise RuntimeError(
                 f"Unknown tool type in stream: {tool_call.function.name}"
             )  # pragma: no cover
-        if (
-            previous_tool_call.id
-            and previous_tool_call.function.arguments
-            and previous_tool_type is not None
-        ):
+        if previous_tool is not None:
             return (
-                previous_tool_type.from_tool_call(previous_tool_call),
+                previous_tool,
                 current_tool_call,
                 current_tool_type,
             )
 
     # Update arguments with each chunk
     if tool_call.function and tool_call.function.arguments:
-        current_tool_call.function.arguments += tool_call.function.arguments
+        current_tool_arguments.append(tool_call.function.arguments)
 
     return None, current_tool_call, current_tool_type
 
@@ -79,12 +94,15 @@ def handle_stream(
         id="", function=FunctionCall(arguments="", name="")
     )
     current_tool_type = None
+    current_tool_arguments: list[str] = []
     for chunk in stream:
         if not tool_types or not chunk.choices or not chunk.choices[0].delta.tool_calls:
             if current_tool_type:
                 yield (
                     AzureCallResponseChunk(chunk=chunk),
-                    current_tool_type.from_tool_call(current_tool_call),
+                    _complete_tool_call(
+                        current_tool_type, current_tool_call, current_tool_arguments
+                    ),
                 )
                 current_tool_type = None
             else:
@@ -93,6 +111,7 @@ def handle_stream(
             chunk,
             current_tool_call,
             current_tool_type,
+            current_tool_arguments,
             tool_types,
         )
         if tool is not None:
@@ -108,12 +127,15 @@ async def handle_stream_async(
         id="", function=FunctionCall(arguments="", name="")
     )
     current_tool_type = None
+    current_tool_arguments: list[str] = []
     async for chunk in stream:
         if not tool_types or not chunk.choices[0].delta.tool_calls:
             if current_tool_type:
                 yield (
                     AzureCallResponseChunk(chunk=chunk),
-                    current_tool_type.from_tool_call(current_tool_call),
+                    _complete_tool_call(
+                        current_tool_type, current_tool_call, current_tool_arguments
+                    ),
                 )
                 current_tool_type = None
             else:
@@ -122,6 +144,7 @@ async def handle_stream_async(
             chunk,
             current_tool_call,
             current_tool_type,
+            current_tool_arguments,
             tool_types,
         )
         if tool is not None:
@@ -17,7 +17,7 @@ from azure.ai.inference.models import (
 )
 from azure.core.credentials import AzureKeyCredential
 
-from ...base import BaseMessageParam, BaseTool, _utils
+from ...base import BaseMessageParam, BaseTool, _utils, client_pool
 from ...base._utils import AsyncCreateFn, CreateFn, get_async_create_fn, get_create_fn
 from ...base.call_params import CommonCallParams
 from .._call_kwargs import AzureCallKwargs
@@ -26,7 +26,7 @@ from ..dynamic_config import AsyncAzureDynamicConfig, AzureDynamicConfig
 from ..tool import AzureTool, GenerateAzureStrictToolJsonSchema
 from ._convert_common_call_params import convert_common_call_params
 from ._convert_message_params import convert_message_params
-from ._get_credential import get_credential
+from ._get_credential import get_async_credential, get_credential
 
 
 @overload
@@ -138,12 +138,18 @@ def setup_call(
 
     if client is None:
         endpoint = os.environ["AZURE_INFERENCE_ENDPOINT"]
-        credential = cast(AzureKeyCredential, get_credential())
-
         client = (
-            AsyncChatCompletionsClient(endpoint=endpoint, credential=credential)
+            client_pool.get_async_client(
+                AsyncChatCompletionsClient,
+                endpoint=endpoint,
+                credential=cast(AzureKeyCredential, get_async_credential()),
+            )
             if inspect.iscoroutinefunction(fn)
-            else ChatCompletionsClient(endpoint=endpoint, credential=credential)
+            else client_pool.get_client(
+                ChatCompletionsClient,
+                endpoint=endpoint,
+                credential=cast(AzureKeyCredential, get_credential()),
+            )
         )
     create = (
         get_async_create_fn(
@@ -15,6 +15,7 @@ from azure.ai.inference.models import (
 from pydantic import SerializeAsAny, SkipValidation, computed_field
 
 from ..base import BaseCallResponse
+from ..base._utils import cached_getter
 from ._utils import calculate_cost
 from .call_params import AzureCallParams
 from .dynamic_config import AsyncAzureDynamicConfig, AzureDynamicConfig
@@ -96,12 +97,14 @@ class AzureCallResponse(
         return self.usage.completion_tokens if self.usage else None
 
     @property
+    @cached_getter
     def cost(self) -> float | None:
         """Returns the cost of the call."""
         return calculate_cost(self.input_tokens, self.output_tokens, self.model)
 
     @computed_field
     @property
+    @cached_getter
     def message_param(self) -> SerializeAsAny[AssistantMessage]:
         """Returns the assistants's response as a message parameter."""
         message_param = self.response.choices[0].message
@@ -111,6 +114,7 @@ class AzureCallResponse(
 
     @computed_field
     @property
+    @cached_getter
     def tools(self) -> list[AzureTool] | None:
         """Returns any available tool calls as their `AzureTool` definition.
 
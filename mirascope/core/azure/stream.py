@@ -131,7 +131,7 @@ class AzureStream(
             created=datetime.datetime.now(),
             usage=usage,
         )
-        return AzureCallResponse(
+        return AzureCallResponse._construct_trusted(
             metadata=self.metadata,
             response=completion,
             tool_types=self.tool_types,
@@ -3,10 +3,14 @@
 from . import _partial, _utils
 from ._call_factory import call_factory
 from ._utils import BaseType
+from .batch import BatchResult, abatch, abatch_iter, batch, batch_iter
+from .batch_job import BaseBatchJob
 from .call_kwargs import BaseCallKwargs
 from .call_params import BaseCallParams, CommonCallParams
 from .call_response import BaseCallResponse
 from .call_response_chunk import BaseCallResponseChunk
+from .client_pool import ClientPool, client_pool
+from .deadline import Deadline, DeadlineExceededError, current_deadline, deadline
 from .dynamic_config import BaseDynamicConfig
 from .from_call_args import FromCallArgs
 from .merge_decorators import merge_decorators
@@ -21,6 +25,14 @@ from .message_param import (
 from .messages import Messages
 from .metadata import Metadata
 from .prompt import BasePrompt, metadata, prompt_template
+from .rate_limiter import RateLimiter, RateLimiters, rate_limiters
+from .response_cache import (
+    BaseResponseCache,
+    InMemoryResponseCache,
+    SQLiteResponseCache,
+    get_response_cache,
+    set_response_cache,
+)
 from .response_model_config_dict import ResponseModelConfigDict
 from .stream import BaseStream
 from .structured_stream import BaseStructuredStream
@@ -29,8 +41,11 @@ from .toolkit import BaseToolKit, toolkit_tool
 from .types import AudioSegment
 
 __all__ = [
+    "abatch",
+    "abatch_iter",
     "AudioPart",
     "AudioSegment",
+    "BaseBatchJob",
     "BaseCallKwargs",
     "BaseCallParams",
     "BaseCallResponse",
@@ -38,23 +53,40 @@ __all__ = [
     "BaseDynamicConfig",
     "BaseMessageParam",
     "BasePrompt",
+    "BaseResponseCache",
     "BaseStream",
     "BaseStructuredStream",
     "BaseTool",
     "BaseToolKit",
     "BaseType",
+    "batch",
+    "batch_iter",
+    "BatchResult",
     "CacheControlPart",
     "call_factory",
+    "ClientPool",
+    "client_pool",
     "CommonCallParams",
+    "current_deadline",
+    "Deadline",
+    "deadline",
+    "DeadlineExceededError",
     "FromCallArgs",
     "GenerateJsonSchemaNoTitles",
+    "get_response_cache",
     "ImagePart",
+    "InMemoryResponseCache",
     "merge_decorators",
     "metadata",
     "Messages",
     "Metadata",
     "prompt_template",
+    "RateLimiter",
+    "RateLimiters",
+    "rate_limiters",
     "ResponseModelConfigDict",
+    "set_response_cache",
+    "SQLiteResponseCache",
     "TextPart",
     "ToolConfig",
     "toolkit_tool",
@@ -6,20 +6,26 @@ from functools import wraps
 from typing import Any, ParamSpec, TypeVar, cast, overload
 
 from ._utils import (
+    CallPlan,
     SameSyncAndAsyncClientSetupCall,
     SetupCall,
+    aprefetch_call_media,
+    create_interceptor,
+    estimate_tokens,
     fn_is_async,
     get_dynamic_configuration,
-    get_fn_args,
     get_metadata,
     get_possible_user_message_param,
     is_prompt_template,
 )
 from .call_params import BaseCallParams
 from .call_response import BaseCallResponse
+from .deadline import current_deadline
 from .dynamic_config import BaseDynamicConfig
 from .messages import Messages
 from .prompt import prompt_template
+from .rate_limiter import rate_limiters
+from .response_cache import get_response_cache, response_cache_key
 from .tool import BaseTool
 
 _BaseCallResponseT = TypeVar("_BaseCallResponseT", bound=BaseCallResponse)
@@ -154,20 +160,22 @@ def create_factory(  # noqa: ANN202
             )
         fn._model = model  # pyright: ignore [reportFunctionMemberAccess]
         fn.__mirascope_call__ = True  # pyright: ignore [reportFunctionMemberAccess]
+        call_plan = CallPlan(fn)
         if fn_is_async(fn):
 
             @wraps(fn)
             async def inner_async(
                 *args: _P.args, **kwargs: _P.kwargs
             ) -> TCallResponse | _ParsedOutputT:
-                fn_args = get_fn_args(fn, args, kwargs)
+                fn_args = call_plan.get_fn_args(args, kwargs)
                 dynamic_config = await get_dynamic_configuration(fn, args, kwargs)
-                nonlocal client
+                await aprefetch_call_media(fn, fn_args, dynamic_config)
+                call_client = client
                 if dynamic_config is not None:
-                    client = dynamic_config.get("client", None) or client
+                    call_client = dynamic_config.get("client", None) or client
                 create, prompt_template, messages, tool_types, call_kwargs = setup_call(  # pyright: ignore [reportCallIssue]
                     model=model,
-                    client=client,  # pyright: ignore [reportArgumentType]
+                    client=call_client,  # pyright: ignore [reportArgumentType]
                     fn=fn,
                     fn_args=fn_args,
                     dynamic_config=dynamic_config,
@@ -177,10 +185,47 @@ def create_factory(  # noqa: ANN202
                     extract=False,
                     stream=False,
                 )
+                cache = get_response_cache()
+                response, cache_key, rate_limiter = None, None, None
+                estimated_tokens = 0
+                if (
+                    cache is not None
+                    and (
+                        cache_key := response_cache_key(
+                            TCallResponse._provider, model, call_kwargs, stream=False
+                        )
+                    )
+                    is not None
+                ):
+                    response = await cache.aget(cache_key)
+                if (
+                    response is None
+                    and rate_limiters
+                    and (
+                        rate_limiter := rate_limiters.get(
+                            TCallResponse._provider, model
+                        )
+                    )
+                ):
+                    estimated_tokens = estimate_tokens(call_kwargs)
+                    await rate_limiter.aacquire(estimated_tokens)
                 start_time = datetime.datetime.now().timestamp() * 1000
-                response = await create(stream=False, **call_kwargs)
+                if response is None:
+                    if (call_deadline := current_deadline()) is not None:
+                        response = await call_deadline.wait_for(
+                            create(
+                                stream=False,
+                                **call_deadline.request_kwargs(
+                                    TCallResponse._provider, call_kwargs, stream=False
+                                ),
+                            )
+                        )
+                    else:
+                        response = await create(stream=False, **call_kwargs)
+                    if cache is not None and cache_key is not None:
+                        await cache.aset(cache_key, response)
                 end_time = datetime.datetime.now().timestamp() * 1000
-                output = TCallResponse(
+                output = TCallResponse._construct_trusted(
                     metadata=get_metadata(fn, dynamic_config),
                     response=response,
                     tool_types=tool_types,  # pyright: ignore [reportArgumentType]
@@ -195,6 +240,10 @@ def create_factory(  # noqa: ANN202
                     end_time=end_time,
                 )
                 output._model = model
+                if rate_limiter:
+                    rate_limiter.reconcile(
+                        estimated_tokens, output.input_tokens, output.output_tokens
+                    )
                 return output if not output_parser else output_parser(output)
 
             return inner_async
@@ -204,14 +253,14 @@ def create_factory(  # noqa: ANN202
             def inner(
                 *args: _P.args, **kwargs: _P.kwargs
             ) -> TCallResponse | _ParsedOutputT:
-                fn_args = get_fn_args(fn, args, kwargs)
+                fn_args = call_plan.get_fn_args(args, kwargs)
                 dynamic_config = get_dynamic_configuration(fn, args, kwargs)
-                nonlocal client
+                call_client = client
                 if dynamic_config is not None:
-                    client = dynamic_config.get("client", None) or client
+                    call_client = dynamic_config.get("client", None) or client
                 create, prompt_template, messages, tool_types, call_kwargs = setup_call(  # pyright: ignore [reportCallIssue]
                     model=model,
-                    client=client,  # pyright: ignore [reportArgumentType]
+                    client=call_client,  # pyright: ignore [reportArgumentType]
                     fn=fn,
                     fn_args=fn_args,
                     dynamic_config=dynamic_config,
@@ -221,10 +270,46 @@ def create_factory(  # noqa: ANN202
                     extract=False,
                     stream=False,
                 )
+                interceptor = create_interceptor.get()
+                cache = get_response_cache() if interceptor is None else None
+                response, cache_key, rate_limiter = None, None, None
+                estimated_tokens = 0
+                if (
+                    cache is not None
+                    and (
+                        cache_key := response_cache_key(
+                            TCallResponse._provider, model, call_kwargs, stream=False
+                        )
+                    )
+                    is not None
+                ):
+                    response = cache.get(cache_key)
+                if (
+                    interceptor is None
+                    and response is None
+                    and rate_limiters
+                    and (
+                        rate_limiter := rate_limiters.get(
+                            TCallResponse._provider, model
+                        )
+                    )
+                ):
+                    estimated_tokens = estimate_tokens(call_kwargs)
+                    rate_limiter.acquire(estimated_tokens)
                 start_time = datetime.datetime.now().timestamp() * 1000
-                response = create(stream=False, **call_kwargs)
+                if interceptor is not None:
+                    response = interceptor(call_kwargs)
+                elif response is None:
+                    request_kwargs = call_kwargs
+                    if (call_deadline := current_deadline()) is not None:
+                        request_kwargs = call_deadline.blocking_request_kwargs(
+                            TCallResponse._provider, call_kwargs, stream=False
+                        )
+                    response = create(stream=False, **request_kwargs)
+                    if cache is not None and cache_key is not None:
+                        cache.set(cache_key, response)
                 end_time = datetime.datetime.now().timestamp() * 1000
-                output = TCallResponse(
+                output = TCallResponse._construct_trusted(
                     metadata=get_metadata(fn, dynamic_config),
                     response=response,
                     tool_types=tool_types,  # pyright: ignore [reportArgumentType]
@@ -239,6 +324,10 @@ def create_factory(  # noqa: ANN202
                     end_time=end_time,
                 )
                 output._model = model
+                if rate_limiter:
+                    rate_limiter.reconcile(
+                        estimated_tokens, output.input_tokens, output.output_tokens
+                    )
                 return output if not output_parser else output_parser(output)
 
             return inner
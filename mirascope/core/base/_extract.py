@@ -121,6 +121,7 @@ def extract_factory(  # noqa: ANN202
         }
 
         if fn_is_async(fn):
+            call = create_decorator(fn=fn, **create_decorator_kwargs)
 
             @wraps(fn)
             async def inner_async(
@@ -129,9 +130,7 @@ def extract_factory(  # noqa: ANN202
                 fields_from_call_args = get_fields_from_call_args(
                     response_model, fn, args, kwargs
                 )
-                call_response = await create_decorator(
-                    fn=fn, **create_decorator_kwargs
-                )(*args, **kwargs)
+                call_response = await call(*args, **kwargs)
                 try:
                     json_output = get_json_output(call_response, json_mode)
                     output = extract_tool_return(
@@ -146,15 +145,14 @@ def extract_factory(  # noqa: ANN202
 
             return inner_async
         else:
+            call = create_decorator(fn=fn, **create_decorator_kwargs)
 
             @wraps(fn)
             def inner(*args: _P.args, **kwargs: _P.kwargs) -> _ResponseModelT:
                 fields_from_call_args = get_fields_from_call_args(
                     response_model, fn, args, kwargs
                 )
-                call_response = create_decorator(fn=fn, **create_decorator_kwargs)(
-                    *args, **kwargs
-                )
+                call_response = call(*args, **kwargs)
                 try:
                     json_output = get_json_output(call_response, json_mode)
                     output = extract_tool_return(
@@ -8,6 +8,7 @@ serves as an acknowledgment of the original author's contribution to this projec
 --------------------------------------------------------------------------------
 """
 
+import threading
 from copy import deepcopy
 from typing import TypeVar, get_args, get_origin
 
@@ -16,6 +17,9 @@ from pydantic.fields import FieldInfo
 
 Model = TypeVar("Model", bound=BaseModel)
 
+_PARTIAL_MODEL_ATTR = "__mirascope_partial__"
+_partial_models_lock = threading.Lock()
+
 
 def _process_annotation(annotation: type) -> type:
     """Recursively process type annotations to make them optional."""
@@ -59,8 +63,24 @@ def partial(wrapped_class: type[Model]) -> type[Model]:
 
     user = User()  # All fields optional
     ```
-    """
 
+    The generated class is cached on the wrapped class itself, so repeated calls (e.g.
+    for every chunk of a structured stream) return the same class and reuse its
+    validator, and the two classes are garbage collected together.
+    """
+    # Read the class `__dict__` so that subclasses don't inherit their base's partial
+    partial_model = wrapped_class.__dict__.get(_PARTIAL_MODEL_ATTR)
+    if partial_model is None:
+        partial_model = _create_partial(wrapped_class)
+        with _partial_models_lock:
+            if _PARTIAL_MODEL_ATTR in wrapped_class.__dict__:
+                partial_model = wrapped_class.__dict__[_PARTIAL_MODEL_ATTR]
+            else:
+                setattr(wrapped_class, _PARTIAL_MODEL_ATTR, partial_model)
+    return partial_model
+
+
+def _create_partial(wrapped_class: type[Model]) -> type[Model]:
     def _make_field_optional(
         field: FieldInfo,
     ) -> tuple[object, FieldInfo]:
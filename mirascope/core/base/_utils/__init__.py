@@ -1,10 +1,21 @@
 """Internal Utilities."""
 
 from ._base_type import BaseType, is_base_type
+from ._cached_getter import cached_getter
+from ._call_plan import CallPlan
+from ._close_stream import aclose_stream, close_stream
 from ._convert_base_model_to_base_tool import convert_base_model_to_base_tool
 from ._convert_base_type_to_base_tool import convert_base_type_to_base_tool
 from ._convert_function_to_base_tool import convert_function_to_base_tool
+from ._convert_tools import DYNAMIC_TOOL_MARKER, clear_tool_cache, convert_tools
+from ._create_interceptor import create_interceptor, intercept_create
 from ._default_tool_docstring import DEFAULT_TOOL_DOCSTRING
+from ._encode_media import (
+    clear_encoded_media_cache,
+    encode_media,
+    encode_media_data_url,
+)
+from ._estimate_tokens import estimate_tokens
 from ._extract_tool_return import extract_tool_return
 from ._fn_is_async import fn_is_async
 from ._format_template import format_template
@@ -23,7 +34,7 @@ from ._get_unsupported_tool_config_keys import get_unsupported_tool_config_keys
 from ._is_prompt_template import is_prompt_template
 from ._json_mode_content import json_mode_content
 from ._messages_decorator import MessagesDecorator, messages_decorator
-from ._parse_content_template import parse_content_template
+from ._parse_content_template import clear_media_cache, parse_content_template
 from ._parse_prompt_messages import parse_prompt_messages
 from ._protocols import (
     AsyncCreateFn,
@@ -37,19 +48,35 @@ from ._protocols import (
     SameSyncAndAsyncClientSetupCall,
     SetupCall,
 )
-from ._setup_call import setup_call
+from ._setup_call import aprefetch_call_media, setup_call
 from ._setup_extract_tool import setup_extract_tool
+from ._template_cache import clear_template_cache
 
 __all__ = [
+    "aclose_stream",
+    "aprefetch_call_media",
     "AsyncCreateFn",
     "SameSyncAndAsyncClientSetupCall",
     "BaseType",
+    "cached_getter",
     "CalculateCost",
+    "CallPlan",
+    "close_stream",
+    "clear_encoded_media_cache",
+    "clear_media_cache",
+    "clear_template_cache",
+    "clear_tool_cache",
     "convert_base_model_to_base_tool",
     "convert_base_type_to_base_tool",
     "convert_function_to_base_tool",
+    "convert_tools",
     "CreateFn",
+    "create_interceptor",
     "DEFAULT_TOOL_DOCSTRING",
+    "DYNAMIC_TOOL_MARKER",
+    "encode_media",
+    "encode_media_data_url",
+    "estimate_tokens",
     "extract_tool_return",
     "fn_is_async",
     "format_template",
@@ -69,6 +96,7 @@ __all__ = [
     "get_unsupported_tool_config_keys",
     "HandleStream",
     "HandleStreamAsync",
+    "intercept_create",
     "is_base_type",
     "is_prompt_template",
     "json_mode_content",
@@ -0,0 +1,30 @@
+"""This module contains the `cached_getter` decorator."""
+
+from collections.abc import Callable
+from functools import wraps
+from typing import TypeVar
+
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
+
+def cached_getter(fn: Callable[[_T], _R]) -> Callable[[_T], _R]:
+    """Caches the value of a property getter on the instance it is read from.
+
+    Use it under `@property`: like `functools.cached_property`, the value is computed on
+    first access and stored in the instance `__dict__` under the property's name (which
+    is where `BaseCallResponse.dump_fields` looks for cached computed fields), but the
+    result stays a `property` and so can override the abstract properties of a base
+    class. Delete the key from `__dict__` to recompute the value.
+    """
+    name = fn.__name__
+
+    @wraps(fn)
+    def getter(self: _T) -> _R:
+        try:
+            return self.__dict__[name]
+        except KeyError:
+            value = self.__dict__[name] = fn(self)
+            return value
+
+    return getter
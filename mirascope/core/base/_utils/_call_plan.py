@@ -0,0 +1,30 @@
+"""This module contains the `CallPlan` class for precomputing per-function state."""
+
+import inspect
+from collections.abc import Callable
+from typing import Any
+
+from ._get_fn_args import get_fn_args
+
+
+class CallPlan:
+    """Everything about a call that only depends on the decorated function.
+
+    Built once when a call decorator is applied so that each invocation only has to
+    bind its arguments and merge the dynamic configuration. The prompt template and
+    tool schemas are compiled once as well through the template and tool caches.
+    """
+
+    fn: Callable
+    signature: inspect.Signature
+
+    def __init__(self, fn: Callable) -> None:
+        """Initializes an instance of `CallPlan`."""
+        self.fn = fn
+        self.signature = inspect.signature(fn)
+
+    def get_fn_args(
+        self, args: tuple[object, ...], kwargs: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Returns the `args` and `kwargs` as a dictionary bound by the signature."""
+        return get_fn_args(self.fn, args, kwargs, self.signature)
@@ -0,0 +1,21 @@
+"""This module contains the utilities for closing provider streams early."""
+
+import inspect
+
+
+def close_stream(stream: object) -> None:
+    """Closes the provider `stream` to release its connection, if it can be closed.
+
+    SDK streams (e.g. `openai.Stream`), generators, and botocore event streams all
+    expose `close()`, which stops reading the response so the provider stops
+    generating and the connection is returned to the pool.
+    """
+    if callable(close := getattr(stream, "close", None)):
+        close()
+
+
+async def aclose_stream(stream: object) -> None:
+    """Closes the async provider `stream` to release its connection, if possible."""
+    close = getattr(stream, "aclose", None) or getattr(stream, "close", None)
+    if callable(close) and inspect.isawaitable(result := close()):
+        await result
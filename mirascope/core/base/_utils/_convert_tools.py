@@ -0,0 +1,93 @@
+"""Utility for converting tools into provider tool types and schemas with caching."""
+
+import inspect
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Sequence
+from typing import Any, TypeVar
+
+from pydantic import BaseModel
+
+from ._convert_base_model_to_base_tool import convert_base_model_to_base_tool
+from ._convert_function_to_base_tool import convert_function_to_base_tool
+
+_BaseToolT = TypeVar("_BaseToolT", bound=BaseModel)
+
+DYNAMIC_TOOL_MARKER = "__mirascope_dynamic_tool__"
+"""Set on tool types that are regenerated per call and should never be cached."""
+
+TOOL_CACHE_MAXSIZE = 1024
+
+_tool_cache: OrderedDict[Hashable, tuple[type, Any]] = OrderedDict()
+_tool_cache_lock = threading.Lock()
+
+
+def _tool_cache_key(
+    tool: type[BaseModel] | Callable, tool_type: type[BaseModel]
+) -> Hashable | None:
+    if getattr(tool, DYNAMIC_TOOL_MARKER, False):
+        return None
+    tool_config = getattr(tool, "tool_config", None)
+    key = (tool, tool_type, repr(tool_config) if tool_config else None)
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def _convert_tool(
+    tool: type[BaseModel] | Callable, tool_type: type[_BaseToolT]
+) -> tuple[type[_BaseToolT], Any]:
+    converted_tool_type = (
+        convert_base_model_to_base_tool(tool, tool_type)
+        if inspect.isclass(tool)
+        else convert_function_to_base_tool(tool, tool_type)
+    )
+    return converted_tool_type, converted_tool_type.tool_schema()  # pyright: ignore [reportAttributeAccessIssue]
+
+
+def convert_tools(
+    tools: Sequence[type[BaseModel] | Callable], tool_type: type[_BaseToolT]
+) -> tuple[list[type[_BaseToolT]], list[Any]]:
+    """Returns the converted tool types and their provider-specific tool schemas.
+
+    Conversion and schema generation only depend on the tool and the provider tool
+    type, so the results are cached in a bounded LRU keyed on the tool's identity, the
+    provider tool type, and the tool's `tool_config`. Tools marked with
+    `DYNAMIC_TOOL_MARKER` (e.g. toolkit tools, which are regenerated with new state on
+    every call) and tools that aren't hashable are always converted from scratch.
+
+    Args:
+        tools: The tools (`BaseModel` types or functions) to convert.
+        tool_type: The provider-specific `BaseTool` type to convert the tools into.
+
+    Returns:
+        A tuple of the converted tool types and their tool schemas.
+    """
+    tool_types, tool_schemas = [], []
+    for tool in tools:
+        key = _tool_cache_key(tool, tool_type)
+        if key is None:
+            converted_tool_type, tool_schema = _convert_tool(tool, tool_type)
+        else:
+            with _tool_cache_lock:
+                cached = _tool_cache.get(key)
+                if cached is not None:
+                    _tool_cache.move_to_end(key)
+            if cached is None:
+                cached = _convert_tool(tool, tool_type)
+                with _tool_cache_lock:
+                    _tool_cache[key] = cached
+                    if len(_tool_cache) > TOOL_CACHE_MAXSIZE:
+                        _tool_cache.popitem(last=False)
+            converted_tool_type, tool_schema = cached
+        tool_types.append(converted_tool_type)
+        tool_schemas.append(tool_schema)
+    return tool_types, tool_schemas
+
+
+def clear_tool_cache() -> None:
+    """Clears the cache of converted tool types and tool schemas."""
+    with _tool_cache_lock:
+        _tool_cache.clear()
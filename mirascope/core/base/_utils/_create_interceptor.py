@@ -0,0 +1,28 @@
+"""This module contains the context for intercepting provider create calls."""
+
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+
+CreateInterceptor = Callable[[dict[str, Any]], Any]
+
+create_interceptor: ContextVar[CreateInterceptor | None] = ContextVar(
+    "create_interceptor", default=None
+)
+
+
+@contextmanager
+def intercept_create(interceptor: CreateInterceptor) -> Iterator[None]:
+    """Routes sync, non-streaming provider create calls through `interceptor`.
+
+    While active, a sync decorated call passes its final call kwargs (the provider request
+    body) to `interceptor` instead of calling the client and uses the returned value as
+    the provider response. This lets batch jobs build request bodies and map batch
+    results back into call responses through the regular call path.
+    """
+    token = create_interceptor.set(interceptor)
+    try:
+        yield
+    finally:
+        create_interceptor.reset(token)
@@ -0,0 +1,117 @@
+"""This module contains the cache of base64-encoded media shared by providers."""
+
+import base64
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Literal
+
+ENCODED_MEDIA_CACHE_MAXBYTES = 64 * 1024 * 1024
+
+_Encoding = Literal["base64", "data_url"]
+
+
+class _EncodedMediaCache:
+    """An LRU cache of encoded media payloads bounded by their total size.
+
+    Entries are keyed by the SHA-256 digest of the media, the encoding, and the media
+    type. Message histories resend the same `bytes` objects every turn, so the digest
+    of each recently encoded object is also remembered by identity to skip hashing.
+    Those objects are kept alive by the cache, so their size counts against the same
+    `maxbytes` budget and they are evicted before any encoded payload.
+    """
+
+    def __init__(self, maxbytes: int) -> None:
+        self.maxbytes = maxbytes
+        self.nbytes = 0
+        self._encoded: OrderedDict[tuple[str, _Encoding, str], str] = OrderedDict()
+        self._digests: OrderedDict[int, tuple[bytes, str]] = OrderedDict()
+        self._digests_nbytes = 0
+        self._lock = threading.Lock()
+
+    def _digest(self, data: bytes) -> str:
+        if type(data) is not bytes:
+            # Mutable buffers (e.g. `bytearray`) can change under the same identity.
+            return hashlib.sha256(data).hexdigest()
+        entry = self._digests.get(id(data))
+        if entry is not None and entry[0] is data:
+            self._digests.move_to_end(id(data))
+            return entry[1]
+        digest = hashlib.sha256(data).hexdigest()
+        if entry is not None:
+            del self._digests[id(data)]
+            self._digests_nbytes -= len(entry[0])
+        self._digests[id(data)] = (data, digest)
+        self._digests_nbytes += len(data)
+        self._evict()
+        return digest
+
+    def _evict(self) -> None:
+        while self._encoded and self.nbytes > self.maxbytes:
+            _, evicted = self._encoded.popitem(last=False)
+            self.nbytes -= len(evicted)
+        while self._digests and (
+            self.nbytes + self._digests_nbytes > self.maxbytes
+            or len(self._digests) > 2 * len(self._encoded) + 64
+        ):
+            _, (data, _) = self._digests.popitem(last=False)
+            self._digests_nbytes -= len(data)
+
+    def encode(self, data: bytes, encoding: _Encoding, media_type: str) -> str:
+        with self._lock:
+            key = (self._digest(data), encoding, media_type)
+            if (encoded := self._encoded.get(key)) is not None:
+                self._encoded.move_to_end(key)
+                return encoded
+        encoded = base64.b64encode(data).decode("utf-8")
+        if encoding == "data_url":
+            encoded = f"data:{media_type};base64,{encoded}"
+        if len(encoded) > self.maxbytes:
+            return encoded
+        with self._lock:
+            if key not in self._encoded:
+                self._encoded[key] = encoded
+                self.nbytes += len(encoded)
+            self._evict()
+        return encoded
+
+    def clear(self) -> None:
+        with self._lock:
+            self._encoded.clear()
+            self._digests.clear()
+            self._digests_nbytes = 0
+            self.nbytes = 0
+
+
+_encoded_media_cache = _EncodedMediaCache(ENCODED_MEDIA_CACHE_MAXBYTES)
+
+
+def encode_media(data: bytes, media_type: str) -> str:
+    """Returns the base64 encoding of the media `data`, reusing previous encodings.
+
+    Args:
+        data: The raw bytes of the image, audio, or document.
+        media_type: The media type of `data`, which is part of the cache key.
+
+    Returns:
+        The base64-encoded `data` as a string.
+    """
+    return _encoded_media_cache.encode(data, "base64", media_type)
+
+
+def encode_media_data_url(data: bytes, media_type: str) -> str:
+    """Returns the media `data` as a `data:` URL, reusing previous encodings.
+
+    Args:
+        data: The raw bytes of the image, audio, or document.
+        media_type: The media type of `data`.
+
+    Returns:
+        The `data:{media_type};base64,...` URL of `data`.
+    """
+    return _encoded_media_cache.encode(data, "data_url", media_type)
+
+
+def clear_encoded_media_cache() -> None:
+    """Clears the cache of base64-encoded media."""
+    _encoded_media_cache.clear()
@@ -0,0 +1,61 @@
+"""This module contains the `estimate_tokens` function."""
+
+from collections.abc import Mapping
+from typing import Any
+
+CHARS_PER_TOKEN = 4
+"""The rough number of characters per token of English text for common tokenizers."""
+
+MEDIA_PART_TOKENS = 1000
+"""The flat number of tokens counted for each image, audio, or document payload."""
+
+_MAX_TOKENS_KEYS = frozenset(
+    {"max_tokens", "max_completion_tokens", "max_output_tokens", "maxTokens"}
+)
+
+# Keys next to a base64 `data` string in Anthropic, OpenAI audio, and Gemini parts
+_MEDIA_TYPE_KEYS = frozenset({"media_type", "mime_type", "format"})
+
+
+def _is_data_url(value: str) -> bool:
+    return value.startswith("data:") and ";base64," in value[:256]
+
+
+def _count(value: object) -> tuple[int, int]:
+    """Returns the number of text characters in `value` and the tokens counted flat.
+
+    The flat tokens are the maximum output tokens and `MEDIA_PART_TOKENS` for each
+    binary or base64 payload, whose length says little about its tokens.
+    """
+    if isinstance(value, str):
+        return (0, MEDIA_PART_TOKENS) if _is_data_url(value) else (len(value), 0)
+    if isinstance(value, bytes | bytearray | memoryview):
+        return 0, MEDIA_PART_TOKENS
+    chars, tokens = 0, 0
+    if isinstance(value, Mapping):
+        is_media = not _MEDIA_TYPE_KEYS.isdisjoint(value.keys())
+        for key, item in value.items():
+            if key in _MAX_TOKENS_KEYS and isinstance(item, int):
+                tokens += item
+            elif key == "data" and is_media and isinstance(item, str):
+                tokens += MEDIA_PART_TOKENS
+            elif key != "model":
+                item_chars, item_tokens = _count(item)
+                chars, tokens = chars + item_chars, tokens + item_tokens
+    elif isinstance(value, list | tuple):
+        for item in value:
+            item_chars, item_tokens = _count(item)
+            chars, tokens = chars + item_chars, tokens + item_tokens
+    return chars, tokens
+
+
+def estimate_tokens(call_kwargs: Mapping[str, Any]) -> int:
+    """Returns a rough upper bound on the tokens a call with `call_kwargs` will use.
+
+    This counts the text in the rendered messages, system prompt, and tool schemas at
+    `CHARS_PER_TOKEN`, each image, audio, or document payload at `MEDIA_PART_TOKENS`,
+    and adds the requested maximum output tokens. It is only meant for client-side
+    rate limiting, where it is reconciled with the actual usage.
+    """
+    chars, tokens = _count(call_kwargs)
+    return -(-chars // CHARS_PER_TOKEN) + tokens
@@ -1,5 +1,6 @@
 """This module contains the function to extract the return value of a tool."""
 
+from functools import lru_cache
 from typing import Any, TypeAlias, TypeVar
 
 import jiter
@@ -15,6 +16,16 @@ _BaseTypeT = TypeVar("_BaseTypeT", bound=BaseType)
 _ResponseModelT: TypeAlias = _BaseModelT | _BaseTypeT
 
 
+@lru_cache(maxsize=1024)
+def _get_base_type_model(response_model: type[BaseType]) -> type[BaseModel]:
+    """Returns the (cached) `BaseModel` wrapping the base type in a `value` field.
+
+    The cache is bounded since the wrapper model references its base type, which a
+    weakly keyed cache would therefore never release.
+    """
+    return convert_base_type_to_base_tool(response_model, BaseModel)
+
+
 def extract_tool_return(
     response_model: type[_ResponseModelT],
     json_output: str | object,
@@ -30,13 +41,13 @@ def extract_tool_return(
         else json_output
     )
     if is_base_type(response_model):
-        temp_model = convert_base_type_to_base_tool(response_model, BaseModel)
+        temp_model = _get_base_type_model(response_model)
         if allow_partial:
             return partial(temp_model).model_validate(json_obj).value  # pyright: ignore [reportAttributeAccessIssue]
         return temp_model.model_validate(json_obj).value  # pyright: ignore [reportAttributeAccessIssue]
     if fields_from_call_args and isinstance(json_obj, dict):
-        # Support only top-level dict
-        json_obj.update(fields_from_call_args)
+        # Support only top-level dict, copied since the caller may still own it
+        json_obj = json_obj | fields_from_call_args
     if allow_partial:
         return partial(response_model).model_validate(json_obj)
     return response_model.model_validate(json_obj)
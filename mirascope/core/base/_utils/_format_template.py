@@ -5,6 +5,7 @@ from typing import Any
 
 from ._get_template_values import get_template_values
 from ._get_template_variables import get_template_variables
+from ._template_cache import template_cache
 
 
 def format_template(template: str, attrs: dict[str, Any]) -> str:
@@ -18,12 +19,17 @@ def format_template(template: str, attrs: dict[str, Any]) -> str:
         The formatted template.
 
     """
-    dedented_template = inspect.cleandoc(template).strip()
-    template_vars = get_template_variables(dedented_template, True)
-
+    dedented_template, template_vars = _compile_template(template)
     values = get_template_values(template_vars, attrs)
+    return dedented_template.format(**values).strip()
+
+
+@template_cache
+def _compile_template(template: str) -> tuple[str, tuple[tuple[str, str | None], ...]]:
+    dedented_template = inspect.cleandoc(template).strip()
+    template_vars = tuple(get_template_variables(dedented_template, True))
 
     # Remove any special format specs that are actually invalid normally
     dedented_template = dedented_template.replace(":lists", "").replace(":list", "")
 
-    return dedented_template.format(**values).strip()
+    return dedented_template, template_vars
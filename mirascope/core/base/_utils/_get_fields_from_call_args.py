@@ -25,6 +25,8 @@ def get_fields_from_call_args(
         for name, field in response_model.model_fields.items()
         if is_from_call_args(field)
     }
+    if not call_args_fields:
+        return {}
 
     fn_args = get_fn_args(fn, args, kwargs)
     if not call_args_fields.issubset(fn_args.keys()):
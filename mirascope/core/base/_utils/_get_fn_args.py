@@ -6,10 +6,17 @@ from typing import Any
 
 
 def get_fn_args(
-    fn: Callable, args: tuple[object, ...], kwargs: dict[str, Any]
+    fn: Callable,
+    args: tuple[object, ...],
+    kwargs: dict[str, Any],
+    signature: inspect.Signature | None = None,
 ) -> dict[str, Any]:
-    """Returns the `args` and `kwargs` as a dictionary bound by `fn`'s signature."""
-    signature = inspect.signature(fn)
+    """Returns the `args` and `kwargs` as a dictionary bound by `fn`'s signature.
+
+    The `signature` can be provided to skip recomputing it for every call.
+    """
+    if signature is None:
+        signature = inspect.signature(fn)
     bound_args = signature.bind_partial(*args, **kwargs)
     bound_args.apply_defaults()
 
@@ -3,6 +3,8 @@
 from string import Formatter
 from typing import Literal, overload
 
+from ._template_cache import template_cache
+
 
 @overload
 def get_template_variables(
@@ -28,11 +30,17 @@ def get_template_variables(
     Returns:
         The variables in the template string.
     """
+    template_variables = _parse_template_variables(template)
     if include_format_spec:
-        return [
-            (var, format_spec)
-            for _, var, format_spec, _ in Formatter().parse(template)
-            if var
-        ]
+        return list(template_variables)
     else:
-        return [var for _, var, _, _ in Formatter().parse(template) if var]
+        return [var for var, _ in template_variables]
+
+
+@template_cache
+def _parse_template_variables(template: str) -> tuple[tuple[str, str | None], ...]:
+    return tuple(
+        (var, format_spec)
+        for _, var, format_spec, _ in Formatter().parse(template)
+        if var
+    )
@@ -0,0 +1,287 @@
+"""This module contains the `IncrementalJSONParser` for streamed JSON objects."""
+
+import re
+from typing import Any
+
+import jiter
+
+_WHITESPACE = frozenset(" \t\n\r")
+_NUMBER_CHARS = frozenset("-+0123456789.eE")
+_LITERALS = {"true": True, "false": False, "null": None}
+_STRING_SPECIAL_CHARS = re.compile(r'["\\]')
+_ESCAPE_OR_CONTROL_CHARS = re.compile(r"[\x00-\x1f\\]")
+
+# Container states. Objects move through KEY -> COLON -> VALUE -> COMMA and arrays
+# through VALUE -> COMMA, where the `*_OR_END` states also accept a closing bracket.
+_KEY_OR_END, _KEY, _COLON, _VALUE, _VALUE_OR_END, _COMMA_OR_END = range(6)
+
+
+def _copy_json(value: Any) -> Any:  # noqa: ANN401
+    """Returns a copy of the parsed JSON `value` that shares no containers with it."""
+    if isinstance(value, dict):
+        return {key: _copy_json(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_copy_json(item) for item in value]
+    return value
+
+
+def _split_escape_tail(raw: str) -> tuple[str, str]:
+    """Splits raw string contents into a decodable head and an incomplete escape."""
+    backslash = raw.rfind("\\")
+    if backslash == -1:
+        return raw, ""
+    run_start = backslash
+    while run_start > 0 and raw[run_start - 1] == "\\":
+        run_start -= 1
+    if (backslash - run_start) % 2 == 1:  # the last backslash is itself escaped
+        return raw, ""
+    escape = raw[backslash + 1 : backslash + 6]
+    if not escape or (escape[0] == "u" and len(escape) < 5):
+        head, tail = raw[:backslash], raw[backslash:]
+    elif escape[0] == "u" and 0xD800 <= int(escape[1:], 16) <= 0xDBFF:
+        # A high surrogate must be decoded together with the low surrogate after it
+        if len(raw) > backslash + 6:
+            return raw, ""
+        head, tail = raw[:backslash], raw[backslash:]
+    else:
+        return raw, ""
+    head, head_tail = _split_escape_tail(head)
+    return head, head_tail + tail
+
+
+class IncrementalJSONParser:
+    """A resumable parser for a JSON object that arrives in chunks.
+
+    Each call to `feed` only scans the newly received text, updating the parsed object
+    in place, so the total parsing cost of a stream is linear in its length instead of
+    re-parsing the entire accumulated buffer for every chunk.
+
+    The partial object mirrors `jiter`'s `"trailing-strings"` partial mode: strings are
+    included as soon as they open (but not while they end in an incomplete escape),
+    numbers once they are valid, and keys only once their value has started. Any text before the first `{` and after the root object
+    closes is ignored.
+
+    Raises:
+        ValueError: from `feed` if the text is not valid JSON.
+    """
+
+    obj: dict[str, Any] | None
+    complete: bool
+    completed_fields: int
+
+    def __init__(self) -> None:
+        """Initializes an instance of `IncrementalJSONParser`."""
+        self.obj = None
+        self.complete = False
+        self.completed_fields = 0
+        self._containers: list[dict[str, Any] | list[Any]] = []
+        self._states: list[int] = []
+        self._keys: list[str | None] = []
+        # The in-progress string (decoded parts and undecoded escape tail)
+        self._string_parts: list[str] | None = None
+        self._string_tail = ""
+        self._string_is_key = False
+        # The in-progress number or literal
+        self._scalar: str | None = None
+        # Whether the in-progress string value or number is included in `obj`
+        self._partial_inserted = False
+
+    def snapshot(self) -> dict[str, Any] | None:
+        """Returns a copy of `obj` that later calls to `feed` do not mutate."""
+        return _copy_json(self.obj)
+
+    def feed(self, text: str) -> None:
+        """Consumes the next chunk of text, updating `obj` in place."""
+        index, length = 0, len(text)
+        while index < length and not self.complete:
+            if self._string_parts is not None:
+                index = self._feed_string(text, index)
+                continue
+            if self._scalar is not None:
+                index = self._feed_scalar(text, index)
+                continue
+            char = text[index]
+            index += 1
+            if char in _WHITESPACE:
+                continue
+            if not self._containers:
+                if char == "{":
+                    self.obj = {}
+                    self._push(self.obj, _KEY_OR_END)
+                continue
+            self._feed_structural(char)
+        self._update_partial_string()
+        self._update_partial_scalar()
+
+    def _feed_structural(self, char: str) -> None:
+        state, container = self._states[-1], self._containers[-1]
+        if state == _COMMA_OR_END:
+            if char == ",":
+                self._states[-1] = _KEY if isinstance(container, dict) else _VALUE
+            elif char == ("}" if isinstance(container, dict) else "]"):
+                self._pop()
+            else:
+                raise ValueError(f"Expected ',' or closing bracket, found {char!r}")
+        elif state in (_KEY_OR_END, _KEY):
+            if char == '"':
+                self._start_string(is_key=True)
+            elif char == "}" and state == _KEY_OR_END:
+                self._pop()
+            else:
+                raise ValueError(f"Expected an object key, found {char!r}")
+        elif state == _COLON:
+            if char != ":":
+                raise ValueError(f"Expected ':', found {char!r}")
+            self._states[-1] = _VALUE
+        elif char == "]" and state == _VALUE_OR_END:
+            self._pop()
+        elif char == "{" or char == "[":
+            value: dict[str, Any] | list[Any] = {} if char == "{" else []
+            self._insert(value)
+            self._push(value, _KEY_OR_END if char == "{" else _VALUE_OR_END)
+        elif char == '"':
+            self._start_string(is_key=False)
+        elif char in _NUMBER_CHARS or char in "tfn":
+            self._scalar = char
+        else:
+            raise ValueError(f"Unexpected character {char!r}")
+
+    def _feed_string(self, text: str, index: int) -> int:
+        assert self._string_parts is not None
+        tail, self._string_tail = self._string_tail, ""
+        segment, position = tail + text[index:], 0
+        while (match := _STRING_SPECIAL_CHARS.search(segment, position)) is not None:
+            if match.group() == "\\":
+                position = match.start() + 2  # skip the escaped character
+                continue
+            self._append_string(segment[: match.start()])
+            if self._string_tail:
+                raise ValueError("Invalid escape sequence at the end of a string")
+            value = "".join(self._string_parts)
+            self._string_parts = None
+            if self._string_is_key:
+                self._keys[-1] = value
+                self._states[-1] = _COLON
+            else:
+                self._complete_partial(value)
+            return index + match.start() - len(tail) + 1
+        self._append_string(segment)
+        return len(text)
+
+    def _append_string(self, raw: str) -> None:
+        assert self._string_parts is not None
+        head, self._string_tail = _split_escape_tail(raw)
+        if _ESCAPE_OR_CONTROL_CHARS.search(head):
+            head = jiter.from_json(f'"{head}"'.encode())
+        if head:
+            self._string_parts.append(head)
+
+    def _feed_scalar(self, text: str, index: int) -> int:
+        assert self._scalar is not None
+        end = index
+        if self._scalar[0] in "tfn":
+            while end < len(text) and text[end].isalpha():
+                end += 1
+            self._scalar += text[index:end]
+            if self._scalar in _LITERALS:
+                self._complete_scalar(_LITERALS[self._scalar])
+            elif end < len(text) or not any(
+                literal.startswith(self._scalar) for literal in _LITERALS
+            ):
+                raise ValueError(f"Invalid literal {self._scalar!r}")
+            return end
+        while end < len(text) and text[end] in _NUMBER_CHARS:
+            end += 1
+        self._scalar += text[index:end]
+        if end < len(text):
+            number = self._parse_number(self._scalar)
+            if number is None:
+                raise ValueError(f"Invalid number {self._scalar!r}")
+            self._complete_scalar(number)
+        return end
+
+    def _complete_scalar(self, value: Any) -> None:  # noqa: ANN401
+        self._scalar = None
+        self._complete_partial(value)
+
+    def _update_partial_string(self) -> None:
+        """Includes a trailing string value unless it ends in an incomplete escape.
+
+        `jiter` leaves out such strings entirely rather than truncating them.
+        """
+        if self._string_parts is None or self._string_is_key:
+            return
+        self._string_parts = ["".join(self._string_parts)]
+        self._update_partial(self._string_parts[0], not self._string_tail)
+
+    def _update_partial_scalar(self) -> None:
+        """Includes or excludes a trailing number depending on whether it's valid."""
+        if self._scalar is None or self._scalar[0] in "tfn":
+            return
+        number = self._parse_number(self._scalar)
+        self._update_partial(number, number is not None)
+
+    def _update_partial(self, value: Any, include: bool) -> None:  # noqa: ANN401
+        """Includes or excludes the in-progress string value or number in `obj`."""
+        if include:
+            if self._partial_inserted:
+                self._set_value(value)
+            else:
+                self._insert(value)
+                self._partial_inserted = True
+        elif self._partial_inserted:
+            container = self._containers[-1]
+            if isinstance(container, dict):
+                del container[self._keys[-1]]  # pyright: ignore [reportArgumentType]
+            else:
+                container.pop()
+            self._partial_inserted = False
+
+    def _complete_partial(self, value: Any) -> None:  # noqa: ANN401
+        self._update_partial(value, True)
+        self._partial_inserted = False
+        self._complete_value()
+
+    @staticmethod
+    def _parse_number(number: str) -> int | float | None:
+        try:
+            return jiter.from_json(number.encode())
+        except ValueError:
+            return None
+
+    def _start_string(self, *, is_key: bool) -> None:
+        self._string_parts, self._string_tail = [], ""
+        self._string_is_key = is_key
+
+    def _push(self, container: dict[str, Any] | list[Any], state: int) -> None:
+        self._containers.append(container)
+        self._states.append(state)
+        self._keys.append(None)
+
+    def _pop(self) -> None:
+        self._containers.pop()
+        self._states.pop()
+        self._keys.pop()
+        if self._containers:
+            self._complete_value()
+        else:
+            self.complete = True
+
+    def _insert(self, value: Any) -> None:  # noqa: ANN401
+        container = self._containers[-1]
+        if isinstance(container, dict):
+            container[self._keys[-1]] = value  # pyright: ignore [reportArgumentType]
+        else:
+            container.append(value)
+
+    def _set_value(self, value: Any) -> None:  # noqa: ANN401
+        container = self._containers[-1]
+        if isinstance(container, dict):
+            container[self._keys[-1]] = value  # pyright: ignore [reportArgumentType]
+        else:
+            container[-1] = value
+
+    def _complete_value(self) -> None:
+        if isinstance(self._containers[-1], dict):
+            self.completed_fields += 1
+        self._states[-1] = _COMMA_OR_END
@@ -1,10 +1,17 @@
 """This module provides a function to parse content parts from a prompt template."""
 
+import asyncio
+import hashlib
 import re
+import threading
 import urllib.request
-from typing import Any, Literal, cast
+from collections import OrderedDict
+from collections.abc import Iterable, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+from typing import Any, Literal, NamedTuple, cast
 
-from typing_extensions import TypedDict
+from typing_extensions import TypeIs
 
 from ..message_param import (
     AudioPart,
@@ -18,19 +25,21 @@ from ._format_template import format_template
 from ._get_audio_type import get_audio_type
 from ._get_document_type import get_document_type
 from ._get_image_type import get_image_type
+from ._template_cache import template_cache
 
 _PartType = Literal[
     "text", "texts", "image", "images", "audio", "audios", "cache_control"
 ]
 
 
-class _Part(TypedDict):
+class _Part(NamedTuple):
     template: str
     type: _PartType
-    options: dict[str, str] | None
+    options: Mapping[str, str] | None
 
 
-def _parse_parts(template: str) -> list[_Part]:
+@template_cache
+def _parse_parts(template: str) -> tuple[_Part, ...]:
     # \{ and \} match the literal curly braces.
     #
     # ([^:{}]*) captures content before the colon that are not { or } or :.
@@ -56,13 +65,162 @@ def _parse_parts(template: str) -> list[_Part]:
                 for option in special_options.split(","):
                     key, value = option.split("=")
                     options[key] = value
-                special_options = options
+                special_options = MappingProxyType(options)
             parts.append(
                 _Part(
                     template=special_content, type=special_type, options=special_options
                 )
             )
-    return parts
+    return tuple(parts)
+
+
+MEDIA_CACHE_MAXBYTES = 64 * 1024 * 1024
+MEDIA_FETCH_TIMEOUT = 30.0
+MEDIA_FETCH_MAX_WORKERS = 8
+
+_MEDIA_PART_TYPES = frozenset(
+    {"image", "images", "audio", "audios", "document", "documents"}
+)
+
+
+class _MediaCache:
+    """A content-addressed LRU cache of fetched media bounded by total size.
+
+    URLs map to the SHA-256 digest of their content, so the same media served from
+    different URLs is only stored once.
+    """
+
+    def __init__(self, maxbytes: int) -> None:
+        self.maxbytes = maxbytes
+        self.nbytes = 0
+        self._digests: dict[str, str] = {}
+        self._data: OrderedDict[str, bytes] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, url: str) -> bytes | None:
+        with self._lock:
+            digest = self._digests.get(url)
+            if digest is None or digest not in self._data:
+                return None
+            self._data.move_to_end(digest)
+            return self._data[digest]
+
+    def set(self, url: str, data: bytes) -> None:
+        if len(data) > self.maxbytes:
+            return
+        digest = hashlib.sha256(data).hexdigest()
+        with self._lock:
+            self._digests[url] = digest
+            if digest not in self._data:
+                self._data[digest] = data
+                self.nbytes += len(data)
+            self._data.move_to_end(digest)
+            while self.nbytes > self.maxbytes:
+                _, evicted = self._data.popitem(last=False)
+                self.nbytes -= len(evicted)
+            if len(self._digests) > 2 * len(self._data) + 64:
+                self._digests = {
+                    url: digest
+                    for url, digest in self._digests.items()
+                    if digest in self._data
+                }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._digests.clear()
+            self._data.clear()
+            self.nbytes = 0
+
+
+_media_cache = _MediaCache(MEDIA_CACHE_MAXBYTES)
+_media_executor: ThreadPoolExecutor | None = None
+_media_executor_lock = threading.Lock()
+
+
+def clear_media_cache() -> None:
+    """Clears the cache of media fetched from URLs."""
+    _media_cache.clear()
+
+
+def _get_media_executor() -> ThreadPoolExecutor:
+    global _media_executor
+    with _media_executor_lock:
+        if _media_executor is None:
+            _media_executor = ThreadPoolExecutor(
+                max_workers=MEDIA_FETCH_MAX_WORKERS,
+                thread_name_prefix="mirascope-media",
+            )
+        return _media_executor
+
+
+def _is_remote(source: object) -> TypeIs[str]:
+    return isinstance(source, str) and source.startswith(("http://", "https://"))
+
+
+def _fetch_media(url: str) -> bytes:
+    """Returns the media at `url`, downloading it unless it is already cached."""
+    data = _media_cache.get(url)
+    if data is None:
+        with urllib.request.urlopen(url, timeout=MEDIA_FETCH_TIMEOUT) as response:
+            data = response.read()
+        _media_cache.set(url, data)
+    return data
+
+
+def _uncached_urls(sources: Iterable[object]) -> list[str]:
+    return list(
+        dict.fromkeys(
+            source
+            for source in sources
+            if _is_remote(source) and _media_cache.get(source) is None
+        )
+    )
+
+
+def _prefetch_media(sources: Iterable[object]) -> None:
+    """Downloads the uncached remote `sources` in parallel.
+
+    Failures are ignored here so that `_load_media` raises them for the part.
+    """
+    urls = _uncached_urls(sources)
+    if len(urls) < 2:
+        return
+    for future in [_get_media_executor().submit(_fetch_media, url) for url in urls]:
+        future.exception()
+
+
+def _media_sources(template: str, attrs: Mapping[str, Any]) -> list[object]:
+    sources = []
+    for part in _parse_parts(template):
+        if part.type in _MEDIA_PART_TYPES and part.template in attrs:
+            source = attrs[part.template]
+            sources += source if isinstance(source, list) else [source]
+    return sources
+
+
+async def aprefetch_media(template: str, attrs: Mapping[str, Any]) -> None:
+    """Downloads the remote media of `template` concurrently without blocking.
+
+    Async calls await this before parsing their messages, so that the synchronous
+    parsing only reads the fetched media from the cache instead of blocking the event
+    loop on downloads.
+
+    Raises:
+        ValueError: If any of the media failed to download, once all downloads are
+            done, so that parsing never retries the download on the event loop.
+    """
+    urls = _uncached_urls(_media_sources(template, attrs))
+    if not urls:
+        return
+    loop = asyncio.get_running_loop()
+    executor = _get_media_executor()
+    results = await asyncio.gather(
+        *(loop.run_in_executor(executor, _fetch_media, url) for url in urls),
+        return_exceptions=True,
+    )
+    for url, result in zip(urls, results, strict=True):
+        if isinstance(result, Exception):
+            raise ValueError(f"Failed to load or encode data from {url}") from result
 
 
 def _load_media(source: str | bytes) -> bytes:
@@ -71,8 +229,12 @@ def _load_media(source: str | bytes) -> bytes:
         # in a type hint of `str | bytearray | memoryview` for source in the else.
         if isinstance(source, bytes | bytearray | memoryview):
             data = source
-        elif source.startswith(("http://", "https://", "data:", "file://")):
-            with urllib.request.urlopen(source) as response:
+        elif _is_remote(source):
+            data = _fetch_media(source)
+        elif source.startswith(("data:", "file://")):
+            with urllib.request.urlopen(
+                source, timeout=MEDIA_FETCH_TIMEOUT
+            ) as response:
                 data = response.read()
         else:
             with open(source, "rb") as f:
@@ -85,7 +247,7 @@ def _load_media(source: str | bytes) -> bytes:
 
 
 def _construct_image_part(
-    source: str | bytes, options: dict[str, str] | None
+    source: str | bytes, options: Mapping[str, str] | None
 ) -> ImagePart:
     image = _load_media(source)
     detail = None
@@ -125,56 +287,59 @@ def _construct_parts(
     | list[CacheControlPart]
     | list[DocumentPart]
 ):
-    if part["type"] == "image":
-        source = attrs[part["template"]]
-        return [_construct_image_part(source, part["options"])] if source else []
-    elif part["type"] == "images":
-        sources = attrs[part["template"]]
+    if part.type == "image":
+        source = attrs[part.template]
+        return [_construct_image_part(source, part.options)] if source else []
+    elif part.type == "images":
+        sources = attrs[part.template]
         if not isinstance(sources, list):
             raise ValueError(
-                f"When using 'images' template, '{part['template']}' must be a list."
+                f"When using 'images' template, '{part.template}' must be a list."
             )
+        _prefetch_media(sources)
         return (
-            [_construct_image_part(source, part["options"]) for source in sources]
+            [_construct_image_part(source, part.options) for source in sources]
             if sources
             else []
         )
-    elif part["type"] == "audio":
-        source = attrs[part["template"]]
+    elif part.type == "audio":
+        source = attrs[part.template]
         return [_construct_audio_part(source)] if source else []
-    elif part["type"] == "audios":
-        sources = attrs[part["template"]]
+    elif part.type == "audios":
+        sources = attrs[part.template]
         if not isinstance(sources, list):
             raise ValueError(
-                f"When using 'audios' template, '{part['template']}' must be a list."
+                f"When using 'audios' template, '{part.template}' must be a list."
             )
+        _prefetch_media(sources)
         return [_construct_audio_part(source) for source in sources] if sources else []
-    elif part["type"] == "cache_control":
+    elif part.type == "cache_control":
         return [
             CacheControlPart(
                 type="cache_control",
-                cache_type=part["options"].get("type", "ephemeral")
-                if part["options"]
+                cache_type=part.options.get("type", "ephemeral")
+                if part.options
                 else "ephemeral",
             )
         ]
-    elif part["type"] == "document":
-        source = attrs[part["template"]]
+    elif part.type == "document":
+        source = attrs[part.template]
         return [_construct_document_part(source)] if source else []
-    elif part["type"] == "documents":
-        sources = attrs[part["template"]]
+    elif part.type == "documents":
+        sources = attrs[part.template]
         if not isinstance(sources, list):
             raise ValueError(
-                f"When using 'documents' template, '{part['template']}' must be a list."
+                f"When using 'documents' template, '{part.template}' must be a list."
             )
+        _prefetch_media(sources)
         return (
             [_construct_document_part(source) for source in sources] if sources else []
         )
-    elif part["type"] == "texts":
-        sources = attrs[part["template"]]
+    elif part.type == "texts":
+        sources = attrs[part.template]
         if not isinstance(sources, list):
             raise ValueError(
-                f"When using 'texts' template, '{part['template']}' must be a list."
+                f"When using 'texts' template, '{part.template}' must be a list."
             )
         return (
             [TextPart(type="text", text=source) for source in sources]
@@ -182,11 +347,11 @@ def _construct_parts(
             else []
         )
     else:  # text type
-        text = part["template"]
+        text = part.template
         if text in attrs:
             source = attrs[text]
             return [TextPart(type="text", text=source)]
-        formatted_template = format_template(part["template"].strip(), attrs)
+        formatted_template = format_template(part.template.strip(), attrs)
         if not formatted_template:
             return []
         return [TextPart(type="text", text=formatted_template)]
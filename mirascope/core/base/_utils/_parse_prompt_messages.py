@@ -10,6 +10,7 @@ from ..dynamic_config import BaseDynamicConfig
 from ..message_param import BaseMessageParam
 from ._get_template_variables import get_template_variables
 from ._parse_content_template import parse_content_template
+from ._template_cache import template_cache
 
 BaseToolT = TypeVar("BaseToolT", bound=BaseModel)
 _MessageParamT = TypeVar("_MessageParamT", bound=Any)
@@ -33,9 +34,7 @@ def parse_prompt_messages(
         if computed_fields:
             attrs |= computed_fields
     messages = []
-    re_roles = "|".join([role.upper() for role in roles] + ["MESSAGES"])
-    for match in re.finditer(rf"({re_roles}):((.|\n)+?)(?=({re_roles}):|\Z)", template):
-        role, content_template = match.group(1).lower(), match.group(2).strip()
+    for role, content_template in _split_messages(tuple(roles), template):
         if role == "messages":
             template_variables = get_template_variables(content_template, False)
             if template_variables[0].startswith("self"):
@@ -61,3 +60,16 @@ def parse_prompt_messages(
         if content:
             messages.append(content)
     return messages
+
+
+@template_cache
+def _split_messages(
+    roles: tuple[str, ...], template: str
+) -> tuple[tuple[str, str], ...]:
+    re_roles = "|".join([role.upper() for role in roles] + ["MESSAGES"])
+    return tuple(
+        (match.group(1).lower(), match.group(2).strip())
+        for match in re.finditer(
+            rf"({re_roles}):((.|\n)+?)(?=({re_roles}):|\Z)", template
+        )
+    )
@@ -1,6 +1,5 @@
 """Utility for setting up a provider-specific call."""
 
-import inspect
 from collections.abc import (
     Awaitable,
     Callable,
@@ -14,8 +13,8 @@ from ..dynamic_config import BaseDynamicConfig
 from ..message_param import BaseMessageParam
 from ..tool import BaseTool
 from . import get_prompt_template, parse_prompt_messages
-from ._convert_base_model_to_base_tool import convert_base_model_to_base_tool
-from ._convert_function_to_base_tool import convert_function_to_base_tool
+from ._convert_tools import convert_tools
+from ._parse_content_template import aprefetch_media
 
 _BaseToolT = TypeVar("_BaseToolT", bound=BaseTool)
 _BaseDynamicConfigT = TypeVar("_BaseDynamicConfigT", bound=BaseDynamicConfig)
@@ -66,12 +65,33 @@ def setup_call(
 
     tool_types = None
     if tools:
-        tool_types = [
-            convert_base_model_to_base_tool(tool, tool_type)
-            if inspect.isclass(tool)
-            else convert_function_to_base_tool(tool, tool_type)
-            for tool in tools
-        ]
-        call_kwargs["tools"] = [tool_type.tool_schema() for tool_type in tool_types]
+        tool_types, tool_schemas = convert_tools(tools, tool_type)
+        call_kwargs["tools"] = tool_schemas
 
     return prompt_template, messages, tool_types, call_kwargs
+
+
+async def aprefetch_call_media(
+    fn: Callable,
+    fn_args: dict[str, Any],
+    dynamic_config: BaseDynamicConfig,
+) -> None:
+    """Fetches the remote media of an async call's prompt template concurrently.
+
+    `setup_call` is synchronous, so async calls await this first to keep downloads of
+    `{url:image}` and similar parts off the event loop.
+
+    Raises:
+        ValueError: If any of the media failed to download.
+    """
+    attrs = fn_args
+    if dynamic_config is not None:
+        if dynamic_config.get("messages", None):
+            return
+        if computed_fields := dynamic_config.get("computed_fields", None):
+            attrs = attrs | computed_fields
+    try:
+        prompt_template = get_prompt_template(fn)
+    except ValueError:
+        return
+    await aprefetch_media(prompt_template, attrs)
@@ -0,0 +1,30 @@
+"""This module contains the cache for compiled prompt templates."""
+
+from collections.abc import Callable
+from functools import lru_cache
+from typing import Any, TypeVar
+
+_CompileFnT = TypeVar("_CompileFnT", bound=Callable[..., Any])
+
+TEMPLATE_CACHE_MAXSIZE = 1024
+
+_cached_compile_fns: list[Any] = []
+
+
+def template_cache(fn: _CompileFnT) -> _CompileFnT:
+    """Caches the result of a function that compiles a template string.
+
+    Prompt templates never change for a given decorated function, so everything that
+    only depends on the template string (splitting messages and content parts, parsing
+    variables and format specs, dedenting) is computed once and reused for every call.
+    The compiled results are shared across calls and must be treated as immutable.
+    """
+    cached_fn = lru_cache(maxsize=TEMPLATE_CACHE_MAXSIZE)(fn)
+    _cached_compile_fns.append(cached_fn)
+    return cached_fn  # pyright: ignore [reportReturnType]
+
+
+def clear_template_cache() -> None:
+    """Clears the cache of compiled prompt templates."""
+    for cached_fn in _cached_compile_fns:
+        cached_fn.cache_clear()
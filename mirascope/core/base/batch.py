@@ -0,0 +1,240 @@
+"""Utilities for running a call over many inputs with bounded concurrency."""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+from collections.abc import (
+    AsyncGenerator,
+    Awaitable,
+    Callable,
+    Generator,
+    Iterable,
+    Mapping,
+    Sized,
+)
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Generic, TypeVar
+
+from typing_extensions import TypedDict
+
+from .rate_limiter import RateLimiter
+
+_OutputT = TypeVar("_OutputT")
+
+ProgressCallback = Callable[[int, int | None], None]
+"""Called with the number of completed inputs and the total (if known)."""
+
+
+class BatchResult(TypedDict, Generic[_OutputT]):
+    """The result of running a call on a single input of a batch.
+
+    Attributes:
+        index: The position of the input in the batch.
+        input: The keyword arguments the call was made with.
+        output: The output of the call, or `None` if it raised an error.
+        error: The error raised by the call, or `None` if it succeeded.
+    """
+
+    index: int
+    input: Mapping[str, Any]
+    output: _OutputT | None
+    error: Exception | None
+
+
+def _rate_limiter(rate_limit: float | RateLimiter | None) -> RateLimiter | None:
+    if rate_limit is None or isinstance(rate_limit, RateLimiter):
+        return rate_limit
+    return RateLimiter(requests_per_minute=rate_limit * 60, burst=1)
+
+
+def _total(inputs: Iterable[Mapping[str, Any]]) -> int | None:
+    return len(inputs) if isinstance(inputs, Sized) else None
+
+
+async def abatch_iter(
+    fn: Callable[..., Awaitable[_OutputT]],
+    inputs: Iterable[Mapping[str, Any]],
+    *,
+    max_concurrency: int = 10,
+    rate_limit: float | RateLimiter | None = None,
+    on_progress: ProgressCallback | None = None,
+) -> AsyncGenerator[BatchResult[_OutputT], None]:
+    """Runs the async `fn` on each of the `inputs`, yielding results as they complete.
+
+    Inputs are consumed lazily and at most `max_concurrency` calls are in flight at
+    once. No new call is started while the consumer hasn't taken the results that are
+    already done, so iterating slowly applies backpressure instead of buffering.
+
+    Args:
+        fn: The async (e.g. decorated call) function to run.
+        inputs: The keyword arguments for each call.
+        max_concurrency: The maximum number of calls in flight at once.
+        rate_limit: The maximum number of calls started per second, or a
+            `RateLimiter` to share with other calls.
+        on_progress: Called with the completed and total count after each call.
+
+    Yields:
+        A `BatchResult` for each input in completion order. Errors are captured in the
+        result's `error` rather than raised.
+    """
+    if max_concurrency < 1:
+        raise ValueError("`max_concurrency` must be at least 1.")
+    total, completed = _total(inputs), 0
+    rate_limiter = _rate_limiter(rate_limit)
+
+    async def run(index: int, kwargs: Mapping[str, Any]) -> BatchResult[_OutputT]:
+        try:
+            return BatchResult(
+                index=index, input=kwargs, output=await fn(**kwargs), error=None
+            )
+        except Exception as e:
+            return BatchResult(index=index, input=kwargs, output=None, error=e)
+
+    pending: set[asyncio.Task[BatchResult[_OutputT]]] = set()
+    iterator = enumerate(inputs)
+    try:
+        exhausted = False
+        while not exhausted or pending:
+            while not exhausted and len(pending) < max_concurrency:
+                if (next_input := next(iterator, None)) is None:
+                    exhausted = True
+                    break
+                if rate_limiter:
+                    await rate_limiter.aacquire()
+                pending.add(asyncio.create_task(run(*next_input)))
+            if not pending:
+                break
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                completed += 1
+                if on_progress:
+                    on_progress(completed, total)
+                yield task.result()
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+async def abatch(
+    fn: Callable[..., Awaitable[_OutputT]],
+    inputs: Iterable[Mapping[str, Any]],
+    *,
+    max_concurrency: int = 10,
+    rate_limit: float | RateLimiter | None = None,
+    on_progress: ProgressCallback | None = None,
+) -> list[BatchResult[_OutputT]]:
+    """Runs the async `fn` on each of the `inputs` and returns the results in order.
+
+    See `abatch_iter` for the arguments.
+
+    Example:
+
+    ```python
+    from mirascope.core import openai
+    from mirascope.core.base import abatch
+
+
+    @openai.call("gpt-4o-mini")
+    async def recommend_book(genre: str) -> str:
+        return f"Recommend a {genre} book"
+
+
+    results = await abatch(
+        recommend_book, [{"genre": "fantasy"}, {"genre": "horror"}], max_concurrency=5
+    )
+    for result in results:
+        print(result["output"] or result["error"])
+    ```
+    """
+    results = [
+        result
+        async for result in abatch_iter(
+            fn,
+            inputs,
+            max_concurrency=max_concurrency,
+            rate_limit=rate_limit,
+            on_progress=on_progress,
+        )
+    ]
+    return sorted(results, key=lambda result: result["index"])
+
+
+def batch_iter(
+    fn: Callable[..., _OutputT],
+    inputs: Iterable[Mapping[str, Any]],
+    *,
+    max_concurrency: int = 10,
+    rate_limit: float | RateLimiter | None = None,
+    on_progress: ProgressCallback | None = None,
+) -> Generator[BatchResult[_OutputT], None, None]:
+    """Runs the sync `fn` on each of the `inputs` in a thread pool.
+
+    This is the sync counterpart of `abatch_iter` with the same arguments and
+    guarantees, where each call runs on one of `max_concurrency` worker threads in a
+    copy of the caller's context (so e.g. `deadline` and `intercept_create` apply).
+    """
+    if max_concurrency < 1:
+        raise ValueError("`max_concurrency` must be at least 1.")
+    total, completed = _total(inputs), 0
+    rate_limiter = _rate_limiter(rate_limit)
+
+    def run(index: int, kwargs: Mapping[str, Any]) -> BatchResult[_OutputT]:
+        try:
+            return BatchResult(
+                index=index, input=kwargs, output=fn(**kwargs), error=None
+            )
+        except Exception as e:
+            return BatchResult(index=index, input=kwargs, output=None, error=e)
+
+    executor = ThreadPoolExecutor(max_workers=max_concurrency)
+    pending: set[Future[BatchResult[_OutputT]]] = set()
+    iterator = enumerate(inputs)
+    try:
+        exhausted = False
+        while not exhausted or pending:
+            while not exhausted and len(pending) < max_concurrency:
+                if (next_input := next(iterator, None)) is None:
+                    exhausted = True
+                    break
+                if rate_limiter:
+                    rate_limiter.acquire()
+                pending.add(
+                    executor.submit(contextvars.copy_context().run, run, *next_input)
+                )
+            if not pending:
+                break
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                completed += 1
+                if on_progress:
+                    on_progress(completed, total)
+                yield future.result()
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def batch(
+    fn: Callable[..., _OutputT],
+    inputs: Iterable[Mapping[str, Any]],
+    *,
+    max_concurrency: int = 10,
+    rate_limit: float | RateLimiter | None = None,
+    on_progress: ProgressCallback | None = None,
+) -> list[BatchResult[_OutputT]]:
+    """Runs the sync `fn` on each of the `inputs` and returns the results in order.
+
+    This is the sync counterpart of `abatch`, running calls on a thread pool.
+    """
+    results = list(
+        batch_iter(
+            fn,
+            inputs,
+            max_concurrency=max_concurrency,
+            rate_limit=rate_limit,
+            on_progress=on_progress,
+        )
+    )
+    return sorted(results, key=lambda result: result["index"])
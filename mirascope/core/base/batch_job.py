@@ -0,0 +1,224 @@
+"""The `BaseBatchJob` class for running calls through provider batch endpoints."""
+
+from __future__ import annotations
+
+import inspect
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterable, Mapping
+from typing import Any, ClassVar, Generic, TypeVar
+
+from pydantic_core import to_jsonable_python
+from typing_extensions import Self
+
+from ._utils import intercept_create
+from .batch import BatchResult
+
+_ClientT = TypeVar("_ClientT")
+_ResponseT = TypeVar("_ResponseT")
+
+
+class _CapturedRequest(BaseException):
+    """Carries the request out of the call, past any `except Exception` or retries."""
+
+    def __init__(self, call_kwargs: dict[str, Any]) -> None:
+        self.call_kwargs = call_kwargs
+
+
+def _capture_request(call_kwargs: dict[str, Any]) -> Any:  # noqa: ANN401
+    raise _CapturedRequest(call_kwargs)
+
+
+def _respond_with(response: object) -> Callable[[dict[str, Any]], Any]:
+    return lambda call_kwargs: response
+
+
+def custom_id(index: int) -> str:
+    """Returns the id of the batch request for the input at `index`."""
+    return f"request-{index}"
+
+
+class BaseBatchJob(Generic[_ClientT, _ResponseT], ABC):
+    """A job running a decorated call over many inputs through a provider batch API.
+
+    Batch endpoints trade latency for price and throughput, which suits offline
+    workloads. Submitting a job runs the decorated call once per input with the
+    provider request intercepted, so the request bodies are built by the same
+    `setup_call` path as regular calls. Once the job has finished, each provider
+    response is fed back through the decorated call, so `results` returns the same
+    call responses, tools, and extracted response models as calling it directly.
+
+    Only sync, non-streaming decorated calls are supported, and the call must build
+    the same request when run again for `results`.
+
+    Example:
+
+    ```python
+    from mirascope.core import openai
+
+
+    @openai.call("gpt-4o-mini")
+    def recommend_book(genre: str) -> str:
+        return f"Recommend a {genre} book"
+
+
+    job = openai.OpenAIBatchJob.submit(
+        recommend_book, [{"genre": "fantasy"}, {"genre": "horror"}]
+    )
+    for result in job.wait(poll_interval=60).results():
+        print(result["output"] or result["error"])
+    ```
+    """
+
+    terminal_statuses: ClassVar[frozenset[str]]
+
+    fn: Callable[..., Any]
+    inputs: list[Mapping[str, Any]]
+    id: str
+    client: _ClientT
+    status: str | None
+
+    def __init__(
+        self,
+        fn: Callable[..., Any],
+        inputs: Iterable[Mapping[str, Any]],
+        id: str,
+        client: _ClientT | None = None,
+    ) -> None:
+        """Initializes an instance of a batch job, e.g. to resume an existing job.
+
+        Args:
+            fn: The decorated call the job was submitted for.
+            inputs: The keyword arguments the job was submitted with.
+            id: The provider id of the batch.
+            client: The client to use, or the default client if `None`.
+        """
+        self.fn = fn
+        self.inputs = list(inputs)
+        self.id = id
+        self.client = client if client is not None else self._default_client()
+        self.status = None
+
+    @classmethod
+    @abstractmethod
+    def _default_client(cls) -> _ClientT:
+        """Returns the client to use when none is provided."""
+        ...
+
+    @classmethod
+    @abstractmethod
+    def _create_batch(cls, client: _ClientT, requests: list[dict[str, Any]]) -> str:
+        """Creates a batch from `custom_id` and `body` requests and returns its id."""
+        ...
+
+    @abstractmethod
+    def _retrieve_status(self) -> str:
+        """Returns the provider's current processing status of the batch."""
+        ...
+
+    @abstractmethod
+    def _fetch_responses(self) -> dict[str, _ResponseT | Exception]:
+        """Returns the response or error for each request by its `custom_id`."""
+        ...
+
+    @staticmethod
+    def build_requests(
+        fn: Callable[..., Any], inputs: Iterable[Mapping[str, Any]]
+    ) -> list[dict[str, Any]]:
+        """Returns the JSON request body for each of the inputs by its `custom_id`.
+
+        Raises:
+            ValueError: If `fn` is not a sync, non-streaming decorated call.
+        """
+        if inspect.iscoroutinefunction(fn):
+            raise ValueError("Batch jobs only support sync decorated calls.")
+        requests = []
+        for index, kwargs in enumerate(inputs):
+            with intercept_create(_capture_request):
+                try:
+                    fn(**kwargs)
+                except _CapturedRequest as captured:
+                    body = to_jsonable_python(captured.call_kwargs)
+                else:
+                    raise ValueError(
+                        "Batch jobs require a function decorated with a provider call "
+                        "decorator and without `stream=True`."
+                    )
+            requests.append({"custom_id": custom_id(index), "body": body})
+        return requests
+
+    @classmethod
+    def submit(
+        cls,
+        fn: Callable[..., Any],
+        inputs: Iterable[Mapping[str, Any]],
+        *,
+        client: _ClientT | None = None,
+    ) -> Self:
+        """Builds a request per input and submits them as a batch.
+
+        Args:
+            fn: The sync decorated call to run on each input.
+            inputs: The keyword arguments for each call.
+            client: The client to use, or the default client if `None`.
+
+        Returns:
+            The submitted batch job.
+        """
+        inputs = list(inputs)
+        client = client if client is not None else cls._default_client()
+        batch_id = cls._create_batch(client, cls.build_requests(fn, inputs))
+        return cls(fn, inputs, batch_id, client)
+
+    @property
+    def done(self) -> bool:
+        """Refreshes `status` and returns whether the batch has finished processing."""
+        self.status = self._retrieve_status()
+        return self.status in self.terminal_statuses
+
+    def wait(self, poll_interval: float = 30.0, timeout: float | None = None) -> Self:
+        """Polls the batch until it has finished processing.
+
+        Args:
+            poll_interval: The number of seconds between status checks.
+            timeout: The maximum number of seconds to wait, or `None` to wait forever.
+
+        Raises:
+            TimeoutError: If the batch has not finished within `timeout` seconds.
+        """
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        while not self.done:
+            if deadline is not None and time.monotonic() + poll_interval > deadline:
+                raise TimeoutError(
+                    f"Batch {self.id} did not finish within {timeout} seconds "
+                    f"(status: {self.status})."
+                )
+            time.sleep(poll_interval)
+        return self
+
+    def results(self) -> list[BatchResult[Any]]:
+        """Returns the output of the decorated call for each input in order.
+
+        Requests that failed, expired, or were cancelled have their error captured in
+        the result's `error`, as do errors raised while processing a response (e.g. a
+        response model validation error).
+        """
+        responses = self._fetch_responses()
+        results: list[BatchResult[Any]] = []
+        for index, kwargs in enumerate(self.inputs):
+            response = responses.get(custom_id(index))
+            if response is None:
+                response = RuntimeError(
+                    f"Batch {self.id} has no result for {custom_id(index)}."
+                )
+            output, error = None, response if isinstance(response, Exception) else None
+            if error is None:
+                try:
+                    with intercept_create(_respond_with(response)):
+                        output = self.fn(**kwargs)
+                except Exception as e:
+                    error = e
+            results.append(
+                BatchResult(index=index, input=kwargs, output=output, error=error)
+            )
+        return results
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import os
 from abc import ABC, abstractmethod
 from typing import Any, ClassVar, Generic, TypeVar
 
@@ -13,6 +14,7 @@ from pydantic import (
     computed_field,
     field_serializer,
 )
+from typing_extensions import Self
 
 from .call_kwargs import BaseCallKwargs
 from .call_params import BaseCallParams
@@ -78,6 +80,19 @@ class BaseCallResponse(
 
     model_config = ConfigDict(extra="allow", arbitrary_types_allowed=True)
 
+    @classmethod
+    def _construct_trusted(cls, **data: Any) -> Self:  # noqa: ANN401
+        """Constructs a call response from fields Mirascope built itself.
+
+        The fields of internally constructed responses (e.g. `fn_args`, `metadata`, and
+        `call_kwargs`) are already correctly typed, so validating them only copies them
+        on every call. Set `MIRASCOPE_VALIDATE_CALL_RESPONSES=ENABLED` in your
+        environment to validate them anyway, e.g. when debugging a provider.
+        """
+        if os.getenv("MIRASCOPE_VALIDATE_CALL_RESPONSES") == "ENABLED":
+            return cls(**data)
+        return cls.model_construct(**data)
+
     @field_serializer("tool_types", when_used="json")
     def serialize_tool_types(
         self, tool_types: list[type[_BaseToolT]] | None, info: FieldSerializationInfo
@@ -88,6 +103,27 @@ class BaseCallResponse(
         """Returns the string content of the response."""
         return self.content
 
+    def dump_fields(self, **kwargs: Any) -> dict[str, Any]:  # noqa: ANN401
+        """Dumps the response like `model_dump` without deriving any computed fields.
+
+        `model_dump` includes every computed field, so dumping a response (e.g. for
+        logging) parses its tools and builds its message param. This only includes the
+        computed fields that were already accessed and cached.
+
+        Args:
+            **kwargs: The keyword arguments for `model_dump` (e.g. `mode="json"`).
+                `exclude` must be a set of field names.
+
+        Returns:
+            The dumped response.
+        """
+        exclude = {
+            name
+            for name in type(self).model_computed_fields
+            if name not in self.__dict__
+        } | set(kwargs.pop("exclude", None) or ())
+        return self.model_dump(exclude=exclude, **kwargs)
+
     @property
     @abstractmethod
     def content(self) -> str:
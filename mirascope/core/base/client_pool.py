@@ -0,0 +1,183 @@
+"""The `ClientPool` class for reusing provider clients across calls."""
+
+from __future__ import annotations
+
+import asyncio
+import atexit
+import contextlib
+import inspect
+import os
+import threading
+import weakref
+from collections.abc import AsyncGenerator, Callable, Hashable, Sequence
+from typing import Any, TypeVar
+
+_ClientT = TypeVar("_ClientT")
+
+
+class ClientPool:
+    """A process-wide registry of provider clients keyed on their configuration.
+
+    Provider SDK clients own an HTTP connection pool, so constructing a new client for
+    every call pays for a new TLS handshake and credential lookup each time. When no
+    `client` is provided to a call decorator, Mirascope instead requests a client from
+    the global `client_pool`, which hands back the same client for the same provider,
+    sync/async flavor, and configuration. The configuration includes the current values
+    of the environment variables the provider's client reads (e.g. `OPENAI_API_KEY`),
+    so changing them yields a new client.
+
+    Asynchronous clients are bound to the event loop on which they are created, so they
+    are pooled per running event loop. They are closed and removed when the loop shuts
+    down its async generators (as `asyncio.run` does before closing the loop), and the
+    clients of loops closed without doing so are dropped once another loop requests a
+    client. Asynchronous clients requested outside of a running event loop are never
+    pooled.
+
+    Example:
+
+    ```python
+    from mirascope.core.base import client_pool
+
+    client_pool.enabled = False  # opt out and construct a new client per call
+    client_pool.close()  # close all pooled sync clients (also runs at exit)
+    await client_pool.aclose()  # close the async clients of the running loop
+    ```
+    """
+
+    enabled: bool
+
+    def __init__(self, *, enabled: bool = True) -> None:
+        """Initializes an instance of `ClientPool`."""
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._sync_clients: dict[Hashable, Any] = {}
+        self._async_clients: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, dict[Hashable, Any]
+        ] = weakref.WeakKeyDictionary()
+        self._shutdown_hooks: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, AsyncGenerator[None, None]
+        ] = weakref.WeakKeyDictionary()
+
+    def _get_or_create(
+        self,
+        clients: dict[Hashable, Any],
+        factory: Callable[..., _ClientT],
+        env: Sequence[str],
+        config: dict[str, Any],
+    ) -> _ClientT:
+        key = (
+            factory,
+            tuple(sorted(config.items())),
+            tuple(os.environ.get(name) for name in env),
+        )
+        try:
+            hash(key)
+        except TypeError:
+            return factory(**config)
+        with self._lock:
+            if (client := clients.get(key)) is None:
+                client = clients[key] = factory(**config)
+        return client
+
+    def get_client(
+        self,
+        factory: Callable[..., _ClientT],
+        /,
+        *,
+        env: Sequence[str] = (),
+        **config: Any,  # noqa: ANN401
+    ) -> _ClientT:
+        """Returns the pooled sync client for `factory(**config)`, creating it if needed.
+
+        Args:
+            factory: The client class (or function) used to construct the client.
+            env: The names of the environment variables that `factory` reads its
+                default configuration from.
+            **config: The keyword arguments with which to construct the client. These
+                must be hashable for the client to be pooled.
+        """
+        if not self.enabled:
+            return factory(**config)
+        return self._get_or_create(self._sync_clients, factory, env, config)
+
+    def get_async_client(
+        self,
+        factory: Callable[..., _ClientT],
+        /,
+        *,
+        env: Sequence[str] = (),
+        **config: Any,  # noqa: ANN401
+    ) -> _ClientT:
+        """Returns the pooled async client for the running event loop.
+
+        Args:
+            factory: The async client class (or function) used to construct the client.
+            env: The names of the environment variables that `factory` reads its
+                default configuration from.
+            **config: The keyword arguments with which to construct the client. These
+                must be hashable for the client to be pooled.
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return factory(**config)
+        if not self.enabled:
+            return factory(**config)
+        return self._get_or_create(self._loop_clients(loop), factory, env, config)
+
+    def _loop_clients(self, loop: asyncio.AbstractEventLoop) -> dict[Hashable, Any]:
+        with self._lock:
+            if (loop_clients := self._async_clients.get(loop)) is not None:
+                return loop_clients
+            # Pooled clients keep their loop alive, so the clients of loops that were
+            # closed without shutting down their async generators are dropped here
+            for closed_loop in [key for key in self._async_clients if key.is_closed()]:
+                del self._async_clients[closed_loop]
+                self._shutdown_hooks.pop(closed_loop, None)
+            if loop not in self._shutdown_hooks:
+                hook = self._shutdown_hooks[loop] = self._aclose_on_shutdown()
+                _start(hook)
+            loop_clients = self._async_clients[loop] = {}
+        return loop_clients
+
+    def close(self) -> None:
+        """Closes and removes every pooled sync client."""
+        with self._lock:
+            clients, self._sync_clients = list(self._sync_clients.values()), {}
+        for client in clients:
+            close = getattr(client, "close", None)
+            if callable(close) and not inspect.iscoroutinefunction(close):
+                close()
+
+    async def _aclose_on_shutdown(self) -> AsyncGenerator[None, None]:
+        # Stays suspended until `loop.shutdown_asyncgens()` closes it.
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._shutdown_hooks.pop(asyncio.get_running_loop(), None)
+            await self.aclose()
+
+    async def aclose(self) -> None:
+        """Closes and removes every async client pooled on the running event loop."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            clients = list(self._async_clients.pop(loop, {}).values())
+        for client in clients:
+            close = getattr(client, "close", None)
+            if not callable(close):
+                continue
+            if inspect.isawaitable(result := close()):
+                await result
+
+
+def _start(hook: AsyncGenerator[None, None]) -> None:
+    """Runs `hook` up to its first `yield`, registering it with the running loop."""
+    with contextlib.suppress(StopIteration):
+        hook.asend(None).send(None)
+
+
+client_pool = ClientPool()
+"""The global `ClientPool` used by all providers when no `client` is provided."""
+
+atexit.register(client_pool.close)
@@ -0,0 +1,312 @@
+"""Deadlines bounding the wall time of calls, streams, and retries.
+
+usage docs: learn/calls.md
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+import warnings
+from collections.abc import (
+    AsyncGenerator,
+    AsyncIterable,
+    Awaitable,
+    Callable,
+    Generator,
+    Iterable,
+)
+from contextvars import ContextVar, Token
+from functools import wraps
+from typing import Any, ParamSpec, TypeVar, overload
+
+from ._utils import fn_is_async
+
+_P = ParamSpec("_P")
+_R = TypeVar("_R")
+_T = TypeVar("_T")
+
+# Providers whose SDKs accept a per-request `timeout` on `create`, which also bounds
+# each read of a stream so blocking sync calls can be cut off by the SDK itself.
+_REQUEST_TIMEOUT_PROVIDERS = frozenset({"anthropic", "groq", "litellm", "openai"})
+
+
+class DeadlineExceededError(TimeoutError):
+    """Raised when a call runs past its deadline."""
+
+
+class Deadline:
+    """The time budget of the calls made while a `deadline` is active.
+
+    Attributes:
+        expires_at: The `time.monotonic()` time at which the budget runs out, if any.
+        first_token_timeout: The maximum seconds from sending a streaming request to
+            receiving its first chunk.
+        chunk_timeout: The maximum seconds between two chunks of a stream.
+    """
+
+    expires_at: float | None
+    first_token_timeout: float | None
+    chunk_timeout: float | None
+
+    def __init__(
+        self,
+        expires_at: float | None = None,
+        first_token_timeout: float | None = None,
+        chunk_timeout: float | None = None,
+    ) -> None:
+        """Initializes an instance of `Deadline`."""
+        self.expires_at = expires_at
+        self.first_token_timeout = first_token_timeout
+        self.chunk_timeout = chunk_timeout
+
+    def remaining(self) -> float | None:
+        """Returns the seconds left in the budget, or `None` if it has no total."""
+        if self.expires_at is None:
+            return None
+        return self.expires_at - time.monotonic()
+
+    def check(self) -> None:
+        """Raises `DeadlineExceededError` if the budget has run out."""
+        if (remaining := self.remaining()) is not None and remaining <= 0:
+            raise DeadlineExceededError("The deadline was exceeded")
+
+    def request_kwargs(
+        self, provider: str, call_kwargs: dict[str, Any], stream: bool
+    ) -> dict[str, Any]:
+        """Returns `call_kwargs` with the SDK request `timeout` set from the budget.
+
+        The kwargs are returned unchanged if `provider` does not support per-request
+        timeouts or a `timeout` was already set through the call params.
+        """
+        if provider not in _REQUEST_TIMEOUT_PROVIDERS or "timeout" in call_kwargs:
+            return call_kwargs
+        if (timeout := self._request_timeout(stream)) is None:
+            return call_kwargs
+        return call_kwargs | {"timeout": max(timeout, 0.0)}
+
+    def blocking_request_kwargs(
+        self, provider: str, call_kwargs: dict[str, Any], stream: bool
+    ) -> dict[str, Any]:
+        """Checks the budget and returns the `request_kwargs` of a sync request.
+
+        Only the SDK can cut off a blocking request, so this warns if `provider` does
+        not support per-request timeouts and the request is left unbounded.
+        """
+        self.check()
+        if (
+            provider not in _REQUEST_TIMEOUT_PROVIDERS
+            and "timeout" not in call_kwargs
+            and self._request_timeout(stream) is not None
+        ):
+            warnings.warn(
+                f"Sync {provider} requests can't be interrupted, so the deadline is "
+                "only checked before the request and between stream chunks. Use an "
+                "async call to enforce it.",
+                UserWarning,
+                stacklevel=2,
+            )
+        return self.request_kwargs(provider, call_kwargs, stream)
+
+    async def wait_for(
+        self, awaitable: Awaitable[_T], timeout: float | None = None
+    ) -> _T:
+        """Awaits `awaitable`, cancelling it once the budget or `timeout` runs out."""
+        try:
+            return await asyncio.wait_for(
+                awaitable, _min_timeout(self.remaining(), timeout)
+            )
+        except asyncio.TimeoutError as e:
+            raise DeadlineExceededError("The deadline was exceeded") from e
+
+    def iter_chunks(
+        self, chunks: Iterable[_T], started: float
+    ) -> Generator[_T, None, None]:
+        """Yields `chunks`, raising once a chunk arrives later than allowed.
+
+        Sync iteration cannot be interrupted while it waits for a chunk, so a late
+        chunk is only detected once it arrives (or once the SDK request timeout set by
+        `request_kwargs` cuts the read off).
+        """
+        last, first = started, True
+        for chunk in chunks:
+            now = time.monotonic()
+            self._check_chunk(now - last, first)
+            last, first = now, False
+            yield chunk
+
+    async def aiter_chunks(
+        self, chunks: AsyncIterable[_T], started: float
+    ) -> AsyncGenerator[_T, None]:
+        """Yields `chunks`, cancelling the read of a chunk that takes too long."""
+        iterator = aiter(chunks)
+        first = True
+        while True:
+            timeout = self.first_token_timeout if first else self.chunk_timeout
+            if first and timeout is not None:
+                timeout -= time.monotonic() - started
+            try:
+                chunk = await self.wait_for(anext(iterator), timeout)
+            except StopAsyncIteration:
+                return
+            first = False
+            yield chunk
+
+    def _request_timeout(self, stream: bool) -> float | None:
+        return _min_timeout(
+            self.remaining(),
+            self.first_token_timeout if stream else None,
+            self.chunk_timeout if stream else None,
+        )
+
+    def _check_chunk(self, gap: float, first: bool) -> None:
+        timeout = self.first_token_timeout if first else self.chunk_timeout
+        if timeout is not None and gap > timeout:
+            raise DeadlineExceededError(
+                f"No {'first' if first else 'next'} chunk within {timeout}s"
+            )
+        self.check()
+
+
+def _min_timeout(*timeouts: float | None) -> float | None:
+    return min((timeout for timeout in timeouts if timeout is not None), default=None)
+
+
+_current_deadline: ContextVar[Deadline | None] = ContextVar(
+    "current_deadline", default=None
+)
+# The tokens of the deadlines entered as context managers in the current context, so
+# each exit resets the token of its own entry even when threads or tasks share a scope
+_entered_tokens: ContextVar[tuple[Token[Deadline | None], ...]] = ContextVar(
+    "entered_deadline_tokens", default=()
+)
+
+
+def current_deadline() -> Deadline | None:
+    """Returns the innermost active deadline, if any."""
+    return _current_deadline.get()
+
+
+class _DeadlineScope:
+    """Activates a new `Deadline` as a context manager or around a function."""
+
+    def __init__(
+        self,
+        timeout: float | None,
+        first_token_timeout: float | None,
+        chunk_timeout: float | None,
+    ) -> None:
+        self.timeout = timeout
+        self.first_token_timeout = first_token_timeout
+        self.chunk_timeout = chunk_timeout
+
+    def _activate(self) -> Token[Deadline | None]:
+        parent = _current_deadline.get() or Deadline()
+        expires_at = parent.expires_at
+        if self.timeout is not None:
+            expires_at = _min_timeout(expires_at, time.monotonic() + self.timeout)
+        return _current_deadline.set(
+            Deadline(
+                expires_at=expires_at,
+                first_token_timeout=_min_timeout(
+                    parent.first_token_timeout, self.first_token_timeout
+                ),
+                chunk_timeout=_min_timeout(parent.chunk_timeout, self.chunk_timeout),
+            )
+        )
+
+    def __enter__(self) -> Deadline:
+        _entered_tokens.set((*_entered_tokens.get(), self._activate()))
+        return _current_deadline.get()  # pyright: ignore [reportReturnType]
+
+    def __exit__(self, *exc_info: object) -> None:
+        *tokens, token = _entered_tokens.get()
+        _entered_tokens.set(tuple(tokens))
+        _current_deadline.reset(token)
+
+    async def __aenter__(self) -> Deadline:
+        return self.__enter__()
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        self.__exit__(*exc_info)
+
+    @overload
+    def __call__(
+        self, fn: Callable[_P, Awaitable[_R]]
+    ) -> Callable[_P, Awaitable[_R]]: ...
+
+    @overload
+    def __call__(self, fn: Callable[_P, _R]) -> Callable[_P, _R]: ...
+
+    def __call__(
+        self, fn: Callable[_P, _R] | Callable[_P, Awaitable[_R]]
+    ) -> Callable[_P, _R] | Callable[_P, Awaitable[_R]]:
+        if fn_is_async(fn):
+
+            @wraps(fn)
+            async def inner_async(*args: _P.args, **kwargs: _P.kwargs) -> _R:
+                token = self._activate()
+                try:
+                    return await fn(*args, **kwargs)
+                finally:
+                    _current_deadline.reset(token)
+
+            return inner_async
+
+        @wraps(fn)
+        def inner(*args: _P.args, **kwargs: _P.kwargs) -> _R:
+            token = self._activate()
+            try:
+                return fn(*args, **kwargs)  # pyright: ignore [reportReturnType]
+            finally:
+                _current_deadline.reset(token)
+
+        return inner
+
+
+def deadline(
+    timeout: float | None = None,
+    *,
+    first_token_timeout: float | None = None,
+    chunk_timeout: float | None = None,
+) -> _DeadlineScope:
+    """Bounds the wall time of every call made within it.
+
+    Use it as a (async) context manager or as a decorator, e.g. around a decorated call
+    or an agent function making several calls. Nested deadlines can only tighten the
+    budget of the enclosing one, so an agent step never outlives its agent.
+
+    Calls check the budget before sending a request. Async requests and stream reads
+    are cancelled once it runs out, while sync ones are bounded by the SDK's request
+    timeout where the provider supports one (OpenAI, Anthropic, Groq, and LiteLLM).
+    Sync requests to other providers can't be interrupted and emit a warning. Streams
+    keep the deadline that was active when they were created. Exceeding it raises
+    `DeadlineExceededError`.
+
+    Example:
+
+    ```python
+    from mirascope.core import openai
+    from mirascope.core.base import deadline
+
+
+    @deadline(30, first_token_timeout=5, chunk_timeout=2)
+    @openai.call("gpt-4o-mini", stream=True)
+    def recommend_book(genre: str) -> str:
+        return f"Recommend a {genre} book"
+
+
+    for chunk, _ in recommend_book("fantasy"):
+        print(chunk.content, end="", flush=True)
+    ```
+
+    Args:
+        timeout: The maximum total seconds, shared by all calls within the deadline.
+        first_token_timeout: The maximum seconds from sending a streaming request to
+            receiving its first chunk.
+        chunk_timeout: The maximum seconds between two chunks of a stream.
+
+    Returns:
+        The context manager or decorator activating the deadline.
+    """
+    return _DeadlineScope(timeout, first_token_timeout, chunk_timeout)
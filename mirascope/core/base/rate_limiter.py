@@ -0,0 +1,168 @@
+"""Client-side rate limiting of provider calls with token buckets.
+
+usage docs: learn/calls.md
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+
+class _TokenBucket:
+    """A bucket refilling at `per_minute / 60` per second up to `capacity`.
+
+    Reservations are taken immediately and may drive the level negative, so waiters
+    are served in order and each one only has to sleep off its own deficit.
+    """
+
+    def __init__(self, per_minute: float, capacity: float | None = None) -> None:
+        self.rate = per_minute / 60
+        self.capacity = capacity if capacity is not None else per_minute
+        self.level = self.capacity
+        self.updated = time.monotonic()
+
+    def reserve(self, amount: float, now: float) -> float:
+        self.level = min(self.capacity, self.level + (now - self.updated) * self.rate)
+        self.updated = now
+        self.level -= min(amount, self.capacity)
+        return max(0.0, -self.level / self.rate)
+
+    def refund(self, amount: float) -> None:
+        self.level = min(self.capacity, self.level + amount)
+
+
+class RateLimiter:
+    """Limits the requests and tokens per minute of the calls that share it.
+
+    Calls reserve one request and their estimated tokens (the rendered messages plus
+    `max_tokens`) before the request is sent, waiting until both buckets allow it.
+    Once the response arrives, the estimate is reconciled with the actual usage.
+
+    Example:
+
+    ```python
+    from mirascope.core import openai
+    from mirascope.core.base import RateLimiter, rate_limiters
+
+    rate_limiters.set("openai", RateLimiter(requests_per_minute=500))
+    rate_limiters.set(
+        "openai", RateLimiter(tokens_per_minute=30_000), model="gpt-4o-mini"
+    )
+
+
+    @openai.call("gpt-4o-mini")
+    def recommend_book(genre: str) -> str:
+        return f"Recommend a {genre} book"
+    ```
+
+    Attributes:
+        throttled_requests: The number of requests that had to wait.
+        throttled_seconds: The total time requests spent waiting.
+    """
+
+    throttled_requests: int
+    throttled_seconds: float
+
+    def __init__(
+        self,
+        requests_per_minute: float | None = None,
+        tokens_per_minute: float | None = None,
+        *,
+        burst: float | None = None,
+    ) -> None:
+        """Initializes an instance of `RateLimiter`.
+
+        Args:
+            requests_per_minute: The maximum number of requests per minute.
+            tokens_per_minute: The maximum number of (input and output) tokens per
+                minute.
+            burst: The maximum number of requests that can start at once, which
+                defaults to `requests_per_minute`.
+        """
+        self._requests = (
+            _TokenBucket(requests_per_minute, burst) if requests_per_minute else None
+        )
+        self._tokens = _TokenBucket(tokens_per_minute) if tokens_per_minute else None
+        self._lock = threading.Lock()
+        self.throttled_requests = 0
+        self.throttled_seconds = 0.0
+
+    def reserve(self, tokens: float = 0) -> float:
+        """Reserves a request and `tokens` and returns the seconds to wait before it."""
+        with self._lock:
+            now = time.monotonic()
+            delay = max(
+                self._requests.reserve(1, now) if self._requests else 0.0,
+                self._tokens.reserve(tokens, now) if self._tokens else 0.0,
+            )
+            if delay:
+                self.throttled_requests += 1
+                self.throttled_seconds += delay
+            return delay
+
+    def acquire(self, tokens: float = 0) -> None:
+        """Blocks until a request using `tokens` is allowed."""
+        if delay := self.reserve(tokens):
+            time.sleep(delay)
+
+    async def aacquire(self, tokens: float = 0) -> None:
+        """Waits without blocking the event loop until a request is allowed."""
+        if delay := self.reserve(tokens):
+            await asyncio.sleep(delay)
+
+    def reconcile(
+        self,
+        estimated_tokens: float,
+        input_tokens: float | None,
+        output_tokens: float | None,
+    ) -> None:
+        """Corrects a reservation of `estimated_tokens` with the reported usage.
+
+        The estimate is kept when the provider did not report any usage.
+        """
+        if not self._tokens or (input_tokens is None and output_tokens is None):
+            return
+        with self._lock:
+            self._tokens.refund(
+                estimated_tokens - (input_tokens or 0) - (output_tokens or 0)
+            )
+
+
+class RateLimiters:
+    """A registry of the rate limiters attached to providers and models."""
+
+    def __init__(self) -> None:
+        """Initializes an empty instance of `RateLimiters`."""
+        self._rate_limiters: dict[tuple[str, str | None], RateLimiter] = {}
+
+    def __bool__(self) -> bool:
+        return bool(self._rate_limiters)
+
+    def set(
+        self,
+        provider: str,
+        rate_limiter: RateLimiter | None,
+        *,
+        model: str | None = None,
+    ) -> None:
+        """Attaches `rate_limiter` to all calls to `provider` or to one of its models.
+
+        A model's rate limiter takes precedence over the provider's. Passing `None`
+        removes the rate limiter.
+        """
+        if rate_limiter is None:
+            self._rate_limiters.pop((provider, model), None)
+        else:
+            self._rate_limiters[(provider, model)] = rate_limiter
+
+    def get(self, provider: str, model: str) -> RateLimiter | None:
+        """Returns the rate limiter for calls to `model` of `provider`, if any."""
+        return self._rate_limiters.get((provider, model)) or self._rate_limiters.get(
+            (provider, None)
+        )
+
+
+rate_limiters = RateLimiters()
+"""The rate limiters honoured by all decorated calls."""
@@ -0,0 +1,296 @@
+"""Exact-match caching of provider responses keyed on the final call kwargs.
+
+usage docs: learn/calls.md
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import pickle
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any
+
+from pydantic_core import to_jsonable_python
+
+
+def _normalize_unknown(value: Any) -> Any:  # noqa: ANN401
+    """Converts the SDK objects `to_jsonable_python` doesn't know into plain data.
+
+    Raises:
+        TypeError: If `value` has no stable representation to key the request on.
+    """
+    if callable(as_dict := getattr(value, "as_dict", None)):  # Azure models
+        return as_dict()
+    if callable(to_dict := getattr(value, "to_dict", None)):  # Vertex AI wrappers
+        return to_dict()
+    if callable(to_proto := getattr(value, "to_proto", None)):  # Gemini types
+        return to_proto()
+    if hasattr(type(value), "pb") and callable(getattr(type(value), "to_dict", None)):
+        return type(value).to_dict(value)  # proto-plus messages
+    if callable(serialize := getattr(value, "SerializeToString", None)):
+        return serialize(deterministic=True)  # protobuf messages
+    raise TypeError(f"Cannot key a request on a value of type {type(value)}.")
+
+
+def response_cache_key(
+    provider: str, model: str, call_kwargs: Mapping[str, Any], stream: bool
+) -> str | None:
+    """Returns a stable hash of a request to `model` of `provider` with `call_kwargs`.
+
+    Returns `None` if `call_kwargs` holds a value without a stable representation
+    (e.g. an image object), in which case the request must not be cached.
+    """
+    try:
+        request = to_jsonable_python(
+            {
+                "provider": provider,
+                "model": model,
+                "stream": stream,
+                "call_kwargs": call_kwargs,
+            },
+            bytes_mode="base64",
+            fallback=_normalize_unknown,
+        )
+    except (TypeError, ValueError):
+        return None
+    return hashlib.sha256(
+        json.dumps(request, sort_keys=True, separators=(",", ":")).encode()
+    ).hexdigest()
+
+
+class BaseResponseCache(ABC):
+    """The base class for caches of provider responses.
+
+    Caches store the original provider response, or the list of provider chunks for
+    streams, so cached calls are rebuilt into complete call responses with their
+    tools, usage, and cost, and cached streams are replayed chunk by chunk.
+
+    Attributes:
+        hits: The number of lookups that found a cached response.
+        misses: The number of lookups that did not.
+    """
+
+    hits: int
+    misses: int
+
+    def __init__(self, ttl: float | None = None) -> None:
+        """Initializes the cache.
+
+        Args:
+            ttl: The number of seconds after which entries expire, or `None` to keep
+                them until they are evicted.
+        """
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._stats_lock = threading.Lock()
+
+    @abstractmethod
+    def _get(self, key: str) -> tuple[Any, float] | None:
+        """Returns the value stored under `key` and when it was stored, if any."""
+        ...
+
+    @abstractmethod
+    def _set(self, key: str, value: Any, created_at: float) -> None:  # noqa: ANN401
+        """Stores `value` under `key`."""
+        ...
+
+    @abstractmethod
+    def _delete(self, key: str) -> None:
+        """Removes the entry stored under `key`."""
+        ...
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Removes all entries from the cache."""
+        ...
+
+    def get(self, key: str) -> Any | None:  # noqa: ANN401
+        """Returns the response cached under `key`, or `None` on a miss."""
+        entry = self._get(key)
+        if (
+            entry is not None
+            and self.ttl is not None
+            and time.time() - entry[1] > self.ttl
+        ):
+            self._delete(key)
+            entry = None
+        with self._stats_lock:
+            if entry is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return None if entry is None else entry[0]
+
+    def set(self, key: str, value: Any) -> None:  # noqa: ANN401
+        """Caches the response `value` under `key`."""
+        self._set(key, value, time.time())
+
+    async def aget(self, key: str) -> Any | None:  # noqa: ANN401
+        """Returns the response cached under `key` from async calls.
+
+        Caches that block on I/O override this to keep it off the event loop.
+        """
+        return self.get(key)
+
+    async def aset(self, key: str, value: Any) -> None:  # noqa: ANN401
+        """Caches the response `value` under `key` from async calls."""
+        self.set(key, value)
+
+
+class InMemoryResponseCache(BaseResponseCache):
+    """An in-process LRU cache of provider responses.
+
+    Responses are shared between the calls that hit them and must not be mutated.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float | None = None) -> None:
+        """Initializes an instance of `InMemoryResponseCache`.
+
+        Args:
+            maxsize: The maximum number of entries before the least recently used one
+                is evicted.
+            ttl: The number of seconds after which entries expire.
+        """
+        super().__init__(ttl)
+        self.maxsize = maxsize
+        self._entries: OrderedDict[str, tuple[Any, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _get(self, key: str) -> tuple[Any, float] | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def _set(self, key: str, value: Any, created_at: float) -> None:  # noqa: ANN401
+        with self._lock:
+            self._entries[key] = (value, created_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def _delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Removes all entries from the cache."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SQLiteResponseCache(BaseResponseCache):
+    """An on-disk cache of pickled provider responses in a SQLite database.
+
+    The cache persists across processes, which suits re-running eval and regression
+    pipelines. Responses that cannot be pickled are not cached, and entries that can no
+    longer be unpickled (e.g. after an SDK upgrade) are treated as misses and removed.
+    """
+
+    def __init__(self, path: str | Path, ttl: float | None = None) -> None:
+        """Initializes an instance of `SQLiteResponseCache`.
+
+        Args:
+            path: The path of the database file, which is created if missing.
+            ttl: The number of seconds after which entries expire.
+        """
+        super().__init__(ttl)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(str(path), check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS responses "
+                "(key TEXT PRIMARY KEY, value BLOB NOT NULL, created_at REAL NOT NULL)"
+            )
+
+    def _get(self, key: str) -> tuple[Any, float] | None:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT value, created_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        try:
+            return pickle.loads(row[0]), row[1]
+        except Exception:
+            # A corrupt entry or one pickled by an incompatible SDK version is a miss
+            self._delete(key)
+            return None
+
+    def _set(self, key: str, value: Any, created_at: float) -> None:  # noqa: ANN401
+        try:
+            blob = pickle.dumps(value)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            return
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?)",
+                (key, blob, created_at),
+            )
+
+    def _delete(self, key: str) -> None:
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM responses WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        """Removes all entries from the cache."""
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM responses")
+
+    async def aget(self, key: str) -> Any | None:  # noqa: ANN401
+        """Returns the response cached under `key` without blocking the event loop."""
+        return await asyncio.to_thread(self.get, key)
+
+    async def aset(self, key: str, value: Any) -> None:  # noqa: ANN401
+        """Caches the response `value` under `key` without blocking the event loop."""
+        await asyncio.to_thread(self.set, key, value)
+
+    def close(self) -> None:
+        """Closes the database connection."""
+        self._connection.close()
+
+
+_response_cache: BaseResponseCache | None = None
+
+
+def set_response_cache(cache: BaseResponseCache | None) -> None:
+    """Sets the cache used by all decorated calls, or disables caching with `None`.
+
+    Example:
+
+    ```python
+    from mirascope.core import openai
+    from mirascope.core.base import SQLiteResponseCache, set_response_cache
+
+    set_response_cache(SQLiteResponseCache(".mirascope_cache.db"))
+
+
+    @openai.call("gpt-4o-mini")
+    def recommend_book(genre: str) -> str:
+        return f"Recommend a {genre} book"
+
+
+    recommend_book("fantasy")  # calls the API
+    recommend_book("fantasy")  # returns the cached response
+    ```
+    """
+    global _response_cache
+    _response_cache = cache
+
+
+def get_response_cache() -> BaseResponseCache | None:
+    """Returns the cache used by all decorated calls, if any."""
+    return _response_cache
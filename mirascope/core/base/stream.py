@@ -1,8 +1,17 @@
 """This module contains the base classes for streaming responses from LLMs."""
 
 import datetime
+import time
 from abc import ABC, abstractmethod
-from collections.abc import AsyncGenerator, Awaitable, Callable, Coroutine, Generator
+from collections.abc import (
+    AsyncGenerator,
+    AsyncIterable,
+    Awaitable,
+    Callable,
+    Coroutine,
+    Generator,
+    Iterable,
+)
 from functools import wraps
 from typing import (
     Any,
@@ -14,14 +23,20 @@ from typing import (
     overload,
 )
 
+from typing_extensions import Self
+
 from ._utils import (
+    CallPlan,
     HandleStream,
     HandleStreamAsync,
     SameSyncAndAsyncClientSetupCall,
     SetupCall,
+    aclose_stream,
+    aprefetch_call_media,
+    close_stream,
+    estimate_tokens,
     fn_is_async,
     get_dynamic_configuration,
-    get_fn_args,
     get_metadata,
     get_possible_user_message_param,
     is_prompt_template,
@@ -30,10 +45,13 @@ from .call_kwargs import BaseCallKwargs
 from .call_params import BaseCallParams
 from .call_response import BaseCallResponse
 from .call_response_chunk import BaseCallResponseChunk
+from .deadline import current_deadline
 from .dynamic_config import BaseDynamicConfig
 from .messages import Messages
 from .metadata import Metadata
 from .prompt import prompt_template
+from .rate_limiter import rate_limiters
+from .response_cache import BaseResponseCache, get_response_cache, response_cache_key
 from .tool import BaseTool
 
 _BaseCallResponseT = TypeVar("_BaseCallResponseT", bound=BaseCallResponse)
@@ -53,6 +71,51 @@ _FinishReason = TypeVar("_FinishReason")
 _DEFAULT = object()
 
 
+_ChunkT = TypeVar("_ChunkT")
+
+
+def _cache_chunks(
+    chunks: Iterable[_ChunkT], cache: BaseResponseCache, key: str
+) -> Generator[_ChunkT, None, None]:
+    """Yields the provider `chunks` and caches them once the stream completes."""
+    cached_chunks = []
+    for chunk in chunks:
+        cached_chunks.append(chunk)
+        yield chunk
+    cache.set(key, cached_chunks)
+
+
+async def _acache_chunks(
+    chunks: AsyncIterable[_ChunkT], cache: BaseResponseCache, key: str
+) -> AsyncGenerator[_ChunkT, None]:
+    """Yields the provider `chunks` and caches them once the stream completes."""
+    cached_chunks = []
+    async for chunk in chunks:
+        cached_chunks.append(chunk)
+        yield chunk
+    await cache.aset(key, cached_chunks)
+
+
+async def _replay_chunks(chunks: list[_ChunkT]) -> AsyncGenerator[_ChunkT, None]:
+    """Yields cached provider `chunks` as an async stream."""
+    for chunk in chunks:
+        yield chunk
+
+
+class _StreamUsage:
+    """Sums the usage reported across the chunks of a stream."""
+
+    def __init__(self) -> None:
+        self.input_tokens: int | float | None = None
+        self.output_tokens: int | float | None = None
+
+    def update(self, chunk: BaseCallResponseChunk) -> None:
+        if chunk.input_tokens is not None:
+            self.input_tokens = (self.input_tokens or 0) + chunk.input_tokens
+        if chunk.output_tokens is not None:
+            self.output_tokens = (self.output_tokens or 0) + chunk.output_tokens
+
+
 class BaseStream(
     Generic[
         _BaseCallResponseT,
@@ -78,7 +141,6 @@ class BaseStream(
             None,
         ]
     )
-    content: str
     metadata: Metadata
     tool_types: list[type[_BaseToolT]] | None
     call_response_type: type[_BaseCallResponseT]
@@ -99,6 +161,7 @@ class BaseStream(
     end_time: float = 0
 
     _provider: ClassVar[str] = "NO PROVIDER"
+    _stop_when: Callable[[Any], bool] | None = None
 
     def __init__(
         self,
@@ -120,7 +183,7 @@ class BaseStream(
         call_kwargs: BaseCallKwargs[_ToolSchemaT],
     ) -> None:
         """Initializes an instance of `BaseStream`."""
-        self.content = ""
+        self._content_parts: list[str] = []
         self.stream = stream
         self.metadata = metadata
         self.tool_types = tool_types
@@ -134,6 +197,62 @@ class BaseStream(
         self.call_kwargs = call_kwargs
         self.user_message_param = get_possible_user_message_param(messages)  # pyright: ignore [reportAttributeAccessIssue]
 
+    def stop_when(self, predicate: Callable[[Self], bool]) -> Self:
+        """Stops the stream as soon as `predicate` is satisfied.
+
+        The predicate is called with the stream after every chunk, so it can check the
+        content received so far. Once it returns `True`, the provider stream is closed,
+        which stops generation and releases the connection, the last chunk is yielded,
+        and `message_param` is constructed from the partial content.
+
+        Example:
+
+        ```python
+        stream = recommend_book("fantasy").stop_when(
+            lambda stream: "\n\n" in stream.content
+        )
+        for chunk, _ in stream:
+            print(chunk.content, end="", flush=True)
+        ```
+
+        Args:
+            predicate: The function deciding whether to stop, given the stream.
+
+        Returns:
+            The stream itself for chaining.
+        """
+        self._stop_when = predicate
+        return self
+
+    def close(self) -> None:
+        """Stops the stream and releases the provider connection.
+
+        Streams are also closed when used as a context manager or when iterating over
+        them stops early, but closing them explicitly guarantees the connection is
+        released right away instead of when the stream is garbage collected.
+        """
+        assert isinstance(self.stream, Generator), "Stream must be a generator"
+        self.stream.close()
+
+    async def aclose(self) -> None:
+        """Stops the async stream and releases the provider connection."""
+        assert isinstance(
+            self.stream, AsyncGenerator
+        ), "Stream must be an async generator"
+        await self.stream.aclose()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
     def __iter__(
         self,
     ) -> Generator[tuple[_BaseCallResponseChunkT, _BaseToolT | None], None, None]:
@@ -143,17 +262,26 @@ class BaseStream(
         ), "Stream must be a generator for __iter__"
         self.content, tool_calls = "", []
         self.start_time = datetime.datetime.now().timestamp() * 1000
-        for chunk, tool in self.stream:
-            self._update_properties(chunk)
-            if tool:
-                tool_call = getattr(tool, "tool_call", _DEFAULT)
-                if tool_call != _DEFAULT:
-                    tool_calls.append(tool_call)
-            yield chunk, tool
-        self.end_time = datetime.datetime.now().timestamp() * 1000
-        self.message_param = self._construct_message_param(
-            tool_calls or None, self.content
-        )
+        try:
+            for chunk, tool in self.stream:
+                self._update_properties(chunk)
+                if tool:
+                    tool_call = getattr(tool, "tool_call", _DEFAULT)
+                    if tool_call != _DEFAULT:
+                        tool_calls.append(tool_call)
+                if self._stop_when is not None and self._stop_when(self):
+                    self.stream.close()
+                    yield chunk, tool
+                    break
+                yield chunk, tool
+        finally:
+            # Also runs when the consumer stops iterating early, so the provider
+            # stream is released and the partial message is kept.
+            self.stream.close()
+            self.end_time = datetime.datetime.now().timestamp() * 1000
+            self.message_param = self._construct_message_param(
+                tool_calls or None, self.content
+            )
 
     def __aiter__(
         self,
@@ -168,40 +296,62 @@ class BaseStream(
                 self.stream, AsyncGenerator
             ), "Stream must be an async generator for __aiter__"
             tool_calls = []
-            async for chunk, tool in self.stream:
-                self._update_properties(chunk)
-                if tool:
-                    tool_call = getattr(tool, "tool_call", _DEFAULT)
-                    if tool_call != _DEFAULT:
-                        tool_calls.append(tool_call)
-                yield chunk, tool
-            self.message_param = self._construct_message_param(
-                tool_calls or None, self.content
-            )
+            try:
+                async for chunk, tool in self.stream:
+                    self._update_properties(chunk)
+                    if tool:
+                        tool_call = getattr(tool, "tool_call", _DEFAULT)
+                        if tool_call != _DEFAULT:
+                            tool_calls.append(tool_call)
+                    if self._stop_when is not None and self._stop_when(self):
+                        await self.stream.aclose()
+                        yield chunk, tool
+                        break
+                    yield chunk, tool
+            finally:
+                await self.stream.aclose()
+                self.message_param = self._construct_message_param(
+                    tool_calls or None, self.content
+                )
 
         return generator()
 
+    @property
+    def content(self) -> str:
+        """Returns the content streamed so far."""
+        parts = self._content_parts
+        if len(parts) > 1:
+            parts[:] = ["".join(parts)]
+        return parts[0] if parts else ""
+
+    @content.setter
+    def content(self, content: str) -> None:
+        self._content_parts = [content] if content else []
+
     def _update_properties(self, chunk: _BaseCallResponseChunkT) -> None:
         """Updates the properties of the stream."""
-        self.content += chunk.content
-        if chunk.input_tokens is not None:
+        # Content is buffered and only joined when read, so accumulating a long
+        # stream stays linear instead of copying the content on every chunk.
+        if content := chunk.content:
+            self._content_parts.append(content)
+        if (input_tokens := chunk.input_tokens) is not None:
             self.input_tokens = (
-                chunk.input_tokens
+                input_tokens
                 if not self.input_tokens
-                else self.input_tokens + chunk.input_tokens
+                else self.input_tokens + input_tokens
             )
-        if chunk.output_tokens is not None:
+        if (output_tokens := chunk.output_tokens) is not None:
             self.output_tokens = (
-                chunk.output_tokens
+                output_tokens
                 if not self.output_tokens
-                else self.output_tokens + chunk.output_tokens
+                else self.output_tokens + output_tokens
             )
-        if chunk.model is not None:
-            self.model = chunk.model
-        if chunk.id is not None:
-            self.id = chunk.id
-        if chunk.finish_reasons is not None:
-            self.finish_reasons = chunk.finish_reasons
+        if (model := chunk.model) is not None:
+            self.model = model
+        if (response_id := chunk.id) is not None:
+            self.id = response_id
+        if (finish_reasons := chunk.finish_reasons) is not None:
+            self.finish_reasons = finish_reasons
 
     @property
     @abstractmethod
@@ -346,18 +496,20 @@ def stream_factory(  # noqa: ANN201
             )
         fn._model = model  # pyright: ignore [reportFunctionMemberAccess]
         fn.__mirascope_call__ = True  # pyright: ignore [reportFunctionMemberAccess]
+        call_plan = CallPlan(fn)
         if fn_is_async(fn):
 
             @wraps(fn)
             async def inner_async(*args: _P.args, **kwargs: _P.kwargs) -> BaseStream:
-                fn_args = get_fn_args(fn, args, kwargs)
+                fn_args = call_plan.get_fn_args(args, kwargs)
                 dynamic_config = await get_dynamic_configuration(fn, args, kwargs)
-                nonlocal client
+                await aprefetch_call_media(fn, fn_args, dynamic_config)
+                call_client = client
                 if dynamic_config is not None:
-                    client = dynamic_config.get("client", None) or client
+                    call_client = dynamic_config.get("client", None) or client
                 create, prompt_template, messages, tool_types, call_kwargs = setup_call(  # pyright: ignore [reportCallIssue]
                     model=model,
-                    client=client,  # pyright: ignore [reportArgumentType]
+                    client=call_client,  # pyright: ignore [reportArgumentType]
                     fn=fn,
                     fn_args=fn_args,
                     dynamic_config=dynamic_config,
@@ -367,16 +519,74 @@ def stream_factory(  # noqa: ANN201
                     extract=False,
                     stream=True,
                 )
+                call_deadline = current_deadline()
 
                 async def generator() -> (
                     AsyncGenerator[
                         tuple[_BaseCallResponseChunkT, _BaseToolT | None], None
                     ]
                 ):
-                    async for chunk, tool in handle_stream_async(
-                        await create(stream=True, **call_kwargs), tool_types
-                    ):
-                        yield chunk, tool
+                    cache = get_response_cache()
+                    cache_key = None
+                    if cache is not None:
+                        cache_key = response_cache_key(
+                            TCallResponse._provider, model, call_kwargs, stream=True
+                        )
+                        if (
+                            cache_key is not None
+                            and (cached_chunks := await cache.aget(cache_key))
+                            is not None
+                        ):
+                            async for chunk, tool in handle_stream_async(
+                                _replay_chunks(cached_chunks), tool_types
+                            ):
+                                yield chunk, tool
+                            return
+                    rate_limiter = (
+                        rate_limiters.get(TCallResponse._provider, model)
+                        if rate_limiters
+                        else None
+                    )
+                    estimated_tokens = 0
+                    if rate_limiter:
+                        estimated_tokens = estimate_tokens(call_kwargs)
+                        await rate_limiter.aacquire(estimated_tokens)
+                    started = time.monotonic()
+                    if call_deadline is None:
+                        provider_stream = chunks = await create(
+                            stream=True, **call_kwargs
+                        )
+                    else:
+                        provider_stream = chunks = await call_deadline.wait_for(
+                            create(
+                                stream=True,
+                                **call_deadline.request_kwargs(
+                                    TCallResponse._provider, call_kwargs, stream=True
+                                ),
+                            ),
+                            call_deadline.first_token_timeout,
+                        )
+                        chunks = call_deadline.aiter_chunks(chunks, started)
+                    if cache is not None and cache_key is not None:
+                        chunks = _acache_chunks(chunks, cache, cache_key)
+                    try:
+                        if not rate_limiter:
+                            async for chunk, tool in handle_stream_async(
+                                chunks, tool_types
+                            ):
+                                yield chunk, tool
+                            return
+                        usage = _StreamUsage()
+                        async for chunk, tool in handle_stream_async(
+                            chunks, tool_types
+                        ):
+                            usage.update(chunk)
+                            yield chunk, tool
+                        rate_limiter.reconcile(
+                            estimated_tokens, usage.input_tokens, usage.output_tokens
+                        )
+                    finally:
+                        await aclose_stream(provider_stream)
 
                 return TStream(
                     stream=generator(),
@@ -397,14 +607,14 @@ def stream_factory(  # noqa: ANN201
 
             @wraps(fn)
             def inner(*args: _P.args, **kwargs: _P.kwargs) -> BaseStream:
-                fn_args = get_fn_args(fn, args, kwargs)
+                fn_args = call_plan.get_fn_args(args, kwargs)
                 dynamic_config = get_dynamic_configuration(fn, args, kwargs)
-                nonlocal client
+                call_client = client
                 if dynamic_config is not None:
-                    client = dynamic_config.get("client", None) or client
+                    call_client = dynamic_config.get("client", None) or client
                 create, prompt_template, messages, tool_types, call_kwargs = setup_call(  # pyright: ignore [reportCallIssue]
                     model=model,
-                    client=client,  # pyright: ignore [reportArgumentType]
+                    client=call_client,  # pyright: ignore [reportArgumentType]
                     fn=fn,
                     fn_args=fn_args,
                     dynamic_config=dynamic_config,
@@ -414,6 +624,7 @@ def stream_factory(  # noqa: ANN201
                     extract=False,
                     stream=True,
                 )
+                call_deadline = current_deadline()
 
                 def generator() -> (
                     Generator[
@@ -422,9 +633,53 @@ def stream_factory(  # noqa: ANN201
                         None,
                     ]
                 ):
-                    yield from handle_stream(
-                        create(stream=True, **call_kwargs), tool_types
+                    cache = get_response_cache()
+                    cache_key = None
+                    if cache is not None:
+                        cache_key = response_cache_key(
+                            TCallResponse._provider, model, call_kwargs, stream=True
+                        )
+                        if (
+                            cache_key is not None
+                            and (cached_chunks := cache.get(cache_key)) is not None
+                        ):
+                            yield from handle_stream(
+                                (chunk for chunk in cached_chunks), tool_types
+                            )
+                            return
+                    rate_limiter = (
+                        rate_limiters.get(TCallResponse._provider, model)
+                        if rate_limiters
+                        else None
                     )
+                    estimated_tokens = 0
+                    if rate_limiter:
+                        estimated_tokens = estimate_tokens(call_kwargs)
+                        rate_limiter.acquire(estimated_tokens)
+                    started = time.monotonic()
+                    request_kwargs = call_kwargs
+                    if call_deadline is not None:
+                        request_kwargs = call_deadline.blocking_request_kwargs(
+                            TCallResponse._provider, call_kwargs, stream=True
+                        )
+                    provider_stream = chunks = create(stream=True, **request_kwargs)
+                    if call_deadline is not None:
+                        chunks = call_deadline.iter_chunks(chunks, started)
+                    if cache is not None and cache_key is not None:
+                        chunks = _cache_chunks(chunks, cache, cache_key)
+                    try:
+                        if not rate_limiter:
+                            yield from handle_stream(chunks, tool_types)
+                            return
+                        usage = _StreamUsage()
+                        for chunk, tool in handle_stream(chunks, tool_types):
+                            usage.update(chunk)
+                            yield chunk, tool
+                        rate_limiter.reconcile(
+                            estimated_tokens, usage.input_tokens, usage.output_tokens
+                        )
+                    finally:
+                        close_stream(provider_stream)
 
                 return TStream(
                     stream=generator(),
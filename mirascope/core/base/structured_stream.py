@@ -1,5 +1,6 @@
 """This module defines the base class for structured streams."""
 
+import time
 from collections.abc import (
     AsyncGenerator,
     AsyncIterable,
@@ -19,6 +20,7 @@ from typing import (
 )
 
 from pydantic import BaseModel
+from typing_extensions import Self
 
 from ._utils import (
     BaseType,
@@ -32,6 +34,7 @@ from ._utils import (
 from ._utils._get_fields_from_call_args import (
     get_fields_from_call_args,
 )
+from ._utils._incremental_json_parser import IncrementalJSONParser
 from .call_params import BaseCallParams
 from .call_response import BaseCallResponse
 from .call_response_chunk import BaseCallResponseChunk
@@ -50,11 +53,28 @@ _ResponseModelT = TypeVar("_ResponseModelT", bound=BaseModel | BaseType)
 
 
 class BaseStructuredStream(Generic[_ResponseModelT]):
-    """A base class for streaming structured outputs from LLMs."""
+    """A base class for streaming structured outputs from LLMs.
+
+    Streamed JSON is parsed incrementally, so each chunk only costs parsing the newly
+    received text. By default a partial response model is yielded for every chunk,
+    which can be throttled with `throttle` since validating the partial model is the
+    dominant per-chunk cost for large outputs.
+
+    Example:
+
+    ```python
+    for partial_book in recommend_book("fantasy").throttle(on_field_complete=True):
+        print(partial_book)
+    ```
+    """
 
     stream: BaseStream
     response_model: type[_ResponseModelT]
     constructed_response_model: _ResponseModelT
+    every_n_chunks: int | None = None
+    every_ms: float | None = None
+    on_field_complete: bool = False
+    _stop_when: Callable[[Any], bool] | None = None
 
     def __init__(
         self,
@@ -68,58 +88,182 @@ class BaseStructuredStream(Generic[_ResponseModelT]):
         self.response_model = response_model
         self.fields_from_call_args = fields_from_call_args
 
+    def throttle(
+        self,
+        *,
+        every_n_chunks: int | None = None,
+        every_ms: float | None = None,
+        on_field_complete: bool = False,
+    ) -> Self:
+        """Limits how often partial response models are yielded while streaming.
+
+        A partial is yielded as soon as any of the configured conditions is met, and the
+        final, fully validated response model is always yielded at the end.
+
+        Args:
+            every_n_chunks: Yield after this many chunks since the last partial.
+            every_ms: Yield once this many milliseconds passed since the last partial.
+            on_field_complete: Yield whenever a field of the streamed object completes.
+
+        Returns:
+            The structured stream itself for chaining.
+        """
+        self.every_n_chunks = every_n_chunks
+        self.every_ms = every_ms
+        self.on_field_complete = on_field_complete
+        return self
+
+    def stop_when(self, predicate: Callable[[_ResponseModelT], bool]) -> Self:
+        """Stops the stream as soon as a partial response model satisfies `predicate`.
+
+        The predicate is called with every partial that is yielded (see `throttle`).
+        Once it returns `True`, the provider stream is closed, which stops generation
+        and releases the connection, and that partial is the last one yielded. Since
+        the full response was never received, that partial is also stored as the
+        `constructed_response_model`.
+
+        Example:
+
+        ```python
+        stream = recommend_book("fantasy").stop_when(
+            lambda partial_book: partial_book.author is not None
+        )
+        for partial_book in stream:
+            print(partial_book)
+        ```
+
+        Args:
+            predicate: The function deciding whether to stop, given the partial.
+
+        Returns:
+            The structured stream itself for chaining.
+        """
+        self._stop_when = predicate
+        return self
+
+    def close(self) -> None:
+        """Stops the stream and releases the provider connection."""
+        self.stream.close()
+
+    async def aclose(self) -> None:
+        """Stops the async stream and releases the provider connection."""
+        await self.stream.aclose()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
+    def _reset(self) -> None:
+        self._parser: IncrementalJSONParser | None = IncrementalJSONParser()
+        self._chunks: list[str] = []
+        self._chunks_since_emit = 0
+        self._completed_fields_at_emit = 0
+        self._last_emit_time = time.perf_counter()
+
+    def _should_emit(self) -> bool:
+        if (
+            self.every_n_chunks is None
+            and self.every_ms is None
+            and not self.on_field_complete
+        ):
+            return True
+        if self.every_n_chunks and self._chunks_since_emit >= self.every_n_chunks:
+            return True
+        if (
+            self.every_ms is not None
+            and (time.perf_counter() - self._last_emit_time) * 1000 >= self.every_ms
+        ):
+            return True
+        return bool(
+            self.on_field_complete
+            and self._parser
+            and self._parser.completed_fields > self._completed_fields_at_emit
+        )
+
+    def _json_output(self) -> str:
+        json_output = "".join(self._chunks)
+        json_start = json_output.find("{")
+        return json_output[json_start:] if json_start != -1 else ""
+
+    def _feed(self, content: str) -> dict[str, Any] | str | None:
+        """Parses the chunk's content and returns the JSON output if a partial is due."""
+        self._chunks.append(content)
+        self._chunks_since_emit += 1
+        if self._parser is not None:
+            try:
+                self._parser.feed(content)
+            except ValueError:
+                # Let `jiter` parse the full buffer to surface the original error
+                self._parser = None
+        if self._parser is not None:
+            if self._parser.obj is None or not self._should_emit():
+                return None
+            self._completed_fields_at_emit = self._parser.completed_fields
+            json_output = self._parser.snapshot()
+        elif not (json_output := self._json_output()):
+            return None
+        self._chunks_since_emit = 0
+        self._last_emit_time = time.perf_counter()
+        return json_output
+
+    def _construct_response_model(self) -> _ResponseModelT:
+        if self._parser is not None and self._parser.complete:
+            json_output = self._parser.obj
+        elif json_output := self._json_output():
+            json_output = json_output[: json_output.rfind("}") + 1]
+        self.constructed_response_model = extract_tool_return(
+            self.response_model, json_output, False, self.fields_from_call_args
+        )
+        return self.constructed_response_model
+
     def __iter__(self) -> Generator[_ResponseModelT, None, None]:
         """Iterates over the stream and extracts structured outputs."""
-        json_output = ""
+        self._reset()
         for chunk, _ in self.stream:
-            json_output += chunk.content
-            if json_output and json_output[0] != "{":
-                try:
-                    json_start = json_output.index("{")
-                    json_output = json_output[json_start:]
-                except ValueError:
-                    json_output = ""
             if chunk.model is not None:
                 self.stream.model = chunk.model
-            if json_output:
-                yield extract_tool_return(
+            if (json_output := self._feed(chunk.content)) is not None:
+                partial = extract_tool_return(
                     self.response_model, json_output, True, self.fields_from_call_args
                 )
-        if json_output:
-            json_output = json_output[: json_output.rfind("}") + 1]
-        self.constructed_response_model = extract_tool_return(
-            self.response_model, json_output, False, self.fields_from_call_args
-        )
-        yield self.constructed_response_model
+                if self._stop_when is not None and self._stop_when(partial):
+                    self.stream.close()
+                    self.constructed_response_model = partial
+                    yield partial
+                    return
+                yield partial
+        yield self._construct_response_model()
 
     def __aiter__(self) -> AsyncGenerator[_ResponseModelT, None]:
         """Iterates over the stream and extracts structured outputs."""
 
         async def generator() -> AsyncGenerator[_ResponseModelT, None]:
-            json_output = ""
+            self._reset()
             async for chunk, _ in self.stream:
-                json_output += chunk.content
-                if json_output and json_output[0] != "{":
-                    try:
-                        json_start = json_output.index("{")
-                        json_output = json_output[json_start:]
-                    except ValueError:
-                        json_output = ""
                 if chunk.model is not None:
                     self.stream.model = chunk.model
-                if json_output:
-                    yield extract_tool_return(
+                if (json_output := self._feed(chunk.content)) is not None:
+                    partial = extract_tool_return(
                         self.response_model,
                         json_output,
                         True,
                         self.fields_from_call_args,
                     )
-            if json_output:
-                json_output = json_output[: json_output.rfind("}") + 1]
-            self.constructed_response_model = extract_tool_return(
-                self.response_model, json_output, False, self.fields_from_call_args
-            )
-            yield self.constructed_response_model
+                    if self._stop_when is not None and self._stop_when(partial):
+                        await self.stream.aclose()
+                        self.constructed_response_model = partial
+                        yield partial
+                        return
+                    yield partial
+            yield self._construct_response_model()
 
         return generator()
 
@@ -257,6 +401,7 @@ def structured_stream_factory(  # noqa: ANN201
         fn._model = model  # pyright: ignore [reportFunctionMemberAccess]
         fn.__mirascope_call__ = True  # pyright: ignore [reportFunctionMemberAccess]
         if fn_is_async(fn):
+            stream = stream_decorator(fn=fn, **stream_decorator_kwargs)
 
             @wraps(fn)
             async def inner_async(
@@ -266,15 +411,14 @@ def structured_stream_factory(  # noqa: ANN201
                     response_model, fn, args, kwargs
                 )
                 return BaseStructuredStream[_ResponseModelT](
-                    stream=await stream_decorator(fn=fn, **stream_decorator_kwargs)(
-                        *args, **kwargs
-                    ),
+                    stream=await stream(*args, **kwargs),
                     response_model=response_model,
                     fields_from_call_args=fields_from_call_args,
                 )
 
             return inner_async
         else:
+            stream = stream_decorator(fn=fn, **stream_decorator_kwargs)
 
             @wraps(fn)
             def inner(*args: _P.args, **kwargs: _P.kwargs) -> Iterable[_ResponseModelT]:
@@ -282,9 +426,7 @@ def structured_stream_factory(  # noqa: ANN201
                     response_model, fn, args, kwargs
                 )
                 return BaseStructuredStream[_ResponseModelT](
-                    stream=stream_decorator(fn=fn, **stream_decorator_kwargs)(
-                        *args, **kwargs
-                    ),
+                    stream=stream(*args, **kwargs),
                     response_model=response_model,
                     fields_from_call_args=fields_from_call_args,
                 )
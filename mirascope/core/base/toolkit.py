@@ -14,7 +14,11 @@ from pydantic import BaseModel, ConfigDict, create_model
 from typing_extensions import ParamSpec
 
 from . import BaseTool
-from ._utils import convert_function_to_base_tool, get_template_variables
+from ._utils import (
+    DYNAMIC_TOOL_MARKER,
+    convert_function_to_base_tool,
+    get_template_variables,
+)
 
 _TOOLKIT_TOOL_METHOD_MARKER: str = "__toolkit_tool_method__"
 
@@ -102,6 +106,7 @@ class BaseToolKit(BaseModel, ABC):
             for key in dir(self):
                 if not hasattr(converted_method, key):
                     setattr(converted_method, key, getattr(self, key))
+            setattr(converted_method, DYNAMIC_TOOL_MARKER, True)
             tools.append(converted_method)
         return tools
 
@@ -19,7 +19,7 @@ from ..tool import BedrockTool
 
 class ToolUseChunk(TypedDict):
     tool_use_id: str
-    input_chunk: str
+    input_chunks: list[str]
     name: str
     stop: bool
 
@@ -41,7 +41,7 @@ def _handle_chunk(
     ):
         current_tool_use_chunk = ToolUseChunk(
             tool_use_id=tool_use["toolUseId"],
-            input_chunk="",
+            input_chunks=[],
             name=tool_use["name"],
             stop=False,
         )
@@ -51,7 +51,7 @@ def _handle_chunk(
         and current_tool_use_chunk
         and not current_tool_use_chunk["stop"]
     ):
-        current_tool_use_chunk["input_chunk"] += tool_use["input"]
+        current_tool_use_chunk["input_chunks"].append(tool_use["input"])
         return None, None, current_tool_use_chunk
     elif "contentBlockStop" in chunk and current_tool_use_chunk:
         current_tool_use_chunk["stop"] = True
@@ -62,7 +62,9 @@ def _handle_chunk(
                 current_tool_use = ToolUseBlockContentTypeDef(
                     toolUse=ToolUseBlockOutputTypeDef(
                         toolUseId=current_tool_use_chunk["tool_use_id"],
-                        input=json.loads(current_tool_use_chunk["input_chunk"]),
+                        input=json.loads(
+                            "".join(current_tool_use_chunk["input_chunks"])
+                        ),
                         name=current_tool_use_chunk["name"],
                     )
                 )
@@ -7,7 +7,7 @@ from collections.abc import AsyncGenerator, Awaitable, Callable, Coroutine, Gene
 from functools import wraps
 from typing import Any, ParamSpec, cast, overload
 
-from aiobotocore.session import AioSession, get_session
+from aiobotocore.session import get_session
 from boto3.session import Session
 from mypy_boto3_bedrock_runtime import BedrockRuntimeClient
 from mypy_boto3_bedrock_runtime.type_defs import (
@@ -27,10 +27,12 @@ from types_aiobotocore_bedrock_runtime.type_defs import (
 )
 
 from ... import BaseMessageParam
-from ...base import BaseTool, _utils
+from ...base import BaseTool, _utils, client_pool
 from ...base._utils import (
     AsyncCreateFn,
     CreateFn,
+    aclose_stream,
+    close_stream,
     fn_is_async,
     get_async_create_fn,
     get_create_fn,
@@ -48,6 +50,16 @@ from ..tool import BedrockTool
 from ._convert_common_call_params import convert_common_call_params
 from ._convert_message_params import convert_message_params
 
+# The environment variables that the default Bedrock clients read their settings from
+CLIENT_ENV = (
+    "AWS_ACCESS_KEY_ID",
+    "AWS_SECRET_ACCESS_KEY",
+    "AWS_SESSION_TOKEN",
+    "AWS_PROFILE",
+    "AWS_DEFAULT_REGION",
+    "AWS_REGION",
+)
+
 _P = ParamSpec("_P")
 
 
@@ -59,10 +71,13 @@ def _extract_sync_stream_fn(
         *args: _P.args, **kwargs: _P.kwargs
     ) -> Generator[StreamOutputChunk, None, None]:
         response = fn(*args, **kwargs)
-        for chunk in response["stream"]:
-            yield StreamOutputChunk(
-                responseMetadata=response["ResponseMetadata"], model=model, **chunk
-            )
+        try:
+            for chunk in response["stream"]:
+                yield StreamOutputChunk(
+                    responseMetadata=response["ResponseMetadata"], model=model, **chunk
+                )
+        finally:
+            close_stream(response["stream"])
 
     return _inner
 
@@ -76,17 +91,74 @@ def _extract_async_stream_fn(
         *args: _P.args, **kwargs: _P.kwargs
     ) -> AsyncGenerator[AsyncStreamOutputChunk, None]:
         response = await fn(*args, **kwargs)
-        async for chunk in response["stream"]:
-            yield AsyncStreamOutputChunk(
-                responseMetadata=response["ResponseMetadata"], model=model, **chunk
-            )
+        try:
+            async for chunk in response["stream"]:
+                yield AsyncStreamOutputChunk(
+                    responseMetadata=response["ResponseMetadata"], model=model, **chunk
+                )
+        finally:
+            await aclose_stream(response["stream"])
 
     return _inner
 
 
-async def _get_async_client(session: AioSession) -> AsyncBedrockRuntimeClient:
-    async with session.create_client("bedrock-runtime") as client:
-        return client
+def _get_sync_client() -> BedrockRuntimeClient:
+    return Session().client("bedrock-runtime")
+
+
+class _AsyncClientManager:
+    """Creates the async Bedrock client of an event loop once and closes it with the loop.
+
+    `aiobotocore` clients must be entered as async context managers, which `setup_call`
+    cannot await, so the client is created on the first `converse(_stream)` call. The
+    manager is pooled per event loop by `client_pool`, so every call and stream on the
+    loop shares the client's connection pool. The client is closed when the loop shuts
+    down its async generators (as `asyncio.run` does) or by `client_pool.aclose()`.
+    """
+
+    def __init__(self) -> None:
+        self._client: AsyncBedrockRuntimeClient | None = None
+        self._context: Any = None
+        self._lock = asyncio.Lock()
+        self._closer: AsyncGenerator[None, None] | None = None
+
+    async def get_client(self) -> AsyncBedrockRuntimeClient:
+        """Returns the client of the running event loop, creating it if needed."""
+        if self._client is not None:
+            return self._client
+        async with self._lock:
+            if self._client is None:
+                context = get_session().create_client("bedrock-runtime")
+                self._client = await context.__aenter__()
+                self._context = context
+                self._closer = self._close_on_shutdown(context)
+                await anext(self._closer)
+        return self._client
+
+    async def _close_on_shutdown(self, context: Any) -> AsyncGenerator[None, None]:  # noqa: ANN401
+        # Stays suspended until `loop.shutdown_asyncgens()` closes it, and leaves alone
+        # a client created since on another loop if this one was already closed.
+        try:
+            yield
+        finally:
+            if self._context is context:
+                await self.close()
+
+    async def converse(self, **kwargs: Any) -> AsyncConverseResponseTypeDef:  # noqa: ANN401
+        return await (await self.get_client()).converse(**kwargs)
+
+    async def converse_stream(
+        self,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> AsyncConverseStreamResponseTypeDef:
+        return await (await self.get_client()).converse_stream(**kwargs)
+
+    async def close(self) -> None:
+        """Closes the client, which is created again if the manager is used again."""
+        context, self._client, self._context = self._context, None, None
+        self._closer, self._lock = None, asyncio.Lock()
+        if context is not None:
+            await context.__aexit__(None, None, None)
 
 
 @overload
@@ -201,18 +273,20 @@ def setup_call(
     call_kwargs |= cast(BedrockCallKwargs, {"modelId": model, "messages": messages})
 
     if client is None:
-        if fn_is_async(fn):
-            session = get_session()
-            client = asyncio.run(_get_async_client(session))
-        else:
-            session = Session()
-            client = session.client("bedrock-runtime")
+        client = (
+            cast(
+                AsyncBedrockRuntimeClient,
+                client_pool.get_async_client(_AsyncClientManager, env=CLIENT_ENV),
+            )
+            if fn_is_async(fn)
+            else client_pool.get_client(_get_sync_client, env=CLIENT_ENV)
+        )
 
     create = (
         get_async_create_fn(
             client.converse, _extract_async_stream_fn(client.converse_stream, model)
         )
-        if isinstance(client, AsyncBedrockRuntimeClient)
+        if isinstance(client, AsyncBedrockRuntimeClient | _AsyncClientManager)
         else get_create_fn(
             client.converse, _extract_sync_stream_fn(client.converse_stream, model)
         )
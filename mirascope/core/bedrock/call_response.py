@@ -14,6 +14,7 @@ from types_aiobotocore_bedrock_runtime.type_defs import (
 )
 
 from ..base import BaseCallResponse
+from ..base._utils import cached_getter
 from ._call_kwargs import BedrockCallKwargs
 from ._types import (
     AssistantMessageTypeDef,
@@ -120,12 +121,14 @@ class BedrockCallResponse(
         return self.usage["outputTokens"] if self.usage else None
 
     @property
+    @cached_getter
     def cost(self) -> float | None:
         """Returns the cost of the call."""
         return calculate_cost(self.input_tokens, self.output_tokens, self.model)
 
     @computed_field
     @property
+    @cached_getter
     def message_param(self) -> SerializeAsAny[AssistantMessageTypeDef]:
         """Returns the assistants's response as a message parameter."""
         message = self.message
@@ -135,6 +138,7 @@ class BedrockCallResponse(
 
     @computed_field
     @property
+    @cached_getter
     def tools(self) -> list[BedrockTool] | None:
         """Returns any available tool calls as their `BedrockTool` definition.
 
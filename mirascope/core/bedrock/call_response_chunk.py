@@ -77,13 +77,13 @@ class BedrockCallResponseChunk(
     @property
     def input_tokens(self) -> int | None:
         """Returns the number of input tokens."""
-        if self.usage:
-            return self.usage["inputTokens"]
+        if usage := self.usage:
+            return usage["inputTokens"]
         return None
 
     @property
     def output_tokens(self) -> int | None:
         """Returns the number of output tokens."""
-        if self.usage:
-            return self.usage["outputTokens"]
+        if usage := self.usage:
+            return usage["outputTokens"]
         return None
@@ -140,7 +140,7 @@ class BedrockStream(
             trace=self.metadata.get("trace", {}),
             ResponseMetadata=self._response_metadata,
         )
-        return BedrockCallResponse(
+        return BedrockCallResponse._construct_trusted(
             metadata=self.metadata,
             response=response,
             tool_types=self.tool_types,
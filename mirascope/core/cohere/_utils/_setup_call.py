@@ -18,7 +18,7 @@ from cohere import (
 )
 from cohere.types import ChatMessage, StreamedChatResponse
 
-from ...base import BaseMessageParam, BaseTool, _utils
+from ...base import BaseMessageParam, BaseTool, _utils, client_pool
 from ...base._utils import (
     AsyncCreateFn,
     CreateFn,
@@ -139,7 +139,11 @@ def setup_call(
     }
 
     if client is None:
-        client = AsyncClient() if inspect.iscoroutinefunction(fn) else Client()
+        client = (
+            client_pool.get_async_client(AsyncClient)
+            if inspect.iscoroutinefunction(fn)
+            else client_pool.get_client(Client)
+        )
 
     create_or_stream = (
         get_async_create_fn(client.chat, client.chat_stream)
@@ -13,6 +13,7 @@ from cohere.types import (
 from pydantic import SkipValidation, computed_field
 
 from ..base import BaseCallResponse
+from ..base._utils import cached_getter
 from ._utils import calculate_cost
 from .call_params import CohereCallParams
 from .dynamic_config import AsyncCohereDynamicConfig, CohereDynamicConfig
@@ -100,12 +101,14 @@ class CohereCallResponse(
         return None
 
     @property
+    @cached_getter
     def cost(self) -> float | None:
         """Returns the cost of the response."""
         return calculate_cost(self.input_tokens, self.output_tokens, self.model)
 
     @computed_field
     @property
+    @cached_getter
     def message_param(self) -> ChatMessage:
         """Returns the assistant's response as a message parameter."""
         return ChatMessage(
@@ -116,6 +119,7 @@ class CohereCallResponse(
 
     @computed_field
     @property
+    @cached_getter
     def tools(self) -> list[CohereTool] | None:
         """Returns the tools for the 0th choice message.
 
@@ -91,13 +91,13 @@ class CohereCallResponseChunk(
     @property
     def input_tokens(self) -> float | None:
         """Returns the number of input tokens."""
-        if self.usage:
-            return self.usage.input_tokens
+        if usage := self.usage:
+            return usage.input_tokens
         return None
 
     @property
     def output_tokens(self) -> float | None:
         """Returns the number of output tokens."""
-        if self.usage:
-            return self.usage.output_tokens
+        if usage := self.usage:
+            return usage.output_tokens
         return None
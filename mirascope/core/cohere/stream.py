@@ -98,7 +98,7 @@ class CohereStream(
             finish_reason=self.finish_reasons[0] if self.finish_reasons else None,
         )
 
-        return CohereCallResponse(
+        return CohereCallResponse._construct_trusted(
             metadata=self.metadata,
             response=completion,
             tool_types=self.tool_types,
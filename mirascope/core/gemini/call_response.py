@@ -14,6 +14,7 @@ from google.generativeai.types import (
 from pydantic import computed_field
 
 from ..base import BaseCallResponse
+from ..base._utils import cached_getter
 from ._utils import calculate_cost
 from .call_params import GeminiCallParams
 from .dynamic_config import GeminiDynamicConfig
@@ -115,18 +116,21 @@ class GeminiCallResponse(
         return None
 
     @property
+    @cached_getter
     def cost(self) -> float | None:
         """Returns the cost of the call."""
         return calculate_cost(self.input_tokens, self.output_tokens, self.model)
 
     @computed_field
     @property
+    @cached_getter
     def message_param(self) -> ContentDict:
         """Returns the models's response as a message parameter."""
         return {"role": "model", "parts": self.response.parts}  # pyright: ignore [reportReturnType]
 
     @computed_field
     @property
+    @cached_getter
     def tools(self) -> list[GeminiTool] | None:
         """Returns the list of tools for the 0th candidate's 0th content part."""
         if self.tool_types is None:
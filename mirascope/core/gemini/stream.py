@@ -105,7 +105,7 @@ class GeminiStream(
                 ]
             )
         )
-        return GeminiCallResponse(
+        return GeminiCallResponse._construct_trusted(
             metadata=self.metadata,
             response=response,
             tool_types=self.tool_types,
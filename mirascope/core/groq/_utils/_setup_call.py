@@ -11,7 +11,7 @@ from groq.types.chat import (
     ChatCompletionMessageParam,
 )
 
-from ...base import BaseMessageParam, BaseTool, _utils
+from ...base import BaseMessageParam, BaseTool, _utils, client_pool
 from ...base._utils import AsyncCreateFn, CreateFn, get_async_create_fn, get_create_fn
 from ...base.call_params import CommonCallParams
 from .._call_kwargs import GroqCallKwargs
@@ -21,6 +21,9 @@ from ..tool import GroqTool
 from ._convert_common_call_params import convert_common_call_params
 from ._convert_message_params import convert_message_params
 
+# The environment variables that the default Groq clients read their settings from
+CLIENT_ENV = ("GROQ_API_KEY", "GROQ_BASE_URL")
+
 
 @overload
 def setup_call(
@@ -122,7 +125,11 @@ def setup_call(
     call_kwargs |= {"model": model, "messages": messages}
 
     if client is None:
-        client = AsyncGroq() if inspect.iscoroutinefunction(fn) else Groq()
+        client = (
+            client_pool.get_async_client(AsyncGroq, env=CLIENT_ENV)
+            if inspect.iscoroutinefunction(fn)
+            else client_pool.get_client(Groq, env=CLIENT_ENV)
+        )
 
     create = (
         get_async_create_fn(client.chat.completions.create)
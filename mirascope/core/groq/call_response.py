@@ -15,6 +15,7 @@ from groq.types.completion_usage import CompletionUsage
 from pydantic import SerializeAsAny, computed_field
 
 from ..base import BaseCallResponse
+from ..base._utils import cached_getter
 from ._utils import calculate_cost
 from .call_params import GroqCallParams
 from .dynamic_config import AsyncGroqDynamicConfig, GroqDynamicConfig
@@ -93,12 +94,14 @@ class GroqCallResponse(
         return self.usage.completion_tokens if self.usage else None
 
     @property
+    @cached_getter
     def cost(self) -> float | None:
         """Returns the cost of the call."""
         return calculate_cost(self.input_tokens, self.output_tokens, self.model)
 
     @computed_field
     @property
+    @cached_getter
     def message_param(self) -> SerializeAsAny[ChatCompletionAssistantMessageParam]:
         """Returns the assistants's response as a message parameter."""
         message_param = self.response.choices[0].message.model_dump(
@@ -108,6 +111,7 @@ class GroqCallResponse(
 
     @computed_field
     @property
+    @cached_getter
     def tools(self) -> list[GroqTool] | None:
         """Returns any available tool calls as their `GroqTool` definition.
 
@@ -6,6 +6,7 @@ usage docs: learn/streams.md#handling-streamed-responses
 from groq.types.chat import ChatCompletionChunk
 from groq.types.chat.chat_completion import Choice
 from groq.types.completion_usage import CompletionUsage
+from pydantic import SkipValidation
 
 from ..base import BaseCallResponseChunk
 
@@ -36,6 +37,8 @@ class GroqCallResponseChunk(BaseCallResponseChunk[ChatCompletionChunk, FinishRea
     ```
     """
 
+    chunk: SkipValidation[ChatCompletionChunk]
+
     @property
     def content(self) -> str:
         """Returns the content for the 0th choice delta."""
@@ -75,13 +78,13 @@ class GroqCallResponseChunk(BaseCallResponseChunk[ChatCompletionChunk, FinishRea
     @property
     def input_tokens(self) -> int | None:
         """Returns the number of input tokens."""
-        if self.usage:
-            return self.usage.prompt_tokens
+        if usage := self.usage:
+            return usage.prompt_tokens
         return None
 
     @property
     def output_tokens(self) -> int | None:
         """Returns the number of output tokens."""
-        if self.usage:
-            return self.usage.completion_tokens
+        if usage := self.usage:
+            return usage.completion_tokens
         return None
@@ -120,7 +120,7 @@ class GroqStream(
             object="chat.completion",
             usage=usage,
         )
-        return GroqCallResponse(
+        return GroqCallResponse._construct_trusted(
             metadata=self.metadata,
             response=completion,
             tool_types=self.tool_types,
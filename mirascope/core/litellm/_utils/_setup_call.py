@@ -7,7 +7,7 @@ from litellm import acompletion, completion
 from openai import OpenAI
 from openai.types.chat import ChatCompletion, ChatCompletionMessageParam
 
-from ...base import BaseTool
+from ...base import BaseTool, client_pool
 from ...base._utils import AsyncCreateFn, CreateFn, fn_is_async
 from ...base.call_params import CommonCallParams
 from ...openai import (
@@ -86,7 +86,7 @@ def setup_call(
 ]:
     _, prompt_template, messages, tool_types, call_kwargs = setup_call_openai(
         model=model,  # pyright: ignore [reportCallIssue]
-        client=OpenAI(api_key="NOT_USED"),
+        client=client_pool.get_client(OpenAI, api_key="NOT_USED"),
         fn=fn,  # pyright: ignore [reportArgumentType]
         fn_args=fn_args,  # pyright: ignore [reportArgumentType]
         dynamic_config=dynamic_config,
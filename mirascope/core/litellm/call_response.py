@@ -5,6 +5,7 @@ usage docs: learn/calls.md#handling-responses
 
 from litellm.cost_calculator import completion_cost
 
+from ..base._utils import cached_getter
 from ..openai import OpenAICallResponse
 
 
@@ -18,6 +19,7 @@ class LiteLLMCallResponse(OpenAICallResponse):
     _provider = "litellm"
 
     @property
+    @cached_getter
     def cost(self) -> float | None:
         """Returns the cost of the call."""
         return completion_cost(self.response)
@@ -42,7 +42,7 @@ class LiteLLMStream(OpenAIStream):
     def construct_call_response(self) -> LiteLLMCallResponse:
         openai_call_response = super().construct_call_response()
         openai_response = openai_call_response.response
-        response = LiteLLMCallResponse(
+        response = LiteLLMCallResponse._construct_trusted(
             metadata=openai_call_response.metadata,
             response=ModelResponse(
                 id=openai_response.id,
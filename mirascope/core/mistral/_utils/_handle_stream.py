@@ -13,10 +13,22 @@ from ..call_response_chunk import MistralCallResponseChunk
 from ..tool import MistralTool
 
 
+def _complete_tool_call(
+    tool_type: type[MistralTool],
+    tool_call: ToolCall,
+    arguments: list[str],
+) -> MistralTool:
+    """Returns the tool for `tool_call` with its buffered streamed `arguments`."""
+    tool_call.function.arguments = "".join(arguments)
+    arguments.clear()
+    return tool_type.from_tool_call(tool_call)
+
+
 def _handle_chunk(
     chunk: ChatCompletionStreamResponse,
     current_tool_call: ToolCall,
     current_tool_type: type[MistralTool] | None,
+    current_tool_arguments: list[str],
     tool_types: list[type[MistralTool]] | None,
 ) -> tuple[
     MistralTool | None,
@@ -30,8 +42,12 @@ def _handle_chunk(
     tool_call = tool_calls[0]
     # Reset on new tool
     if tool_call.id != "null" and tool_call.function is not None:
-        previous_tool_call = current_tool_call.model_copy()
-        previous_tool_type = current_tool_type
+        previous_tool = None
+        if current_tool_call.id and current_tool_type is not None:
+            previous_tool = _complete_tool_call(
+                current_tool_type, current_tool_call, current_tool_arguments
+            )
+        current_tool_arguments.clear()
         current_tool_call = ToolCall(
             id=tool_call.id,
             function=FunctionCall(
@@ -49,16 +65,16 @@ def _handle_chunk(
             raise RuntimeError(
                 f"Unknown tool type in stream: {tool_call.function.name}"
             )  # pragma: no cover
-        if previous_tool_call.id and previous_tool_type is not None:
+        if previous_tool is not None:
             return (
-                previous_tool_type.from_tool_call(previous_tool_call),
+                previous_tool,
                 current_tool_call,
                 current_tool_type,
             )
 
     # Update arguments with each chunk
     if tool_call.function and tool_call.function.arguments:
-        current_tool_call.function.arguments += tool_call.function.arguments
+        current_tool_arguments.append(tool_call.function.arguments)
 
     return None, current_tool_call, current_tool_type
 
@@ -72,12 +88,15 @@ def handle_stream(
         id="", function=FunctionCall(arguments="", name=""), type=ToolType.function
     )
     current_tool_type = None
+    current_tool_arguments: list[str] = []
     for chunk in stream:
         if not tool_types or not chunk.choices[0].delta.tool_calls:
             if current_tool_type:
                 yield (
                     MistralCallResponseChunk(chunk=chunk),
-                    current_tool_type.from_tool_call(current_tool_call),
+                    _complete_tool_call(
+                        current_tool_type, current_tool_call, current_tool_arguments
+                    ),
                 )
                 current_tool_type = None
             else:
@@ -86,6 +105,7 @@ def handle_stream(
             chunk,
             current_tool_call,
             current_tool_type,
+            current_tool_arguments,
             tool_types,
         )
         if tool is not None:
@@ -101,12 +121,15 @@ async def handle_stream_async(
         id="", function=FunctionCall(arguments="", name=""), type=ToolType.function
     )
     current_tool_type = None
+    current_tool_arguments: list[str] = []
     async for chunk in stream:
         if not tool_types or not chunk.choices[0].delta.tool_calls:
             if current_tool_type:
                 yield (
                     MistralCallResponseChunk(chunk=chunk),
-                    current_tool_type.from_tool_call(current_tool_call),
+                    _complete_tool_call(
+                        current_tool_type, current_tool_call, current_tool_arguments
+                    ),
                 )
                 current_tool_type = None
             else:
@@ -115,6 +138,7 @@ async def handle_stream_async(
             chunk,
             current_tool_call,
             current_tool_type,
+            current_tool_arguments,
             tool_types,
         )
         if tool is not None:
@@ -18,7 +18,7 @@ from mistralai.models.chat_completion import (
     ToolChoice,
 )
 
-from ...base import BaseMessageParam, BaseTool, _utils
+from ...base import BaseMessageParam, BaseTool, _utils, client_pool
 from ...base._utils import AsyncCreateFn, CreateFn, get_async_create_fn, get_create_fn
 from ...base.call_params import CommonCallParams
 from .._call_kwargs import MistralCallKwargs
@@ -28,6 +28,9 @@ from ..tool import MistralTool
 from ._convert_common_call_params import convert_common_call_params
 from ._convert_message_params import convert_message_params
 
+# The environment variables that the default Mistral clients read their settings from
+CLIENT_ENV = ("MISTRAL_API_KEY",)
+
 
 @overload
 def setup_call(
@@ -124,7 +127,9 @@ def setup_call(
 
     if client is None:
         client = (
-            MistralAsyncClient() if inspect.iscoroutinefunction(fn) else MistralClient()
+            client_pool.get_async_client(MistralAsyncClient, env=CLIENT_ENV)
+            if inspect.iscoroutinefunction(fn)
+            else client_pool.get_client(MistralClient, env=CLIENT_ENV)
         )
     if isinstance(client, MistralAsyncClient):
         create_or_stream = get_async_create_fn(client.chat, client.chat_stream)
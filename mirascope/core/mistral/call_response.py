@@ -10,6 +10,7 @@ from mistralai.models.common import UsageInfo
 from pydantic import computed_field
 
 from ..base import BaseCallResponse
+from ..base._utils import cached_getter
 from ._utils import calculate_cost
 from .call_params import MistralCallParams
 from .dynamic_config import AsyncMistralDynamicConfig, MistralDynamicConfig
@@ -90,18 +91,21 @@ class MistralCallResponse(
         return self.usage.completion_tokens
 
     @property
+    @cached_getter
     def cost(self) -> float | None:
         """Returns the cost of the call."""
         return calculate_cost(self.input_tokens, self.output_tokens, self.model)
 
     @computed_field
     @property
+    @cached_getter
     def message_param(self) -> ChatMessage:
         """Returns the assistants's response as a message parameter."""
         return self.response.choices[0].message
 
     @computed_field
     @property
+    @cached_getter
     def tools(self) -> list[MistralTool] | None:
         """Returns the tools for the 0th choice message.
 
@@ -5,6 +5,7 @@ usage docs: learn/streams.md#handling-streamed-responses
 
 from mistralai.models.chat_completion import ChatCompletionStreamResponse, FinishReason
 from mistralai.models.common import UsageInfo
+from pydantic import SkipValidation
 
 from ..base import BaseCallResponseChunk
 
@@ -36,6 +37,8 @@ class MistralCallResponseChunk(
     ```
     """
 
+    chunk: SkipValidation[ChatCompletionStreamResponse]
+
     @property
     def content(self) -> str:
         """Returns the content of the delta."""
@@ -71,13 +74,13 @@ class MistralCallResponseChunk(
     @property
     def input_tokens(self) -> int | None:
         """Returns the number of input tokens."""
-        if self.usage:
-            return self.usage.prompt_tokens
+        if usage := self.usage:
+            return usage.prompt_tokens
         return None
 
     @property
     def output_tokens(self) -> int | None:
         """Returns the number of output tokens."""
-        if self.usage:
-            return self.usage.completion_tokens
+        if usage := self.usage:
+            return usage.completion_tokens
         return None
@@ -103,7 +103,7 @@ class MistralStream(
             object="",
             usage=usage,
         )
-        return MistralCallResponse(
+        return MistralCallResponse._construct_trusted(
             metadata=self.metadata,
             response=completion,
             tool_types=self.tool_types,
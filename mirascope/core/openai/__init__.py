@@ -7,6 +7,7 @@ from openai.types.chat import ChatCompletionMessageParam
 from ..base import BaseMessageParam
 from ._call import openai_call
 from ._call import openai_call as call
+from .batch_job import OpenAIBatchJob
 from .call_params import OpenAICallParams
 from .call_response import OpenAICallResponse
 from .call_response_chunk import OpenAICallResponseChunk
@@ -19,6 +20,7 @@ OpenAIMessageParam: TypeAlias = ChatCompletionMessageParam | BaseMessageParam
 __all__ = [
     "AsyncOpenAIDynamicConfig",
     "call",
+    "OpenAIBatchJob",
     "OpenAIDynamicConfig",
     "OpenAICallParams",
     "OpenAICallResponse",
@@ -1,10 +1,9 @@
 """Utility for converting `BaseMessageParam` to `ChatCompletionMessageParam`."""
 
-import base64
-
 from openai.types.chat import ChatCompletionMessageParam
 
 from ...base import BaseMessageParam
+from ...base._utils import encode_media, encode_media_data_url
 
 
 def convert_message_params(
@@ -32,12 +31,13 @@ def convert_message_params(
                             f"Unsupported image media type: {part.media_type}. OpenAI"
                             " currently only supports JPEG, PNG, GIF, and WebP images."
                         )
-                    data = base64.b64encode(part.image).decode("utf-8")
                     converted_content.append(
                         {
                             "type": "image_url",
                             "image_url": {
-                                "url": f"data:{part.media_type};base64,{data}",
+                                "url": encode_media_data_url(
+                                    part.image, part.media_type
+                                ),
                                 "detail": part.detail if part.detail else "auto",
                             },
                         }
@@ -55,7 +55,7 @@ def convert_message_params(
                         {
                             "input_audio": {
                                 "format": part.media_type.split("/")[-1],
-                                "data": base64.b64encode(part.audio).decode("utf-8"),
+                                "data": encode_media(part.audio, part.media_type),
                             },
                             "type": "input_audio",
                         }
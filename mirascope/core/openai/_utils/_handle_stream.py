@@ -9,10 +9,22 @@ from ..call_response_chunk import OpenAICallResponseChunk
 from ..tool import OpenAITool
 
 
+def _complete_tool_call(
+    tool_type: type[OpenAITool],
+    tool_call: ChatCompletionMessageToolCall,
+    arguments: list[str],
+) -> OpenAITool:
+    """Returns the tool for `tool_call` with its buffered streamed `arguments`."""
+    tool_call.function.arguments = "".join(arguments)
+    arguments.clear()
+    return tool_type.from_tool_call(tool_call)
+
+
 def _handle_chunk(
     chunk: ChatCompletionChunk,
     current_tool_call: ChatCompletionMessageToolCall,
     current_tool_type: type[OpenAITool] | None,
+    current_tool_arguments: list[str],
     tool_types: list[type[OpenAITool]] | None,
 ) -> tuple[
     OpenAITool | None,
@@ -30,8 +42,16 @@ def _handle_chunk(
     tool_call = tool_calls[0]
     # Reset on new tool
     if tool_call.id and tool_call.function is not None:
-        previous_tool_call = current_tool_call.model_copy()
-        previous_tool_type = current_tool_type
+        previous_tool = None
+        if (
+            current_tool_call.id
+            and current_tool_arguments
+            and current_tool_type is not None
+        ):
+            previous_tool = _complete_tool_call(
+                current_tool_type, current_tool_call, current_tool_arguments
+            )
+        current_tool_arguments.clear()
         current_tool_call = ChatCompletionMessageToolCall(
             id=tool_call.id,
             function=Function(
@@ -49,20 +69,16 @@ def _handle_chunk(
             raise RuntimeError(
                 f"Unknown tool type in stream: {tool_call.function.name}"
             )  # pragma: no cover
-        if (
-            previous_tool_call.id
-            and previous_tool_call.function.arguments
-            and previous_tool_type is not None
-        ):
+        if previous_tool is not None:
             return (
-                previous_tool_type.from_tool_call(previous_tool_call),
+                previous_tool,
                 current_tool_call,
                 current_tool_type,
             )
 
     # Update arguments with each chunk
     if tool_call.function and tool_call.function.arguments:
-        current_tool_call.function.arguments += tool_call.function.arguments
+        current_tool_arguments.append(tool_call.function.arguments)
 
     return None, current_tool_call, current_tool_type
 
@@ -76,12 +92,15 @@ def handle_stream(
         id="", function=Function(arguments="", name=""), type="function"
     )
     current_tool_type = None
+    current_tool_arguments: list[str] = []
     for chunk in stream:
         if not tool_types or not chunk.choices or not chunk.choices[0].delta.tool_calls:
             if current_tool_type:
                 yield (
                     OpenAICallResponseChunk(chunk=chunk),
-                    current_tool_type.from_tool_call(current_tool_call),
+                    _complete_tool_call(
+                        current_tool_type, current_tool_call, current_tool_arguments
+                    ),
                 )
                 current_tool_type = None
             else:
@@ -90,6 +109,7 @@ def handle_stream(
             chunk,
             current_tool_call,
             current_tool_type,
+            current_tool_arguments,
             tool_types,
         )
         if tool is not None:
@@ -105,12 +125,15 @@ async def handle_stream_async(
         id="", function=Function(arguments="", name=""), type="function"
     )
     current_tool_type = None
+    current_tool_arguments: list[str] = []
     async for chunk in stream:
         if not tool_types or not chunk.choices[0].delta.tool_calls:
             if current_tool_type:
                 yield (
                     OpenAICallResponseChunk(chunk=chunk),
-                    current_tool_type.from_tool_call(current_tool_call),
+                    _complete_tool_call(
+                        current_tool_type, current_tool_call, current_tool_arguments
+                    ),
                 )
                 current_tool_type = None
             else:
@@ -119,6 +142,7 @@ async def handle_stream_async(
             chunk,
             current_tool_call,
             current_tool_type,
+            current_tool_arguments,
             tool_types,
         )
         if tool is not None:
@@ -13,7 +13,7 @@ from openai.types.chat import (
     ChatCompletionUserMessageParam,
 )
 
-from ...base import BaseMessageParam, BaseTool, _utils
+from ...base import BaseMessageParam, BaseTool, _utils, client_pool
 from ...base._utils import AsyncCreateFn, CreateFn, get_async_create_fn, get_create_fn
 from ...base.call_params import CommonCallParams
 from .._call_kwargs import OpenAICallKwargs
@@ -23,6 +23,9 @@ from ..tool import GenerateOpenAIStrictToolJsonSchema, OpenAITool
 from ._convert_common_call_params import convert_common_call_params
 from ._convert_message_params import convert_message_params
 
+# The environment variables that the default OpenAI clients read their settings from
+CLIENT_ENV = ("OPENAI_API_KEY", "OPENAI_BASE_URL", "OPENAI_ORG_ID", "OPENAI_PROJECT_ID")
+
 
 @overload
 def setup_call(
@@ -141,7 +144,11 @@ def setup_call(
     call_kwargs |= {"model": model, "messages": messages}
 
     if client is None:
-        client = AsyncOpenAI() if inspect.iscoroutinefunction(fn) else OpenAI()
+        client = (
+            client_pool.get_async_client(AsyncOpenAI, env=CLIENT_ENV)
+            if inspect.iscoroutinefunction(fn)
+            else client_pool.get_client(OpenAI, env=CLIENT_ENV)
+        )
     create = (
         get_async_create_fn(client.chat.completions.create)
         if isinstance(client, AsyncOpenAI)
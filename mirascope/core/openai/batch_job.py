@@ -0,0 +1,90 @@
+"""The `OpenAIBatchJob` class for running calls through the OpenAI Batch API.
+
+usage docs: learn/calls.md
+"""
+
+import json
+from typing import Any, ClassVar
+
+from openai import OpenAI
+from openai.types import Batch
+from openai.types.chat import ChatCompletion
+
+from ..base import client_pool
+from ..base.batch_job import BaseBatchJob
+
+BATCH_ENDPOINT = "/v1/chat/completions"
+
+
+class OpenAIBatchJob(BaseBatchJob[OpenAI, ChatCompletion]):
+    """A job running an `openai.call` over many inputs through the OpenAI Batch API.
+
+    The request bodies are written as JSONL, uploaded as a batch input file, and run
+    against the chat completions endpoint within a 24h completion window.
+
+    Example:
+
+    ```python
+    from mirascope.core import openai
+
+
+    @openai.call("gpt-4o-mini", response_model=Book)
+    def extract_book(text: str) -> str:
+        return f"Extract {text}"
+
+
+    job = openai.OpenAIBatchJob.submit(extract_book, [{"text": text} for text in texts])
+    books = [result["output"] for result in job.wait().results()]
+    ```
+    """
+
+    terminal_statuses: ClassVar[frozenset[str]] = frozenset(
+        {"completed", "failed", "expired", "cancelled"}
+    )
+
+    batch: Batch | None = None
+
+    @classmethod
+    def _default_client(cls) -> OpenAI:
+        return client_pool.get_client(OpenAI)
+
+    @classmethod
+    def _create_batch(cls, client: OpenAI, requests: list[dict[str, Any]]) -> str:
+        jsonl = "\n".join(
+            json.dumps(request | {"method": "POST", "url": BATCH_ENDPOINT})
+            for request in requests
+        )
+        input_file = client.files.create(
+            file=("batch.jsonl", jsonl.encode()), purpose="batch"
+        )
+        return client.batches.create(
+            input_file_id=input_file.id,
+            endpoint=BATCH_ENDPOINT,
+            completion_window="24h",
+        ).id
+
+    def _retrieve_status(self) -> str:
+        self.batch = self.client.batches.retrieve(self.id)
+        return self.batch.status
+
+    def _fetch_responses(self) -> dict[str, ChatCompletion | Exception]:
+        batch = self.batch or self.client.batches.retrieve(self.id)
+        responses: dict[str, ChatCompletion | Exception] = {}
+        for file_id in (batch.output_file_id, batch.error_file_id):
+            if not file_id:
+                continue
+            for line in self.client.files.content(file_id).text.splitlines():
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                response = record.get("response") or {}
+                if record.get("error") or response.get("status_code") != 200:
+                    error = record.get("error") or response.get("body", {}).get("error")
+                    responses[record["custom_id"]] = RuntimeError(
+                        f"Batch request {record['custom_id']} failed: {error}"
+                    )
+                else:
+                    responses[record["custom_id"]] = ChatCompletion.model_validate(
+                        response["body"]
+                    )
+        return responses
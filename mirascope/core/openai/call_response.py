@@ -17,6 +17,7 @@ from openai.types.completion_usage import CompletionUsage
 from pydantic import SerializeAsAny, SkipValidation, computed_field
 
 from ..base import BaseCallResponse
+from ..base._utils import cached_getter
 from ._utils import calculate_cost
 from .call_params import OpenAICallParams
 from .dynamic_config import OpenAIDynamicConfig
@@ -111,12 +112,14 @@ class OpenAICallResponse(
         return self.usage.completion_tokens if self.usage else None
 
     @property
+    @cached_getter
     def cost(self) -> float | None:
         """Returns the cost of the call."""
         return calculate_cost(self.input_tokens, self.output_tokens, self.model)
 
     @computed_field
     @property
+    @cached_getter
     def message_param(self) -> SerializeAsAny[ChatCompletionAssistantMessageParam]:
         """Returns the assistants's response as a message parameter."""
         message_param = self.response.choices[0].message.model_dump(
@@ -128,6 +131,7 @@ class OpenAICallResponse(
 
     @computed_field
     @property
+    @cached_getter
     def tools(self) -> list[OpenAITool] | None:
         """Returns any available tool calls as their `OpenAITool` definition.
 
@@ -193,6 +197,7 @@ class OpenAICallResponse(
 
     @computed_field
     @property
+    @cached_getter
     def audio(self) -> bytes | None:
         """Returns the audio data of the response."""
         if audio := getattr(self.response.choices[0].message, "audio", None):
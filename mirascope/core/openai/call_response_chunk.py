@@ -74,22 +74,20 @@ class OpenAICallResponseChunk(BaseCallResponseChunk[ChatCompletionChunk, FinishR
     @property
     def usage(self) -> CompletionUsage | None:
         """Returns the usage of the chat completion."""
-        if hasattr(self.chunk, "usage") and self.chunk.usage:
-            return self.chunk.usage
-        return None
+        return getattr(self.chunk, "usage", None) or None
 
     @property
     def input_tokens(self) -> int | None:
         """Returns the number of input tokens."""
-        if self.usage:
-            return self.usage.prompt_tokens
+        if usage := self.usage:
+            return usage.prompt_tokens
         return None
 
     @property
     def output_tokens(self) -> int | None:
         """Returns the number of output tokens."""
-        if self.usage:
-            return self.usage.completion_tokens
+        if usage := self.usage:
+            return usage.completion_tokens
         return None
 
     @computed_field
@@ -31,6 +31,20 @@ from .tool import OpenAITool
 FinishReason = Choice.__annotations__["finish_reason"]
 
 
+def _audio_id(chunk: OpenAICallResponseChunk) -> str | None:
+    """Returns the id of the audio in the chunk's delta, if any.
+
+    `audio` is not a declared field of `ChoiceDelta`, so it is looked up in the extra
+    fields directly. A `getattr` default would go through pydantic's `__getattr__`,
+    which raises and catches an `AttributeError` for every chunk without audio.
+    """
+    if not (choices := chunk.chunk.choices):
+        return None
+    delta = choices[0].delta
+    audio = delta.__dict__.get("audio") or (delta.model_extra or {}).get("audio")
+    return audio.get("id") if audio else None
+
+
 class OpenAIStream(
     BaseStream[
         OpenAICallResponse,
@@ -74,11 +88,7 @@ class OpenAIStream(
         self,
     ) -> Generator[tuple[OpenAICallResponseChunk, OpenAITool | None], None, None]:
         for chunk, tool in super().__iter__():
-            if (
-                (choices := chunk.chunk.choices)
-                and (audio := getattr(choices[0].delta, "audio", None))
-                and (audio_id := audio.get("id"))
-            ):
+            if audio_id := _audio_id(chunk):
                 self.audio_id = audio_id
             yield chunk, tool
 
@@ -91,11 +101,7 @@ class OpenAIStream(
             AsyncGenerator[tuple[OpenAICallResponseChunk, OpenAITool | None], None]
         ):
             async for chunk, tool in aiter:
-                if (
-                    (choices := chunk.chunk.choices)
-                    and (audio := getattr(choices[0].delta, "audio", None))
-                    and (audio_id := audio.get("id"))
-                ):
+                if audio_id := _audio_id(chunk):
                     self.audio_id = audio_id
                 yield chunk, tool
 
@@ -170,7 +176,7 @@ class OpenAIStream(
             object="chat.completion",
             usage=usage,
         )
-        return OpenAICallResponse(
+        return OpenAICallResponse._construct_trusted(
             metadata=self.metadata,
             response=completion,
             tool_types=self.tool_types,
@@ -8,6 +8,7 @@ from pydantic import computed_field
 from vertexai.generative_models import Content, GenerationResponse, Part, Tool
 
 from ..base import BaseCallResponse
+from ..base._utils import cached_getter
 from ._utils import calculate_cost
 from .call_params import VertexCallParams
 from .dynamic_config import VertexDynamicConfig
@@ -105,18 +106,21 @@ class VertexCallResponse(
         return self.usage.candidates_token_count
 
     @property
+    @cached_getter
     def cost(self) -> float | None:
         """Returns the cost of the call."""
         return calculate_cost(self.input_tokens, self.output_tokens, self.model)
 
     @computed_field
     @property
+    @cached_getter
     def message_param(self) -> Content:
         """Returns the models's response as a message parameter."""
         return Content(role="model", parts=self.response.candidates[0].content.parts)
 
     @computed_field
     @property
+    @cached_getter
     def tools(self) -> list[VertexTool] | None:
         """Returns the list of tools for the 0th candidate's 0th content part."""
         if self.tool_types is None:
@@ -104,7 +104,7 @@ class VertexStream(
                 ]
             }
         )
-        return VertexCallResponse(
+        return VertexCallResponse._construct_trusted(
             metadata=self.metadata,
             response=response,
             tool_types=self.tool_types,
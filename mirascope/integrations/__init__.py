@@ -1,16 +1,38 @@
-"""Integrations with third party libraries."""
+"""Integrations with third party libraries.
 
-from contextlib import suppress
+Integration subpackages are imported lazily on first access, like the providers of
+`mirascope.core`.
+"""
+
+import importlib
+from types import ModuleType
+from typing import TYPE_CHECKING
 
 from ._middleware_factory import middleware_factory
 
-with suppress(ImportError):
+if TYPE_CHECKING:
+    from . import langfuse as langfuse
     from . import logfire as logfire
+    from . import otel as otel
 
-with suppress(ImportError):
-    from . import langfuse as langfuse
+_INTEGRATIONS = frozenset({"langfuse", "logfire", "otel"})
+
+
+def __getattr__(name: str) -> ModuleType:
+    if name not in _INTEGRATIONS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    try:
+        module = importlib.import_module(f".{name}", __name__)
+    except ImportError as e:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r} ({e})"
+        ) from e
+    globals()[name] = module
+    return module
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | _INTEGRATIONS)
 
-with suppress(ImportError):
-    from . import otel as otel
 
 __all__ = ["langfuse", "logfire", "middleware_factory", "otel"]
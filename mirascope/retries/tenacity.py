@@ -4,6 +4,8 @@ from collections.abc import Callable
 
 from tenacity import RetryCallState
 
+from ..core.base.deadline import DeadlineExceededError, current_deadline
+
 
 def collect_errors(
     *args: type[Exception],
@@ -48,3 +50,42 @@ def collect_errors(
             )
 
     return inner
+
+
+def stop_at_deadline(retry_state: RetryCallState) -> bool:
+    """Stops retrying once the active deadline would be exceeded.
+
+    Retries stop when the last attempt ran out of time or when the remaining budget of
+    the enclosing `deadline` does not cover the wait before the next attempt. Combine it
+    with other stop conditions using `|`.
+
+    Example:
+
+    ```python
+    from mirascope.core import openai
+    from mirascope.core.base import deadline
+    from mirascope.retries.tenacity import stop_at_deadline
+    from tenacity import retry, stop_after_attempt, wait_exponential
+
+
+    @deadline(30)
+    @retry(stop=stop_after_attempt(5) | stop_at_deadline, wait=wait_exponential())
+    @openai.call("gpt-4o-mini")
+    def recommend_book(genre: str) -> str:
+        return f"Recommend a {genre} book"
+    ```
+
+    Args:
+        retry_state: The state of the retried call.
+    """
+    if (
+        (outcome := retry_state.outcome)
+        and outcome.failed
+        and isinstance(outcome.exception(), DeadlineExceededError)
+    ):
+        return True
+    if (call_deadline := current_deadline()) is None or (
+        remaining := call_deadline.remaining()
+    ) is None:
+        return False
+    return remaining <= (retry_state.upcoming_sleep or 0.0)
@@ -0,0 +1,25 @@
+"""Tests the RAG chunkers."""
+
+from mirascope.beta.rag.base import TextChunker
+
+
+def test_text_chunker() -> None:
+    """Tests that texts are split into overlapping chunks with unique ids."""
+    chunker = TextChunker(chunk_size=4, chunk_overlap=1)
+    chunks = chunker.chunk("abcdefghij")
+    assert [chunk.text for chunk in chunks] == ["abcd", "defg", "ghij", "j"]
+    assert chunker.chunk("abcd")[0].id != chunker.chunk("abcd")[0].id
+
+
+def test_chunk_source() -> None:
+    """Tests that source chunks have stable ids that differ between sources."""
+    chunker = TextChunker(chunk_size=4, chunk_overlap=0)
+    chunks = chunker.chunk_source("notes.md", "headbody")
+    assert [chunk.text for chunk in chunks] == ["head", "body"]
+    assert all(chunk.metadata == {"source_id": "notes.md"} for chunk in chunks)
+    assert [chunk.id for chunk in chunks] == [
+        chunk.id for chunk in chunker.chunk_source("notes.md", "headbody")
+    ]
+    assert chunker.chunk_source("notes.md", "headtail")[0].id == chunks[0].id
+    assert chunker.chunk_source("other.md", "headbody")[0].id != chunks[0].id
+    assert chunker.chunk_source("notes.md", "bodyhead")[1].id != chunks[0].id
@@ -0,0 +1,175 @@
+"""Tests the `BaseEmbedder` batching and retry pipeline."""
+
+import pytest
+
+from mirascope.beta.rag.base.embedders import BaseEmbedder
+from mirascope.beta.rag.base.embedding_cache import InMemoryEmbeddingCache
+from mirascope.beta.rag.base.embedding_response import BaseEmbeddingResponse
+
+
+class FakeEmbeddingResponse(BaseEmbeddingResponse[list[list[float]]]):
+    @property
+    def embeddings(self) -> list[list[float]]:
+        return self.response
+
+
+class StatusError(Exception):
+    def __init__(self, status_code: int) -> None:
+        self.status_code = status_code
+
+
+class FakeEmbedder(BaseEmbedder[FakeEmbeddingResponse]):
+    """Embeds each input as its length, raising the queued errors first."""
+
+    max_workers: int = 1
+    retry_backoff: float = 0
+    calls: list[list[str]] = []
+    errors: list[Exception] = []
+
+    def _embed(self, inputs: list[str]) -> FakeEmbeddingResponse:
+        self.calls.append(inputs)
+        if self.errors:
+            raise self.errors.pop(0)
+        return FakeEmbeddingResponse(
+            response=[[float(len(input))] for input in inputs],
+            start_time=len(self.calls),
+            end_time=len(self.calls),
+        )
+
+    def _merge_batch_embeddings(
+        self, embedding_responses: list[FakeEmbeddingResponse]
+    ) -> FakeEmbeddingResponse:
+        return FakeEmbeddingResponse(
+            response=[
+                embedding
+                for response in embedding_responses
+                for embedding in response.embeddings
+            ],
+            start_time=min(response.start_time for response in embedding_responses),
+            end_time=max(response.end_time for response in embedding_responses),
+        )
+
+    def _response_from_embeddings(
+        self,
+        inputs: list[str],
+        embeddings: list[list[float]],
+        response: FakeEmbeddingResponse | None,
+    ) -> FakeEmbeddingResponse:
+        return FakeEmbeddingResponse(response=embeddings, start_time=0, end_time=0)
+
+
+def test_batch_inputs() -> None:
+    """Tests splitting inputs by count and estimated tokens."""
+    embedder = FakeEmbedder(embed_batch_size=2)
+    assert embedder._batch_inputs([]) == []
+    assert embedder._batch_inputs(["a", "b", "c"]) == [["a", "b"], ["c"]]
+
+    # `_estimate_tokens` counts one token per three UTF-8 bytes, plus one
+    embedder = FakeEmbedder(max_batch_tokens=5)
+    assert embedder._estimate_tokens("abcdef") == 3
+    assert embedder._estimate_tokens("abc") == 2
+    assert embedder._estimate_tokens("x" * 30) == 11
+    assert embedder._batch_inputs(["abcdef", "abc", "x" * 30, "a"]) == [
+        ["abcdef", "abc"],
+        ["x" * 30],
+        ["a"],
+    ]
+
+
+def test_embed_merges_batches_in_order() -> None:
+    """Tests that the responses of the batches are merged in input order."""
+    embedder = FakeEmbedder(embed_batch_size=2, max_workers=4)
+    response = embedder.embed(["a", "bb", "ccc", "dddd", "eeeee"])
+    assert response.embeddings == [[1.0], [2.0], [3.0], [4.0], [5.0]]
+    assert sorted(embedder.calls) == [["a", "bb"], ["ccc", "dddd"], ["eeeee"]]
+
+
+def test_embed_empty_inputs() -> None:
+    """Tests that embedding no inputs never calls the provider."""
+    embedder = FakeEmbedder()
+    assert embedder.embed([]).embeddings == []
+    assert embedder.calls == []
+
+
+def test_embed_retries_transient_errors() -> None:
+    """Tests that only the failed batches are retried on transient errors."""
+    embedder = FakeEmbedder(
+        embed_batch_size=1, errors=[StatusError(429), StatusError(503), TimeoutError()]
+    )
+    assert embedder.embed(["a", "bb"]).embeddings == [[1.0], [2.0]]
+    assert embedder.calls == [["a"], ["bb"], ["a"], ["bb"], ["a"]]
+
+
+@pytest.mark.parametrize(
+    "error", [StatusError(401), StatusError(400), ValueError("invalid input")]
+)
+def test_embed_raises_permanent_errors(error: Exception) -> None:
+    """Tests that errors like authentication failures are not retried."""
+    embedder = FakeEmbedder(errors=[error])
+    with pytest.raises(type(error)):
+        embedder.embed(["a"])
+    assert embedder.calls == [["a"]]
+
+
+def test_embed_raises_once_retries_run_out() -> None:
+    """Tests that the last transient error is raised after `max_retries` retries."""
+    embedder = FakeEmbedder(max_retries=1, errors=[ConnectionError(), TimeoutError()])
+    with pytest.raises(TimeoutError):
+        embedder.embed(["a"])
+    assert embedder.calls == [["a"], ["a"]]
+
+
+@pytest.mark.asyncio
+async def test_embed_async() -> None:
+    """Tests that `_embed_async` defaults to running `_embed` in a thread."""
+    embedder = FakeEmbedder(embed_batch_size=1, errors=[StatusError(500)])
+    response = await embedder.embed_async(["a", "bb"])
+    assert response.embeddings == [[1.0], [2.0]]
+    assert len(embedder.calls) == 3
+    assert (await embedder.embed_async([])).embeddings == []
+
+
+def test_embed_with_cache() -> None:
+    """Tests that only the inputs missing from the cache are embedded."""
+    cache = InMemoryEmbeddingCache()
+    embedder = FakeEmbedder(cache=cache)
+    assert embedder.embed(["a", "bb", "a"]).embeddings == [[1.0], [2.0], [1.0]]
+    assert embedder.calls == [["a", "bb"]]
+
+    response = embedder.embed(["bb", "ccc", "a"])
+    assert response.embeddings == [[2.0], [3.0], [1.0]]
+    assert embedder.calls == [["a", "bb"], ["ccc"]]
+    assert embedder.embed(["a"]).embeddings == [[1.0]]
+    assert len(embedder.calls) == 2
+
+    other_embedder = FakeEmbedder(cache=cache, dimensions=8)
+    other_embedder.embed(["a"])
+    assert other_embedder.calls == [["a"]]
+
+
+@pytest.mark.asyncio
+async def test_embed_async_with_cache() -> None:
+    """Tests that async embeds share the cache with sync ones."""
+    embedder = FakeEmbedder(cache=InMemoryEmbeddingCache())
+    embedder.embed(["a"])
+    assert (await embedder.embed_async(["a", "bb"])).embeddings == [[1.0], [2.0]]
+    assert embedder.calls == [["a"], ["bb"]]
+    assert (await embedder.embed_async(["bb"])).embeddings == [[2.0]]
+    assert len(embedder.calls) == 2
+
+
+def test_embedder_overriding_embed() -> None:
+    """Tests that embedders implementing only `embed` can still be instantiated."""
+
+    class MyEmbedder(BaseEmbedder[FakeEmbeddingResponse]):
+        def embed(self, inputs: list[str]) -> FakeEmbeddingResponse:
+            return FakeEmbeddingResponse(response=[], start_time=0, end_time=0)
+
+        async def embed_async(self, inputs: list[str]) -> FakeEmbeddingResponse:
+            return self.embed(inputs)  # pragma: no cover
+
+    assert MyEmbedder().embed(["a"]).embeddings == []
+    with pytest.raises(NotImplementedError, match="_embed"):
+        MyEmbedder()._embed(["a"])
+    with pytest.raises(NotImplementedError, match="_merge_batch_embeddings"):
+        MyEmbedder()._merge_batch_embeddings([])
@@ -0,0 +1,62 @@
+"""Tests the `embedding_cache` module."""
+
+from pathlib import Path
+
+import pytest
+
+from mirascope.beta.rag.base.embedding_cache import (
+    BaseEmbeddingCache,
+    InMemoryEmbeddingCache,
+    SQLiteEmbeddingCache,
+)
+
+
+def test_embedding_cache_key() -> None:
+    """Tests that keys depend on both the namespace and the text."""
+    key = BaseEmbeddingCache.key("openai:model:1536", "text")
+    assert key == BaseEmbeddingCache.key("openai:model:1536", "text")
+    assert key != BaseEmbeddingCache.key("openai:model:512", "text")
+    assert key != BaseEmbeddingCache.key("openai:model:1536", "other text")
+
+
+def test_in_memory_embedding_cache() -> None:
+    """Tests the LRU eviction, float32 storage, and stats of the in-memory cache."""
+    cache = InMemoryEmbeddingCache(max_size=2)
+    cache.set_many({"a": [0.5, 1.0], "b": [0.1, 2.0]})
+    assert cache.get_many(["a", "c", "a"]) == {"a": [0.5, 1.0]}
+    assert cache.stats.hits == 2
+    assert cache.stats.misses == 1
+    assert cache.stats.hit_rate == pytest.approx(2 / 3)
+
+    embedding = cache.get_many(["b"])["b"]
+    assert embedding == pytest.approx([0.1, 2.0])
+    assert embedding[0] != 0.1  # stored with float32 precision
+
+    cache.set_many({"c": [3.0]})
+    assert len(cache) == 2
+    assert set(cache.get_many(["a", "b", "c"])) == {"b", "c"}
+
+    cache.clear()
+    assert len(cache) == 0
+    cache.stats.reset()
+    assert repr(cache.stats) == "EmbeddingCacheStats(hits=0, misses=0, hit_rate=0.00%)"
+
+
+def test_sqlite_embedding_cache(tmp_path: Path) -> None:
+    """Tests that the SQLite cache persists embeddings across connections."""
+    path = tmp_path / "cache" / "embeddings.db"
+    cache = SQLiteEmbeddingCache(path)
+    cache._MAX_VARIABLES = 2
+    cache.set_many({"a": [0.5, 1.0], "b": [2.0], "c": [-1.0]})
+    cache.close()
+
+    cache = SQLiteEmbeddingCache(path)
+    assert cache.get_many(["a", "b", "c", "d"]) == {
+        "a": [0.5, 1.0],
+        "b": [2.0],
+        "c": [-1.0],
+    }
+    assert cache.stats.misses == 1
+    cache.clear()
+    assert cache.get_many(["a"]) == {}
+    cache.close()
@@ -0,0 +1,68 @@
+"""Tests the `BaseVectorStore.sync` diffing."""
+
+from typing import Any, ClassVar
+
+from mirascope.beta.rag.base import TextChunker
+from mirascope.beta.rag.base.document import Document
+from mirascope.beta.rag.base.query_results import BaseQueryResults
+from mirascope.beta.rag.base.vectorstores import BaseVectorStore
+
+
+class DictVectorStore(BaseVectorStore):
+    """Stores documents in a dict keyed on their ids."""
+
+    chunker = TextChunker(chunk_size=4, chunk_overlap=0)
+    documents: ClassVar[dict[str, Document]] = {}
+    added: ClassVar[list[list[str]]] = []
+
+    def retrieve(self, text: str, **kwargs: Any) -> BaseQueryResults:  # noqa: ANN401
+        return BaseQueryResults()  # pragma: no cover
+
+    def add(self, text: str | list[Document], **kwargs: Any) -> None:  # noqa: ANN401
+        documents = self.chunker.chunk(text) if isinstance(text, str) else text
+        self.added.append([document.text for document in documents])
+        self.documents.update((document.id, document) for document in documents)
+
+    def _get_source_ids(self, source_id: str) -> list[str]:
+        return [
+            id
+            for id, document in self.documents.items()
+            if (document.metadata or {}).get("source_id") == source_id
+        ]
+
+    def _delete(self, ids: list[str]) -> None:
+        for id in ids:
+            del self.documents[id]
+
+
+def test_vectorstore_sync() -> None:
+    """Tests that only new or changed chunks are added and stale ones deleted."""
+    DictVectorStore.documents.clear()
+    DictVectorStore.added.clear()
+    store = DictVectorStore()
+    store.add("headfoot")
+
+    result = store.sync("notes.md", "headbody")
+    assert len(result.added_ids) == 2
+    assert result.deleted_ids == []
+    assert result.unchanged == 0
+
+    result = store.sync("notes.md", "headtailmore")
+    assert len(result.added_ids) == 2
+    assert len(result.deleted_ids) == 1
+    assert result.unchanged == 1
+    assert store.added[-1] == ["tail", "more"]
+
+    result = store.sync("notes.md", "headtailmore")
+    assert result.added_ids == result.deleted_ids == []
+    assert result.unchanged == 3
+    assert len(store.added) == 3
+
+    store.sync("other.md", "head")
+    result = store.sync("notes.md", "")
+    assert len(result.deleted_ids) == 3
+    assert sorted(document.text for document in store.documents.values()) == [
+        "foot",
+        "head",
+        "head",
+    ]
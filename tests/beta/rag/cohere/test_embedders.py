@@ -0,0 +1,25 @@
+"""Tests the `CohereEmbedder` class."""
+
+from mirascope.beta.rag.cohere.embedders import CohereEmbedder
+from mirascope.beta.rag.cohere.embedding_params import CohereEmbeddingParams
+
+
+def test_cohere_embedder_cache_namespace() -> None:
+    """Tests that every parameter changing the embeddings is in the namespace."""
+
+    class NoTruncateEmbedder(CohereEmbedder):
+        embedding_params = CohereEmbeddingParams(truncate="none")
+
+    class DocumentEmbedder(CohereEmbedder):
+        embedding_params = CohereEmbeddingParams(input_type="search_document")
+
+    namespaces = {
+        embedder._cache_namespace()
+        for embedder in [
+            CohereEmbedder(),
+            CohereEmbedder(dimensions=384),
+            NoTruncateEmbedder(),
+            DocumentEmbedder(),
+        ]
+    }
+    assert len(namespaces) == 4
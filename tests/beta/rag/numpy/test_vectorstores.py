@@ -0,0 +1,150 @@
+"""Tests the `NumpyVectorStore` class."""
+
+from pathlib import Path
+from typing import ClassVar
+
+import pytest
+
+from mirascope.beta.rag.base import TextChunker
+from mirascope.beta.rag.base.document import Document
+from mirascope.beta.rag.base.embedders import BaseEmbedder
+from mirascope.beta.rag.base.embedding_response import BaseEmbeddingResponse
+from mirascope.beta.rag.numpy import NumpySettings, NumpyVectorStore
+
+VECTORS = {
+    "apple": [1.0, 0.0, 0.0],
+    "apricot": [0.9, 0.1, 0.0],
+    "banana": [0.0, 1.0, 0.0],
+    "cherry": [0.0, 0.0, 1.0],
+    "date": [0.0, 0.6, 0.8],
+}
+
+
+class VectorEmbeddingResponse(BaseEmbeddingResponse[list[list[float]]]):
+    @property
+    def embeddings(self) -> list[list[float]]:
+        return self.response
+
+
+class VectorEmbedder(BaseEmbedder[VectorEmbeddingResponse]):
+    """Embeds the texts of `VECTORS` as their vectors."""
+
+    def _embed(self, inputs: list[str]) -> VectorEmbeddingResponse:
+        return VectorEmbeddingResponse(
+            response=[VECTORS[input] for input in inputs], start_time=0, end_time=0
+        )
+
+
+class MemoryStore(NumpyVectorStore):
+    embedder = VectorEmbedder()
+    chunker = TextChunker(chunk_size=1000, chunk_overlap=0)
+    client_settings = NumpySettings(path=None, search_chunk_size=2)
+
+
+DOCUMENTS = [
+    Document(id="1", text="apple", metadata={"color": "red"}),
+    Document(id="2", text="apricot", metadata={"color": "orange"}),
+    Document(id="3", text="banana", metadata={"color": "yellow"}),
+    Document(id="4", text="cherry", metadata={"color": "red", "tags": ["pit"]}),
+]
+
+
+def test_numpy_vectorstore_retrieve() -> None:
+    """Tests the top-k matches of single and batched queries with filters."""
+    store = MemoryStore()
+    store.add(DOCUMENTS)
+    result = store.retrieve("apple", top_k=2)
+    assert result.ids == [["1", "2"]]
+    assert result.documents == [["apple", "apricot"]]
+    assert result.metadatas == [[{"color": "red"}, {"color": "orange"}]]
+    assert result.scores[0][0] == pytest.approx(1.0)
+    assert result.scores[0][1] == pytest.approx(0.9 / (0.82**0.5))
+
+    assert store.retrieve(["apple", "banana"], top_k=1).ids == [["1"], ["3"]]
+    assert store.retrieve("apple", where={"color": "red"}).ids == [["1", "4"]]
+    assert store.retrieve("apple", where={"color": ["yellow", "orange"]}).ids == [
+        ["2", "3"]
+    ]
+    assert store.retrieve("apple", where={"color": "green"}).ids == [[]]
+    assert store.retrieve("apple", where={"tags": ["pit"]}).ids == [[]]
+    assert store.retrieve("apple", top_k=1, namespace="ignored").ids == [["1"]]
+    with pytest.raises(ValueError, match="top_k"):
+        store.retrieve("apple", top_k=0)
+
+
+def test_numpy_vectorstore_replace_delete_compact() -> None:
+    """Tests that replaced and deleted documents are masked until compacted."""
+    store = MemoryStore()
+    store.add(DOCUMENTS)
+    store.add([Document(id="1", text="date")])
+    store._delete(["2", "missing"])
+    result = store.retrieve("banana", top_k=8)
+    assert result.ids[0][:2] == ["3", "1"]
+    assert sorted(result.ids[0]) == ["1", "3", "4"]
+    assert len(store._index.ids) == 5
+
+    store.compact()
+    assert len(store._index.ids) == 3
+    assert store.retrieve("banana", top_k=8).ids == result.ids
+    with pytest.raises(ValueError, match="dimensions"):
+        store._index.add([Document(id="5", text="")], [[1.0, 0.0]])
+
+
+def test_numpy_vectorstore_sync() -> None:
+    """Tests that syncing a source only adds and deletes the changed chunks."""
+    store = MemoryStore()
+    assert len(store.sync("fruit.md", "apple").added_ids) == 1
+    assert store.sync("fruit.md", "apple").unchanged == 1
+    result = store.sync("fruit.md", "banana")
+    assert len(result.added_ids) == len(result.deleted_ids) == 1
+    assert store.retrieve("banana", top_k=8).documents == [["banana"]]
+
+
+def _persistent_store(path: Path) -> NumpyVectorStore:
+    class PersistentStore(MemoryStore):
+        index_name = "fruits"
+        client_settings: ClassVar[NumpySettings] = NumpySettings(path=str(path))
+
+    return PersistentStore()
+
+
+def test_numpy_vectorstore_persistence(tmp_path: Path) -> None:
+    """Tests that a persisted index is reloaded, including after compaction."""
+    store = _persistent_store(tmp_path)
+    store.add(DOCUMENTS)
+    store.add([Document(id="1", text="date")])
+    store._delete(["2"])
+    expected = store.retrieve("banana", top_k=8)
+
+    reloaded = _persistent_store(tmp_path)
+    assert reloaded.retrieve("banana", top_k=8) == expected
+    reloaded.compact()
+    assert (tmp_path / "fruits" / "vectors.f32").stat().st_size == 3 * 3 * 4
+    assert _persistent_store(tmp_path).retrieve("banana", top_k=8) == expected
+
+
+def test_numpy_vectorstore_recovers_interrupted_add(tmp_path: Path) -> None:
+    """Tests that vectors without recorded documents never shift later rows."""
+    store = _persistent_store(tmp_path)
+    store.add(DOCUMENTS[:2])
+    directory = tmp_path / "fruits"
+    with open(directory / "vectors.f32", "ab") as file:
+        file.write(b"\0" * 3 * 4 * 2)  # the vectors of an add that crashed
+    with open(directory / "documents.jsonl", "a") as file:
+        file.write('{"id": "torn')
+
+    reloaded = _persistent_store(tmp_path)
+    assert reloaded._index.ids == ["1", "2"]
+    assert (directory / "vectors.f32").stat().st_size == 2 * 3 * 4
+    reloaded.add([DOCUMENTS[2]])
+    with pytest.raises(TypeError):
+        reloaded.add([Document(id="5", text="date", metadata={"bad": object()})])
+    reloaded.add([DOCUMENTS[3]])
+    assert _persistent_store(tmp_path).retrieve(
+        ["apple", "banana", "cherry"], top_k=1
+    ).ids == [["1"], ["3"], ["4"]]
+
+    with open(directory / "vectors.f32", "r+b") as file:
+        file.truncate(3 * 4)
+    with pytest.raises(ValueError, match="missing vectors"):
+        _persistent_store(tmp_path)._index  # noqa: B018
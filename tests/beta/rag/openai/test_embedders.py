@@ -0,0 +1,54 @@
+"""Tests the `OpenAIEmbedder` class."""
+
+from unittest.mock import MagicMock, patch
+
+from openai.types import Embedding
+from openai.types.create_embedding_response import CreateEmbeddingResponse, Usage
+
+from mirascope.beta.rag.base.embedding_cache import InMemoryEmbeddingCache
+from mirascope.beta.rag.openai.embedders import OpenAIEmbedder
+from mirascope.beta.rag.openai.embedding_params import OpenAIEmbeddingParams
+
+
+def _create_embedding_response(
+    embeddings: list[list[float]],
+) -> CreateEmbeddingResponse:
+    return CreateEmbeddingResponse(
+        data=[
+            Embedding(embedding=embedding, index=i, object="embedding")
+            for i, embedding in enumerate(embeddings)
+        ],
+        model="text-embedding-3-small",
+        object="list",
+        usage=Usage(prompt_tokens=len(embeddings), total_tokens=len(embeddings)),
+    )
+
+
+@patch("mirascope.beta.rag.openai.embedders.client_pool")
+def test_openai_embedder(mock_client_pool: MagicMock) -> None:
+    """Tests that batches are sent on the pooled client and merged in order."""
+    mock_create = mock_client_pool.get_client.return_value.embeddings.create
+    mock_create.side_effect = lambda input, **kwargs: _create_embedding_response(
+        [[float(len(text))] for text in input]
+    )
+    embedder = OpenAIEmbedder(embed_batch_size=2, max_workers=1)
+    response = embedder.embed(["a", "bb", "ccc"])
+    assert response.embeddings == [[1.0], [2.0], [3.0]]
+    assert [embedding.index for embedding in response.response.data] == [0, 1, 2]
+    assert response.response.usage.total_tokens == 3
+    assert mock_create.call_count == 2
+    assert mock_create.call_args.kwargs["dimensions"] == 1536
+
+    assert embedder.embed([]).embeddings == []
+    assert mock_create.call_count == 2
+
+
+def test_openai_embedder_active_cache() -> None:
+    """Tests that base64-encoded embeddings are never cached."""
+    cache = InMemoryEmbeddingCache()
+    assert OpenAIEmbedder(cache=cache)._active_cache() is cache
+
+    class Base64Embedder(OpenAIEmbedder):
+        embedding_params = OpenAIEmbeddingParams(encoding_format="base64")
+
+    assert Base64Embedder(cache=cache)._active_cache() is None
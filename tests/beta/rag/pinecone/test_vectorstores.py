@@ -0,0 +1,24 @@
+"""Tests the `PineconeVectorStore` class."""
+
+from unittest.mock import MagicMock, PropertyMock, patch
+
+from mirascope.beta.rag.pinecone.vectorstores import PineconeVectorStore
+
+
+def test_pinecone_source_ids_are_prefixed_per_source() -> None:
+    """Tests that the id prefix of a source never matches another source's ids."""
+    prefix = PineconeVectorStore._source_prefix("notes")
+    other_prefix = PineconeVectorStore._source_prefix("notes#x")
+    assert prefix == "notes#"
+    assert not other_prefix.startswith(prefix)
+    assert PineconeVectorStore._source_prefix("docs/a b.md") == "docs%2Fa%20b.md#"
+
+    mock_index = MagicMock()
+    mock_index.list.return_value = iter([["notes#1", "notes#2"], ["notes#3"]])
+    with patch.object(
+        PineconeVectorStore, "_index", new_callable=PropertyMock
+    ) as mock_index_property:
+        mock_index_property.return_value = mock_index
+        ids = PineconeVectorStore()._get_source_ids("notes")
+    assert ids == ["notes#1", "notes#2", "notes#3"]
+    mock_index.list.assert_called_once_with(prefix="notes#")
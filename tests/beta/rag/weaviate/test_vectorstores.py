@@ -0,0 +1,27 @@
+"""Tests the `WeaviateVectorStore` class."""
+
+from unittest.mock import MagicMock, PropertyMock, patch
+
+from mirascope.beta.rag.weaviate.vectorstores import WeaviateVectorStore
+
+
+def test_weaviate_get_source_ids_pages() -> None:
+    """Tests that the ids of a source are paged through until they run out."""
+
+    class MyStore(WeaviateVectorStore):
+        source_page_size = 2
+
+    pages = [["a", "b"], ["c", "d"], ["e"]]
+    mock_index = MagicMock()
+    mock_index.query.fetch_objects.side_effect = [
+        MagicMock(objects=[MagicMock(uuid=id) for id in page]) for page in pages
+    ]
+    with patch.object(
+        WeaviateVectorStore, "_index", new_callable=PropertyMock
+    ) as mock_index_property:
+        mock_index_property.return_value = mock_index
+        assert MyStore()._get_source_ids("notes.md") == ["a", "b", "c", "d", "e"]
+    offsets = [
+        call.kwargs["offset"] for call in mock_index.query.fetch_objects.call_args_list
+    ]
+    assert offsets == [0, 2, 4]
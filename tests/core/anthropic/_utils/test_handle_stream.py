@@ -144,13 +144,13 @@ def test_handle_chunk_no_tool_types() -> None:
     mock_chunk = MagicMock(spec=MessageStreamEvent)
     mock_current_tool_call = MagicMock(spec=ToolUseBlock)
     buffer, chunk, current_tool_call, current_tool_type = _handle_chunk(
-        "",
+        [],
         mock_chunk,
         mock_current_tool_call,
         None,
         None,
     )
-    assert buffer == ""
+    assert buffer == []
     assert chunk is None
     assert current_tool_call == mock_current_tool_call
     assert current_tool_type is None
@@ -0,0 +1,101 @@
+"""Tests the `anthropic.batch_job` module against a local stand-in batch server."""
+
+import json
+
+import httpx
+from anthropic import Anthropic
+
+from mirascope.core import anthropic
+from mirascope.core.anthropic.batch_job import AnthropicBatchJob
+
+BATCH_URL = "https://api.anthropic.com/v1/messages/batches"
+
+
+class BatchServer:
+    """A minimal in-memory stand-in for the Message Batches endpoints."""
+
+    def __init__(self) -> None:
+        self.requests: list[dict] = []
+        self.status = "in_progress"
+
+    def batch(self) -> dict:
+        return {
+            "id": "batch_0",
+            "type": "message_batch",
+            "processing_status": self.status,
+            "request_counts": {
+                "processing": 0,
+                "succeeded": 0,
+                "errored": 0,
+                "canceled": 0,
+                "expired": 0,
+            },
+            "created_at": "2024-01-01T00:00:00Z",
+            "expires_at": "2024-01-02T00:00:00Z",
+            "results_url": f"{BATCH_URL}/batch_0/results",
+        }
+
+    def result(self, request: dict) -> dict:
+        content = request["params"]["messages"][0]["content"]
+        text = content if isinstance(content, str) else content[0]["text"]
+        if "error" in text:
+            return {"type": "expired"}
+        return {
+            "type": "succeeded",
+            "message": {
+                "id": "msg_0",
+                "type": "message",
+                "role": "assistant",
+                "model": request["params"]["model"],
+                "content": [{"type": "text", "text": text}],
+                "stop_reason": "end_turn",
+                "usage": {"input_tokens": 1, "output_tokens": 1},
+            },
+        }
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        if path == "/v1/messages/batches":
+            self.requests = json.loads(request.content)["requests"]
+            return httpx.Response(200, json=self.batch())
+        if path == "/v1/messages/batches/batch_0":
+            return httpx.Response(200, json=self.batch())
+        if path == "/v1/messages/batches/batch_0/results":
+            lines = [
+                {"custom_id": request["custom_id"], "result": self.result(request)}
+                for request in self.requests
+            ]
+            return httpx.Response(200, text="\n".join(map(json.dumps, lines)))
+        return httpx.Response(404)
+
+
+def test_anthropic_batch_job() -> None:
+    """Tests submitting, polling, and mapping the results of an Anthropic batch."""
+    server = BatchServer()
+    client = Anthropic(
+        api_key="test",
+        http_client=httpx.Client(transport=httpx.MockTransport(server.handle)),
+    )
+
+    @anthropic.call("claude-3-5-sonnet-20240620", client=client)
+    def recommend_book(genre: str) -> str:
+        return f"Recommend a {genre} book"
+
+    job = AnthropicBatchJob.submit(
+        recommend_book, [{"genre": "fantasy"}, {"genre": "error"}], client=client
+    )
+    assert job.id == "batch_0"
+    assert [request["custom_id"] for request in server.requests] == [
+        "request-0",
+        "request-1",
+    ]
+    assert server.requests[0]["params"]["model"] == "claude-3-5-sonnet-20240620"
+    assert server.requests[0]["params"]["max_tokens"] == 1000
+
+    assert not job.done
+    server.status = "ended"
+    results = job.wait(poll_interval=0).results()
+    assert job.status == "ended"
+    assert results[0]["output"].content == "Recommend a fantasy book"  # pyright: ignore [reportOptionalMemberAccess]
+    assert results[1]["output"] is None
+    assert "expired" in str(results[1]["error"])
@@ -1,15 +1,30 @@
+import time
+from collections.abc import Generator
 from unittest.mock import MagicMock, patch
 
 import pytest
-from azure.core.credentials import AzureKeyCredential
+from azure.core.credentials import AccessToken, AzureKeyCredential
 
 from mirascope.core.azure._utils._get_credential import (
+    TOKEN_REFRESH_MARGIN,
+    AsyncCachedTokenCredential,
+    CachedTokenCredential,
     _get_azure_default_credential,
     _get_key_from_env,
+    clear_credential_cache,
+    get_async_credential,
     get_credential,
 )
 
 
+@pytest.fixture(autouse=True)
+def empty_credential_cache() -> Generator[None, None, None]:
+    """Clears the cached credentials before and after each test."""
+    clear_credential_cache()
+    yield
+    clear_credential_cache()
+
+
 @pytest.mark.parametrize(
     "env_value, expected",
     [
@@ -45,7 +60,7 @@ def test_get_azure_default_credential_import_error():
     "key_value, expected_type",
     [
         ("test_key", AzureKeyCredential),
-        (None, MagicMock),  # DefaultAzureCredential will be mocked
+        (None, CachedTokenCredential),  # DefaultAzureCredential will be mocked
     ],
 )
 def test_get_credential(key_value, expected_type):
@@ -65,3 +80,60 @@ def test_get_credential(key_value, expected_type):
             result = get_credential()
             assert isinstance(result, expected_type)
             assert result.key == key_value  # pyright: ignore [reportAttributeAccessIssue]
+
+
+def test_get_credential_cached() -> None:
+    """Tests that the same credential is returned for sync and async clients."""
+    with patch(
+        "mirascope.core.azure._utils._get_credential._get_key_from_env",
+        return_value="test_key",
+    ):
+        assert get_credential() is get_credential() is get_async_credential()
+    with (
+        patch(
+            "mirascope.core.azure._utils._get_credential._get_key_from_env",
+            return_value=None,
+        ),
+        patch(
+            "mirascope.core.azure._utils._get_credential._get_azure_default_credential"
+        ) as mock_default_cred,
+    ):
+        credential = get_credential()
+        assert get_credential() is credential
+        async_credential = get_async_credential()
+        assert isinstance(async_credential, AsyncCachedTokenCredential)
+        assert get_async_credential() is async_credential
+        mock_default_cred.assert_called_once()
+
+
+def test_cached_token_credential() -> None:
+    """Tests that tokens are cached per scope and refreshed ahead of expiry."""
+    credential = MagicMock()
+    credential.get_token.side_effect = [
+        AccessToken("token", int(time.time()) + 3600),
+        AccessToken("expiring", int(time.time()) + TOKEN_REFRESH_MARGIN - 1),
+        AccessToken("refreshed", int(time.time()) + 3600),
+        AccessToken("challenge", int(time.time()) + 3600),
+    ]
+    cached_credential = CachedTokenCredential(credential)
+    assert cached_credential.get_token("scope").token == "token"
+    assert cached_credential.get_token("scope").token == "token"
+    assert cached_credential.get_token("other").token == "expiring"
+    assert cached_credential.get_token("other").token == "refreshed"
+    assert cached_credential.get_token("scope", claims="claims").token == "challenge"
+    assert cached_credential.get_token("scope").token == "token"
+    assert credential.get_token.call_count == 4
+
+
+@pytest.mark.asyncio
+async def test_async_cached_token_credential() -> None:
+    """Tests that async clients share the token cache of the sync credential."""
+    credential = MagicMock()
+    credential.get_token.return_value = AccessToken("token", int(time.time()) + 3600)
+    cached_credential = CachedTokenCredential(credential)
+    async with AsyncCachedTokenCredential(cached_credential) as async_credential:
+        assert (await async_credential.get_token("scope")).token == "token"
+        assert (await async_credential.get_token("scope")).token == "token"
+        assert cached_credential.get_token("scope").token == "token"
+        await async_credential.get_token("scope", tenant_id="tenant")
+    assert credential.get_token.call_count == 2
@@ -203,3 +203,31 @@ def test_setup_call_extract(
             stream=False,
         )
     assert "tool_choice" in call_kwargs and call_kwargs["tool_choice"] == "required"
+
+
+@patch(
+    "mirascope.core.azure._utils._setup_call.ChatCompletionsClient",
+    new_callable=MagicMock,
+)
+@patch("mirascope.core.azure._utils._setup_call._utils", new_callable=MagicMock)
+def test_setup_call_pools_clients(
+    mock_utils: MagicMock, mock_azure: MagicMock, mock_base_setup_call: MagicMock
+) -> None:
+    """Tests that calls without a client reuse the client of their endpoint."""
+    mock_utils.setup_call = mock_base_setup_call
+    for _ in range(2):
+        setup_call(
+            model="gpt-4o",
+            client=None,
+            fn=MagicMock(),
+            fn_args={},
+            dynamic_config=None,
+            tools=None,
+            json_mode=False,
+            call_params={},
+            extract=False,
+            stream=False,
+        )
+    mock_azure.assert_called_once()
+    assert mock_azure.call_args.kwargs["endpoint"] == "test"
+    assert mock_azure.call_args.kwargs["credential"].key == "test"
@@ -0,0 +1,26 @@
+"""Tests the `_utils.cached_getter` module."""
+
+from mirascope.core.base._utils._cached_getter import cached_getter
+
+
+def test_cached_getter() -> None:
+    """Tests that the getter's value is cached in the instance `__dict__`."""
+    calls = []
+
+    class Book:
+        @property
+        @cached_getter
+        def title(self) -> str:
+            calls.append(self)
+            return "The Name of the Wind"
+
+    book, other_book = Book(), Book()
+    assert book.title == "The Name of the Wind"
+    assert book.title == "The Name of the Wind"
+    assert book.__dict__ == {"title": "The Name of the Wind"}
+    assert calls == [book]
+
+    assert other_book.title == "The Name of the Wind"
+    del book.__dict__["title"]
+    assert book.title == "The Name of the Wind"
+    assert calls == [book, other_book, book]
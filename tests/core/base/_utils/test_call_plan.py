@@ -0,0 +1,21 @@
+"""Tests the `_utils.CallPlan` class."""
+
+from unittest.mock import patch
+
+from mirascope.core.base._utils._call_plan import CallPlan
+
+
+def test_call_plan() -> None:
+    """Tests that the call plan binds arguments with a precomputed signature."""
+
+    def fn(genre: str, *, topic: str = "magic", **kwargs: str) -> None:
+        """Dummy fn."""
+
+    call_plan = CallPlan(fn)
+    with patch("inspect.signature") as mock_signature:
+        assert call_plan.get_fn_args(("fantasy",), {"author": "Patrick"}) == {
+            "genre": "fantasy",
+            "topic": "magic",
+            "author": "Patrick",
+        }
+        mock_signature.assert_not_called()
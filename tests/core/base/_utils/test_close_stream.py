@@ -0,0 +1,29 @@
+"""Tests the `_utils.close_stream` module."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from mirascope.core.base._utils._close_stream import aclose_stream, close_stream
+
+
+def test_close_stream() -> None:
+    """Tests closing provider streams that may or may not be closeable."""
+    stream = MagicMock()
+    close_stream(stream)
+    stream.close.assert_called_once_with()
+    close_stream(iter([]))
+
+
+@pytest.mark.asyncio
+async def test_aclose_stream() -> None:
+    """Tests closing async provider streams with `aclose`, `close`, or neither."""
+    stream = MagicMock(aclose=AsyncMock())
+    await aclose_stream(stream)
+    stream.aclose.assert_awaited_once_with()
+
+    sync_close_stream = MagicMock(spec=["close"])
+    await aclose_stream(sync_close_stream)
+    sync_close_stream.close.assert_called_once_with()
+
+    await aclose_stream(object())
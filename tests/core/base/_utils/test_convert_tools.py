@@ -0,0 +1,122 @@
+"""Tests the `_utils.convert_tools` function."""
+
+from collections.abc import Generator
+from typing import Any, ClassVar
+from unittest.mock import patch
+
+import pytest
+from pydantic import BaseModel
+
+from mirascope.core.base import BaseTool, ToolConfig
+from mirascope.core.base._utils._convert_tools import (
+    DYNAMIC_TOOL_MARKER,
+    _tool_cache,
+    _tool_cache_key,
+    clear_tool_cache,
+    convert_tools,
+)
+
+
+class SchemaTool(BaseTool):
+    """A tool with a simple schema."""
+
+    def call(self) -> str:
+        return "called"  # pragma: no cover
+
+    @classmethod
+    def tool_schema(cls) -> dict[str, Any]:
+        return {"name": cls._name(), "parameters": cls.model_json_schema()}
+
+
+@pytest.fixture(autouse=True)
+def empty_tool_cache() -> Generator[None, None, None]:
+    clear_tool_cache()
+    yield
+    clear_tool_cache()
+
+
+def format_book(title: str, author: str) -> str:
+    """Returns the formatted book.
+
+    Args:
+        title: The title of the book.
+        author: The author of the book.
+    """
+    return f"{title} by {author}"  # pragma: no cover
+
+
+class Book(BaseModel):
+    """A book."""
+
+    title: str
+
+
+def test_convert_tools() -> None:
+    """Tests that converted tool types and schemas are cached across calls."""
+    tool_types, tool_schemas = convert_tools([format_book, Book], SchemaTool)
+    assert [tool_type._name() for tool_type in tool_types] == ["format_book", "Book"]
+    assert tool_schemas[0]["name"] == "format_book"
+    assert list(tool_schemas[0]["parameters"]["properties"]) == ["title", "author"]
+    assert tool_schemas[1]["name"] == "Book"
+
+    with patch.object(SchemaTool, "tool_schema") as mock_tool_schema:
+        cached_tool_types, cached_tool_schemas = convert_tools(
+            [format_book, Book], SchemaTool
+        )
+        mock_tool_schema.assert_not_called()
+    assert cached_tool_types == tool_types
+    assert cached_tool_schemas == tool_schemas
+
+
+def test_convert_tools_tool_config() -> None:
+    """Tests that changing a tool's `tool_config` invalidates its cache entry."""
+
+    class FormatBook(BaseTool):
+        """Formats a book."""
+
+        tool_config: ClassVar[ToolConfig] = ToolConfig()
+
+        def call(self) -> str:
+            return "called"  # pragma: no cover
+
+    tool_types, _ = convert_tools([FormatBook], SchemaTool)
+    assert convert_tools([FormatBook], SchemaTool)[0] == tool_types
+    FormatBook.tool_config = {"strict": True}  # pyright: ignore [reportAttributeAccessIssue]
+    assert convert_tools([FormatBook], SchemaTool)[0] != tool_types
+
+
+def test_convert_tools_dynamic_tool() -> None:
+    """Tests that dynamic tools are never cached."""
+
+    def dynamic_tool() -> str:
+        """A dynamic tool."""
+        return "dynamic"  # pragma: no cover
+
+    setattr(dynamic_tool, DYNAMIC_TOOL_MARKER, True)
+    tool_types, _ = convert_tools([dynamic_tool], SchemaTool)
+    assert convert_tools([dynamic_tool], SchemaTool)[0] != tool_types
+    assert not _tool_cache
+
+
+def test_tool_cache_key_unhashable_tool() -> None:
+    """Tests that unhashable tools don't get a cache key."""
+
+    class UnhashableTool:
+        __hash__ = None  # pyright: ignore [reportAssignmentType]
+
+    assert _tool_cache_key(UnhashableTool(), SchemaTool) is None  # pyright: ignore [reportArgumentType]
+
+
+def test_convert_tools_maxsize() -> None:
+    """Tests that the least recently used entries are evicted."""
+
+    def first() -> None:
+        """First."""
+
+    def second() -> None:
+        """Second."""
+
+    with patch("mirascope.core.base._utils._convert_tools.TOOL_CACHE_MAXSIZE", new=1):
+        convert_tools([first], SchemaTool)
+        convert_tools([second], SchemaTool)
+    assert list(_tool_cache) == [(second, SchemaTool, None)]
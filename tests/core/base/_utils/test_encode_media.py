@@ -0,0 +1,75 @@
+"""Tests the `_utils._encode_media` module."""
+
+import base64
+from collections.abc import Generator
+from unittest.mock import patch
+
+import pytest
+
+from mirascope.core.base._utils._encode_media import (
+    _EncodedMediaCache,
+    clear_encoded_media_cache,
+    encode_media,
+    encode_media_data_url,
+)
+
+
+@pytest.fixture(autouse=True)
+def empty_encoded_media_cache() -> Generator[None, None, None]:
+    clear_encoded_media_cache()
+    yield
+    clear_encoded_media_cache()
+
+
+def test_encode_media() -> None:
+    """Tests that encoded media is cached by content, encoding, and media type."""
+    data = b"\xff\xd8\xffimage data"
+    encoded = base64.b64encode(data).decode("utf-8")
+    with patch("base64.b64encode", wraps=base64.b64encode) as mock_b64encode:
+        assert encode_media(data, "image/jpeg") == encoded
+        assert encode_media(data, "image/jpeg") is encode_media(data, "image/jpeg")
+        assert encode_media(bytes(bytearray(data)), "image/jpeg") == encoded
+        assert mock_b64encode.call_count == 1
+        assert (
+            encode_media_data_url(data, "image/jpeg")
+            == f"data:image/jpeg;base64,{encoded}"
+        )
+        assert encode_media_data_url(data, "image/png").startswith("data:image/png")
+        assert mock_b64encode.call_count == 3
+
+
+def test_encoded_media_cache_eviction() -> None:
+    """Tests that the cache is bounded by the total size of the encoded media."""
+    cache = _EncodedMediaCache(maxbytes=24)
+    cache.encode(b"aaaaaaa", "base64", "image/png")
+    cache.encode(b"bbbbbbb", "base64", "image/png")
+    assert cache.nbytes == 24
+    cache.encode(b"ccccccc", "base64", "image/png")
+    assert cache.nbytes == 24
+    assert len(cache._encoded) == 2
+    assert cache.encode(b"d" * 24, "base64", "image/png") == base64.b64encode(
+        b"d" * 24
+    ).decode("utf-8")
+    assert cache.nbytes == 24
+    for i in range(200):
+        cache.encode(str(i).encode(), "base64", "image/png")
+    assert len(cache._digests) <= 2 * len(cache._encoded) + 64
+
+
+def test_encoded_media_cache_retained_bytes() -> None:
+    """Tests that the raw media remembered by identity counts against the budget."""
+    cache = _EncodedMediaCache(maxbytes=64)
+    payloads = [bytes([i]) * 30 for i in range(4)]
+    for payload in payloads:
+        cache.encode(payload, "base64", "image/png")
+        assert cache.nbytes + cache._digests_nbytes <= cache.maxbytes
+    assert cache._digests_nbytes == sum(
+        len(data) for data, _ in cache._digests.values()
+    )
+
+    data = bytearray(b"image data")
+    encoded = cache.encode(bytes(data), "base64", "image/png")
+    assert cache.encode(data, "base64", "image/png") == encoded  # pyright: ignore [reportArgumentType]
+    assert id(data) not in cache._digests
+    data[:] = b"other data"
+    assert cache.encode(data, "base64", "image/png") != encoded  # pyright: ignore [reportArgumentType]
@@ -0,0 +1,59 @@
+"""Tests the `_utils.estimate_tokens` function."""
+
+from mirascope.core.base._utils._estimate_tokens import (
+    MEDIA_PART_TOKENS,
+    estimate_tokens,
+)
+
+
+def test_estimate_tokens() -> None:
+    """Tests estimating tokens from the text and maximum output tokens."""
+    assert estimate_tokens({"model": "a-very-long-model-name"}) == 0
+    assert (
+        estimate_tokens(
+            {
+                "model": "gpt-4o-mini",
+                "messages": [{"role": "user", "content": "Recommend a book"}],
+                "max_tokens": 100,
+            }
+        )
+        == 5 + 100
+    )
+    assert (
+        estimate_tokens(
+            {
+                "inferenceConfig": {"maxTokens": 10},
+                "system": ("abc",),
+                "temperature": 0.5,
+                "image": b"bytes",
+            }
+        )
+        == 1 + 10 + MEDIA_PART_TOKENS
+    )
+
+
+def test_estimate_tokens_media() -> None:
+    """Tests that base64 media payloads are counted flat rather than as text."""
+    data = "a" * 40_000
+    content = [
+        {"type": "text", "text": "Describe"},
+        {"type": "image_url", "image_url": {"url": f"data:image/png;base64,{data}"}},
+        {"type": "input_audio", "input_audio": {"data": data, "format": "wav"}},
+        {
+            "type": "document",
+            "source": {"type": "base64", "media_type": "application/pdf", "data": data},
+        },
+        {"type": "image_url", "image_url": {"url": "https://example.com/image.png"}},
+        {"data": "not media"},
+    ]
+    text = "".join(
+        [
+            *("user", "text", "Describe", "image_url", "input_audio", "wav"),
+            *("document", "base64", "application/pdf", "image_url"),
+            *("https://example.com/image.png", "not media"),
+        ]
+    )
+    assert (
+        estimate_tokens({"messages": [{"role": "user", "content": content}]})
+        == -(-len(text) // 4) + 3 * MEDIA_PART_TOKENS
+    )
@@ -1,9 +1,13 @@
 """Tests the `_utils.extract_tool_return` module."""
 
 from typing import Annotated
+from unittest.mock import patch
 
 from pydantic import BaseModel, RootModel
 
+from mirascope.core.base._utils._convert_base_type_to_base_tool import (
+    convert_base_type_to_base_tool,
+)
 from mirascope.core.base._utils._extract_tool_return import extract_tool_return
 from mirascope.core.base.from_call_args import FromCallArgs
 
@@ -65,6 +69,16 @@ def test_extract_tool_return_parse_obj_with_fields_from_call_args() -> None:
     assert book.title == "The Name of the Wind"
     assert book.author == "Patrick Rothfuss"
 
+    json_obj = {"author": "Patrick Rothfuss"}
+    book = extract_tool_return(
+        Book,
+        json_obj,
+        allow_partial=True,
+        fields_from_call_args={"title": "The Name of the Wind"},
+    )
+    assert book.title == "The Name of the Wind"
+    assert json_obj == {"author": "Patrick Rothfuss"}
+
 
 def test_extract_tool_return_parse_array_with_fields_from_call_args() -> None:
     """Tests the `extract_tool_return` function parsing array and fields from call args."""
@@ -87,3 +101,16 @@ def test_extract_tool_return_parse_array_with_fields_from_call_args() -> None:
     assert isinstance(list_model.root, list)
     assert len(list_model.root) == 1
     assert list_model.root[0].title == "The Name of the Wind"
+
+
+def test_extract_tool_return_base_type_model_cached() -> None:
+    """Tests that base type wrapper models are cached across calls."""
+    with patch(
+        "mirascope.core.base._utils._extract_tool_return.convert_base_type_to_base_tool",
+        wraps=convert_base_type_to_base_tool,
+    ) as mock_convert:
+        assert extract_tool_return(list[int], '{"value": [1', True, {}) == [1]
+        assert extract_tool_return(list[int], '{"value": [1, 2]}', False, {}) == [1, 2]
+        mock_convert.assert_called_once()
+        assert extract_tool_return(list[str], '{"value": ["1"]}', False, {}) == ["1"]
+        assert mock_convert.call_count == 2
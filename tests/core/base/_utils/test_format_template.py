@@ -1,8 +1,19 @@
 """Tests the `_utils.format_template` module."""
 
+from collections.abc import Generator
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 from mirascope.core.base._utils._format_template import format_template
+from mirascope.core.base._utils._template_cache import clear_template_cache
+
+
+@pytest.fixture(autouse=True)
+def empty_template_cache() -> Generator[None, None, None]:
+    clear_template_cache()
+    yield
+    clear_template_cache()
 
 
 @patch(
@@ -29,7 +40,12 @@ def test_format_template(
     mock_get_template_variables.assert_called_once_with(
         "Recommend a {genre} book.", True
     )
-    mock_get_template_values.assert_called_once_with([("genre", None)], attrs)
+    mock_get_template_values.assert_called_once_with((("genre", None),), attrs)
+
+    attrs = {"genre": "scifi"}
+    mock_get_template_values.return_value = attrs
+    assert format_template(template, attrs) == "Recommend a scifi book."
+    mock_get_template_variables.assert_called_once()
 
 
 def test_format_template_with_none_attrs() -> None:
@@ -0,0 +1,77 @@
+"""Tests the `_utils.IncrementalJSONParser` class."""
+
+import jiter
+import pytest
+
+from mirascope.core.base._utils._incremental_json_parser import IncrementalJSONParser
+
+JSON = (
+    '{"title": "The \\"Name\\" \\u00e9\\ud83d\\ude00\\n", "pages": -12.5e1, '
+    '"tags": ["a", {"b": [true, false, null]}, []], "empty": {}, "count": 3}'
+)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, len(JSON)])
+def test_incremental_json_parser(chunk_size: int) -> None:
+    """Tests that every partial object matches `jiter`'s partial parsing."""
+    parser = IncrementalJSONParser()
+    for end in range(chunk_size, len(JSON) + chunk_size, chunk_size):
+        parser.feed(JSON[end - chunk_size : end])
+        expected = jiter.from_json(JSON[:end].encode(), partial_mode="trailing-strings")
+        assert parser.obj == expected
+    assert parser.complete
+    assert parser.completed_fields == 6
+
+
+def test_incremental_json_parser_incomplete_escape() -> None:
+    """Tests that strings ending in an incomplete escape are left out like `jiter`."""
+    parser = IncrementalJSONParser()
+    parser.feed('{"tags": ["a\\')
+    assert parser.obj == {"tags": []}
+    parser.feed("u00e9")
+    assert parser.obj == {"tags": ["a\u00e9"]}
+    parser.feed("\\ud83d")
+    assert parser.obj == {"tags": []}
+    parser.feed('\\ude00", "b\\')
+    assert parser.obj == {"tags": ["a\u00e9\U0001f600"]}
+
+
+def test_incremental_json_parser_ignores_surrounding_text() -> None:
+    """Tests that text before and after the root object is ignored."""
+    parser = IncrementalJSONParser()
+    parser.feed("Sure! ")
+    assert parser.obj is None
+    parser.feed('```json\n{"a": 1}\n``` done {')
+    assert parser.obj == {"a": 1}
+    assert parser.complete
+
+
+def test_incremental_json_parser_snapshot() -> None:
+    """Tests that snapshots are not mutated by later chunks."""
+    parser = IncrementalJSONParser()
+    assert parser.snapshot() is None
+    parser.feed('{"tags": ["a", {"b": [1')
+    snapshot = parser.snapshot()
+    parser.feed(', 2]}, "c"], "title": "x"}')
+    assert snapshot == {"tags": ["a", {"b": [1]}]}
+    assert parser.obj == {"tags": ["a", {"b": [1, 2]}, "c"], "title": "x"}
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        '{"a": tru}',
+        '{"a": nope',
+        '{"a": 1-}',
+        '{"a" 1}',
+        '{"a": 1 "b": 2}',
+        "{1: 2}",
+        '{"a": ]',
+        '{"a": "\\x"}',
+        '{"a": "\\u12"}',
+    ],
+)
+def test_incremental_json_parser_invalid_json(text: str) -> None:
+    """Tests that invalid JSON raises a `ValueError`."""
+    with pytest.raises(ValueError):
+        IncrementalJSONParser().feed(text)
@@ -1,10 +1,17 @@
 """Tests the `_utils.parse_content_template` function."""
 
+import threading
+from collections.abc import Generator
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from mirascope.core.base._utils._parse_content_template import parse_content_template
+from mirascope.core.base._utils._parse_content_template import (
+    _MediaCache,
+    aprefetch_media,
+    clear_media_cache,
+    parse_content_template,
+)
 from mirascope.core.base.message_param import (
     AudioPart,
     BaseMessageParam,
@@ -15,6 +22,13 @@ from mirascope.core.base.message_param import (
 )
 
 
+@pytest.fixture(autouse=True)
+def empty_media_cache() -> Generator[None, None, None]:
+    clear_media_cache()
+    yield
+    clear_media_cache()
+
+
 def test_parse_content_template() -> None:
     """Test the parse_content_template function."""
     assert parse_content_template("user", "", {}) is None
@@ -309,3 +323,88 @@ def test_parse_content_template_document(
         match="When using 'documents' template, 'urls' must be a list.",
     ):
         parse_content_template("user", template, {"urls": None})
+
+
+def _mock_urlopen(data_by_url: dict[str, bytes]) -> MagicMock:
+    def urlopen(url: str, timeout: float) -> MagicMock:
+        response = MagicMock()
+        response.__enter__.return_value.read.return_value = data_by_url[url]
+        return response
+
+    return MagicMock(side_effect=urlopen)
+
+
+def test_parse_content_template_media_cache() -> None:
+    """Tests that remote media is fetched once and reused across calls."""
+    image_data = b"\xff\xd8\xffimage data"
+    mock_urlopen = _mock_urlopen({"https://a": image_data})
+    with patch("urllib.request.urlopen", mock_urlopen):
+        for _ in range(2):
+            message = parse_content_template(
+                "user", "{url:image}", {"url": "https://a"}
+            )
+            assert message and message.content[0].image == image_data  # pyright: ignore [reportAttributeAccessIssue]
+    mock_urlopen.assert_called_once_with("https://a", timeout=30.0)
+
+
+def test_parse_content_template_images_parallel() -> None:
+    """Tests that the remote media of a list is fetched in parallel."""
+    barrier = threading.Barrier(2, timeout=5)
+    image_data = b"\xff\xd8\xffimage data"
+
+    def urlopen(url: str, timeout: float) -> MagicMock:
+        barrier.wait()
+        response = MagicMock()
+        response.__enter__.return_value.read.return_value = image_data
+        return response
+
+    with patch("urllib.request.urlopen", MagicMock(side_effect=urlopen)):
+        message = parse_content_template(
+            "user", "{urls:images}", {"urls": ["https://a", "https://b"]}
+        )
+    assert message and len(message.content) == 2
+
+
+@pytest.mark.asyncio
+async def test_aprefetch_media() -> None:
+    """Tests that async prefetching fills the cache used by parsing."""
+    audio_data = b"ID3audio data"
+    mock_urlopen = _mock_urlopen({"https://a": audio_data, "https://b": audio_data})
+    attrs = {"url": "https://a", "urls": ["https://a", "https://b"]}
+    template = "USER: {url:audio} {urls:audios} {missing:audio} {text}"
+    with patch("urllib.request.urlopen", mock_urlopen):
+        await aprefetch_media(template, attrs)
+        await aprefetch_media(template, attrs)
+        assert mock_urlopen.call_count == 2
+        parse_content_template("user", "{url:audio} {urls:audios}", attrs)
+    assert mock_urlopen.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_aprefetch_media_failure() -> None:
+    """Tests that async prefetching raises failed downloads instead of deferring."""
+    mock_urlopen = MagicMock(side_effect=OSError("unreachable"))
+    with (
+        patch("urllib.request.urlopen", mock_urlopen),
+        pytest.raises(ValueError, match="Failed to load or encode data from https://a"),
+    ):
+        await aprefetch_media("{url:image}", {"url": "https://a"})
+    assert mock_urlopen.call_count == 1
+
+
+def test_media_cache() -> None:
+    """Tests that the media cache dedupes content and evicts by size."""
+    cache = _MediaCache(maxbytes=10)
+    cache.set("a", b"12345")
+    cache.set("b", b"12345")
+    assert cache.nbytes == 5
+    assert cache.get("a") == cache.get("b") == b"12345"
+    cache.set("c", b"67890")
+    cache.set("d", b"abcde")
+    assert cache.get("a") is None
+    assert cache.get("d") == b"abcde"
+    cache.set("e", b"x" * 11)
+    assert cache.get("e") is None
+    for i in range(100):
+        cache.set(str(i), str(i).encode())
+    assert len(cache._digests) <= 2 * len(cache._data) + 64
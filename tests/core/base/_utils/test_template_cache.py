@@ -0,0 +1,21 @@
+"""Tests the `_utils.template_cache` module."""
+
+from unittest.mock import MagicMock
+
+from mirascope.core.base._utils._template_cache import (
+    clear_template_cache,
+    template_cache,
+)
+
+
+def test_template_cache() -> None:
+    """Tests that compiled templates are cached until the cache is cleared."""
+    mock_compile = MagicMock(side_effect=lambda template: template.split())
+    compile_template = template_cache(mock_compile)
+    compiled = compile_template("Recommend a {genre} book.")
+    assert compile_template("Recommend a {genre} book.") is compiled
+    mock_compile.assert_called_once_with("Recommend a {genre} book.")
+
+    clear_template_cache()
+    assert compile_template("Recommend a {genre} book.") is not compiled
+    assert mock_compile.call_count == 2
@@ -0,0 +1,175 @@
+"""Tests the `batch` module."""
+
+import asyncio
+import contextvars
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from mirascope.core.base.batch import abatch, abatch_iter, batch, batch_iter
+
+
+async def arecommend_book(genre: str) -> str:
+    if genre == "error":
+        raise ValueError("error")
+    await asyncio.sleep(0.01 if genre == "slow" else 0)
+    return f"{genre} book"
+
+
+def recommend_book(genre: str) -> str:
+    if genre == "error":
+        raise ValueError("error")
+    time.sleep(0.01 if genre == "slow" else 0)
+    return f"{genre} book"
+
+
+INPUTS = [{"genre": "slow"}, {"genre": "error"}, {"genre": "fantasy"}]
+
+
+@pytest.mark.asyncio
+async def test_abatch() -> None:
+    """Tests that `abatch` returns the results in input order and captures errors."""
+    on_progress = MagicMock()
+    results = await abatch(arecommend_book, INPUTS, on_progress=on_progress)
+    assert [result["index"] for result in results] == [0, 1, 2]
+    assert [result["input"] for result in results] == INPUTS
+    assert [result["output"] for result in results] == [
+        "slow book",
+        None,
+        "fantasy book",
+    ]
+    assert results[0]["error"] is None
+    assert isinstance(results[1]["error"], ValueError)
+    assert [call.args for call in on_progress.call_args_list] == [
+        (1, 3),
+        (2, 3),
+        (3, 3),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_abatch_iter_completion_order() -> None:
+    """Tests that `abatch_iter` yields results as they complete from a generator."""
+    on_progress = MagicMock()
+    results = [
+        result
+        async for result in abatch_iter(
+            arecommend_book, (kwargs for kwargs in INPUTS), on_progress=on_progress
+        )
+    ]
+    assert results[-1]["index"] == 0
+    on_progress.assert_called_with(3, None)
+
+
+@pytest.mark.asyncio
+async def test_abatch_iter_max_concurrency() -> None:
+    """Tests that at most `max_concurrency` calls are in flight at once."""
+    in_flight, max_in_flight = 0, 0
+
+    async def fn(genre: str) -> str:
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        return genre
+
+    results = await abatch(
+        fn, [{"genre": str(i)} for i in range(10)], max_concurrency=3
+    )
+    assert len(results) == 10
+    assert max_in_flight == 3
+
+    with pytest.raises(ValueError, match="max_concurrency"):
+        await abatch(fn, INPUTS, max_concurrency=0)
+
+
+@pytest.mark.asyncio
+async def test_abatch_iter_rate_limit() -> None:
+    """Tests that `rate_limit` spaces out the start of the calls."""
+    start = time.monotonic()
+    await abatch(arecommend_book, [{"genre": "fantasy"}] * 3, rate_limit=50)
+    assert time.monotonic() - start >= 0.04
+
+
+@pytest.mark.asyncio
+async def test_abatch_iter_close_cancels_pending() -> None:
+    """Tests that closing the iterator early cancels the calls still in flight."""
+    cancelled = asyncio.Event()
+
+    async def fn(genre: str) -> str:
+        if genre == "fantasy":
+            return genre
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+        return genre
+
+    results = abatch_iter(fn, [{"genre": "fantasy"}, {"genre": "horror"}])
+    assert (await results.__anext__())["output"] == "fantasy"
+    await results.aclose()
+    await asyncio.wait_for(cancelled.wait(), timeout=1)
+
+
+def test_batch() -> None:
+    """Tests that `batch` runs the sync calls on a thread pool."""
+    on_progress = MagicMock()
+    results = batch(recommend_book, INPUTS, on_progress=on_progress)
+    assert [result["output"] for result in results] == [
+        "slow book",
+        None,
+        "fantasy book",
+    ]
+    assert isinstance(results[1]["error"], ValueError)
+    on_progress.assert_called_with(3, 3)
+
+    with pytest.raises(ValueError, match="max_concurrency"):
+        batch(recommend_book, INPUTS, max_concurrency=0)
+
+
+def test_batch_iter_max_concurrency() -> None:
+    """Tests that at most `max_concurrency` sync calls run at once."""
+    lock = threading.Lock()
+    in_flight, max_in_flight = 0, 0
+
+    def fn(genre: str) -> str:
+        nonlocal in_flight, max_in_flight
+        with lock:
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+        time.sleep(0.005)
+        with lock:
+            in_flight -= 1
+        return genre
+
+    results = list(
+        batch_iter(fn, [{"genre": str(i)} for i in range(6)], max_concurrency=2)
+    )
+    assert len(results) == 6
+    assert max_in_flight <= 2
+
+
+def test_batch_iter_rate_limit() -> None:
+    """Tests that `rate_limit` spaces out the start of the sync calls."""
+    start = time.monotonic()
+    batch(recommend_book, [{"genre": "fantasy"}] * 3, rate_limit=50)
+    assert time.monotonic() - start >= 0.04
+
+
+def test_batch_iter_copies_context() -> None:
+    """Tests that the sync calls run in a copy of the caller's context."""
+    genre: contextvars.ContextVar[str] = contextvars.ContextVar("genre")
+
+    def recommend_genre() -> str:
+        return f"{genre.get()} book"
+
+    token = genre.set("fantasy")
+    try:
+        results = batch(recommend_genre, [{}, {}])
+    finally:
+        genre.reset(token)
+    assert [result["output"] for result in results] == ["fantasy book"] * 2
@@ -0,0 +1,103 @@
+"""Tests the `batch_job` module."""
+
+from typing import Any, ClassVar
+
+import pytest
+
+from mirascope.core.base._utils import create_interceptor, intercept_create
+from mirascope.core.base.batch_job import BaseBatchJob
+
+
+def call(genre: str) -> str:
+    """Mimics a decorated call by routing its request through the interceptor."""
+    if genre == "invalid":
+        raise ValueError("invalid genre")
+    interceptor = create_interceptor.get()
+    assert interceptor is not None
+    return interceptor({"prompt": f"Recommend a {genre} book"}).upper()
+
+
+class BatchJob(BaseBatchJob[dict, str]):
+    terminal_statuses: ClassVar[frozenset[str]] = frozenset({"ended"})
+
+    @classmethod
+    def _default_client(cls) -> dict:
+        return {"statuses": ["ended"]}
+
+    @classmethod
+    def _create_batch(cls, client: dict, requests: list[dict[str, Any]]) -> str:
+        client["requests"] = requests
+        return "batch_0"
+
+    def _retrieve_status(self) -> str:
+        return self.client["statuses"].pop(0)
+
+    def _fetch_responses(self) -> dict[str, str | Exception]:
+        return {
+            "request-0": "fantasy",
+            "request-1": RuntimeError("expired"),
+            "request-3": "invalid",
+        }
+
+
+def test_batch_job() -> None:
+    """Tests building requests and mapping responses back through the call."""
+    client = {"statuses": ["in_progress", "ended"]}
+    inputs = [{"genre": genre} for genre in ["fantasy", "horror", "mystery"]]
+    job = BatchJob.submit(call, inputs, client=client)
+    assert job.id == "batch_0"
+    assert client["requests"][0] == {
+        "custom_id": "request-0",
+        "body": {"prompt": "Recommend a fantasy book"},
+    }
+    results = job.wait(poll_interval=0).results()
+    assert job.status == "ended"
+    assert results[0]["output"] == "FANTASY"
+    assert str(results[1]["error"]) == "expired"
+    assert "no result for request-2" in str(results[2]["error"])
+    assert create_interceptor.get() is None
+
+
+def test_batch_job_results_error() -> None:
+    """Tests that errors raised while processing a response are captured."""
+    job = BatchJob(call, [{"genre": "a"}] * 3 + [{"genre": "invalid"}], "batch_0")
+    assert str(job.results()[3]["error"]) == "invalid genre"
+
+
+def test_batch_job_build_requests_through_except_exception() -> None:
+    """Tests that capturing a request is not swallowed by `except Exception`."""
+
+    def guarded_call(genre: str) -> str:
+        try:
+            return call(genre)
+        except Exception:  # pragma: no cover
+            return "swallowed"
+
+    assert BatchJob.build_requests(guarded_call, [{"genre": "fantasy"}]) == [
+        {"custom_id": "request-0", "body": {"prompt": "Recommend a fantasy book"}}
+    ]
+
+
+def test_batch_job_invalid_fn() -> None:
+    """Tests that only sync decorated calls can be submitted."""
+
+    async def async_call(genre: str) -> str: ...
+
+    with pytest.raises(ValueError, match="sync"):
+        BatchJob.submit(async_call, [{"genre": "fantasy"}])
+    with pytest.raises(ValueError, match="decorated"):
+        BatchJob.submit(lambda genre: genre, [{"genre": "fantasy"}])
+
+
+def test_batch_job_wait_timeout() -> None:
+    """Tests that `wait` raises once the timeout would be exceeded."""
+    job = BatchJob(call, [], "batch_0", {"statuses": ["in_progress"]})
+    with pytest.raises(TimeoutError, match="in_progress"):
+        job.wait(poll_interval=1, timeout=0.5)
+
+
+def test_intercept_create() -> None:
+    """Tests that the interceptor is only set within the context."""
+    with intercept_create(str):
+        assert create_interceptor.get() is str
+    assert create_interceptor.get() is None
@@ -2,6 +2,10 @@
 
 from unittest.mock import MagicMock, patch
 
+import pytest
+from pydantic import ValidationError
+
+from mirascope.core.base._utils import cached_getter
 from mirascope.core.base.call_response import BaseCallResponse
 
 
@@ -32,3 +36,94 @@ def test_base_call_response() -> None:
     assert call_response.serialize_tool_types([tool], info=MagicMock()) == [
         {"type": "function", "name": "mock_tool"}
     ]
+
+
+def test_base_call_response_construct_trusted() -> None:
+    """Tests that trusted construction skips validation unless it is enabled."""
+
+    class MyCallResponse(BaseCallResponse):
+        @property
+        def content(self) -> str:
+            return "content"
+
+    patch.multiple(MyCallResponse, __abstractmethods__=set()).start()
+    fn_args = {"genre": "fantasy"}
+    data = {
+        "metadata": {},
+        "response": "",
+        "tool_types": None,
+        "prompt_template": "",
+        "fn_args": fn_args,
+        "dynamic_config": None,
+        "messages": [],
+        "call_params": {},
+        "call_kwargs": {},
+        "user_message_param": None,
+        "start_time": 0,
+        "end_time": 0,
+    }
+    call_response = MyCallResponse._construct_trusted(**data)
+    assert call_response.fn_args is fn_args
+    assert call_response == MyCallResponse(**data)  # pyright: ignore [reportAbstractUsage]
+    assert call_response._model == "NO MODEL"
+    assert call_response.model_dump()["fn_args"] == fn_args
+
+    with (
+        patch.dict("os.environ", {"MIRASCOPE_VALIDATE_CALL_RESPONSES": "ENABLED"}),
+        pytest.raises(ValidationError),
+    ):
+        MyCallResponse._construct_trusted(**(data | {"start_time": "now"}))
+
+
+def test_base_call_response_dump_fields() -> None:
+    """Tests that `dump_fields` only includes the computed fields already cached."""
+    calls = []
+
+    class MyCallResponse(BaseCallResponse):
+        @property
+        def content(self) -> str:
+            return "content"
+
+        @property
+        @cached_getter
+        def message_param(self) -> dict:
+            calls.append("message_param")
+            return {"role": "assistant", "content": self.content}
+
+        @property
+        @cached_getter
+        def tools(self) -> None:
+            calls.append("tools")
+            return None
+
+    patch.multiple(MyCallResponse, __abstractmethods__=set()).start()
+    call_response = MyCallResponse(
+        metadata={},
+        response="",
+        tool_types=None,
+        prompt_template="",
+        fn_args={"genre": "fantasy"},
+        dynamic_config=None,
+        messages=[],
+        call_params={},
+        call_kwargs={},
+        user_message_param=None,
+        start_time=0,
+        end_time=0,
+    )  # type: ignore
+    dumped = call_response.dump_fields(exclude={"response"})
+    assert dumped["fn_args"] == {"genre": "fantasy"}
+    assert not {"message_param", "tools", "response"} & set(dumped)
+    assert calls == []
+
+    assert call_response.message_param == {"role": "assistant", "content": "content"}
+    dumped = call_response.dump_fields(mode="json")
+    assert dumped["message_param"] == {"role": "assistant", "content": "content"}
+    assert "tools" not in dumped
+    assert set(call_response.model_dump()) >= {"message_param", "tools"}
+    assert calls == ["message_param", "tools"]
+
+
+def test_base_call_response_abstract_derived_properties() -> None:
+    """Tests that the derived properties stay abstract on the base class."""
+    assert {"cost", "message_param", "tools"} <= BaseCallResponse.__abstractmethods__
@@ -0,0 +1,136 @@
+"""Tests the `client_pool` module."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from mirascope.core.base.client_pool import ClientPool
+
+
+class Client:
+    def __init__(self, api_key: str | None = None) -> None:
+        self.api_key = api_key
+        self.closed = False
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class AsyncClient:
+    def __init__(self, api_key: str | None = None) -> None:
+        self.api_key = api_key
+        self.closed = False
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+def test_client_pool_get_client() -> None:
+    """Tests that sync clients are reused per factory and configuration."""
+    pool = ClientPool()
+    client = pool.get_client(Client)
+    assert pool.get_client(Client) is client
+    other_client = pool.get_client(Client, api_key="key")
+    assert other_client is not client
+    assert other_client.api_key == "key"
+    assert pool.get_client(Client, api_key="key") is other_client
+
+
+def test_client_pool_get_client_env() -> None:
+    """Tests that clients are pooled per value of the environment they read."""
+    pool = ClientPool()
+    with patch.dict("os.environ", {"API_KEY": "key"}):
+        client = pool.get_client(Client, env=("API_KEY",))
+        assert pool.get_client(Client, env=("API_KEY",)) is client
+    with patch.dict("os.environ", {"API_KEY": "other-key"}):
+        assert pool.get_client(Client, env=("API_KEY",)) is not client
+
+
+def test_client_pool_get_client_unhashable_config() -> None:
+    """Tests that clients with unhashable configuration are not pooled."""
+    pool = ClientPool()
+    factory = MagicMock(side_effect=lambda **kwargs: MagicMock())
+    assert pool.get_client(factory, headers={}) is not pool.get_client(
+        factory, headers={}
+    )
+    assert factory.call_count == 2
+
+
+def test_client_pool_disabled() -> None:
+    """Tests that a disabled pool constructs a new client every time."""
+    pool = ClientPool(enabled=False)
+    assert pool.get_client(Client) is not pool.get_client(Client)
+
+
+def test_client_pool_close() -> None:
+    """Tests closing the pooled sync clients."""
+    pool = ClientPool()
+    client = pool.get_client(Client)
+    no_close_client = pool.get_client(MagicMock(return_value=object()))
+    pool.close()
+    assert client.closed
+    assert not hasattr(no_close_client, "closed")
+    assert pool.get_client(Client) is not client
+
+
+def test_client_pool_get_async_client_no_running_loop() -> None:
+    """Tests that async clients are not pooled outside of a running loop."""
+    pool = ClientPool()
+    assert pool.get_async_client(AsyncClient) is not pool.get_async_client(AsyncClient)
+
+
+@pytest.mark.asyncio
+async def test_client_pool_get_async_client() -> None:
+    """Tests that async clients are pooled per running event loop."""
+    pool = ClientPool()
+    client = pool.get_async_client(AsyncClient)
+    assert pool.get_async_client(AsyncClient) is client
+
+    other_loop_client = await asyncio.to_thread(
+        asyncio.run, _get_async_client_in_new_loop(pool)
+    )
+    assert other_loop_client is not client
+
+    sync_close_client = pool.get_async_client(Client)
+    await pool.aclose()
+    assert client.closed
+    assert sync_close_client.closed
+    assert pool.get_async_client(AsyncClient) is not client
+
+    pool.enabled = False
+    assert pool.get_async_client(AsyncClient) is not pool.get_async_client(AsyncClient)
+
+
+def test_client_pool_closes_async_clients_on_loop_shutdown() -> None:
+    """Tests that async clients are closed and removed when their loop shuts down."""
+    pool = ClientPool()
+    client = asyncio.run(_get_async_client_in_new_loop(pool))
+    assert client.closed
+    assert not pool._async_clients
+    assert not pool._shutdown_hooks
+
+
+def test_client_pool_drops_async_clients_of_closed_loops() -> None:
+    """Tests that the clients of loops closed without shutting down are dropped."""
+    pool = ClientPool()
+    loop = asyncio.new_event_loop()
+    loop.run_until_complete(_get_async_client_in_new_loop(pool))
+    loop.close()
+    assert loop in pool._async_clients
+    asyncio.run(_get_async_client_in_new_loop(pool))
+    assert loop not in pool._async_clients
+    assert loop not in pool._shutdown_hooks
+
+
+@pytest.mark.asyncio
+async def test_client_pool_aclose_without_close() -> None:
+    """Tests that `aclose` skips clients without a `close` method."""
+    pool = ClientPool()
+    factory = MagicMock(return_value=AsyncMock(spec=[]))
+    pool.get_async_client(factory)
+    await pool.aclose()
+
+
+async def _get_async_client_in_new_loop(pool: ClientPool) -> AsyncClient:
+    return pool.get_async_client(AsyncClient)
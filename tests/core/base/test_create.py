@@ -1,7 +1,7 @@
 """Tests the internal `_create` module."""
 
 from functools import partial
-from typing import TypeVar, cast
+from typing import Any, TypeVar, cast
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -12,6 +12,14 @@ from mirascope.core.base.call_response import BaseCallResponse
 _T = TypeVar("_T")
 
 
+class MockCallResponse(MagicMock):
+    """A mock call response type supporting the trusted construction path."""
+
+    @classmethod
+    def _construct_trusted(cls, **data: Any) -> "MockCallResponse":  # noqa: ANN401
+        return cls(**data)
+
+
 @pytest.fixture()
 def mock_create_decorator_kwargs() -> dict:
     """Returns the mock kwargs (excluding fn) for the create `decorator` function."""
@@ -53,7 +61,7 @@ def test_create_factory_sync(
     mock_create = cast(MagicMock, mock_create)
 
     decorator = partial(
-        create_factory(TCallResponse=MagicMock, setup_call=mock_setup_call),
+        create_factory(TCallResponse=MockCallResponse, setup_call=mock_setup_call),
         **mock_create_decorator_kwargs,
     )
 
@@ -137,7 +145,7 @@ def test_create_factory_sync_dynamic_config_cases(
     mock_create = cast(MagicMock, mock_create)
 
     decorator = partial(
-        create_factory(TCallResponse=MagicMock, setup_call=mock_setup_call),
+        create_factory(TCallResponse=MockCallResponse, setup_call=mock_setup_call),
         **mock_create_decorator_kwargs,
     )
 
@@ -200,7 +208,9 @@ async def test_create_factory_async(
     mock_create = cast(MagicMock, mock_create)
 
     decorator = partial(
-        create_factory(TCallResponse=MagicMock, setup_call=mock_setup_call_async),
+        create_factory(
+            TCallResponse=MockCallResponse, setup_call=mock_setup_call_async
+        ),
         **mock_create_decorator_kwargs,
     )
 
@@ -283,7 +293,9 @@ async def test_create_factory_async_dynamic_config_cases(
     mock_create = cast(MagicMock, mock_create)
 
     decorator = partial(
-        create_factory(TCallResponse=MagicMock, setup_call=mock_setup_call_async),
+        create_factory(
+            TCallResponse=MockCallResponse, setup_call=mock_setup_call_async
+        ),
         **mock_create_decorator_kwargs,
     )
 
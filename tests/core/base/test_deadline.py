@@ -0,0 +1,260 @@
+"""Tests the `deadline` module."""
+
+import asyncio
+import threading
+import time
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from openai import AsyncOpenAI, OpenAI
+from openai.types.chat import ChatCompletion, ChatCompletionChunk
+
+from mirascope.core import openai
+from mirascope.core.base.deadline import (
+    Deadline,
+    DeadlineExceededError,
+    current_deadline,
+    deadline,
+)
+
+COMPLETION = ChatCompletion.model_validate(
+    {
+        "id": "id",
+        "created": 0,
+        "model": "gpt-4o-mini",
+        "object": "chat.completion",
+        "choices": [
+            {
+                "index": 0,
+                "finish_reason": "stop",
+                "message": {"role": "assistant", "content": "content"},
+            }
+        ],
+    }
+)
+CHUNK = ChatCompletionChunk.model_validate(
+    {
+        "id": "id",
+        "created": 0,
+        "model": "gpt-4o-mini",
+        "object": "chat.completion.chunk",
+        "choices": [{"index": 0, "delta": {"content": "content"}}],
+    }
+)
+
+
+def test_deadline_nesting() -> None:
+    """Tests that nested deadlines can only tighten the enclosing budget."""
+    assert current_deadline() is None
+    with deadline(10, chunk_timeout=2) as outer:
+        assert current_deadline() is outer
+        assert outer.remaining() == pytest.approx(10, abs=0.1)
+        with deadline(60, first_token_timeout=5, chunk_timeout=3) as inner:
+            assert inner.expires_at == outer.expires_at
+            assert inner.first_token_timeout == 5
+            assert inner.chunk_timeout == 2
+        with deadline(1) as inner:
+            assert inner.remaining() == pytest.approx(1, abs=0.1)
+        assert current_deadline() is outer
+    assert current_deadline() is None
+    assert Deadline().remaining() is None
+    Deadline().check()
+    with pytest.raises(DeadlineExceededError):
+        Deadline(expires_at=time.monotonic() - 1).check()
+
+
+@pytest.mark.asyncio
+async def test_deadline_decorator() -> None:
+    """Tests that decorated functions run within a fresh deadline for each call."""
+
+    @deadline(5)
+    def fn() -> Deadline | None:
+        return current_deadline()
+
+    @deadline(first_token_timeout=1)
+    async def fn_async() -> Deadline | None:
+        return current_deadline()
+
+    first, second = fn(), fn()
+    assert first is not None and second is not None and first is not second
+    assert current_deadline() is None
+    async_deadline = await fn_async()
+    assert async_deadline is not None and async_deadline.expires_at is None
+    assert async_deadline.first_token_timeout == 1
+    async with deadline(1) as active:
+        assert current_deadline() is active
+
+
+def test_deadline_shared_scope() -> None:
+    """Tests that threads entering the same scope each reset their own deadline."""
+    scope = deadline(10)
+    barrier = threading.Barrier(2)
+
+    def enter() -> None:
+        with scope as active:
+            barrier.wait()
+            assert current_deadline() is active
+        assert current_deadline() is None
+
+    with ThreadPoolExecutor(2) as executor:
+        for future in [executor.submit(enter) for _ in range(2)]:
+            future.result()
+
+
+@pytest.mark.asyncio
+async def test_deadline_shared_scope_async() -> None:
+    """Tests that tasks entering the same scope each reset their own deadline."""
+    scope = deadline(10)
+
+    async def enter(delay: float) -> None:
+        async with scope as active:
+            await asyncio.sleep(delay)
+            assert current_deadline() is active
+        assert current_deadline() is None
+
+    await asyncio.gather(enter(0.02), enter(0))
+
+
+def test_deadline_request_kwargs() -> None:
+    """Tests that the SDK request timeout is only set for supporting providers."""
+    budget = Deadline(
+        expires_at=time.monotonic() + 10, first_token_timeout=3, chunk_timeout=1
+    )
+    call_kwargs = {"model": "model"}
+    assert budget.request_kwargs("openai", call_kwargs, stream=False)[
+        "timeout"
+    ] == pytest.approx(10, abs=0.1)
+    assert budget.request_kwargs("anthropic", call_kwargs, stream=True) == {
+        "model": "model",
+        "timeout": 1,
+    }
+    assert budget.request_kwargs("gemini", call_kwargs, stream=False) is call_kwargs
+    call_kwargs_with_timeout = {"model": "model", "timeout": 60}
+    assert (
+        budget.request_kwargs("openai", call_kwargs_with_timeout, stream=False)
+        is call_kwargs_with_timeout
+    )
+    assert Deadline().request_kwargs("openai", call_kwargs, stream=True) is call_kwargs
+
+
+def test_deadline_blocking_request_kwargs() -> None:
+    """Tests that sync requests warn when the provider can't bound them."""
+    budget = Deadline(expires_at=time.monotonic() + 10)
+    call_kwargs = {"model": "model"}
+    with pytest.warns(UserWarning, match="Sync gemini requests can't be interrupted"):
+        assert (
+            budget.blocking_request_kwargs("gemini", call_kwargs, stream=False)
+            is call_kwargs
+        )
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        assert "timeout" in budget.blocking_request_kwargs(
+            "openai", call_kwargs, stream=False
+        )
+        Deadline().blocking_request_kwargs("gemini", call_kwargs, stream=True)
+    with pytest.raises(DeadlineExceededError):
+        Deadline(expires_at=time.monotonic() - 1).blocking_request_kwargs(
+            "openai", call_kwargs, stream=False
+        )
+
+
+def test_deadline_call() -> None:
+    """Tests that sync calls pass the remaining budget and fail once it ran out."""
+    client = OpenAI(api_key="test")
+    client.chat.completions.create = MagicMock(return_value=COMPLETION)
+
+    @openai.call("gpt-4o-mini", client=client)
+    def recommend_book(genre: str) -> str:
+        return f"Recommend a {genre} book"
+
+    with deadline(10):
+        assert recommend_book("fantasy").content == "content"
+    assert client.chat.completions.create.call_args.kwargs["timeout"] == pytest.approx(
+        10, abs=0.1
+    )
+    response = recommend_book("fantasy")
+    assert "timeout" not in client.chat.completions.create.call_args.kwargs
+    assert "timeout" not in response.call_kwargs
+
+    with deadline(0), pytest.raises(DeadlineExceededError):
+        recommend_book("fantasy")
+
+
+@pytest.mark.asyncio
+async def test_deadline_call_async() -> None:
+    """Tests that async calls are cancelled once the budget runs out."""
+
+    async def create(**kwargs) -> ChatCompletion:  # noqa: ANN003
+        await asyncio.sleep(kwargs["messages"][0]["content"] == "slow")
+        return COMPLETION
+
+    client = AsyncOpenAI(api_key="test")
+    client.chat.completions.create = create  # pyright: ignore [reportAttributeAccessIssue]
+
+    @openai.call("gpt-4o-mini", client=client)
+    async def answer(question: str) -> str:
+        return question
+
+    async with deadline(0.05):
+        assert (await answer("fast")).content == "content"
+        with pytest.raises(DeadlineExceededError):
+            await answer("slow")
+
+
+def test_deadline_stream() -> None:
+    """Tests that sync streams raise once a chunk arrives later than allowed."""
+
+    def chunks() -> object:
+        yield CHUNK
+        time.sleep(0.02)
+        yield CHUNK
+
+    client = OpenAI(api_key="test")
+    client.chat.completions.create = MagicMock(side_effect=lambda **_: chunks())
+
+    @openai.call("gpt-4o-mini", client=client, stream=True)
+    def recommend_book(genre: str) -> str:
+        return f"Recommend a {genre} book"
+
+    with deadline(chunk_timeout=0.01):
+        stream = recommend_book("fantasy")
+    contents = []
+    with pytest.raises(DeadlineExceededError, match="No next chunk within 0.01s"):
+        for chunk, _ in stream:
+            contents.append(chunk.content)
+    assert contents == ["content"]
+    assert client.chat.completions.create.call_args.kwargs["timeout"] == 0.01
+
+    with deadline(first_token_timeout=1):
+        assert len(list(recommend_book("fantasy"))) == 2
+
+
+@pytest.mark.asyncio
+async def test_deadline_stream_async() -> None:
+    """Tests that async streams cancel a read that exceeds the first token timeout."""
+    closed = asyncio.Event()
+
+    async def chunks(delay: float) -> object:
+        try:
+            await asyncio.sleep(delay)
+            yield CHUNK
+            yield CHUNK
+        finally:
+            closed.set()
+
+    client = AsyncOpenAI(api_key="test")
+    client.chat.completions.create = AsyncMock(side_effect=[chunks(1), chunks(0)])
+
+    @openai.call("gpt-4o-mini", client=client, stream=True)
+    async def recommend_book(genre: str) -> str:
+        return f"Recommend a {genre} book"
+
+    async with deadline(first_token_timeout=0.1, chunk_timeout=1):
+        stream = await recommend_book("fantasy")
+        with pytest.raises(DeadlineExceededError):
+            async for _ in stream:
+                pass
+        assert closed.is_set()
+        assert len([chunk async for chunk in await recommend_book("fantasy")]) == 2
@@ -1,5 +1,8 @@
 """Tests that `partial` works to make all fields optional."""
 
+import gc
+import weakref
+
 from pydantic import BaseModel
 
 from mirascope.core.base._partial import partial
@@ -92,3 +95,31 @@ def test_list_partial() -> None:
         partial(ModelWithList).model_json_schema()
         == PartialModelWithList.model_json_schema()
     )
+
+
+def test_partial_cached() -> None:
+    """Tests that partial models are cached per wrapped class."""
+    partial_model = partial(DeeperModel)
+    assert partial(DeeperModel) is partial_model
+    assert (
+        partial_model.model_fields["shallow"].annotation == partial(ShallowModel) | None
+    )
+    assert partial(ShallowModel) is not partial_model
+
+    class DeeperSubModel(DeeperModel):
+        extra: str
+
+    assert set(partial(DeeperSubModel).model_fields) == {"shallow", "param", "extra"}
+
+
+def test_partial_cache_releases_classes() -> None:
+    """Tests that a dropped class is collected along with its partial model."""
+
+    class Book(BaseModel):
+        title: str
+
+    book, partial_book = weakref.ref(Book), weakref.ref(partial(Book))
+    del Book
+    gc.collect()
+    assert book() is None
+    assert partial_book() is None
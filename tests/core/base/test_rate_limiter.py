@@ -0,0 +1,169 @@
+"""Tests the `rate_limiter` module."""
+
+import time
+from collections.abc import Generator
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from openai import AsyncOpenAI, OpenAI
+from openai.types.chat import ChatCompletion, ChatCompletionChunk
+
+from mirascope.core import openai
+from mirascope.core.base.rate_limiter import RateLimiter, RateLimiters, rate_limiters
+
+COMPLETION = ChatCompletion.model_validate(
+    {
+        "id": "id",
+        "created": 0,
+        "model": "gpt-4o-mini",
+        "object": "chat.completion",
+        "choices": [
+            {
+                "index": 0,
+                "finish_reason": "stop",
+                "message": {"role": "assistant", "content": "content"},
+            }
+        ],
+        "usage": {"prompt_tokens": 10, "completion_tokens": 5, "total_tokens": 15},
+    }
+)
+CHUNK = ChatCompletionChunk.model_validate(
+    {
+        "id": "id",
+        "created": 0,
+        "model": "gpt-4o-mini",
+        "object": "chat.completion.chunk",
+        "choices": [{"index": 0, "delta": {"content": "content"}}],
+        "usage": {"prompt_tokens": 10, "completion_tokens": 5, "total_tokens": 15},
+    }
+)
+
+
+@pytest.fixture()
+def rate_limiter() -> Generator[MagicMock, None, None]:
+    """Attaches a mock rate limiter to OpenAI calls for the duration of a test."""
+    rate_limiter = MagicMock(spec=RateLimiter)
+    rate_limiters.set("openai", rate_limiter)
+    yield rate_limiter
+    rate_limiters.set("openai", None)
+
+
+def test_rate_limiter_requests() -> None:
+    """Tests that requests beyond the burst are spaced out by the refill rate."""
+    rate_limiter = RateLimiter(requests_per_minute=60, burst=2)
+    assert rate_limiter.reserve() == 0
+    assert rate_limiter.reserve() == 0
+    assert rate_limiter.reserve() == pytest.approx(1, abs=0.01)
+    assert rate_limiter.reserve() == pytest.approx(2, abs=0.01)
+    assert rate_limiter.throttled_requests == 2
+    assert rate_limiter.throttled_seconds == pytest.approx(3, abs=0.02)
+
+
+def test_rate_limiter_tokens() -> None:
+    """Tests that token reservations wait and are reconciled with the usage."""
+    rate_limiter = RateLimiter(tokens_per_minute=600)
+    assert rate_limiter.reserve(600) == 0
+    assert rate_limiter.reserve(100) == pytest.approx(10, abs=0.01)
+    rate_limiter.reconcile(100, 40, 10)
+    assert rate_limiter.reserve(0) == pytest.approx(5, abs=0.01)
+    rate_limiter.reconcile(100, None, None)
+    assert rate_limiter.reserve(0) == pytest.approx(5, abs=0.01)
+    assert RateLimiter().reserve(1000) == 0
+
+
+def test_rate_limiter_acquire() -> None:
+    """Tests that `acquire` sleeps for the reserved delay."""
+    rate_limiter = RateLimiter(requests_per_minute=6000, burst=1)
+    start = time.monotonic()
+    for _ in range(3):
+        rate_limiter.acquire()
+    assert time.monotonic() - start >= 0.015
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_aacquire() -> None:
+    """Tests that `aacquire` waits for the reserved delay."""
+    rate_limiter = RateLimiter(requests_per_minute=6000, burst=1)
+    with patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+        await rate_limiter.aacquire()
+        await rate_limiter.aacquire()
+    mock_sleep.assert_awaited_once()
+
+
+def test_rate_limiters() -> None:
+    """Tests that model rate limiters take precedence over provider ones."""
+    registry = RateLimiters()
+    assert not registry
+    provider_limiter, model_limiter = RateLimiter(), RateLimiter()
+    registry.set("openai", provider_limiter)
+    registry.set("openai", model_limiter, model="gpt-4o")
+    assert registry
+    assert registry.get("openai", "gpt-4o") is model_limiter
+    assert registry.get("openai", "gpt-4o-mini") is provider_limiter
+    assert registry.get("anthropic", "gpt-4o") is None
+    registry.set("openai", None, model="gpt-4o")
+    assert registry.get("openai", "gpt-4o") is provider_limiter
+
+
+def test_rate_limited_call(rate_limiter: MagicMock) -> None:
+    """Tests that sync calls acquire and reconcile the provider's rate limiter."""
+    client = OpenAI(api_key="test")
+    client.chat.completions.create = MagicMock(return_value=COMPLETION)
+
+    @openai.call("gpt-4o-mini", client=client, call_params={"max_tokens": 100})
+    def recommend_book(genre: str) -> str:
+        return f"Recommend a {genre} book"
+
+    recommend_book("fantasy")
+    rate_limiter.acquire.assert_called_once_with(107)
+    rate_limiter.reconcile.assert_called_once_with(107, 10, 5)
+
+
+@pytest.mark.asyncio
+async def test_rate_limited_call_async(rate_limiter: MagicMock) -> None:
+    """Tests that async calls wait on the provider's rate limiter."""
+    client = AsyncOpenAI(api_key="test")
+    client.chat.completions.create = AsyncMock(return_value=COMPLETION)
+
+    @openai.call("gpt-4o-mini", client=client)
+    async def recommend_book(genre: str) -> str:
+        return f"Recommend a {genre} book"
+
+    await recommend_book("fantasy")
+    rate_limiter.aacquire.assert_awaited_once_with(7)
+    rate_limiter.reconcile.assert_called_once_with(7, 10, 5)
+
+
+def test_rate_limited_stream(rate_limiter: MagicMock) -> None:
+    """Tests that streams reconcile the rate limiter with the streamed usage."""
+    client = OpenAI(api_key="test")
+    client.chat.completions.create = MagicMock(return_value=iter([CHUNK, CHUNK]))
+
+    @openai.call("gpt-4o-mini", client=client, stream=True)
+    def recommend_book(genre: str) -> str:
+        return f"Recommend a {genre} book"
+
+    for _ in recommend_book("fantasy"):
+        rate_limiter.acquire.assert_called_once_with(7)
+    rate_limiter.reconcile.assert_called_once_with(7, 20, 10)
+
+
+@pytest.mark.asyncio
+async def test_rate_limited_stream_async(rate_limiter: MagicMock) -> None:
+    """Tests that async streams wait on the rate limiter."""
+
+    async def chunks() -> object:
+        for chunk in [CHUNK]:
+            yield chunk
+
+    client = AsyncOpenAI(api_key="test")
+    client.chat.completions.create = AsyncMock(return_value=chunks())
+
+    @openai.call("gpt-4o-mini", client=client, stream=True)
+    async def recommend_book(genre: str) -> str:
+        return f"Recommend a {genre} book"
+
+    async for _ in await recommend_book("fantasy"):
+        pass
+    rate_limiter.aacquire.assert_awaited_once_with(7)
+    rate_limiter.reconcile.assert_called_once_with(7, 10, 5)
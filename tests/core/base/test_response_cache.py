@@ -0,0 +1,334 @@
+"""Tests the `response_cache` module."""
+
+import threading
+import time
+from collections.abc import Generator
+from pathlib import Path
+from typing import cast
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from openai import AsyncOpenAI, OpenAI
+from openai.types.chat import ChatCompletion, ChatCompletionChunk
+from pydantic import BaseModel
+
+from mirascope.core import openai
+from mirascope.core.base.response_cache import (
+    BaseResponseCache,
+    InMemoryResponseCache,
+    SQLiteResponseCache,
+    get_response_cache,
+    response_cache_key,
+    set_response_cache,
+)
+
+USAGE = {"prompt_tokens": 10, "completion_tokens": 5, "total_tokens": 15}
+COMPLETION = ChatCompletion.model_validate(
+    {
+        "id": "id",
+        "created": 0,
+        "model": "gpt-4o-mini",
+        "object": "chat.completion",
+        "choices": [
+            {
+                "index": 0,
+                "finish_reason": "stop",
+                "message": {
+                    "role": "assistant",
+                    "content": None,
+                    "tool_calls": [
+                        {
+                            "id": "call_0",
+                            "type": "function",
+                            "function": {
+                                "name": "format_book",
+                                "arguments": '{"title": "Dune", "author": "Herbert"}',
+                            },
+                        }
+                    ],
+                },
+            }
+        ],
+        "usage": USAGE,
+    }
+)
+CHUNKS = [
+    ChatCompletionChunk.model_validate(
+        {
+            "id": "id",
+            "created": 0,
+            "model": "gpt-4o-mini",
+            "object": "chat.completion.chunk",
+            "choices": [{"index": 0, "delta": {"content": content}}],
+        }
+    )
+    for content in ["Dune ", "by Herbert"]
+]
+
+
+class Book(BaseModel):
+    title: str
+    author: str
+
+
+def format_book(title: str, author: str) -> str:
+    """Returns the formatted book."""
+    return f"{title} by {author}"
+
+
+@pytest.fixture()
+def cache() -> Generator[InMemoryResponseCache, None, None]:
+    """Sets an in-memory response cache for the duration of a test."""
+    cache = InMemoryResponseCache()
+    set_response_cache(cache)
+    yield cache
+    set_response_cache(None)
+
+
+def test_response_cache_key() -> None:
+    """Tests that keys are stable and depend on every part of the request."""
+    call_kwargs = {"messages": [{"role": "user", "content": "hi"}], "image": b"\xff"}
+    key = response_cache_key("openai", "gpt-4o", call_kwargs, stream=False)
+    assert key == response_cache_key(
+        "openai", "gpt-4o", dict(reversed(call_kwargs.items())), stream=False
+    )
+    assert key != response_cache_key("openai", "gpt-4o", call_kwargs, stream=True)
+    assert key != response_cache_key("openai", "gpt-4o-mini", call_kwargs, False)
+    assert key != response_cache_key("anthropic", "gpt-4o", call_kwargs, False)
+    assert key != response_cache_key("openai", "gpt-4o", {}, stream=False)
+
+
+def test_response_cache_key_sdk_objects() -> None:
+    """Tests that SDK objects are keyed on their data and unknown objects not at all."""
+
+    class AzureModel:
+        def __init__(self, content: str) -> None:
+            self.content = content
+
+        def as_dict(self) -> dict:
+            return {"content": self.content}
+
+    class VertexContent:
+        def __init__(self, text: str) -> None:
+            self.text = text
+
+        def to_dict(self) -> dict:
+            return {"parts": [{"text": self.text}]}
+
+    class ProtobufMessage:
+        def SerializeToString(self, deterministic: bool = False) -> bytes:
+            return b"\x0a\x02hi"
+
+    for make in (AzureModel, VertexContent):
+        key = response_cache_key("p", "m", {"messages": [make("hi")]}, False)
+        assert key == response_cache_key("p", "m", {"messages": [make("hi")]}, False)
+        assert key != response_cache_key("p", "m", {"messages": [make("yo")]}, False)
+    assert response_cache_key("p", "m", {"tool": ProtobufMessage()}, False) is not None
+    assert response_cache_key("p", "m", {"image": object()}, False) is None
+
+
+def test_in_memory_response_cache() -> None:
+    """Tests LRU eviction, TTL expiry, and the hit and miss counters."""
+    cache = InMemoryResponseCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert (cache.get("a"), cache.get("c")) == (1, 3)
+    assert (cache.hits, cache.misses) == (3, 1)
+    cache.clear()
+    assert len(cache) == 0
+
+    cache = InMemoryResponseCache(ttl=0.01)
+    cache.set("a", 1)
+    time.sleep(0.02)
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_sqlite_response_cache(tmp_path: Path) -> None:
+    """Tests that responses persist across cache instances."""
+    path = tmp_path / "cache.db"
+    cache = SQLiteResponseCache(path)
+    cache.set("completion", COMPLETION)
+    cache.set("unpicklable", lambda: None)
+    cache.close()
+
+    cache = SQLiteResponseCache(path, ttl=60)
+    assert cache.get("completion") == COMPLETION
+    assert cache.get("unpicklable") is None
+    assert (cache.hits, cache.misses) == (1, 1)
+    cache.clear()
+    assert cache.get("completion") is None
+
+    cache = SQLiteResponseCache(path, ttl=-1)
+    cache.set("a", 1)
+    assert cache.get("a") is None
+    assert cache._connection.execute("SELECT * FROM responses").fetchall() == []
+
+
+def test_response_cache_counts_concurrent_lookups() -> None:
+    """Tests that hits and misses are counted exactly across threads."""
+    cache = InMemoryResponseCache()
+    cache.set("a", 1)
+
+    def lookup() -> None:
+        for _ in range(1000):
+            cache.get("a")
+            cache.get("b")
+
+    threads = [threading.Thread(target=lookup) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert (cache.hits, cache.misses) == (8000, 8000)
+
+
+@pytest.mark.asyncio
+async def test_sqlite_response_cache_async(tmp_path: Path) -> None:
+    """Tests that async lookups run the SQLite queries off the event loop."""
+    cache = SQLiteResponseCache(tmp_path / "cache.db")
+    threads: list[int] = []
+
+    def record_thread(*args: object) -> None:
+        threads.append(threading.get_ident())
+
+    with (
+        patch.object(cache, "_get", side_effect=record_thread) as get,
+        patch.object(cache, "_set", side_effect=record_thread) as set_,
+    ):
+        await cache.aset("completion", COMPLETION)
+        assert await cache.aget("completion") is None
+    get.assert_called_once_with("completion")
+    set_.assert_called_once()
+    assert threading.get_ident() not in threads
+
+
+def test_sqlite_response_cache_corrupt_entry(tmp_path: Path) -> None:
+    """Tests that entries that can't be unpickled are treated as misses and removed."""
+    cache = SQLiteResponseCache(tmp_path / "cache.db")
+    with cache._connection:
+        cache._connection.execute(
+            "INSERT INTO responses VALUES (?, ?, ?)",
+            ("a", b"not a pickle", time.time()),
+        )
+    assert cache.get("a") is None
+    assert (cache.hits, cache.misses) == (0, 1)
+    assert cache._connection.execute("SELECT * FROM responses").fetchall() == []
+
+
+def test_uncacheable_call(cache: InMemoryResponseCache) -> None:
+    """Tests that calls with values that can't be keyed skip the cache."""
+    client = OpenAI(api_key="test")
+    client.chat.completions.create = MagicMock(return_value=COMPLETION)
+
+    call_params = cast(openai.OpenAICallParams, {"user": object()})
+
+    @openai.call("gpt-4o-mini", client=client, call_params=call_params)
+    def recommend_book(genre: str) -> str:
+        return f"Recommend a {genre} book"
+
+    recommend_book("fantasy")
+    recommend_book("fantasy")
+    assert client.chat.completions.create.call_count == 2
+    assert len(cache) == 0
+
+
+def test_set_response_cache(cache: BaseResponseCache) -> None:
+    """Tests setting the global response cache."""
+    assert get_response_cache() is cache
+
+
+def test_cached_call(cache: InMemoryResponseCache) -> None:
+    """Tests that identical calls are served from the cache with tools and usage."""
+    client = OpenAI(api_key="test")
+    client.chat.completions.create = MagicMock(return_value=COMPLETION)
+
+    @openai.call("gpt-4o-mini", client=client, tools=[format_book])
+    def recommend_book(genre: str) -> str:
+        return f"Recommend a {genre} book"
+
+    response = recommend_book("fantasy")
+    cached_response = recommend_book("fantasy")
+    client.chat.completions.create.assert_called_once()
+    assert cached_response.response == response.response
+    assert cached_response.tool and cached_response.tool.call() == "Dune by Herbert"
+    assert cached_response.input_tokens == 10
+    assert cached_response.cost == response.cost
+    recommend_book("horror")
+    assert client.chat.completions.create.call_count == 2
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+@pytest.mark.asyncio
+async def test_cached_call_async(cache: InMemoryResponseCache) -> None:
+    """Tests that async extractions are served from the cache."""
+    client = AsyncOpenAI(api_key="test")
+    client.chat.completions.create = AsyncMock(return_value=COMPLETION)
+
+    @openai.call("gpt-4o-mini", client=client, response_model=Book)
+    async def extract_book(text: str) -> str:
+        return f"Extract {text}"
+
+    assert await extract_book("Dune") == await extract_book("Dune")
+    client.chat.completions.create.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_cached_call_async_sqlite(tmp_path: Path) -> None:
+    """Tests that async calls are served from an on-disk cache."""
+    cache = SQLiteResponseCache(tmp_path / "cache.db")
+    set_response_cache(cache)
+    client = AsyncOpenAI(api_key="test")
+    client.chat.completions.create = AsyncMock(return_value=COMPLETION)
+
+    @openai.call("gpt-4o-mini", client=client, tools=[format_book])
+    async def recommend_book(genre: str) -> str:
+        return f"Recommend a {genre} book"
+
+    try:
+        response = await recommend_book("fantasy")
+        cached_response = await recommend_book("fantasy")
+    finally:
+        set_response_cache(None)
+    assert cached_response.response == response.response
+    assert (cache.hits, cache.misses) == (1, 1)
+    client.chat.completions.create.assert_awaited_once()
+
+
+def test_cached_stream(cache: InMemoryResponseCache) -> None:
+    """Tests that cached streams are replayed chunk by chunk."""
+    client = OpenAI(api_key="test")
+    client.chat.completions.create = MagicMock(side_effect=lambda **_: iter(CHUNKS))
+
+    @openai.call("gpt-4o-mini", client=client, stream=True)
+    def recommend_book(genre: str) -> str:
+        return f"Recommend a {genre} book"
+
+    chunks = [chunk.content for chunk, _ in recommend_book("fantasy")]
+    cached_chunks = [chunk.content for chunk, _ in recommend_book("fantasy")]
+    assert chunks == cached_chunks == ["Dune ", "by Herbert"]
+    client.chat.completions.create.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_cached_stream_async(cache: InMemoryResponseCache) -> None:
+    """Tests that cached async streams are replayed chunk by chunk."""
+
+    async def chunks() -> object:
+        for chunk in CHUNKS:
+            yield chunk
+
+    client = AsyncOpenAI(api_key="test")
+    client.chat.completions.create = AsyncMock(side_effect=lambda **_: chunks())
+
+    @openai.call("gpt-4o-mini", client=client, stream=True)
+    async def recommend_book(genre: str) -> str:
+        return f"Recommend a {genre} book"
+
+    for _ in range(2):
+        stream = await recommend_book("fantasy")
+        assert [chunk.content async for chunk, _ in stream] == ["Dune ", "by Herbert"]
+    client.chat.completions.create.assert_awaited_once()
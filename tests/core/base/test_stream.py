@@ -2,7 +2,7 @@
 
 from functools import partial
 from typing import cast
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -236,3 +236,173 @@ async def test_base_stream(mock_get_possible_user_message_param: MagicMock) -> N
 
     assert stream.tool_message_params(tools_and_outputs)
     mock_tool_message_params.assert_called_once_with(tools_and_outputs)
+
+
+@patch.multiple(BaseStream, __abstractmethods__=set())
+def test_base_stream_content() -> None:
+    """Tests that `BaseStream` buffers the streamed content until it is read."""
+    chunks = []
+    for content in ["Hello", "", ", ", "world"]:
+        chunk = MagicMock()
+        chunk.content = content
+        chunks.append((chunk, None))
+
+    stream = BaseStream(
+        stream=(t for t in chunks),
+        metadata={},
+        tool_types=[],
+        call_response_type=MagicMock,
+        model="model",
+        prompt_template="prompt_template",
+        fn_args={},
+        dynamic_config=None,
+        messages=[],
+        call_params={},
+        call_kwargs={},
+    )  # type: ignore
+    assert stream.content == ""
+    iterator = iter(stream)
+    next(iterator)
+    next(iterator)
+    assert stream.content == "Hello"
+    assert stream._content_parts == ["Hello"]
+    next(iterator)
+    assert stream._content_parts == ["Hello", ", "]
+    list(iterator)
+    assert stream.content == "Hello, world"
+    assert stream._content_parts == ["Hello, world"]
+    stream.content = "replaced"
+    assert stream.content == "replaced"
+
+
+class _ProviderStream:
+    """A fake SDK stream that records how many chunks were read and when closed."""
+
+    def __init__(self, contents: list[str]) -> None:
+        self.contents = contents
+        self.consumed = 0
+        self.closed = False
+
+    def __iter__(self):  # noqa: ANN204
+        for content in self.contents:
+            if self.closed:
+                return
+            self.consumed += 1
+            yield content
+
+    async def __aiter__(self):  # noqa: ANN204
+        for content in self:
+            yield content
+
+    def close(self) -> None:
+        self.closed = True
+
+    async def aclose(self) -> None:
+        self.closed = True
+
+
+def _stream_chunk(content: str) -> tuple[MagicMock, None]:
+    return MagicMock(
+        content=content,
+        input_tokens=None,
+        output_tokens=None,
+        model=None,
+        id=None,
+        finish_reasons=None,
+    ), None
+
+
+def _closeable_stream_decorator(create: MagicMock) -> partial:
+    async def handle_stream_async(chunks, tool_types):  # noqa: ANN001, ANN202
+        async for content in chunks:
+            yield _stream_chunk(content)
+
+    BaseStream._construct_message_param = MagicMock(return_value="message_param")
+    return partial(
+        stream_factory(
+            TCallResponse=MagicMock,
+            TStream=BaseStream,
+            setup_call=MagicMock(return_value=(create, "prompt", [], None, {})),
+            handle_stream=MagicMock(
+                side_effect=lambda chunks, tool_types: map(_stream_chunk, chunks)
+            ),
+            handle_stream_async=MagicMock(side_effect=handle_stream_async),
+        ),
+        model="model",
+        tools=None,
+        json_mode=False,
+        client=None,
+        call_params={},
+    )
+
+
+def _closeable_stream(provider_stream: _ProviderStream) -> BaseStream:
+    def fn() -> None: ...
+
+    decorator = _closeable_stream_decorator(MagicMock(return_value=provider_stream))
+    return decorator(fn)()  # type: ignore
+
+
+async def _closeable_stream_async(provider_stream: _ProviderStream) -> BaseStream:
+    async def fn() -> None: ...
+
+    decorator = _closeable_stream_decorator(AsyncMock(return_value=provider_stream))
+    return await decorator(fn)()  # type: ignore
+
+
+@patch.multiple(BaseStream, __abstractmethods__=set())
+def test_base_stream_close() -> None:
+    """Tests that closing a partially consumed stream releases the provider stream."""
+    contents = ["a", "b", "c", "d"]
+    provider_stream = _ProviderStream(contents)
+    stream = _closeable_stream(provider_stream)
+    iterator = iter(stream)
+    next(iterator)
+    stream.close()
+    assert provider_stream.closed
+    assert provider_stream.consumed == 1
+
+    provider_stream = _ProviderStream(contents)
+    with _closeable_stream(provider_stream) as stream:
+        for chunk, _ in stream:
+            if chunk.content == "b":
+                break
+    assert provider_stream.closed
+    assert provider_stream.consumed == 2
+    assert stream.content == "ab"
+    assert stream.message_param == "message_param"
+
+
+@patch.multiple(BaseStream, __abstractmethods__=set())
+def test_base_stream_stop_when() -> None:
+    """Tests that `stop_when` stops the stream and closes the provider stream."""
+    provider_stream = _ProviderStream(["Hello", ", ", "world", "!"])
+    stream = _closeable_stream(provider_stream).stop_when(
+        lambda stream: "," in stream.content
+    )
+    assert [chunk.content for chunk, _ in stream] == ["Hello", ", "]
+    assert provider_stream.closed
+    assert provider_stream.consumed == 2
+    assert stream.content == "Hello, "
+    BaseStream._construct_message_param.assert_called_once_with(None, "Hello, ")  # pyright: ignore [reportFunctionMemberAccess]
+
+
+@patch.multiple(BaseStream, __abstractmethods__=set())
+@pytest.mark.asyncio
+async def test_base_stream_aclose_and_stop_when() -> None:
+    """Tests closing and stopping async streams early."""
+    provider_stream = _ProviderStream(["a", "b", "c"])
+    async with await _closeable_stream_async(provider_stream) as stream:
+        async for _ in stream:
+            break
+    assert provider_stream.closed
+    assert provider_stream.consumed == 1
+
+    provider_stream = _ProviderStream(["a", "b", "c"])
+    stream = (await _closeable_stream_async(provider_stream)).stop_when(
+        lambda stream: stream.content == "ab"
+    )
+    assert [chunk.content async for chunk, _ in stream] == ["a", "b"]
+    assert provider_stream.closed
+    assert provider_stream.consumed == 2
+    assert stream.message_param == "message_param"
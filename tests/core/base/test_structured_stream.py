@@ -1,9 +1,11 @@
 """Tests for the internal `_structured_stream` module."""
 
+from copy import deepcopy
 from functools import partial
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from pydantic import BaseModel
 
 from mirascope.core.base.structured_stream import (
     BaseStructuredStream,
@@ -197,14 +199,113 @@ async def test_base_structured_stream(mock_extract_tool_return: MagicMock) -> No
     for i, output in enumerate(structured_stream):
         assert output == "tool"
         mock_extract_tool_return.assert_called_once_with(
-            MagicMock, '{"title": "title"}', i == 0, {}
+            MagicMock, {"title": "title"}, i == 0, {}
         )
         mock_extract_tool_return.reset_mock()
     i = 0
     async for output in structured_stream:
         assert output == "tool"
         mock_extract_tool_return.assert_called_with(
-            MagicMock, '{"title": "title"}', i == 0, {}
+            MagicMock, {"title": "title"}, i == 0, {}
         )
         mock_extract_tool_return.reset_mock()
         i += 1
+
+
+@patch(
+    "mirascope.core.base.structured_stream.extract_tool_return", new_callable=MagicMock
+)
+def test_base_structured_stream_invalid_json(
+    mock_extract_tool_return: MagicMock,
+) -> None:
+    """Tests that invalid JSON falls back to parsing the full buffer."""
+    json_outputs = []
+    mock_extract_tool_return.side_effect = lambda _, json_output, *args: (
+        json_outputs.append(deepcopy(json_output)) or "partial"
+    )
+    mock_chunk0 = MagicMock(content='{"title": "ti', model=None)
+    mock_chunk1 = MagicMock(content='tle"]}', model=None)
+    base_stream = MagicMock()
+    base_stream.__iter__.return_value = iter([(mock_chunk0, None), (mock_chunk1, None)])
+    structured_stream = BaseStructuredStream(
+        stream=base_stream, response_model=MagicMock, fields_from_call_args={}
+    )
+    assert len(list(structured_stream)) == 3
+    assert json_outputs == [
+        {"title": "ti"},
+        '{"title": "title"]}',
+        '{"title": "title"]}',
+    ]
+
+    mock_chunk0.content = '{"title": } '
+    base_stream.__iter__.return_value = iter([(mock_chunk0, None)])
+    json_outputs.clear()
+    assert len(list(structured_stream)) == 2
+    assert json_outputs == ['{"title": } ', '{"title": }']
+
+
+class Book(BaseModel):
+    title: str
+    author: str
+
+
+def _book_stream(contents: list[str]) -> MagicMock:
+    base_stream = MagicMock()
+    base_stream.__iter__.return_value = iter(
+        [(MagicMock(content=content, model=None), None) for content in contents]
+    )
+    return base_stream
+
+
+def test_base_structured_stream_throttle() -> None:
+    """Tests throttling the partial response models of a structured stream."""
+    contents = ['{"title": "The', " Name", '", "author": "Pat', 'rick"', "}"]
+    structured_stream = BaseStructuredStream(
+        stream=_book_stream(contents), response_model=Book, fields_from_call_args={}
+    )
+    assert len(list(structured_stream)) == 6
+
+    structured_stream.stream = _book_stream(contents)
+    books = list(structured_stream.throttle(on_field_complete=True))
+    assert [book.model_dump() for book in books] == [
+        {"title": "The Name", "author": "Pat"},
+        {"title": "The Name", "author": "Patrick"},
+        {"title": "The Name", "author": "Patrick"},
+    ]
+    assert structured_stream.constructed_response_model == Book(
+        title="The Name", author="Patrick"
+    )
+
+    structured_stream.stream = _book_stream(contents)
+    books = list(structured_stream.throttle(every_n_chunks=2))
+    assert [book.model_dump() for book in books] == [
+        {"title": "The Name", "author": None},
+        {"title": "The Name", "author": "Patrick"},
+        {"title": "The Name", "author": "Patrick"},
+    ]
+
+    structured_stream.stream = _book_stream(contents)
+    assert len(list(structured_stream.throttle(every_ms=0))) == 6
+    structured_stream.stream = _book_stream(contents)
+    assert len(list(structured_stream.throttle(every_ms=60_000))) == 1
+
+
+def test_base_structured_stream_stop_when() -> None:
+    """Tests stopping a structured stream once a partial satisfies a predicate."""
+    contents = ['{"title": "The', " Name", '", "author": "Pat', 'rick"', "}"]
+    base_stream = _book_stream(contents)
+    structured_stream = BaseStructuredStream(
+        stream=base_stream, response_model=Book, fields_from_call_args={}
+    ).stop_when(lambda book: book.author is not None)
+    books = list(structured_stream)
+    assert [book.model_dump() for book in books] == [
+        {"title": "The", "author": None},
+        {"title": "The Name", "author": None},
+        {"title": "The Name", "author": "Pat"},
+    ]
+    assert structured_stream.constructed_response_model is books[-1]
+    base_stream.close.assert_called_once()
+
+    with structured_stream:
+        pass
+    assert base_stream.close.call_count == 2
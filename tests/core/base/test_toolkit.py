@@ -6,6 +6,7 @@ from unittest import mock
 import pytest
 
 from mirascope.core.base import BaseToolKit, toolkit_tool
+from mirascope.core.base._utils import DYNAMIC_TOOL_MARKER
 
 
 @pytest.fixture
@@ -44,6 +45,7 @@ def test_toolkit(mock_namespaces, namespace: str | None, expected_name: str) ->
     assert len(tools) == 1
     tool = tools[0]
     assert tool._name() == expected_name
+    assert getattr(tool, DYNAMIC_TOOL_MARKER) is True
     assert (
         tool._description()
         == "Returns formatted title and author.\n\nReading level: beginner"
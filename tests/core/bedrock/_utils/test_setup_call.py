@@ -1,3 +1,4 @@
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -5,13 +6,16 @@ from types_aiobotocore_bedrock_runtime import (
     BedrockRuntimeClient as AsyncBedrockRuntimeClient,
 )
 
+from mirascope.core.base import client_pool
 from mirascope.core.bedrock._utils._convert_common_call_params import (
     convert_common_call_params,
 )
 from mirascope.core.bedrock._utils._setup_call import (
+    CLIENT_ENV,
+    _AsyncClientManager,
     _extract_async_stream_fn,
     _extract_sync_stream_fn,
-    _get_async_client,
+    _get_sync_client,
     setup_call,
 )
 from mirascope.core.bedrock.tool import BedrockTool
@@ -24,18 +28,69 @@ def mock_base_setup_call() -> MagicMock:
     return mock_setup_call
 
 
-@pytest.mark.asyncio
-async def test_get_async_client():
-    mock_session = MagicMock()
-
+@patch("mirascope.core.bedrock._utils._setup_call.get_session")
+def test_async_client_manager(mock_get_session: MagicMock) -> None:
+    """Tests that the async client is created once and closed with its loop."""
     mock_client = MagicMock(spec=AsyncBedrockRuntimeClient)
-    mock_session.create_client.return_value.__aenter__.return_value = mock_client
+    mock_client.converse = AsyncMock(return_value="response")
+    mock_client.converse_stream = AsyncMock(return_value="stream")
+    context = mock_get_session.return_value.create_client.return_value
+    context.__aenter__ = AsyncMock(return_value=mock_client)
+    context.__aexit__ = AsyncMock()
+    manager = _AsyncClientManager()
+
+    async def run() -> None:
+        assert await manager.converse(modelId="model") == "response"
+        assert await manager.converse_stream(modelId="model") == "stream"
+        assert await manager.get_client() is mock_client
+        assert context.__aexit__.await_count == context.__aenter__.await_count - 1
+
+    asyncio.run(run())
+    mock_get_session.return_value.create_client.assert_called_once_with(
+        "bedrock-runtime"
+    )
+    mock_client.converse.assert_awaited_once_with(modelId="model")
+    mock_client.converse_stream.assert_awaited_once_with(modelId="model")
+    context.__aexit__.assert_awaited_once_with(None, None, None)
+
+    asyncio.run(run())
+    assert mock_get_session.return_value.create_client.call_count == 2
+    assert context.__aexit__.await_count == 2
+
+
+@patch("mirascope.core.bedrock._utils._setup_call.get_session")
+def test_async_client_manager_reuse_after_close(mock_get_session: MagicMock) -> None:
+    """Tests that closing the manager detaches it from the loop that created it."""
+    contexts = [MagicMock(), MagicMock()]
+    for context in contexts:
+        context.__aenter__ = AsyncMock(return_value=MagicMock())
+        context.__aexit__ = AsyncMock()
+    mock_get_session.return_value.create_client.side_effect = contexts
+    manager = _AsyncClientManager()
+
+    loop = asyncio.new_event_loop()
+    loop.run_until_complete(manager.get_client())
+    loop.run_until_complete(manager.close())
+    assert manager._closer is None
+    contexts[0].__aexit__.assert_awaited_once_with(None, None, None)
+
+    new_loop = asyncio.new_event_loop()
+    try:
+        new_loop.run_until_complete(manager.get_client())
+        loop.run_until_complete(loop.shutdown_asyncgens())
+        loop.close()
+        assert manager._context is contexts[1]
+        contexts[1].__aexit__.assert_not_awaited()
+        new_loop.run_until_complete(new_loop.shutdown_asyncgens())
+        contexts[1].__aexit__.assert_awaited_once_with(None, None, None)
+    finally:
+        new_loop.close()
 
-    client = await _get_async_client(mock_session)
 
-    assert isinstance(client, MagicMock)
-    assert client == mock_client
-    mock_session.create_client.assert_called_once_with("bedrock-runtime")
+@pytest.mark.asyncio
+async def test_async_client_manager_close() -> None:
+    """Tests that closing an unused manager does nothing."""
+    await _AsyncClientManager().close()
 
 
 def test_extract_sync_stream_fn():
@@ -279,11 +334,11 @@ def test_setup_call_with_tools(
     assert call_kwargs["toolConfig"] == {"tools": [{"name": "test_tool"}]}
 
 
-@patch("mirascope.core.bedrock._utils._setup_call._get_async_client")
+@patch("mirascope.core.bedrock._utils._setup_call.client_pool")
 @patch("mirascope.core.bedrock._utils._setup_call._utils", new_callable=MagicMock)
 def test_setup_call_client_creation(
     mock_utils: MagicMock,
-    mock_get_async_client: AsyncMock,
+    mock_client_pool: MagicMock,
     mock_base_setup_call: MagicMock,
 ) -> None:
     mock_utils.setup_call = mock_base_setup_call
@@ -306,7 +361,11 @@ def test_setup_call_client_creation(
         stream=False,
     )
 
-    # Test async client creation
+    mock_client_pool.get_client.assert_called_once_with(
+        _get_sync_client, env=CLIENT_ENV
+    )
+
+    # Test async client creation, which is pooled per event loop
     async def async_fn(): ...
 
     setup_call(
@@ -321,7 +380,9 @@ def test_setup_call_client_creation(
         extract=False,
         stream=False,
     )
-    mock_get_async_client.assert_called_once()
+    mock_client_pool.get_async_client.assert_called_once_with(
+        _AsyncClientManager, env=CLIENT_ENV
+    )
 
     # Test when client is provided
     mock_client = MagicMock()
@@ -337,4 +398,14 @@ def test_setup_call_client_creation(
         extract=False,
         stream=False,
     )
-    assert mock_get_async_client.call_count == 1
+    assert mock_client_pool.get_async_client.call_count == 1
+    assert mock_client_pool.get_client.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_async_client_manager_pooled() -> None:
+    """Tests that calls on the same event loop share the async client manager."""
+    manager = client_pool.get_async_client(_AsyncClientManager)
+    assert client_pool.get_async_client(_AsyncClientManager) is manager
+    await client_pool.aclose()
+    assert client_pool.get_async_client(_AsyncClientManager) is not manager
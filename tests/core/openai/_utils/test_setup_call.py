@@ -245,3 +245,33 @@ def test_setup_call_extract(
             stream=False,
         )
     assert "tool_choice" in call_kwargs and call_kwargs["tool_choice"] == "required"
+
+
+@patch("mirascope.core.openai._utils._setup_call.OpenAI", new_callable=MagicMock)
+@patch(
+    "mirascope.core.openai._utils._setup_call.convert_message_params",
+    new_callable=MagicMock,
+)
+@patch("mirascope.core.openai._utils._setup_call._utils", new_callable=MagicMock)
+def test_setup_call_reuses_pooled_client(
+    mock_utils: MagicMock,
+    mock_convert_message_params: MagicMock,
+    mock_openai: MagicMock,
+    mock_base_setup_call: MagicMock,
+) -> None:
+    """Tests that `setup_call` reuses the pooled client across calls."""
+    mock_utils.setup_call = mock_base_setup_call
+    for _ in range(2):
+        setup_call(
+            model="gpt-4o",
+            client=None,
+            fn=MagicMock(),
+            fn_args={},
+            dynamic_config=None,
+            tools=None,
+            json_mode=False,
+            call_params={},
+            extract=False,
+            stream=False,
+        )
+    mock_openai.assert_called_once_with()
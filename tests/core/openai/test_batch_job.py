@@ -0,0 +1,175 @@
+"""Tests the `openai.batch_job` module against a local stand-in Batch API server."""
+
+import json
+
+import httpx
+from openai import OpenAI
+from pydantic import BaseModel
+
+from mirascope.core import openai
+from mirascope.core.openai.batch_job import OpenAIBatchJob
+
+
+class Book(BaseModel):
+    title: str
+    author: str
+
+
+def _completion(body: dict) -> dict:
+    if body.get("tools"):
+        message = {
+            "role": "assistant",
+            "content": None,
+            "tool_calls": [
+                {
+                    "id": "call_0",
+                    "type": "function",
+                    "function": {
+                        "name": body["tools"][0]["function"]["name"],
+                        "arguments": json.dumps(
+                            {"title": "The Name of the Wind", "author": "Rothfuss"}
+                        ),
+                    },
+                }
+            ],
+        }
+    else:
+        message = {"role": "assistant", "content": body["messages"][0]["content"]}
+    return {
+        "id": "id",
+        "created": 0,
+        "model": body["model"],
+        "object": "chat.completion",
+        "choices": [{"index": 0, "finish_reason": "stop", "message": message}],
+    }
+
+
+class BatchServer:
+    """A minimal in-memory stand-in for the OpenAI Files and Batches endpoints."""
+
+    def __init__(self) -> None:
+        self.requests: list[dict] = []
+        self.status = "in_progress"
+
+    def batch(self) -> dict:
+        return {
+            "id": "batch_0",
+            "object": "batch",
+            "endpoint": "/v1/chat/completions",
+            "input_file_id": "file_in",
+            "completion_window": "24h",
+            "created_at": 0,
+            "status": self.status,
+            "output_file_id": "file_out",
+            "error_file_id": "file_err",
+        }
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        if path == "/v1/files":
+            self.requests = [
+                json.loads(line)
+                for line in request.content.decode().splitlines()
+                if line.startswith("{")
+            ]
+            return httpx.Response(
+                200,
+                json={
+                    "id": "file_in",
+                    "object": "file",
+                    "bytes": 0,
+                    "created_at": 0,
+                    "filename": "batch.jsonl",
+                    "purpose": "batch",
+                    "status": "processed",
+                },
+            )
+        if path in ("/v1/batches", "/v1/batches/batch_0"):
+            return httpx.Response(200, json=self.batch())
+        if path == "/v1/files/file_out/content":
+            lines = [
+                {
+                    "custom_id": request["custom_id"],
+                    "response": {
+                        "status_code": 200,
+                        "body": _completion(request["body"]),
+                    },
+                    "error": None,
+                }
+                for request in self.requests[:-1]
+            ]
+            return httpx.Response(200, text="\n".join(map(json.dumps, lines)))
+        if path == "/v1/files/file_err/content":
+            line = {
+                "custom_id": self.requests[-1]["custom_id"],
+                "response": {
+                    "status_code": 400,
+                    "body": {"error": {"message": "bad request"}},
+                },
+                "error": None,
+            }
+            return httpx.Response(200, text=json.dumps(line))
+        return httpx.Response(404)
+
+
+def _client(server: BatchServer) -> OpenAI:
+    return OpenAI(
+        api_key="test",
+        http_client=httpx.Client(transport=httpx.MockTransport(server.handle)),
+    )
+
+
+def test_openai_batch_job() -> None:
+    """Tests submitting, polling, and mapping the results of an OpenAI batch."""
+    server = BatchServer()
+    client = _client(server)
+
+    @openai.call("gpt-4o-mini", client=client)
+    def recommend_book(genre: str) -> str:
+        return f"Recommend a {genre} book"
+
+    inputs = [{"genre": "fantasy"}, {"genre": "horror"}, {"genre": "mystery"}]
+    job = OpenAIBatchJob.submit(recommend_book, inputs, client=client)
+    assert job.id == "batch_0"
+    assert [request["custom_id"] for request in server.requests] == [
+        "request-0",
+        "request-1",
+        "request-2",
+    ]
+    assert server.requests[0]["url"] == "/v1/chat/completions"
+    assert server.requests[0]["body"] == {
+        "model": "gpt-4o-mini",
+        "messages": [{"role": "user", "content": "Recommend a fantasy book"}],
+    }
+
+    assert not job.done
+    assert job.status == "in_progress"
+    server.status = "completed"
+    results = job.wait(poll_interval=0).results()
+    assert job.status == "completed"
+    assert [result["output"].content for result in results[:2]] == [  # pyright: ignore [reportOptionalMemberAccess]
+        "Recommend a fantasy book",
+        "Recommend a horror book",
+    ]
+    assert results[0]["output"].fn_args == {"genre": "fantasy"}  # pyright: ignore [reportOptionalMemberAccess]
+    assert results[2]["output"] is None
+    assert "bad request" in str(results[2]["error"])
+
+
+def test_openai_batch_job_extract() -> None:
+    """Tests mapping batch results into response models through tools."""
+    server = BatchServer()
+    server.status = "completed"
+    client = _client(server)
+
+    @openai.call("gpt-4o-mini", client=client, response_model=Book)
+    def extract_book(text: str) -> str:
+        return f"Extract {text}"
+
+    job = OpenAIBatchJob.submit(
+        extract_book, [{"text": "book"}, {"text": "error"}], client=client
+    )
+    assert server.requests[0]["body"]["tools"][0]["function"]["name"] == "Book"
+    results = job.wait(poll_interval=0).results()
+    assert results[0]["output"] == Book(title="The Name of the Wind", author="Rothfuss")
+    assert isinstance(results[1]["error"], RuntimeError)
@@ -66,6 +66,7 @@ def test_openai_call_response() -> None:
     }
     assert call_response.tools is None
     assert call_response.tool is None
+    assert call_response.message_param is call_response.message_param
 
 
 def test_openai_call_response_with_tools() -> None:
@@ -132,7 +133,10 @@ def test_openai_call_response_with_tools() -> None:
         )
     ]
 
+    assert call_response.tools is tools
+
     completion.choices[0].message.refusal = "refusal message"
+    del call_response.__dict__["tools"]  # clears the cached tools
     with pytest.raises(ValueError, match="refusal message"):
         tool = call_response.tools
 
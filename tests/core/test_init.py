@@ -0,0 +1,67 @@
+"""Tests the lazy provider imports of `mirascope.core` and their import time."""
+
+import subprocess
+import sys
+from unittest.mock import patch
+
+import pytest
+
+import mirascope.core
+
+PROVIDER_SDKS = {
+    "anthropic": "anthropic",
+    "azure": "azure.ai.inference",
+    "cohere": "cohere",
+    "gemini": "google.generativeai",
+    "groq": "groq",
+    "litellm": "litellm",
+    "mistral": "mistralai",
+    "openai": "openai",
+    "vertex": "vertexai",
+}
+
+
+def imported_modules(module: str) -> set[str]:
+    """Returns the names of all modules loaded by importing `module` from scratch."""
+    completed = subprocess.run(
+        [sys.executable, "-c", f"import sys, {module}; print(*sys.modules)"],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    return set(completed.stdout.split())
+
+
+def test_import_core_skips_provider_sdks() -> None:
+    """Tests that importing `mirascope.core` does not import any provider SDK."""
+    modules = imported_modules("mirascope.core")
+    assert "mirascope.core.base" in modules
+    assert not modules & set(PROVIDER_SDKS.values())
+
+
+def test_import_provider_only_imports_its_sdk() -> None:
+    """Tests that importing one provider does not import the others' SDKs."""
+    modules = imported_modules("mirascope.core.openai")
+    assert "openai" in modules
+    assert not modules & (set(PROVIDER_SDKS.values()) - {"openai"})
+
+
+def test_provider_attribute() -> None:
+    """Tests that providers are imported and cached on first attribute access."""
+    from mirascope.core import openai
+
+    assert mirascope.core.openai is openai
+    assert mirascope.core.__dict__["openai"] is openai
+    assert "anthropic" in dir(mirascope.core)
+
+
+def test_provider_attribute_missing_sdk() -> None:
+    """Tests that providers with a missing SDK raise `AttributeError`."""
+    with (
+        patch.dict(mirascope.core.__dict__),
+        patch("importlib.import_module", side_effect=ImportError("no mistralai")),
+    ):
+        mirascope.core.__dict__.pop("mistral", None)
+        assert not hasattr(mirascope.core, "mistral")
+    with pytest.raises(AttributeError, match="has no attribute 'unknown'"):
+        mirascope.core.unknown  # pyright: ignore [reportAttributeAccessIssue]  # noqa: B018
@@ -3,7 +3,8 @@ from unittest.mock import MagicMock
 from pydantic import BaseModel, ValidationError
 from tenacity import RetryCallState
 
-from mirascope.retries.tenacity import collect_errors
+from mirascope.core.base.deadline import DeadlineExceededError, deadline
+from mirascope.retries.tenacity import collect_errors, stop_at_deadline
 
 
 def test_collect_errors() -> None:
@@ -23,3 +24,22 @@ def test_collect_errors() -> None:
     outcome.exception.return_value = validation_error
     collect_errors(ValidationError)(mock_retry_state)
     assert mock_retry_state.kwargs["errors"] == [validation_error]
+
+
+def test_stop_at_deadline() -> None:
+    mock_retry_state = MagicMock(spec=RetryCallState)
+    mock_retry_state.outcome = None
+    mock_retry_state.upcoming_sleep = 1.0
+    assert not stop_at_deadline(mock_retry_state)
+    with deadline(10):
+        assert not stop_at_deadline(mock_retry_state)
+        mock_retry_state.upcoming_sleep = 20.0
+        assert stop_at_deadline(mock_retry_state)
+    with deadline(first_token_timeout=1):
+        assert not stop_at_deadline(mock_retry_state)
+
+    outcome = MagicMock()
+    outcome.failed = True
+    outcome.exception.return_value = DeadlineExceededError()
+    mock_retry_state.outcome = outcome
+    assert stop_at_deadline(mock_retry_state)